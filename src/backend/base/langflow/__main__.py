@@ -9,6 +9,7 @@ import time
 import warnings
 from contextlib import suppress
 from pathlib import Path
+from uuid import UUID
 
 import click
 import httpx
@@ -72,7 +73,7 @@ def set_var_for_macos_issue() -> None:
         import os
 
         os.environ["OBJC_DISABLE_INITIALIZE_FORK_SAFETY"] = "YES"
-        # https://stackoverflow.com/questions/75747888/uwsgi-segmentation-fault-with-flask-python-app-behind-nginx-after-running-for-2 # noqa: E501
+        # https://stackoverflow.com/questions/75747888/uwsgi-segmentation-fault-with-flask-python-app-behind-nginx-after-running-for-2
         os.environ["no_proxy"] = "*"  # to avoid error with gunicorn
         logger.debug("Set OBJC_DISABLE_INITIALIZE_FORK_SAFETY to YES to avoid error")
 
@@ -614,6 +615,36 @@ def api_key(
         api_key_banner(unmasked_api_key)
 
 
+@app.command()
+def rebuild_crm_stats(
+    workspace_id: list[str] = typer.Option(
+        None, "--workspace-id", help="Workspace to rebuild. Can be repeated, defaults to every workspace."
+    ),
+    log_level: str = typer.Option("error", help="Logging level."),
+) -> None:
+    """Recompute the CRM dashboard counters and report rollups from the CRM tables.
+
+    They are kept up to date as CRM records are written; this repairs them if they drifted,
+    e.g. after records were changed directly in the database.
+    """
+    configure(log_level=log_level)
+
+    async def _rebuild_crm_stats():
+        await initialize_services()
+        from langflow.services.database.models.crm.daily_rollup import rebuild_daily_rollups
+        from langflow.services.database.models.crm.rollup import rebuild_workspace_stats
+
+        workspace_ids = [UUID(value) for value in workspace_id] if workspace_id else None
+        async with session_scope() as session:
+            return (
+                await rebuild_workspace_stats(session, workspace_ids),
+                await rebuild_daily_rollups(session, workspace_ids),
+            )
+
+    rebuilt, rollup_rows = asyncio.run(_rebuild_crm_stats())
+    typer.echo(f"Rebuilt the CRM counters of {rebuilt} workspace(s) and {rollup_rows} daily report rollup(s).")
+
+
 def show_version(*, value: bool):
     if value:
         default = "DEV"
@@ -37,6 +37,13 @@ target_metadata.naming_convention = NAMING_CONVENTION
 # ... etc.
 
 
+def include_name(name, type_, parent_names) -> bool:  # noqa: ARG001
+    # The SQLite full-text index of CRM search and its shadow tables aren't models
+    if type_ == "table":
+        return not (name or "").startswith("crm_search_document_fts")
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -53,6 +60,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_name=include_name,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
         render_as_batch=True,
@@ -80,7 +88,11 @@ def _sqlite_do_begin(conn):
 
 def _do_run_migrations(connection):
     context.configure(
-        connection=connection, target_metadata=target_metadata, render_as_batch=True, prepare_threshold=None
+        connection=connection,
+        target_metadata=target_metadata,
+        include_name=include_name,
+        render_as_batch=True,
+        prepare_threshold=None,
     )
 
     with context.begin_transaction():
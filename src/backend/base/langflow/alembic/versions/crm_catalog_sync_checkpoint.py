@@ -0,0 +1,43 @@
+"""Create CRM catalog sync checkpoint table
+
+Revision ID: crm_catalog_sync_checkpoint
+Revises: crm_rollup_amount_count
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision = 'crm_catalog_sync_checkpoint'
+down_revision = 'crm_rollup_amount_count'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    table_names = inspector.get_table_names()
+
+    # Create crm_catalog_sync_checkpoint table, the first sync of each store is a full sync
+    if "crm_catalog_sync_checkpoint" not in table_names:
+        op.create_table(
+            'crm_catalog_sync_checkpoint',
+            sa.Column('workspace_id', sqlmodel.sql.sqltypes.types.Uuid(), nullable=False),
+            sa.Column('source', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+            sa.Column('site', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+            sa.Column('synced_at', sa.DateTime(timezone=True), nullable=False),
+            sa.ForeignKeyConstraint(['workspace_id'], ['workspace.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('workspace_id', 'source', 'site')
+        )
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    table_names = inspector.get_table_names()
+
+    if "crm_catalog_sync_checkpoint" in table_names:
+        op.drop_table('crm_catalog_sync_checkpoint')
@@ -0,0 +1,89 @@
+"""Create CRM daily rollups and report indexes
+
+Revision ID: crm_daily_rollup
+Revises: crm_search_index
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision = 'crm_daily_rollup'
+down_revision = 'crm_search_index'
+branch_labels = None
+depends_on = None
+
+# (table, columns) of each index, named ix_<table>_<columns>
+REPORT_INDEXES = [
+    ('invoice', ['workspace_id', 'status', 'created_at']),
+    ('opportunity', ['workspace_id', 'status', 'created_at']),
+]
+
+# (table, series, date column, amount column) of the records already in the database
+ROLLUP_SERIES = [
+    ('invoice', 'invoice', 'created_at', 'amount'),
+    ('invoice', 'invoice_due', 'due_date', 'amount'),
+    ('opportunity', 'opportunity', 'created_at', 'value'),
+    ('opportunity', 'opportunity_close', 'expected_close_date', 'value'),
+]
+
+
+def _index_name(table, columns):
+    return f"ix_{table}_{'_'.join(columns)}"
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    table_names = inspector.get_table_names()
+
+    for table, columns in REPORT_INDEXES:
+        if table not in table_names:
+            continue
+        existing = {index['name'] for index in inspector.get_indexes(table)}
+        if _index_name(table, columns) not in existing:
+            op.create_index(_index_name(table, columns), table, columns, unique=False)
+
+    if "crm_daily_rollup" in table_names:
+        return
+
+    op.create_table(
+        'crm_daily_rollup',
+        sa.Column('workspace_id', sqlmodel.sql.sqltypes.types.Uuid(), nullable=False),
+        sa.Column('series', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('status', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column('record_count', sa.Integer(), nullable=False),
+        sa.Column('amount', sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(['workspace_id'], ['workspace.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('workspace_id', 'series', 'day', 'status')
+    )
+
+    # Roll up the records that already exist
+    for table, series, date_column, amount_column in ROLLUP_SERIES:
+        if table not in table_names:
+            continue
+        op.execute(
+            "INSERT INTO crm_daily_rollup (workspace_id, series, day, status, record_count, amount) "
+            f"SELECT workspace_id, '{series}', date({date_column}), status, count(*), coalesce(sum({amount_column}), 0) "
+            f"FROM {table} WHERE {date_column} IS NOT NULL "
+            f"GROUP BY workspace_id, date({date_column}), status"
+        )
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    table_names = inspector.get_table_names()
+
+    if "crm_daily_rollup" in table_names:
+        op.drop_table('crm_daily_rollup')
+
+    for table, columns in REPORT_INDEXES:
+        if table not in table_names:
+            continue
+        existing = {index['name'] for index in inspector.get_indexes(table)}
+        if _index_name(table, columns) in existing:
+            op.drop_index(_index_name(table, columns), table_name=table)
@@ -0,0 +1,55 @@
+"""Add indexes for cursor pagination of CRM lists
+
+Revision ID: crm_keyset_indexes
+Revises: crm_rollup_tables
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'crm_keyset_indexes'
+down_revision = 'crm_rollup_tables'
+branch_labels = None
+depends_on = None
+
+# (table, columns) of each index, named ix_<table>_<columns>
+KEYSET_INDEXES = [
+    ('client', ['workspace_id', 'created_at', 'id']),
+    ('invoice', ['workspace_id', 'created_at', 'id']),
+    ('opportunity', ['workspace_id', 'created_at', 'id']),
+    ('task', ['workspace_id', 'created_at', 'id']),
+    ('product_variation', ['product_id', 'created_at', 'id']),
+    ('product_meta', ['product_id', 'key', 'id']),
+]
+
+
+def _index_name(table, columns):
+    return f"ix_{table}_{'_'.join(columns)}"
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    table_names = inspector.get_table_names()
+
+    for table, columns in KEYSET_INDEXES:
+        if table not in table_names:
+            continue
+        existing = {index['name'] for index in inspector.get_indexes(table)}
+        if _index_name(table, columns) not in existing:
+            op.create_index(_index_name(table, columns), table, columns, unique=False)
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    table_names = inspector.get_table_names()
+
+    for table, columns in KEYSET_INDEXES:
+        if table not in table_names:
+            continue
+        existing = {index['name'] for index in inspector.get_indexes(table)}
+        if _index_name(table, columns) in existing:
+            op.drop_index(_index_name(table, columns), table_name=table)
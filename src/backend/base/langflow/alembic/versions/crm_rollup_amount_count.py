@@ -0,0 +1,61 @@
+"""Count the CRM records with an amount in the daily rollups
+
+Revision ID: crm_rollup_amount_count
+Revises: message_session_index
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'crm_rollup_amount_count'
+down_revision = 'message_session_index'
+branch_labels = None
+depends_on = None
+
+# (table, series, date column, amount column) of the rolled up records
+ROLLUP_SERIES = [
+    ('invoice', 'invoice', 'created_at', 'amount'),
+    ('invoice', 'invoice_due', 'due_date', 'amount'),
+    ('opportunity', 'opportunity', 'created_at', 'value'),
+    ('opportunity', 'opportunity_close', 'expected_close_date', 'value'),
+]
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    table_names = inspector.get_table_names()
+    if 'crm_daily_rollup' not in table_names:
+        return
+    if 'amount_count' in {column['name'] for column in inspector.get_columns('crm_daily_rollup')}:
+        return
+
+    with op.batch_alter_table('crm_daily_rollup', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('amount_count', sa.Integer(), nullable=False, server_default='0'))
+
+    # Count the records with an amount of the rows that already exist
+    for table, series, date_column, amount_column in ROLLUP_SERIES:
+        if table not in table_names:
+            continue
+        op.execute(
+            f"UPDATE crm_daily_rollup SET amount_count = ("
+            f"SELECT count({table}.{amount_column}) FROM {table} "
+            f"WHERE {table}.workspace_id = crm_daily_rollup.workspace_id "
+            f"AND {table}.status = crm_daily_rollup.status "
+            f"AND date({table}.{date_column}) = crm_daily_rollup.day"
+            f") WHERE series = '{series}'"
+        )
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    if 'crm_daily_rollup' not in inspector.get_table_names():
+        return
+    if 'amount_count' not in {column['name'] for column in inspector.get_columns('crm_daily_rollup')}:
+        return
+
+    with op.batch_alter_table('crm_daily_rollup', schema=None) as batch_op:
+        batch_op.drop_column('amount_count')
@@ -0,0 +1,135 @@
+"""Create CRM workspace stats and activity tables
+
+Revision ID: crm_rollup_tables
+Revises: merge_all_heads
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from uuid import uuid4
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision = 'crm_rollup_tables'
+down_revision = 'merge_all_heads'
+branch_labels = None
+depends_on = None
+
+# For each CRM table: its activity type and the fields shown in the activity feed,
+# as in `langflow.services.database.models.crm.rollup.TRACKED_MODELS`
+ACTIVITY_SOURCES = {
+    "client": ("client", ("name", "status")),
+    "invoice": ("invoice", ("invoice_number", "amount", "status")),
+    "opportunity": ("opportunity", ("name", "value", "status")),
+    "task": ("task", ("title", "status", "priority")),
+}
+BACKFILL_BATCH_SIZE = 1000
+
+
+def backfill_activity(conn, table_names):
+    """Add a "created" entry to the activity feed for every existing CRM record."""
+    activity = sa.table(
+        'crm_activity',
+        sa.column('id', sa.Uuid()),
+        sa.column('workspace_id', sa.Uuid()),
+        sa.column('entity_type', sa.String()),
+        sa.column('entity_id', sa.Uuid()),
+        sa.column('action', sa.String()),
+        sa.column('details', sa.JSON()),
+        sa.column('created_by', sa.Uuid()),
+        sa.column('created_at', sa.DateTime(timezone=True)),
+    )
+    for table_name, (entity_type, detail_fields) in ACTIVITY_SOURCES.items():
+        if table_name not in table_names:
+            continue
+        source = sa.table(
+            table_name,
+            sa.column('id', sa.Uuid()),
+            sa.column('workspace_id', sa.Uuid()),
+            sa.column('created_by', sa.Uuid()),
+            sa.column('created_at', sa.DateTime()),
+            *(sa.column(field) for field in detail_fields),
+        )
+        rows = conn.execute(sa.select(source))
+        for batch in rows.partitions(BACKFILL_BATCH_SIZE):
+            conn.execute(
+                sa.insert(activity),
+                [
+                    {
+                        'id': uuid4(),
+                        'workspace_id': row.workspace_id,
+                        'entity_type': entity_type,
+                        'entity_id': row.id,
+                        'action': 'created',
+                        'details': {field: row._mapping[field] for field in detail_fields},
+                        'created_by': row.created_by,
+                        'created_at': row.created_at,
+                    }
+                    for row in batch
+                ],
+            )
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    table_names = inspector.get_table_names()
+
+    # Create crm_workspace_stats table, filled in by the dashboard or `langflow rebuild-crm-stats`
+    if "crm_workspace_stats" not in table_names:
+        op.create_table(
+            'crm_workspace_stats',
+            sa.Column('workspace_id', sqlmodel.sql.sqltypes.types.Uuid(), nullable=False),
+            sa.Column('client_count', sa.Integer(), nullable=False),
+            sa.Column('active_client_count', sa.Integer(), nullable=False),
+            sa.Column('inactive_client_count', sa.Integer(), nullable=False),
+            sa.Column('lead_client_count', sa.Integer(), nullable=False),
+            sa.Column('invoice_count', sa.Integer(), nullable=False),
+            sa.Column('paid_invoice_total', sa.Float(), nullable=False),
+            sa.Column('opportunity_count', sa.Integer(), nullable=False),
+            sa.Column('open_opportunity_value', sa.Float(), nullable=False),
+            sa.Column('open_task_count', sa.Integer(), nullable=False),
+            sa.Column('in_progress_task_count', sa.Integer(), nullable=False),
+            sa.Column('completed_task_count', sa.Integer(), nullable=False),
+            sa.Column('updated_at', sa.DateTime(), nullable=False),
+            sa.ForeignKeyConstraint(['workspace_id'], ['workspace.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('workspace_id')
+        )
+
+    # Create crm_activity table
+    if "crm_activity" not in table_names:
+        op.create_table(
+            'crm_activity',
+            sa.Column('id', sqlmodel.sql.sqltypes.types.Uuid(), nullable=False),
+            sa.Column('workspace_id', sqlmodel.sql.sqltypes.types.Uuid(), nullable=False),
+            sa.Column('entity_type', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+            sa.Column('entity_id', sqlmodel.sql.sqltypes.types.Uuid(), nullable=False),
+            sa.Column('action', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+            sa.Column('details', sa.JSON(), nullable=True),
+            sa.Column('created_by', sqlmodel.sql.sqltypes.types.Uuid(), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+            sa.ForeignKeyConstraint(['workspace_id'], ['workspace.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+        op.create_index(
+            'ix_crm_activity_workspace_id_created_at', 'crm_activity', ['workspace_id', 'created_at'], unique=False
+        )
+
+        # So the feed doesn't start out empty for workspaces that already have records
+        backfill_activity(conn, table_names)
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    table_names = inspector.get_table_names()
+
+    if "crm_activity" in table_names:
+        op.drop_index('ix_crm_activity_workspace_id_created_at', table_name='crm_activity')
+        op.drop_table('crm_activity')
+
+    if "crm_workspace_stats" in table_names:
+        op.drop_table('crm_workspace_stats')
@@ -0,0 +1,100 @@
+"""Create CRM full-text search index
+
+Revision ID: crm_search_index
+Revises: crm_keyset_indexes
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision = 'crm_search_index'
+down_revision = 'crm_keyset_indexes'
+branch_labels = None
+depends_on = None
+
+SQLITE_FTS_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS crm_search_document_fts USING fts5("
+    "title, body, content='crm_search_document', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    "CREATE TRIGGER IF NOT EXISTS crm_search_document_ai AFTER INSERT ON crm_search_document BEGIN "
+    "INSERT INTO crm_search_document_fts(rowid, title, body) VALUES (new.id, new.title, new.body); END",
+    "CREATE TRIGGER IF NOT EXISTS crm_search_document_ad AFTER DELETE ON crm_search_document BEGIN "
+    "INSERT INTO crm_search_document_fts(crm_search_document_fts, rowid, title, body) "
+    "VALUES ('delete', old.id, old.title, old.body); END",
+    "CREATE TRIGGER IF NOT EXISTS crm_search_document_au AFTER UPDATE ON crm_search_document BEGIN "
+    "INSERT INTO crm_search_document_fts(crm_search_document_fts, rowid, title, body) "
+    "VALUES ('delete', old.id, old.title, old.body); "
+    "INSERT INTO crm_search_document_fts(rowid, title, body) VALUES (new.id, new.title, new.body); END",
+]
+
+POSTGRES_GIN_DDL = (
+    "CREATE INDEX IF NOT EXISTS ix_crm_search_document_vector ON crm_search_document USING gin "
+    "((setweight(to_tsvector('simple', title), 'A') || setweight(to_tsvector('simple', body), 'B')))"
+)
+
+# (table, search type, title column, body columns) of the records already in the database
+INDEXED_TABLES = [
+    ('client', 'client', 'name', ['company', 'email', 'description']),
+    ('opportunity', 'opportunity', 'name', ['description']),
+    ('product', 'product', 'name', ['sku', 'short_description', 'description']),
+]
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    table_names = inspector.get_table_names()
+
+    if "crm_search_document" in table_names:
+        return
+
+    op.create_table(
+        'crm_search_document',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('workspace_id', sqlmodel.sql.sqltypes.types.Uuid(), nullable=False),
+        sa.Column('entity_type', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column('entity_id', sqlmodel.sql.sqltypes.types.Uuid(), nullable=False),
+        sa.Column('title', sa.Text(), nullable=False),
+        sa.Column('body', sa.Text(), nullable=False),
+        sa.ForeignKeyConstraint(['workspace_id'], ['workspace.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_crm_search_document_entity', 'crm_search_document', ['entity_type', 'entity_id'], unique=True
+    )
+    op.create_index(
+        op.f('ix_crm_search_document_workspace_id'), 'crm_search_document', ['workspace_id'], unique=False
+    )
+
+    if conn.dialect.name == "sqlite":
+        for statement in SQLITE_FTS_DDL:
+            op.execute(statement)
+    elif conn.dialect.name == "postgresql":
+        op.execute(POSTGRES_GIN_DDL)
+
+    # Index the records that already exist
+    for table, entity_type, title_column, body_columns in INDEXED_TABLES:
+        if table not in table_names:
+            continue
+        body = " || ' ' || ".join(f"coalesce({column}, '')" for column in body_columns)
+        op.execute(
+            "INSERT INTO crm_search_document (workspace_id, entity_type, entity_id, title, body) "
+            f"SELECT workspace_id, '{entity_type}', id, coalesce({title_column}, ''), trim({body}) FROM {table}"
+        )
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    table_names = inspector.get_table_names()
+
+    if conn.dialect.name == "sqlite":
+        for trigger in ('crm_search_document_ai', 'crm_search_document_ad', 'crm_search_document_au'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS crm_search_document_fts")
+
+    if "crm_search_document" in table_names:
+        op.drop_table('crm_search_document')
@@ -0,0 +1,38 @@
+"""Index messages by chat session, flow and time
+
+Revision ID: message_session_index
+Revises: crm_daily_rollup
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'message_session_index'
+down_revision = 'crm_daily_rollup'
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = 'ix_message_session_id_flow_id_timestamp'
+INDEX_COLUMNS = ['session_id', 'flow_id', 'timestamp']
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    if 'message' not in inspector.get_table_names():
+        return
+    existing = {index['name'] for index in inspector.get_indexes('message')}
+    if INDEX_NAME not in existing:
+        op.create_index(INDEX_NAME, 'message', INDEX_COLUMNS, unique=False)
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    if 'message' not in inspector.get_table_names():
+        return
+    existing = {index['name'] for index in inspector.get_indexes('message')}
+    if INDEX_NAME in existing:
+        op.drop_index(INDEX_NAME, table_name='message')
@@ -1,10 +1,12 @@
 import asyncio
 import json
+from contextlib import ExitStack
 from http import HTTPStatus
-from typing import Annotated, Any
+from typing import Annotated
 
 from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
 
 from langflow.logging.logger import log_buffer
 
@@ -14,41 +16,25 @@ log_router = APIRouter(tags=["Log"])
 NUMBER_OF_NOT_SENT_BEFORE_KEEPALIVE = 5
 
 
-async def event_generator(request: Request):
-    global log_buffer  # noqa: PLW0602
-    last_read_item = None
+async def event_generator(request: Request, queue: asyncio.Queue[tuple[int, str]], subscription: ExitStack):
     current_not_sent = 0
-    while not await request.is_disconnected():
-        to_write: list[Any] = []
-        with log_buffer.get_write_lock():
-            if last_read_item is None:
-                last_read_item = log_buffer.buffer[len(log_buffer.buffer) - 1]
-            else:
-                found_last = False
-                for item in log_buffer.buffer:
-                    if found_last:
-                        to_write.append(item)
-                        last_read_item = item
-                        continue
-                    if item is last_read_item:
-                        found_last = True
-                        continue
-
-                # in case the last item is nomore in the buffer
-                if not found_last:
-                    for item in log_buffer.buffer:
-                        to_write.append(item)
-                        last_read_item = item
-        if to_write:
+    with subscription:
+        while not await request.is_disconnected():
+            try:
+                entry = await asyncio.wait_for(queue.get(), timeout=1)
+            except asyncio.TimeoutError:
+                current_not_sent += 1
+                if current_not_sent == NUMBER_OF_NOT_SENT_BEFORE_KEEPALIVE:
+                    current_not_sent = 0
+                    yield "keepalive\n\n"
+                continue
+            current_not_sent = 0
+            # Send whatever was written meanwhile along with it
+            to_write = [entry]
+            while not queue.empty():
+                to_write.append(queue.get_nowait())
             for ts, msg in to_write:
                 yield f"{json.dumps({ts: msg})}\n\n"
-        else:
-            current_not_sent += 1
-            if current_not_sent == NUMBER_OF_NOT_SENT_BEFORE_KEEPALIVE:
-                current_not_sent = 0
-                yield "keepalive\n\n"
-
-        await asyncio.sleep(1)
 
 
 @log_router.get("/logs-stream")
@@ -67,7 +53,18 @@ async def stream_logs(
             detail="Log retrieval is disabled",
         )
 
-    return StreamingResponse(event_generator(request), media_type="text/event-stream")
+    subscription = ExitStack()
+    try:
+        queue = subscription.enter_context(log_buffer.subscribe())
+    except RuntimeError as exc:
+        raise HTTPException(status_code=HTTPStatus.TOO_MANY_REQUESTS, detail=str(exc)) from exc
+
+    return StreamingResponse(
+        event_generator(request, queue, subscription),
+        media_type="text/event-stream",
+        # In case the stream is never started
+        background=BackgroundTask(subscription.close),
+    )
 
 
 @log_router.get("/logs")
@@ -41,6 +41,7 @@ from langflow.api.v1.crm import (
     product_images_router,
     product_reviews_router,
     ecommerce_integration_router,
+    search_router,
 )
 from langflow.api.v2 import files_router as files_router_v2
 
@@ -93,6 +94,7 @@ router_v1.include_router(product_categories_router)
 router_v1.include_router(product_attributes_router)
 router_v1.include_router(product_variations_router)
 router_v1.include_router(product_meta_router)
+router_v1.include_router(search_router)
 
 router_v2.include_router(files_router_v2)
 
@@ -0,0 +1,93 @@
+"""Responses and uploads that stream files to and from the storage service."""
+
+import re
+from collections.abc import AsyncGenerator
+
+from fastapi import UploadFile
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+from langflow.services.storage.constants import DEFAULT_CHUNK_SIZE
+from langflow.services.storage.service import StorageService
+
+# A single range of bytes, e.g. bytes=0-99, bytes=100- or bytes=-100
+SINGLE_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeNotSatisfiableError(ValueError):
+    """The requested range doesn't overlap the file."""
+
+
+def parse_range(range_header: str | None, size: int) -> tuple[int, int] | None:
+    """Parse an HTTP Range header against a file of `size` bytes.
+
+    Returns:
+        The first and last positions of the range, or None to send the whole file, which is
+        also how servers may answer ranges they don't support, like multiple ranges.
+
+    Raises:
+        RangeNotSatisfiableError: If the range starts after the end of the file.
+    """
+    if not range_header or not (match := SINGLE_RANGE.match(range_header.strip())):
+        return None
+    first, last = match.groups()
+    if first:
+        start, end = int(first), min(int(last), size - 1) if last else size - 1
+    elif last:
+        # The last N bytes
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        return None
+    if start >= size or start > end:
+        msg = f"Range {range_header} is not satisfiable for a file of {size} bytes"
+        raise RangeNotSatisfiableError(msg)
+    return start, end
+
+
+async def storage_file_response(
+    storage_service: StorageService,
+    flow_id: str,
+    file_name: str,
+    *,
+    media_type: str,
+    headers: dict[str, str] | None = None,
+    range_header: str | None = None,
+) -> Response:
+    """Send a file from the storage service, or the part of it asked for by `range_header`.
+
+    Files on the local filesystem are sent by Starlette's FileResponse, which serves ranges
+    itself and lets servers that support it send the file without it passing through Python.
+    Other files are streamed from the storage backend, only fetching the requested range.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    # Also checks that the file exists, before any of the response is sent
+    size = await storage_service.get_file_size(flow_id, file_name)
+    headers = {**(headers or {}), "Accept-Ranges": "bytes"}
+
+    if (path := storage_service.get_local_path(flow_id, file_name)) is not None:
+        return FileResponse(path, media_type=media_type, headers=headers)
+
+    try:
+        byte_range = parse_range(range_header, size)
+    except RangeNotSatisfiableError:
+        return Response(status_code=416, headers={"Content-Range": f"bytes */{size}"})
+    if byte_range is None:
+        return StreamingResponse(
+            storage_service.get_file_stream(flow_id, file_name),
+            media_type=media_type,
+            headers={**headers, "Content-Length": str(size)},
+        )
+    start, end = byte_range
+    return StreamingResponse(
+        storage_service.get_file_stream(flow_id, file_name, start=start, end=end),
+        status_code=206,
+        media_type=media_type,
+        headers={**headers, "Content-Length": str(end - start + 1), "Content-Range": f"bytes {start}-{end}/{size}"},
+    )
+
+
+async def upload_chunks(file: UploadFile, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncGenerator[bytes, None]:
+    """Read an uploaded file in chunks, to save it without holding all of it in memory."""
+    while chunk := await file.read(chunk_size):
+        yield chunk
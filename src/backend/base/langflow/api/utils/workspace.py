@@ -1,12 +1,138 @@
 from typing import Optional
 from uuid import UUID
 
+from cachetools import TTLCache
 from fastapi import HTTPException, status
-from sqlmodel import select, or_
+from sqlmodel import select
 
 from langflow.services.database.models.folder.model import Folder
 from langflow.services.database.models.workspace.model import Workspace, WorkspaceMember
 
+# A role grants everything the roles ranked below it grant. Unknown roles rank as viewers.
+ROLE_RANKS = {"viewer": 0, "editor": 1, "owner": 2}
+# Memberships are cached per process, so changes made through another worker are picked up
+# after at most this many seconds. Changes made through this one invalidate the cache.
+WORKSPACE_ROLES_CACHE_TTL = 30
+WORKSPACE_ROLES_CACHE_MAX_SIZE = 10_000
+
+# The role of each user in every workspace they own or are a member of, by user id
+_workspace_roles_cache: TTLCache[UUID, dict[UUID, str]] = TTLCache(
+    maxsize=WORKSPACE_ROLES_CACHE_MAX_SIZE, ttl=WORKSPACE_ROLES_CACHE_TTL
+)
+
+
+async def _load_workspace_roles(session, user_id: UUID) -> dict[UUID, str]:
+    memberships = (
+        await session.exec(
+            select(WorkspaceMember.workspace_id, WorkspaceMember.role).where(WorkspaceMember.user_id == user_id)
+        )
+    ).all()
+    owned_workspace_ids = (await session.exec(select(Workspace.id).where(Workspace.owner_id == user_id))).all()
+
+    roles = dict(memberships)
+    # The owner of a workspace has every permission, whatever their membership says
+    roles.update(dict.fromkeys(owned_workspace_ids, "owner"))
+    return roles
+
+
+async def get_workspace_roles(session, user_id: UUID, *, refresh: bool = False) -> dict[UUID, str]:
+    """
+    Get the role of a user in every workspace they have access to.
+
+    Args:
+        session: Database session
+        user_id: User ID
+        refresh: Whether to reload the roles even if they are cached
+
+    Returns:
+        The user's role (owner, editor, viewer) by workspace ID
+    """
+    roles = None if refresh else _workspace_roles_cache.get(user_id)
+    if roles is None:
+        roles = await _load_workspace_roles(session, user_id)
+        _workspace_roles_cache[user_id] = roles
+    return roles
+
+
+def invalidate_workspace_roles(*user_ids: UUID) -> None:
+    """
+    Drop cached workspace roles, after memberships or ownerships have changed.
+
+    Args:
+        *user_ids: The users whose roles changed. If none are given, the roles of all users are dropped.
+    """
+    if not user_ids:
+        _workspace_roles_cache.clear()
+        return
+    for user_id in user_ids:
+        _workspace_roles_cache.pop(user_id, None)
+
+
+def has_workspace_role(role: Optional[str], required_role: Optional[str] = None) -> bool:
+    """
+    Check if a role grants the permissions of the required role.
+
+    Args:
+        role: The user's role in a workspace, or None if they have no access
+        required_role: Required role (owner, editor, viewer). If None, any role is allowed.
+
+    Returns:
+        True if the role is sufficient, False otherwise
+    """
+    if role is None:
+        return False
+    if required_role is None:
+        return True
+    return ROLE_RANKS.get(role, ROLE_RANKS["viewer"]) >= ROLE_RANKS[required_role]
+
+
+async def get_workspace_role(session, workspace_id: UUID, user_id: UUID) -> Optional[str]:
+    """
+    Get the role of a user in a workspace.
+
+    Args:
+        session: Database session
+        workspace_id: Workspace ID
+        user_id: User ID
+
+    Returns:
+        The user's role (owner, editor, viewer), or None if they have no access to the workspace
+    """
+    roles = await get_workspace_roles(session, user_id)
+    if workspace_id not in roles:
+        # Access may have been granted since the roles were cached, e.g. by another worker
+        roles = await get_workspace_roles(session, user_id, refresh=True)
+    return roles.get(workspace_id)
+
+
+async def get_accessible_workspace_ids(
+    session,
+    workspace_ids,
+    user_id: UUID,
+    required_role: Optional[str] = None,
+) -> set[UUID]:
+    """
+    Check a user's access to several workspaces at once.
+
+    Args:
+        session: Database session
+        workspace_ids: Workspace IDs
+        user_id: User ID
+        required_role: Required role (owner, editor, viewer). If None, any role is allowed.
+
+    Returns:
+        The IDs of the workspaces the user has the required role in
+    """
+    workspace_ids = set(workspace_ids)
+    roles = await get_workspace_roles(session, user_id)
+    if not workspace_ids <= roles.keys():
+        roles = await get_workspace_roles(session, user_id, refresh=True)
+    return {
+        workspace_id
+        for workspace_id in workspace_ids
+        if has_workspace_role(roles.get(workspace_id), required_role)
+    }
+
 
 async def verify_workspace_access(
     session,
@@ -29,54 +155,21 @@ async def verify_workspace_access(
     Raises:
         HTTPException: If user doesn't have access to the workspace
     """
-    # Check if user is the owner of the workspace
-    workspace = (
-        await session.exec(
-            select(Workspace)
-            .where(
-                Workspace.id == workspace_id,
-                Workspace.owner_id == user_id
-            )
-        )
-    ).first()
+    role = await get_workspace_role(session, workspace_id, user_id)
 
-    if workspace:
-        # User is the owner, they have all permissions
-        return True
-
-    # Check if user is a member of the workspace
-    workspace_member = (
-        await session.exec(
-            select(WorkspaceMember)
-            .where(
-                WorkspaceMember.workspace_id == workspace_id,
-                WorkspaceMember.user_id == user_id
-            )
-        )
-    ).first()
-
-    if not workspace_member:
-        # User is not a member of the workspace
+    if role is None:
+        # User is neither the owner nor a member of the workspace
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Workspace not found or access denied",
         )
 
-    # If a specific role is required, check if user has that role
-    if required_role and workspace_member.role != required_role:
-        # Check if user has a higher role
-        if required_role == "viewer":
-            # Any role can view
-            return True
-        elif required_role == "editor" and workspace_member.role == "owner":
-            # Owner can edit
-            return True
-        else:
-            # User doesn't have the required role
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"You need {required_role} permissions for this action",
-            )
+    if not has_workspace_role(role, required_role):
+        # User doesn't have the required role
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"You need {required_role} permissions for this action",
+        )
 
     return True
 
@@ -0,0 +1,133 @@
+"""Zip archives streamed to the client as their entries are read."""
+
+import asyncio
+import io
+import zipfile
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterable, Iterable
+from datetime import datetime, timezone
+
+ZIP_MEDIA_TYPE = "application/x-zip-compressed"
+
+# Size of the pieces entries are written to the archive in, and so the most that is buffered
+ZIP_CHUNK_SIZE = 64 * 1024
+
+ZipEntry = tuple[str, bytes | AsyncIterable[bytes]]
+
+_END = object()
+
+
+class _ZipChunks(io.RawIOBase):
+    """Unseekable file that collects what zipfile writes until it is drained.
+
+    Being unseekable makes zipfile write each entry's sizes after its data, so nothing has to
+    be rewritten once it was sent.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def stream_zip(
+    entries: AsyncIterable[ZipEntry], *, compression: int = zipfile.ZIP_STORED
+) -> AsyncGenerator[bytes, None]:
+    """Write a zip archive of `entries` and yield it in chunks as it is written.
+
+    Only the entry being written is held in memory, so the size of the archive is not limited
+    by the memory available, and the first bytes are sent as soon as the first entry is read.
+
+    Args:
+        entries: (name, content) of each file in the archive, the content either bytes or an
+            async iterable of chunks of bytes.
+        compression: The zipfile compression method of the entries.
+
+    Yields:
+        The bytes of the archive.
+    """
+    buffer = _ZipChunks()
+    date_time = datetime.now(tz=timezone.utc).astimezone().timetuple()[:6]
+    with zipfile.ZipFile(buffer, "w", compression=compression) as zip_file:
+        async for name, content in entries:
+            info = zipfile.ZipInfo(name, date_time=date_time)
+            info.compress_type = compression
+            if isinstance(content, bytes):
+                info.file_size = len(content)
+                with zip_file.open(info, "w") as entry:
+                    for start in range(0, len(content), ZIP_CHUNK_SIZE):
+                        entry.write(content[start : start + ZIP_CHUNK_SIZE])
+                        yield buffer.drain()
+            else:
+                # The size isn't known until the end, allow it to be over 4GB
+                with zip_file.open(info, "w", force_zip64=True) as entry:
+                    async for chunk in content:
+                        entry.write(chunk)
+                        if data := buffer.drain():
+                            yield data
+            if data := buffer.drain():
+                yield data
+    # The central directory
+    yield buffer.drain()
+
+
+class _ReadAhead:
+    """Reads chunks into a buffer of at most `max_chunks` from a task of its own, ahead of the consumer."""
+
+    def __init__(self, chunks: AsyncIterable[bytes], max_chunks: int) -> None:
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_chunks)
+        self._task = asyncio.create_task(self._fill(chunks))
+
+    async def _fill(self, chunks: AsyncIterable[bytes]) -> None:
+        try:
+            async for chunk in chunks:
+                await self._queue.put(chunk)
+        except Exception as exc:  # noqa: BLE001
+            # Raised to the consumer once it reaches the point the read failed at
+            await self._queue.put(exc)
+        else:
+            await self._queue.put(_END)
+
+    async def __aiter__(self) -> AsyncGenerator[bytes, None]:
+        while (item := await self._queue.get()) is not _END:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    def cancel(self) -> None:
+        self._task.cancel()
+
+
+async def fetch_ahead(
+    entries: Iterable[tuple[str, AsyncIterable[bytes]]], *, limit: int, max_chunks: int
+) -> AsyncGenerator[ZipEntry, None]:
+    """Yield `entries` in order, reading the content of at most `limit` of them at a time.
+
+    While one entry is consumed the next ones are already being read, which hides the latency
+    of opening them, and each holds at most `max_chunks` chunks until it is consumed.
+    """
+    readers: deque[tuple[str, _ReadAhead]] = deque()
+    try:
+        for name, chunks in entries:
+            readers.append((name, _ReadAhead(chunks, max_chunks)))
+            if len(readers) >= limit:
+                yield readers[0]
+                # The next entry is only requested once this one was consumed
+                readers.popleft()
+        while readers:
+            yield readers[0]
+            readers.popleft()
+    finally:
+        for _, reader in readers:
+            reader.cancel()
@@ -6,6 +6,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlmodel import select
 
 from langflow.api.utils import CurrentActiveUser, DbSession
+from langflow.services.book.export_service import BookExportService
 from langflow.services.database.models.book import (
     Book,
     BookCover,
@@ -128,6 +129,7 @@ async def delete_book(
     except Exception as e:
         await session.rollback()
         raise HTTPException(status_code=400, detail=f"Error deleting book: {e}") from e
+    await BookExportService.delete_cached_pdfs(book_id)
 
 
 # Book Cover endpoints
@@ -1,14 +1,31 @@
+import time
+import uuid
 from typing import Annotated, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import StreamingResponse
-import io
 
-from langflow.api.utils import CurrentActiveUser, DbSession
+from fastapi import APIRouter, Depends, Header, Query, status
+from fastapi.responses import Response
+from loguru import logger
+
+from langflow.api.build import get_flow_events_response
+from langflow.api.utils import CurrentActiveUser, DbSession, EventDeliveryType
+from langflow.events.event_manager import EventManager
 from langflow.services.book import BookExportService
+from langflow.services.book.export_service import BookExport
+from langflow.services.deps import get_queue_service
+from langflow.services.job_queue.service import JobQueueService
 
 router = APIRouter(tags=["Book Export"], prefix="/books/{book_id}/export")
 
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches an ETag, using weak comparison."""
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
 @router.get("")
 async def export_book(
     book_id: UUID,
@@ -18,13 +35,18 @@ async def export_book(
     quality: int = Query(300, description="Export quality in DPI"),
     include_cover: bool = Query(True, description="Include cover in export"),
     include_bleed: bool = Query(False, description="Include bleed area for printing"),
-) -> StreamingResponse:
+    if_none_match: Optional[str] = Header(None),
+) -> Response:
     """Export a book as PDF.
 
     This endpoint generates a PDF file for the specified book. The PDF can be customized
     with various options such as including the cover, adding bleed area for printing,
     and setting the quality.
 
+    PDFs are rendered in a worker process and cached by a hash of the book content and the
+    export options, which is also sent as the ETag: a request with a matching If-None-Match
+    header gets a 304 response without the PDF being loaded or rendered.
+
     Args:
         book_id: The ID of the book to export
         session: The database session
@@ -33,18 +55,16 @@ async def export_book(
         quality: The quality of the PDF in DPI
         include_cover: Whether to include the cover in the PDF
         include_bleed: Whether to include bleed area for printing
+        if_none_match: The ETag of a PDF the client already has
 
     Returns:
-        A StreamingResponse containing the PDF file
+        A response containing the PDF file
 
     Raises:
         HTTPException: If the book is not found or the user doesn't have access
     """
-    # Create export service
     export_service = BookExportService(session)
-
-    # Export book as PDF
-    buffer = await export_service.export_book_as_pdf(
+    export = await export_service.prepare_export(
         book_id=book_id,
         user_id=current_user.id,
         include_cover=include_cover,
@@ -53,12 +73,84 @@ async def export_book(
         format=format,
     )
 
-    # Get book name for filename
-    book = await export_service.get_book(book_id, current_user.id)
+    etag = f'"{export.key}"'
+    # Clients have to revalidate, the book may have been edited since
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
-    # Return PDF
-    return StreamingResponse(
-        buffer,
+    pdf = await export_service.get_or_render_pdf(export)
+    return Response(
+        content=pdf,
         media_type="application/pdf",
-        headers={"Content-Disposition": f"attachment; filename={book.name}.pdf"}
+        headers={**headers, "Content-Disposition": f"attachment; filename={export.book_name}.pdf"},
+    )
+
+
+async def run_book_export(event_manager: EventManager, export_service: BookExportService, export: BookExport) -> None:
+    """Render a book's PDF as a job, reporting the rendered pages through the job's event queue."""
+    try:
+        cached = await export_service.get_cached_pdf(export) is not None
+        if not cached:
+            await export_service.render_pdf(
+                export,
+                on_progress=lambda rendered, total: event_manager.on_export_progress(
+                    data={"pages_rendered": rendered, "total_pages": total}
+                ),
+            )
+        event_manager.on_end(data={"etag": f'"{export.key}"', "cached": cached})
+    except Exception as e:  # noqa: BLE001
+        logger.exception(f"Rendering the PDF of book {export.book_name} failed")
+        event_manager.on_error(data={"error": str(e)})
+    finally:
+        await event_manager.queue.put((None, None, time.time()))
+
+
+@router.post("/jobs", status_code=202)
+async def start_book_export(
+    book_id: UUID,
+    session: DbSession,
+    current_user: CurrentActiveUser,
+    queue_service: Annotated[JobQueueService, Depends(get_queue_service)],
+    format: str = Query("pdf", description="Export format (pdf, print-ready)"),
+    quality: int = Query(300, description="Export quality in DPI"),
+    include_cover: bool = Query(True, description="Include cover in export"),
+    include_bleed: bool = Query(False, description="Include bleed area for printing"),
+):
+    """Start rendering a book's PDF in the background.
+
+    Returns a job id whose progress can be followed at `/jobs/{job_id}/events`. Once the job
+    has ended, the PDF is downloaded from the export endpoint with the same options.
+    """
+    export_service = BookExportService(session)
+    export = await export_service.prepare_export(
+        book_id=book_id,
+        user_id=current_user.id,
+        include_cover=include_cover,
+        include_bleed=include_bleed,
+        quality=quality,
+        format=format,
+    )
+
+    job_id = str(uuid.uuid4())
+    _, event_manager = queue_service.create_queue(job_id)
+    event_manager.register_event("on_export_progress", "export_progress")
+    queue_service.start_job(job_id, run_book_export(event_manager, export_service, export))
+    return {"job_id": job_id, "etag": f'"{export.key}"'}
+
+
+@router.get("/jobs/{job_id}/events")
+async def get_book_export_events(
+    book_id: UUID,  # noqa: ARG001
+    job_id: str,
+    current_user: CurrentActiveUser,  # noqa: ARG001
+    queue_service: Annotated[JobQueueService, Depends(get_queue_service)],
+    *,
+    event_delivery: EventDeliveryType = EventDeliveryType.STREAMING,
+):
+    """Get the progress events of a book export job."""
+    return await get_flow_events_response(
+        job_id=job_id,
+        queue_service=queue_service,
+        event_delivery=event_delivery,
     )
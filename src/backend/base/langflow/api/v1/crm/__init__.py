@@ -15,6 +15,7 @@ from .product_import_export import router as product_import_export_router
 from .product_images import router as product_images_router
 from .product_reviews import router as product_reviews_router
 from .ecommerce_integration import router as ecommerce_integration_router
+from .search import router as search_router
 
 __all__ = [
     "clients_router",
@@ -32,4 +33,5 @@ __all__ = [
     "product_images_router",
     "product_reviews_router",
     "ecommerce_integration_router",
+    "search_router",
 ]
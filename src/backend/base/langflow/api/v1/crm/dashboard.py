@@ -1,142 +1,64 @@
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, status
-from sqlalchemy import func, case, cast, Float
-from sqlmodel import select, or_
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import select
 
 from langflow.api.utils import CurrentActiveUser, DbSession
-from langflow.services.database.models.workspace import Workspace, WorkspaceMember
-from langflow.services.database.models.crm.client import Client
-from langflow.services.database.models.crm.invoice import Invoice
-from langflow.services.database.models.crm.opportunity import Opportunity
-from langflow.services.database.models.crm.task import Task
-from langflow.api.v1.crm.cache import cached, invalidate_cache
+from langflow.api.v1.crm.utils import check_workspace_access
+from langflow.services.database.models.crm.rollup import CRMActivity, WorkspaceStats, rebuild_workspace_stats
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
-async def check_workspace_access(session: DbSession, workspace_id: UUID, current_user: CurrentActiveUser):
-    """Check if the user has access to the workspace and return the workspace if they do."""
-    workspace = (
-        await session.exec(
-            select(Workspace)
-            .where(
-                Workspace.id == workspace_id,
-                or_(
-                    Workspace.owner_id == current_user.id,
-                    Workspace.id.in_(
-                        select(WorkspaceMember.workspace_id)
-                        .where(WorkspaceMember.user_id == current_user.id)
-                    )
-                )
-            )
-        )
-    ).first()
-
-    if not workspace:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Workspace not found or access denied",
-        )
 
-    return workspace
+async def get_rolled_up_stats(session, workspace_id: UUID) -> WorkspaceStats:
+    """Get the counters of a workspace, building them if no CRM record was written since they were added."""
+    stats = await session.get(WorkspaceStats, workspace_id)
+    if stats is None:
+        try:
+            await rebuild_workspace_stats(session, [workspace_id])
+            await session.commit()
+        except IntegrityError:
+            # Built by a concurrent request
+            await session.rollback()
+        stats = await session.get(WorkspaceStats, workspace_id)
+    return stats
 
 
 @router.get("/workspace/{workspace_id}/stats", status_code=200)
-@cached(ttl_seconds=300)  # Cache for 5 minutes
 async def get_workspace_stats(
     *,
     session: DbSession,
     workspace_id: UUID,
     current_user: CurrentActiveUser,
 ):
-    """Get statistics for a specific workspace."""
+    """Get statistics for a specific workspace.
+
+    The counters are maintained as CRM records are written, so this is a single row read.
+    """
     try:
         # Check if user has access to the workspace
         await check_workspace_access(session, workspace_id, current_user)
 
-        # Get all stats in a single query using a dictionary of aggregations
-
-        # Client stats
-        client_stats = (
-            await session.exec(
-                select(
-                    func.count().label("total_count"),
-                    func.sum(case((Client.status == "active", 1), else_=0)).label("active_count")
-                )
-                .where(Client.workspace_id == workspace_id)
-            )
-        ).one()
-
-        client_count = client_stats[0] if client_stats else 0
-        active_client_count = client_stats[1] if client_stats and len(client_stats) > 1 else 0
-
-        # Invoice stats
-        invoice_stats = (
-            await session.exec(
-                select(
-                    func.count().label("total_count"),
-                    func.sum(case((Invoice.status == "paid", Invoice.amount), else_=0)).label("total_revenue")
-                )
-                .where(Invoice.workspace_id == workspace_id)
-            )
-        ).one()
-
-        invoice_count = invoice_stats[0] if invoice_stats else 0
-        total_revenue = invoice_stats[1] if invoice_stats and len(invoice_stats) > 1 and invoice_stats[1] is not None else 0
-
-        # Opportunity stats
-        opportunity_stats = (
-            await session.exec(
-                select(
-                    func.count().label("total_count"),
-                    func.sum(
-                        case(
-                            (Opportunity.status.in_(["new", "qualified", "proposal", "negotiation"]),
-                             cast(Opportunity.value, Float)),
-                            else_=0
-                        )
-                    ).label("open_value")
-                )
-                .where(Opportunity.workspace_id == workspace_id)
-            )
-        ).one()
-
-        opportunity_count = opportunity_stats[0] if opportunity_stats else 0
-        open_opportunity_value = opportunity_stats[1] if opportunity_stats and len(opportunity_stats) > 1 and opportunity_stats[1] is not None else 0
-
-        # Task stats
-        task_stats = (
-            await session.exec(
-                select(
-                    func.sum(case((Task.status == "open", 1), else_=0)).label("open_count"),
-                    func.sum(case((Task.status == "in_progress", 1), else_=0)).label("in_progress_count"),
-                    func.sum(case((Task.status == "completed", 1), else_=0)).label("completed_count")
-                )
-                .where(Task.workspace_id == workspace_id)
-            )
-        ).one()
-
-        open_tasks = task_stats[0] if task_stats and task_stats[0] is not None else 0
-        in_progress_tasks = task_stats[1] if task_stats and len(task_stats) > 1 and task_stats[1] is not None else 0
-        completed_tasks = task_stats[2] if task_stats and len(task_stats) > 2 and task_stats[2] is not None else 0
+        stats = await get_rolled_up_stats(session, workspace_id)
 
         return {
             "clients": {
-                "total": client_count,
-                "active": active_client_count,
+                "total": stats.client_count,
+                "active": stats.active_client_count,
             },
             "invoices": {
-                "total": invoice_count,
-                "revenue": total_revenue,
+                "total": stats.invoice_count,
+                "revenue": stats.paid_invoice_total,
             },
             "opportunities": {
-                "total": opportunity_count,
-                "open_value": open_opportunity_value,
+                "total": stats.opportunity_count,
+                "open_value": stats.open_opportunity_value,
             },
             "tasks": {
-                "open": open_tasks,
-                "in_progress": in_progress_tasks,
-                "completed": completed_tasks,
+                "open": stats.open_task_count,
+                "in_progress": stats.in_progress_task_count,
+                "completed": stats.completed_task_count,
             }
         }
     except Exception as e:
@@ -149,7 +71,6 @@ async def get_workspace_stats(
 
 
 @router.get("/workspace/{workspace_id}/client-distribution", status_code=200)
-@cached(ttl_seconds=300)  # Cache for 5 minutes
 async def get_client_distribution(
     *,
     session: DbSession,
@@ -161,34 +82,13 @@ async def get_client_distribution(
         # Check if user has access to the workspace
         await check_workspace_access(session, workspace_id, current_user)
 
-        # Get client count by status in a single query using GROUP BY
-
-        # Query to get counts by status
-        client_distribution = {}
-
-        # First, get all possible statuses to ensure we have entries for all
-        possible_statuses = ["active", "inactive", "lead"]
-        for status in possible_statuses:
-            client_distribution[status] = 0
-
-        # Then get the actual counts from the database
-        status_counts = (
-            await session.exec(
-                select(
-                    Client.status,
-                    func.count().label("count")
-                )
-                .where(Client.workspace_id == workspace_id)
-                .group_by(Client.status)
-            )
-        ).all()
-
-        # Update the distribution dictionary with actual counts
-        for status, count in status_counts:
-            if status in client_distribution:
-                client_distribution[status] = count
+        stats = await get_rolled_up_stats(session, workspace_id)
 
-        return client_distribution
+        return {
+            "active": stats.active_client_count,
+            "inactive": stats.inactive_client_count,
+            "lead": stats.lead_client_count,
+        }
     except Exception as e:
         if isinstance(e, HTTPException):
             raise e
@@ -199,7 +99,6 @@ async def get_client_distribution(
 
 
 @router.get("/workspace/{workspace_id}/recent-activity", status_code=200)
-@cached(ttl_seconds=60)  # Cache for 1 minute (shorter time since this data changes more frequently)
 async def get_recent_activity(
     *,
     session: DbSession,
@@ -207,101 +106,35 @@ async def get_recent_activity(
     current_user: CurrentActiveUser,
     limit: int = 10,
 ):
-    """Get recent activity for a specific workspace."""
+    """Get recent activity for a specific workspace.
+
+    Reads the activity feed, which has an entry for every client, invoice, opportunity and
+    task that was created, updated or deleted.
+    """
     try:
         # Check if user has access to the workspace
         await check_workspace_access(session, workspace_id, current_user)
 
-        # Get recent clients
-        recent_clients = (
-            await session.exec(
-                select(Client)
-                .where(Client.workspace_id == workspace_id)
-                .order_by(Client.created_at.desc())
-                .limit(limit)
-            )
-        ).all()
-
-        # Get recent invoices
-        recent_invoices = (
-            await session.exec(
-                select(Invoice)
-                .where(Invoice.workspace_id == workspace_id)
-                .order_by(Invoice.created_at.desc())
-                .limit(limit)
-            )
-        ).all()
-
-        # Get recent opportunities
-        recent_opportunities = (
+        recent_activities = (
             await session.exec(
-                select(Opportunity)
-                .where(Opportunity.workspace_id == workspace_id)
-                .order_by(Opportunity.created_at.desc())
+                select(CRMActivity)
+                .where(CRMActivity.workspace_id == workspace_id)
+                .order_by(CRMActivity.created_at.desc())
                 .limit(limit)
             )
         ).all()
 
-        # Get recent tasks
-        recent_tasks = (
-            await session.exec(
-                select(Task)
-                .where(Task.workspace_id == workspace_id)
-                .order_by(Task.created_at.desc())
-                .limit(limit)
-            )
-        ).all()
-
-        # Combine and sort all recent activities
-        activities = []
-
-        for client in recent_clients:
-            activities.append({
-                "type": "client",
-                "id": str(client.id),
-                "name": client.name,
-                "created_at": client.created_at,
-                "created_by": str(client.created_by),
-            })
-
-        for invoice in recent_invoices:
-            activities.append({
-                "type": "invoice",
-                "id": str(invoice.id),
-                "invoice_number": invoice.invoice_number,
-                "amount": invoice.amount,
-                "status": invoice.status,
-                "created_at": invoice.created_at,
-                "created_by": str(invoice.created_by),
-            })
-
-        for opportunity in recent_opportunities:
-            activities.append({
-                "type": "opportunity",
-                "id": str(opportunity.id),
-                "name": opportunity.name,
-                "value": opportunity.value,
-                "status": opportunity.status,
-                "created_at": opportunity.created_at,
-                "created_by": str(opportunity.created_by),
-            })
-
-        for task in recent_tasks:
-            activities.append({
-                "type": "task",
-                "id": str(task.id),
-                "title": task.title,
-                "status": task.status,
-                "priority": task.priority,
-                "created_at": task.created_at,
-                "created_by": str(task.created_by),
-            })
-
-        # Sort by created_at (newest first) and limit to requested number
-        activities.sort(key=lambda x: x["created_at"], reverse=True)
-        activities = activities[:limit]
-
-        return activities
+        return [
+            {
+                "type": activity.entity_type,
+                "id": str(activity.entity_id),
+                "action": activity.action,
+                **(activity.details or {}),
+                "created_at": activity.created_at,
+                "created_by": str(activity.created_by) if activity.created_by else None,
+            }
+            for activity in recent_activities
+        ]
     except Exception as e:
         if isinstance(e, HTTPException):
             raise e
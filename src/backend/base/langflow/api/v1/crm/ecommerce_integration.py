@@ -1,18 +1,35 @@
+import time
+import uuid
+from datetime import datetime
 from uuid import UUID
 import json
-from typing import Dict, List, Optional, Any
+from typing import Annotated, Dict, List, Literal, Optional, Any
 import httpx
-from fastapi import APIRouter, HTTPException, status, Query, Body
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Body
+from loguru import logger
+from pydantic import BaseModel, Field
 
-from langflow.api.utils import CurrentActiveUser, DbSession
-from langflow.services.database.models.crm.product import (
-    Product,
-    ProductCreate,
+from langflow.api.build import get_flow_events_response
+from langflow.api.utils import CurrentActiveUser, DbSession, EventDeliveryType
+from langflow.api.v1.crm.ecommerce_sync import (
+    DEFAULT_MAX_CONCURRENT_FETCHES,
+    DEFAULT_PAGE_SIZE,
+    CatalogSource,
+    ShopifySource,
+    WooCommerceSource,
+    map_products,
+    shopify_product_data,
+    sync_catalog,
+    upsert_products,
+    woocommerce_product_data,
 )
 from langflow.api.v1.crm.utils import (
     check_workspace_access,
 )
 from langflow.api.v1.crm.error_handling import handle_exceptions
+from langflow.events.event_manager import EventManager
+from langflow.services.deps import get_http_client_service, get_queue_service
+from langflow.services.job_queue.service import JobQueueService
 
 router = APIRouter(prefix="/ecommerce-integration", tags=["E-commerce Integration"])
 
@@ -44,98 +61,38 @@ async def import_woocommerce_products(
     
     try:
         # Make API request to WooCommerce
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                api_url,
-                params=params,
-                auth=(consumer_key, consumer_secret),
-                timeout=30.0,
-            )
-            
-            # Check if request was successful
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"WooCommerce API request failed: {response.text}",
-                )
-            
-            # Parse response
-            woo_products = response.json()
+        response = await get_http_client_service().get(
+            api_url,
+            params=params,
+            auth=(consumer_key, consumer_secret),
+            timeout=30.0,
+        )
             
-            # Import products
-            imported_products = []
-            errors = []
+        # Check if request was successful
+        if response.status_code != 200:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"WooCommerce API request failed: {response.text}",
+            )
             
-            for woo_product in woo_products:
-                try:
-                    # Map WooCommerce product to our product model
-                    product_data = {
-                        "name": woo_product.get("name", ""),
-                        "slug": woo_product.get("slug", ""),
-                        "description": woo_product.get("description", ""),
-                        "short_description": woo_product.get("short_description", ""),
-                        "sku": woo_product.get("sku", ""),
-                        "price": float(woo_product.get("price", 0)),
-                        "regular_price": float(woo_product.get("regular_price", 0)) if woo_product.get("regular_price") else 0,
-                        "sale_price": float(woo_product.get("sale_price", 0)) if woo_product.get("sale_price") else None,
-                        "on_sale": woo_product.get("on_sale", False),
-                        "status": woo_product.get("status", "publish"),
-                        "featured": woo_product.get("featured", False),
-                        "catalog_visibility": woo_product.get("catalog_visibility", "visible"),
-                        "tax_status": woo_product.get("tax_status", "taxable"),
-                        "tax_class": woo_product.get("tax_class", ""),
-                        "manage_stock": woo_product.get("manage_stock", False),
-                        "stock_quantity": woo_product.get("stock_quantity", None),
-                        "stock_status": woo_product.get("stock_status", "instock"),
-                        "backorders": woo_product.get("backorders", "no"),
-                        "backorders_allowed": woo_product.get("backorders_allowed", False),
-                        "backordered": woo_product.get("backordered", False),
-                        "weight": woo_product.get("weight", ""),
-                        "dimensions": woo_product.get("dimensions", {}),
-                        "shipping_class": woo_product.get("shipping_class", ""),
-                        "shipping_class_id": woo_product.get("shipping_class_id", None),
-                        "virtual": woo_product.get("virtual", False),
-                        "downloadable": woo_product.get("downloadable", False),
-                        "downloads": woo_product.get("downloads", []),
-                        "download_limit": woo_product.get("download_limit", -1),
-                        "download_expiry": woo_product.get("download_expiry", -1),
-                        "sold_individually": woo_product.get("sold_individually", False),
-                        "external_url": woo_product.get("external_url", ""),
-                        "button_text": woo_product.get("button_text", ""),
-                        "menu_order": woo_product.get("menu_order", 0),
-                        "purchasable": woo_product.get("purchasable", True),
-                        "images": woo_product.get("images", []),
-                        "workspace_id": str(workspace_id),
-                    }
-                    
-                    # Create product
-                    product_create = ProductCreate(**product_data)
-                    db_product = Product.model_validate(product_create)
-                    db_product.created_by = current_user.id
-                    
-                    # Add to session
-                    session.add(db_product)
-                    await session.commit()
-                    await session.refresh(db_product)
-                    
-                    imported_products.append(db_product)
-                except Exception as e:
-                    # Rollback session
-                    await session.rollback()
-                    
-                    # Add error to list
-                    errors.append({
-                        "product": woo_product.get("name", "Unknown"),
-                        "error": str(e)
-                    })
+        # Parse response
+        woo_products = response.json()
             
-            # Return results
-            return {
-                "success": len(imported_products),
-                "errors": len(errors),
-                "error_details": errors,
-                "products": [p.model_dump() for p in imported_products]
-            }
+        # Import products
+        products_data, errors = map_products(woo_products, woocommerce_product_data, workspace_id)
+        created, updated, upsert_errors = await upsert_products(
+            session, products_data, workspace_id=workspace_id, user_id=current_user.id
+        )
+        errors += upsert_errors
+        imported_products = created + updated
+
+        # Return results
+        return {
+            "success": len(imported_products),
+            "errors": len(errors),
+            "error_details": errors,
+            "products": [p.model_dump() for p in imported_products]
+        }
     except httpx.RequestError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -174,116 +131,157 @@ async def import_shopify_products(
     
     try:
         # Make API request to Shopify
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                api_url,
-                params=params,
-                headers=headers,
-                timeout=30.0,
-            )
-            
-            # Check if request was successful
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Shopify API request failed: {response.text}",
-                )
-            
-            # Parse response
-            shopify_data = response.json()
-            shopify_products = shopify_data.get("products", [])
+        response = await get_http_client_service().get(
+            api_url,
+            params=params,
+            headers=headers,
+            timeout=30.0,
+        )
             
-            # Import products
-            imported_products = []
-            errors = []
+        # Check if request was successful
+        if response.status_code != 200:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Shopify API request failed: {response.text}",
+            )
             
-            for shopify_product in shopify_products:
-                try:
-                    # Get first variant for pricing info
-                    variant = shopify_product.get("variants", [{}])[0]
-                    
-                    # Map Shopify product to our product model
-                    product_data = {
-                        "name": shopify_product.get("title", ""),
-                        "slug": shopify_product.get("handle", ""),
-                        "description": shopify_product.get("body_html", ""),
-                        "short_description": "",
-                        "sku": variant.get("sku", ""),
-                        "price": float(variant.get("price", 0)),
-                        "regular_price": float(variant.get("compare_at_price", 0)) if variant.get("compare_at_price") else float(variant.get("price", 0)),
-                        "sale_price": float(variant.get("price", 0)) if variant.get("compare_at_price") else None,
-                        "on_sale": bool(variant.get("compare_at_price")),
-                        "status": "publish" if shopify_product.get("status") == "active" else "draft",
-                        "featured": shopify_product.get("published", False),
-                        "catalog_visibility": "visible",
-                        "tax_status": "taxable",
-                        "tax_class": "",
-                        "manage_stock": variant.get("inventory_management") == "shopify",
-                        "stock_quantity": variant.get("inventory_quantity", None),
-                        "stock_status": "instock" if variant.get("inventory_quantity", 0) > 0 else "outofstock",
-                        "backorders": "no",
-                        "backorders_allowed": False,
-                        "backordered": False,
-                        "weight": str(variant.get("weight", "")),
-                        "dimensions": {
-                            "length": "",
-                            "width": "",
-                            "height": "",
-                        },
-                        "shipping_class": "",
-                        "shipping_class_id": None,
-                        "virtual": False,
-                        "downloadable": False,
-                        "downloads": [],
-                        "download_limit": -1,
-                        "download_expiry": -1,
-                        "sold_individually": False,
-                        "external_url": "",
-                        "button_text": "",
-                        "menu_order": 0,
-                        "purchasable": True,
-                        "images": [
-                            {
-                                "id": str(img.get("id", "")),
-                                "src": img.get("src", ""),
-                                "name": img.get("alt", ""),
-                                "alt": img.get("alt", ""),
-                            }
-                            for img in shopify_product.get("images", [])
-                        ],
-                        "workspace_id": str(workspace_id),
-                    }
-                    
-                    # Create product
-                    product_create = ProductCreate(**product_data)
-                    db_product = Product.model_validate(product_create)
-                    db_product.created_by = current_user.id
-                    
-                    # Add to session
-                    session.add(db_product)
-                    await session.commit()
-                    await session.refresh(db_product)
-                    
-                    imported_products.append(db_product)
-                except Exception as e:
-                    # Rollback session
-                    await session.rollback()
-                    
-                    # Add error to list
-                    errors.append({
-                        "product": shopify_product.get("title", "Unknown"),
-                        "error": str(e)
-                    })
+        # Parse response
+        shopify_data = response.json()
+        shopify_products = shopify_data.get("products", [])
             
-            # Return results
-            return {
-                "success": len(imported_products),
-                "errors": len(errors),
-                "error_details": errors,
-                "products": [p.model_dump() for p in imported_products]
-            }
+        # Import products
+        products_data, errors = map_products(shopify_products, shopify_product_data, workspace_id)
+        created, updated, upsert_errors = await upsert_products(
+            session, products_data, workspace_id=workspace_id, user_id=current_user.id
+        )
+        errors += upsert_errors
+        imported_products = created + updated
+
+        # Return results
+        return {
+            "success": len(imported_products),
+            "errors": len(errors),
+            "error_details": errors,
+            "products": [p.model_dump() for p in imported_products]
+        }
     except httpx.RequestError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error connecting to Shopify: {str(e)}",
         )
+
+
+class CatalogSyncRequest(BaseModel):
+    """Request to sync the catalog of a WooCommerce or Shopify store."""
+    source: Literal["woocommerce", "shopify"]
+    site_url: str = Field(..., description="WooCommerce site URL or Shopify shop domain")
+    consumer_key: Optional[str] = Field(None, description="WooCommerce consumer key")
+    consumer_secret: Optional[str] = Field(None, description="WooCommerce consumer secret")
+    access_token: Optional[str] = Field(None, description="Shopify access token")
+    updated_after: Optional[datetime] = Field(
+        None, description="Only sync products changed after this time, defaults to the last sync checkpoint"
+    )
+    full_sync: bool = Field(False, description="Sync the whole catalog, ignoring the last sync checkpoint")
+    page_size: int = Field(DEFAULT_PAGE_SIZE, ge=1, le=250)
+    max_concurrency: int = Field(DEFAULT_MAX_CONCURRENT_FETCHES, ge=1, le=16)
+
+
+def _catalog_source(sync_request: CatalogSyncRequest) -> CatalogSource:
+    if sync_request.source == "woocommerce":
+        if not sync_request.consumer_key or not sync_request.consumer_secret:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="consumer_key and consumer_secret are required to sync from WooCommerce",
+            )
+        return WooCommerceSource(
+            sync_request.site_url,
+            sync_request.consumer_key,
+            sync_request.consumer_secret,
+            page_size=sync_request.page_size,
+            max_concurrency=sync_request.max_concurrency,
+        )
+    if not sync_request.access_token:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="access_token is required to sync from Shopify",
+        )
+    return ShopifySource(sync_request.site_url, sync_request.access_token, page_size=sync_request.page_size)
+
+
+async def run_catalog_sync(
+    event_manager: EventManager,
+    source: CatalogSource,
+    *,
+    workspace_id: UUID,
+    user_id: UUID,
+    updated_after: Optional[datetime],
+    incremental: bool,
+) -> None:
+    """Run a catalog sync as a job, reporting its progress through the job's event queue."""
+    try:
+        progress = await sync_catalog(
+            source,
+            workspace_id=workspace_id,
+            user_id=user_id,
+            updated_after=updated_after,
+            incremental=incremental,
+            on_progress=lambda progress: event_manager.on_sync_progress(data=progress.to_dict()),
+        )
+        event_manager.on_end(data=progress.to_dict())
+    except Exception as e:  # noqa: BLE001
+        logger.exception(f"Catalog sync from {source.name} failed")
+        event_manager.on_error(data={"error": str(e)})
+    finally:
+        await event_manager.queue.put((None, None, time.time()))
+
+
+@router.post("/sync", status_code=202)
+@handle_exceptions
+async def start_catalog_sync(
+    *,
+    session: DbSession,
+    current_user: CurrentActiveUser,
+    workspace_id: UUID,
+    sync_request: CatalogSyncRequest,
+    queue_service: Annotated[JobQueueService, Depends(get_queue_service)],
+):
+    """Start syncing the catalog of a store in the background.
+
+    The whole catalog is paged through, or only the products changed since the last sync,
+    and products are upserted by SKU. Returns a job id whose progress can be followed at
+    `/sync/{job_id}/events`.
+    """
+    await check_workspace_access(session, workspace_id, current_user, require_edit_permission=True)
+    source = _catalog_source(sync_request)
+
+    job_id = str(uuid.uuid4())
+    _, event_manager = queue_service.create_queue(job_id)
+    event_manager.register_event("on_sync_progress", "sync_progress")
+    queue_service.start_job(
+        job_id,
+        run_catalog_sync(
+            event_manager,
+            source,
+            workspace_id=workspace_id,
+            user_id=current_user.id,
+            updated_after=sync_request.updated_after,
+            incremental=not sync_request.full_sync,
+        ),
+    )
+    return {"job_id": job_id}
+
+
+@router.get("/sync/{job_id}/events")
+async def get_catalog_sync_events(
+    job_id: str,
+    current_user: CurrentActiveUser,  # noqa: ARG001
+    queue_service: Annotated[JobQueueService, Depends(get_queue_service)],
+    *,
+    event_delivery: EventDeliveryType = EventDeliveryType.STREAMING,
+):
+    """Get the progress events of a catalog sync job."""
+    return await get_flow_events_response(
+        job_id=job_id,
+        queue_service=queue_service,
+        event_delivery=event_delivery,
+    )
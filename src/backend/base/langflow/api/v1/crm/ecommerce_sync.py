@@ -0,0 +1,427 @@
+"""Catalog sync from WooCommerce and Shopify stores.
+
+A sync pages through the whole remote catalog, or only the products changed since a
+checkpoint, and upserts them in batches. Products are matched by SKU, or by slug when
+they have no SKU, so syncing the same store twice updates products instead of
+duplicating them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+
+from loguru import logger
+from pydantic import ValidationError
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from langflow.services.database.models.crm.catalog_sync import CatalogSyncCheckpoint
+from langflow.services.database.models.crm.product import Product, ProductCreate
+from langflow.services.deps import get_http_client_service, session_scope
+
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_MAX_CONCURRENT_FETCHES = 4
+# Number of products written to the database per transaction
+UPSERT_BATCH_SIZE = 200
+SHOPIFY_API_VERSION = "2023-04"
+SHOPIFY_MAX_PAGE_SIZE = 250
+WOOCOMMERCE_MAX_PAGE_SIZE = 100
+# Fields that are not columns of the product table
+_NON_PRODUCT_FIELDS = {"workspace_id", "category_ids", "attribute_ids"}
+
+
+class CatalogSyncError(Exception):
+    """Raised when the remote store can't be read."""
+
+
+def woocommerce_product_data(woo_product: dict[str, Any], workspace_id: UUID | str) -> dict[str, Any]:
+    """Map a product of the WooCommerce REST API to the fields of `ProductCreate`."""
+    return {
+        "name": woo_product.get("name", ""),
+        "slug": woo_product.get("slug", ""),
+        "description": woo_product.get("description", ""),
+        "short_description": woo_product.get("short_description", ""),
+        "sku": woo_product.get("sku", ""),
+        "price": float(woo_product.get("price") or 0),
+        "regular_price": float(woo_product.get("regular_price", 0)) if woo_product.get("regular_price") else 0,
+        "sale_price": float(woo_product.get("sale_price", 0)) if woo_product.get("sale_price") else None,
+        "on_sale": woo_product.get("on_sale", False),
+        "status": woo_product.get("status", "publish"),
+        "featured": woo_product.get("featured", False),
+        "catalog_visibility": woo_product.get("catalog_visibility", "visible"),
+        "tax_status": woo_product.get("tax_status", "taxable"),
+        "tax_class": woo_product.get("tax_class", ""),
+        "manage_stock": woo_product.get("manage_stock", False),
+        "stock_quantity": woo_product.get("stock_quantity"),
+        "stock_status": woo_product.get("stock_status", "instock"),
+        "backorders": woo_product.get("backorders", "no"),
+        "backorders_allowed": woo_product.get("backorders_allowed", False),
+        "backordered": woo_product.get("backordered", False),
+        "weight": woo_product.get("weight", ""),
+        "dimensions": woo_product.get("dimensions", {}),
+        "shipping_class": woo_product.get("shipping_class", ""),
+        "shipping_class_id": woo_product.get("shipping_class_id"),
+        "virtual": woo_product.get("virtual", False),
+        "downloadable": woo_product.get("downloadable", False),
+        "downloads": woo_product.get("downloads", []),
+        "download_limit": woo_product.get("download_limit", -1),
+        "download_expiry": woo_product.get("download_expiry", -1),
+        "sold_individually": woo_product.get("sold_individually", False),
+        "external_url": woo_product.get("external_url", ""),
+        "button_text": woo_product.get("button_text", ""),
+        "menu_order": woo_product.get("menu_order", 0),
+        "purchasable": woo_product.get("purchasable", True),
+        "images": woo_product.get("images", []),
+        "workspace_id": str(workspace_id),
+    }
+
+
+def shopify_product_data(shopify_product: dict[str, Any], workspace_id: UUID | str) -> dict[str, Any]:
+    """Map a product of the Shopify Admin API to the fields of `ProductCreate`.
+
+    Prices and stock come from the first variant of the product.
+    """
+    variant = (shopify_product.get("variants") or [{}])[0]
+    return {
+        "name": shopify_product.get("title", ""),
+        "slug": shopify_product.get("handle", ""),
+        "description": shopify_product.get("body_html", ""),
+        "short_description": "",
+        "sku": variant.get("sku", ""),
+        "price": float(variant.get("price") or 0),
+        "regular_price": float(variant.get("compare_at_price", 0))
+        if variant.get("compare_at_price")
+        else float(variant.get("price") or 0),
+        "sale_price": float(variant.get("price") or 0) if variant.get("compare_at_price") else None,
+        "on_sale": bool(variant.get("compare_at_price")),
+        "status": "publish" if shopify_product.get("status") == "active" else "draft",
+        "featured": shopify_product.get("published", False),
+        "catalog_visibility": "visible",
+        "tax_status": "taxable",
+        "tax_class": "",
+        "manage_stock": variant.get("inventory_management") == "shopify",
+        "stock_quantity": variant.get("inventory_quantity"),
+        "stock_status": "instock" if (variant.get("inventory_quantity") or 0) > 0 else "outofstock",
+        "backorders": "no",
+        "backorders_allowed": False,
+        "backordered": False,
+        "weight": str(variant.get("weight", "")),
+        "dimensions": {
+            "length": "",
+            "width": "",
+            "height": "",
+        },
+        "shipping_class": "",
+        "shipping_class_id": None,
+        "virtual": False,
+        "downloadable": False,
+        "downloads": [],
+        "download_limit": -1,
+        "download_expiry": -1,
+        "sold_individually": False,
+        "external_url": "",
+        "button_text": "",
+        "menu_order": 0,
+        "purchasable": True,
+        "images": [
+            {
+                "id": str(img.get("id", "")),
+                "src": img.get("src", ""),
+                "name": img.get("alt", ""),
+                "alt": img.get("alt", ""),
+            }
+            for img in shopify_product.get("images", [])
+        ],
+        "workspace_id": str(workspace_id),
+    }
+
+
+def map_products(
+    raw_products: list[dict[str, Any]],
+    to_product_data: Callable[[dict[str, Any], UUID | str], dict[str, Any]],
+    workspace_id: UUID | str,
+) -> tuple[list[dict[str, Any]], list[dict[str, str]]]:
+    """Map raw products with `to_product_data`, collecting the products that can't be mapped."""
+    products_data: list[dict[str, Any]] = []
+    errors: list[dict[str, str]] = []
+    for raw_product in raw_products:
+        try:
+            products_data.append(to_product_data(raw_product, workspace_id))
+        except (ValueError, TypeError, AttributeError, IndexError) as exc:
+            name = raw_product.get("name") or raw_product.get("title") or "Unknown"
+            errors.append({"product": str(name), "error": str(exc)})
+    return products_data, errors
+
+
+class CatalogSource:
+    """A remote store whose catalog can be paged through."""
+
+    name: str
+    site: str
+
+    def fetch_pages(self, updated_after: datetime | None = None) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield pages of raw products, only those changed after `updated_after` if given."""
+        raise NotImplementedError
+
+    def to_product_data(self, raw_product: dict[str, Any], workspace_id: UUID | str) -> dict[str, Any]:
+        raise NotImplementedError
+
+    @staticmethod
+    async def _get(url: str, **kwargs) -> Any:
+        response = await get_http_client_service().get(url, timeout=30.0, **kwargs)
+        if response.status_code != 200:  # noqa: PLR2004
+            msg = f"Request to {url} failed with status {response.status_code}: {response.text[:500]}"
+            raise CatalogSyncError(msg)
+        return response
+
+
+class WooCommerceSource(CatalogSource):
+    """Pages through the WooCommerce REST API.
+
+    Pages are numbered, so once the first page tells the number of pages, the others are
+    fetched `max_concurrency` at a time.
+    """
+
+    name = "woocommerce"
+
+    def __init__(
+        self,
+        site_url: str,
+        consumer_key: str,
+        consumer_secret: str,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_FETCHES,
+    ) -> None:
+        self.site = site_url.rstrip("/")
+        self.api_url = f"{self.site}/wp-json/wc/v3/products"
+        self.auth = (consumer_key, consumer_secret)
+        self.page_size = min(max(page_size, 1), WOOCOMMERCE_MAX_PAGE_SIZE)
+        self.max_concurrency = max(max_concurrency, 1)
+
+    async def _fetch_page(self, page: int, updated_after: datetime | None):
+        params: dict[str, Any] = {"per_page": self.page_size, "page": page, "orderby": "id", "order": "asc"}
+        if updated_after is not None:
+            # Without dates_are_gmt, modified_after is read in the store's timezone
+            params["modified_after"] = updated_after.astimezone(timezone.utc).isoformat()
+            params["dates_are_gmt"] = "true"
+        return await self._get(self.api_url, params=params, auth=self.auth)
+
+    async def fetch_pages(self, updated_after: datetime | None = None) -> AsyncIterator[list[dict[str, Any]]]:
+        first_page = await self._fetch_page(1, updated_after)
+        yield first_page.json()
+        total_pages = int(first_page.headers.get("X-WP-TotalPages") or 1)
+        for start in range(2, total_pages + 1, self.max_concurrency):
+            pages = range(start, min(start + self.max_concurrency, total_pages + 1))
+            responses = await asyncio.gather(*(self._fetch_page(page, updated_after) for page in pages))
+            for response in responses:
+                yield response.json()
+
+    def to_product_data(self, raw_product: dict[str, Any], workspace_id: UUID | str) -> dict[str, Any]:
+        return woocommerce_product_data(raw_product, workspace_id)
+
+
+class ShopifySource(CatalogSource):
+    """Pages through the Shopify Admin API.
+
+    Shopify paginates with a cursor in the `Link` header, so pages are fetched one after
+    the other; `sync_catalog` still overlaps fetching with writing to the database.
+    """
+
+    name = "shopify"
+
+    def __init__(self, shop_url: str, access_token: str, *, page_size: int = DEFAULT_PAGE_SIZE) -> None:
+        self.site = shop_url.replace("https://", "").replace("http://", "").rstrip("/")
+        self.api_url = f"https://{self.site}/admin/api/{SHOPIFY_API_VERSION}/products.json"
+        self.headers = {"X-Shopify-Access-Token": access_token, "Content-Type": "application/json"}
+        self.page_size = min(max(page_size, 1), SHOPIFY_MAX_PAGE_SIZE)
+
+    async def fetch_pages(self, updated_after: datetime | None = None) -> AsyncIterator[list[dict[str, Any]]]:
+        params: dict[str, Any] | None = {"limit": self.page_size}
+        if updated_after is not None:
+            params["updated_at_min"] = updated_after.isoformat()
+        url: str | None = self.api_url
+        while url:
+            response = await self._get(url, params=params, headers=self.headers)
+            yield response.json().get("products", [])
+            # The next page URL carries the cursor and all the filters
+            url = response.links.get("next", {}).get("url")
+            params = None
+
+    def to_product_data(self, raw_product: dict[str, Any], workspace_id: UUID | str) -> dict[str, Any]:
+        return shopify_product_data(raw_product, workspace_id)
+
+
+@dataclass
+class SyncProgress:
+    pages: int = 0
+    fetched: int = 0
+    created: int = 0
+    updated: int = 0
+    failed: int = 0
+    errors: list[dict[str, str]] = field(default_factory=list)
+    checkpoint: datetime | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def _product_key(product_data: dict[str, Any], position: int) -> tuple[str, str]:
+    if product_data.get("sku"):
+        return "sku", product_data["sku"]
+    if product_data.get("slug"):
+        return "slug", product_data["slug"]
+    # Nothing to match on, so the product is always created
+    return "new", str(position)
+
+
+async def upsert_products(
+    session: AsyncSession,
+    products_data: list[dict[str, Any]],
+    *,
+    workspace_id: UUID | str,
+    user_id: UUID | str,
+) -> tuple[list[Product], list[Product], list[dict[str, str]]]:
+    """Insert or update products in one transaction, matching them by SKU, or by slug without a SKU.
+
+    Returns:
+        The created products, the updated products and the products that failed validation.
+    """
+    validated: dict[tuple[str, str], ProductCreate] = {}
+    errors: list[dict[str, str]] = []
+    for position, product_data in enumerate(products_data):
+        try:
+            # The last copy of a product wins if a batch contains it twice
+            validated[_product_key(product_data, position)] = ProductCreate(**product_data)
+        except (ValidationError, ValueError, TypeError) as exc:
+            errors.append({"product": str(product_data.get("name") or "Unknown"), "error": str(exc)})
+
+    skus = [value for kind, value in validated if kind == "sku"]
+    slugs = [value for kind, value in validated if kind == "slug"]
+    existing: dict[tuple[str, str], Product] = {}
+    if skus:
+        stmt = select(Product).where(Product.workspace_id == workspace_id, col(Product.sku).in_(skus))
+        existing.update({("sku", product.sku): product for product in (await session.exec(stmt)).all()})
+    if slugs:
+        stmt = select(Product).where(
+            Product.workspace_id == workspace_id,
+            col(Product.slug).in_(slugs),
+            (col(Product.sku).is_(None)) | (col(Product.sku) == ""),
+        )
+        existing.update({("slug", product.slug): product for product in (await session.exec(stmt)).all()})
+
+    created: list[Product] = []
+    updated: list[Product] = []
+    now = datetime.now(timezone.utc)
+    for key, product_create in validated.items():
+        if (product := existing.get(key)) is not None:
+            for name, value in product_create.model_dump(exclude=_NON_PRODUCT_FIELDS).items():
+                setattr(product, name, value)
+            product.updated_at = now
+            updated.append(product)
+        else:
+            product = Product.model_validate(product_create, update={"created_by": user_id})
+            created.append(product)
+        session.add(product)
+    await session.commit()
+    return created, updated, errors
+
+
+async def get_sync_checkpoint(
+    session: AsyncSession, source: CatalogSource, workspace_id: UUID | str
+) -> datetime | None:
+    """Return when the last successful sync of `source` into the workspace started."""
+    checkpoint = await session.get(CatalogSyncCheckpoint, (UUID(str(workspace_id)), source.name, source.site))
+    if checkpoint is None:
+        return None
+    # SQLite doesn't keep the timezone
+    synced_at = checkpoint.synced_at
+    return synced_at if synced_at.tzinfo else synced_at.replace(tzinfo=timezone.utc)
+
+
+async def save_sync_checkpoint(
+    session: AsyncSession, source: CatalogSource, workspace_id: UUID | str, synced_at: datetime
+) -> None:
+    """Store `synced_at` as the start of the last successful sync of `source` into the workspace."""
+    await session.merge(
+        CatalogSyncCheckpoint(
+            workspace_id=UUID(str(workspace_id)), source=source.name, site=source.site, synced_at=synced_at
+        )
+    )
+    await session.commit()
+
+
+async def sync_catalog(
+    source: CatalogSource,
+    *,
+    workspace_id: UUID | str,
+    user_id: UUID | str,
+    updated_after: datetime | None = None,
+    incremental: bool = True,
+    batch_size: int = UPSERT_BATCH_SIZE,
+    on_progress: Callable[[SyncProgress], None] | None = None,
+) -> SyncProgress:
+    """Sync the catalog of `source` into a workspace.
+
+    Pages are fetched while the previous ones are written to the database. Incremental syncs
+    only fetch the products changed after `updated_after`, defaulting to the start of the
+    last successful sync. The start of this sync is returned as the next checkpoint.
+    """
+    started_at = datetime.now(timezone.utc)
+    if updated_after is None and incremental:
+        async with session_scope() as session:
+            updated_after = await get_sync_checkpoint(session, source, workspace_id)
+    progress = SyncProgress()
+    pages: asyncio.Queue[list[dict[str, Any]] | None] = asyncio.Queue(maxsize=2)
+
+    async def produce() -> None:
+        try:
+            async for page in source.fetch_pages(updated_after):
+                await pages.put(page)
+        finally:
+            await pages.put(None)
+
+    async def write(batch: list[dict[str, Any]]) -> None:
+        async with session_scope() as session:
+            created, updated, errors = await upsert_products(session, batch, workspace_id=workspace_id, user_id=user_id)
+        progress.created += len(created)
+        progress.updated += len(updated)
+        progress.failed += len(errors)
+        progress.errors.extend(errors)
+
+    producer = asyncio.create_task(produce())
+    batch: list[dict[str, Any]] = []
+    try:
+        while (page := await pages.get()) is not None:
+            progress.pages += 1
+            progress.fetched += len(page)
+            products_data, errors = map_products(page, source.to_product_data, workspace_id)
+            batch.extend(products_data)
+            progress.failed += len(errors)
+            progress.errors.extend(errors)
+            while len(batch) >= batch_size:
+                await write(batch[:batch_size])
+                batch = batch[batch_size:]
+            if on_progress is not None:
+                on_progress(progress)
+        if batch:
+            await write(batch)
+        # Surface fetch errors
+        await producer
+    finally:
+        if not producer.done():
+            producer.cancel()
+
+    progress.checkpoint = started_at
+    async with session_scope() as session:
+        await save_sync_checkpoint(session, source, workspace_id, started_at)
+    logger.info(
+        f"Synced {progress.fetched} products from {source.name} ({source.site}): "
+        f"{progress.created} created, {progress.updated} updated, {progress.failed} failed"
+    )
+    return progress
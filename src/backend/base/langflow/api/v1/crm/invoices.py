@@ -14,6 +14,7 @@ from langflow.services.database.models.crm.invoice import (
 from langflow.api.v1.crm.utils import (
     check_workspace_access,
     get_entity_access_filter,
+    get_keyset,
     update_entity_timestamps,
     paginate_query,
 )
@@ -75,12 +76,16 @@ async def read_invoices(
     skip: int = 0,
     limit: int = 100,
     page: int | None = None,
+    cursor: str | None = None,
+    include_total: bool = True,
 ):
     """
     Get all invoices the user has access to.
 
-    Supports pagination with skip/limit or page/limit parameters.
-    Returns a paginated response with items and metadata.
+    Supports pagination with skip/limit or page/limit parameters, or with the cursor
+    from the metadata of the previous page, which stays fast on deep pages.
+    Pass include_total=false to skip counting the matching items.
+    Returns a paginated response with items and metadata, newest first.
     """
     try:
         # Base query to get invoices from workspaces the user has access to
@@ -105,7 +110,10 @@ async def read_invoices(
             query=query,
             skip=skip,
             limit=limit,
-            page=page
+            page=page,
+            keyset=get_keyset(Invoice),
+            cursor=cursor,
+            include_total=include_total,
         )
 
         # Return paginated response
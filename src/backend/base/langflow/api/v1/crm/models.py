@@ -7,14 +7,15 @@ T = TypeVar('T')
 
 class PaginationMetadata(BaseModel):
     """Metadata for paginated responses."""
-    total: int = Field(..., description="Total number of items")
-    page: int = Field(..., description="Current page number (1-based)")
+    total: Optional[int] = Field(..., description="Total number of items, if requested")
+    page: Optional[int] = Field(..., description="Current page number (1-based), unknown when paginating by cursor")
     size: int = Field(..., description="Number of items per page")
-    pages: int = Field(..., description="Total number of pages")
+    pages: Optional[int] = Field(..., description="Total number of pages, if the total was requested")
     has_next: bool = Field(..., description="Whether there is a next page")
     has_prev: bool = Field(..., description="Whether there is a previous page")
     next_page: Optional[int] = Field(None, description="Next page number")
     prev_page: Optional[int] = Field(None, description="Previous page number")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page")
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
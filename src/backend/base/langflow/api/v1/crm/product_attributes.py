@@ -89,7 +89,7 @@ async def read_product_attributes(
         query = query.order_by(ProductAttribute.name)
 
         # Paginate results
-        attributes, metadata = await paginate_query(session, query, page, size)
+        attributes, metadata = await paginate_query(session, query, page=page, limit=size)
 
         # Return paginated response
         return PaginatedResponse(items=attributes, metadata=metadata)
@@ -318,7 +318,7 @@ async def read_attribute_terms(
         query = query.order_by(ProductAttributeTerm.menu_order, ProductAttributeTerm.name)
 
         # Paginate results
-        terms, metadata = await paginate_query(session, query, page, size)
+        terms, metadata = await paginate_query(session, query, page=page, limit=size)
 
         # Return paginated response
         return PaginatedResponse(items=terms, metadata=metadata)
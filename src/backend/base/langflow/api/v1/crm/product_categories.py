@@ -90,7 +90,7 @@ async def read_product_categories(
         query = query.order_by(ProductCategory.name)
 
         # Paginate results
-        categories, metadata = await paginate_query(session, query, page, size)
+        categories, metadata = await paginate_query(session, query, page=page, limit=size)
 
         # Return paginated response
         return PaginatedResponse(items=categories, metadata=metadata)
@@ -83,39 +83,41 @@ async def read_product_meta(
     product_id: UUID | None = None,
     page: int = 1,
     size: int = 10,
+    cursor: str | None = None,
+    include_total: bool = True,
 ):
     """Get all product meta the user has access to."""
     try:
-        # Build query for products the user has access to
-        product_query = select(Product).where(get_entity_access_filter(Product, current_user.id))
-        
-        # Get the product IDs
-        product_ids = [p.id for p in (await session.exec(product_query)).all()]
-        
-        if not product_ids:
-            return PaginatedResponse(
-                items=[],
-                metadata={"page": page, "size": size, "total": 0, "pages": 0}
-            )
-        
+        # Products the user has access to, as a subquery so their IDs are never loaded
+        accessible_product_ids = select(Product.id).where(get_entity_access_filter(Product, current_user.id))
+
         # Build query for meta
-        query = select(ProductMeta).where(ProductMeta.product_id.in_(product_ids))
-        
+        query = select(ProductMeta).where(ProductMeta.product_id.in_(accessible_product_ids))
+
         # Filter by product if provided
         if product_id:
-            if product_id not in product_ids:
+            accessible_product = (
+                await session.exec(accessible_product_ids.where(Product.id == product_id))
+            ).first()
+            if accessible_product is None:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Product not found or access denied",
                 )
             query = query.where(ProductMeta.product_id == product_id)
-        
-        # Order by key
-        query = query.order_by(ProductMeta.key)
-        
-        # Paginate results
-        meta_items, metadata = await paginate_query(session, query, page, size)
-        
+
+        # Paginate results, order by key
+        meta_items, metadata = await paginate_query(
+            session,
+            query,
+            limit=size,
+            page=page,
+            keyset=(ProductMeta.key, ProductMeta.id),
+            descending=False,
+            cursor=cursor,
+            include_total=include_total,
+        )
+
         # Return paginated response
         return PaginatedResponse(items=meta_items, metadata=metadata)
     except Exception as e:
@@ -88,7 +88,7 @@ async def read_product_reviews(
     query = query.order_by(ProductReview.created_at.desc())
     
     # Paginate results
-    reviews, metadata = await paginate_query(session, query, page, size)
+    reviews, metadata = await paginate_query(session, query, page=page, limit=size)
     
     # Return paginated response
     return PaginatedResponse(items=reviews, metadata=metadata)
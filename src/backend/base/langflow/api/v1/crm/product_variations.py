@@ -14,6 +14,7 @@ from langflow.services.database.models.crm.product_variation import (
 )
 from langflow.api.v1.crm.utils import (
     get_entity_access_filter,
+    get_keyset,
     update_entity_timestamps,
     paginate_query,
 )
@@ -86,39 +87,40 @@ async def read_product_variations(
     product_id: UUID | None = None,
     page: int = 1,
     size: int = 10,
+    cursor: str | None = None,
+    include_total: bool = True,
 ):
     """Get all product variations the user has access to."""
     try:
-        # Build query for products the user has access to
-        product_query = select(Product).where(get_entity_access_filter(Product, current_user.id))
-        
-        # Get the product IDs
-        product_ids = [p.id for p in (await session.exec(product_query)).all()]
-        
-        if not product_ids:
-            return PaginatedResponse(
-                items=[],
-                metadata={"page": page, "size": size, "total": 0, "pages": 0}
-            )
-        
+        # Products the user has access to, as a subquery so their IDs are never loaded
+        accessible_product_ids = select(Product.id).where(get_entity_access_filter(Product, current_user.id))
+
         # Build query for variations
-        query = select(ProductVariation).where(ProductVariation.product_id.in_(product_ids))
-        
+        query = select(ProductVariation).where(ProductVariation.product_id.in_(accessible_product_ids))
+
         # Filter by product if provided
         if product_id:
-            if product_id not in product_ids:
+            accessible_product = (
+                await session.exec(accessible_product_ids.where(Product.id == product_id))
+            ).first()
+            if accessible_product is None:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Product not found or access denied",
                 )
             query = query.where(ProductVariation.product_id == product_id)
-        
-        # Order by created_at
-        query = query.order_by(ProductVariation.created_at.desc())
-        
-        # Paginate results
-        variations, metadata = await paginate_query(session, query, page, size)
-        
+
+        # Paginate results, order by created_at
+        variations, metadata = await paginate_query(
+            session,
+            query,
+            limit=size,
+            page=page,
+            keyset=get_keyset(ProductVariation),
+            cursor=cursor,
+            include_total=include_total,
+        )
+
         # Return paginated response
         return PaginatedResponse(items=variations, metadata=metadata)
     except Exception as e:
@@ -1,20 +1,20 @@
 from typing import Annotated, List, Optional
 from uuid import UUID
-from datetime import datetime, timezone, timedelta
+from datetime import date, datetime, timezone, timedelta
 from enum import Enum
 import json
 import csv
 import io
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from fastapi.responses import StreamingResponse
-from sqlalchemy import func, desc, and_, or_, text
+from sqlalchemy import desc, and_, or_, text
 from sqlmodel import select, col
 
 from langflow.api.utils import CurrentActiveUser, DbSession
 from langflow.services.database.models.workspace import Workspace, WorkspaceMember
 from langflow.services.database.models.crm.client import Client
-from langflow.services.database.models.crm.invoice import Invoice
-from langflow.services.database.models.crm.opportunity import Opportunity
+from langflow.services.database.models.crm.daily_rollup import report_totals, utc_day
+from langflow.services.database.models.crm.rollup import OPEN_OPPORTUNITY_STATUSES
 from langflow.services.database.models.crm.task import Task
 from langflow.services.database.models.user import User
 
@@ -227,101 +227,102 @@ async def generate_report(
         ) from e
 
 # Helper functions for report generation
+#
+# The sales overview, pipeline, invoice aging and forecast reports read the daily rollups of the
+# workspace (see `langflow.services.database.models.crm.daily_rollup`), a handful of grouped
+# queries whatever the size of the invoice and opportunity tables. They cover whole UTC days.
+# Reports for a single client aggregate its invoices and opportunities instead, in the same
+# single grouped query per table.
+
+INVOICE_STATUSES = ("draft", "sent", "paid", "overdue")
+OUTSTANDING_INVOICE_STATUSES = ("sent", "overdue")
+OPPORTUNITY_STATUSES = ("new", "qualified", "proposal", "negotiation", "won", "lost")
+
+# Chance that an open opportunity is won, by stage, to weight the forecast
+STAGE_PROBABILITIES = {"new": 0.1, "qualified": 0.25, "proposal": 0.5, "negotiation": 0.75}
+
+# (name, first, last) days overdue of each invoice aging bucket
+AGING_BUCKETS = (
+    ("current", None, 0),
+    ("1_30_days", 1, 30),
+    ("31_60_days", 31, 60),
+    ("61_90_days", 61, 90),
+    ("over_90_days", 91, None),
+)
+
+FORECAST_MONTHS = 12
+
+
+async def _totals(session, workspace_id, series, date_from=None, date_to=None, **options):
+    """Totals of a rollup series over the days from `date_from` to `date_to`, see `report_totals`."""
+    day_from, day_to = (utc_day(value) if isinstance(value, datetime) else value for value in (date_from, date_to))
+    return await session.run_sync(
+        lambda sync_session: report_totals(sync_session.connection(), workspace_id, series, day_from, day_to, **options)
+    )
+
+
+def _status_totals(rows, statuses):
+    """Count and amount of every status in `statuses`, plus any other status present in `rows`."""
+    totals = {status_: {"count": 0, "amount": 0.0} for status_ in statuses}
+    for row in rows:
+        totals.setdefault(row["status"], {"count": 0, "amount": 0.0})
+        totals[row["status"]]["count"] += row["record_count"]
+        totals[row["status"]]["amount"] += row["amount"]
+    return totals
+
+
+def _percentage(part, whole):
+    return part / whole * 100 if whole else 0
+
+
+def _month(day):
+    return day.strftime("%Y-%m")
+
+
+def _first_of_month(day, months_later=0):
+    year, month = divmod(day.year * 12 + day.month - 1 + months_later, 12)
+    return date(year, month + 1, 1)
+
+
+def _months(date_from, date_to):
+    """The months from `date_from` to `date_to` as YYYY-MM, oldest first."""
+    months = []
+    month, last = _first_of_month(date_from), _first_of_month(date_to)
+    while month <= last:
+        months.append(_month(month))
+        month = _first_of_month(month, 1)
+    return months
+
+
+def _time_period(date_from, date_to):
+    return {"start_date": date_from.isoformat(), "end_date": date_to.isoformat()}
+
+
 async def generate_sales_overview(session, workspace_id, date_from, date_to, client_id=None, filters=None):
     """Generate sales overview report."""
-    # Base query conditions
-    conditions = [
-        Invoice.workspace_id == workspace_id,
-        Invoice.created_at >= date_from,
-        Invoice.created_at <= date_to
-    ]
-    
-    if client_id:
-        conditions.append(Invoice.client_id == client_id)
-    
-    # Add custom filters if provided
-    if filters and "status" in filters:
-        conditions.append(Invoice.status == filters["status"])
-    
-    # Get total revenue (sum of paid invoices)
-    total_revenue = (
-        await session.exec(
-            select(func.sum(Invoice.amount))
-            .where(
-                *conditions,
-                Invoice.status == "paid"
-            )
-        )
-    ).one() or 0
-    
-    # Get invoice counts by status
-    invoice_counts = {}
-    for status in ["draft", "sent", "paid", "overdue"]:
-        count = (
-            await session.exec(
-                select(func.count())
-                .where(
-                    *conditions,
-                    Invoice.status == status
-                )
-            )
-        ).one()
-        invoice_counts[status] = count
-    
-    # Get opportunity data
-    opp_conditions = [
-        Opportunity.workspace_id == workspace_id,
-        Opportunity.created_at >= date_from,
-        Opportunity.created_at <= date_to
-    ]
-    
-    if client_id:
-        opp_conditions.append(Opportunity.client_id == client_id)
-    
-    # Get opportunity counts by status
-    opportunity_counts = {}
-    for status in ["new", "qualified", "proposal", "negotiation", "won", "lost"]:
-        count = (
-            await session.exec(
-                select(func.count())
-                .where(
-                    *opp_conditions,
-                    Opportunity.status == status
-                )
-            )
-        ).one()
-        opportunity_counts[status] = count
-    
-    # Calculate win rate
-    total_closed = opportunity_counts.get("won", 0) + opportunity_counts.get("lost", 0)
-    win_rate = (opportunity_counts.get("won", 0) / total_closed * 100) if total_closed > 0 else 0
-    
-    # Calculate average deal size
-    avg_deal_size = (
-        await session.exec(
-            select(func.avg(Opportunity.value))
-            .where(
-                *opp_conditions,
-                Opportunity.status == "won"
-            )
-        )
-    ).one() or 0
-    
-    # Return compiled report data
+    invoice_statuses = [filters["status"]] if filters and "status" in filters else None
+    invoices = _status_totals(
+        await _totals(session, workspace_id, "invoice", date_from, date_to, statuses=invoice_statuses,
+                      client_id=client_id),
+        INVOICE_STATUSES,
+    )
+    opportunity_rows = await _totals(session, workspace_id, "opportunity", date_from, date_to, client_id=client_id)
+    opportunities = _status_totals(opportunity_rows, OPPORTUNITY_STATUSES)
+
+    won, lost = opportunities["won"], opportunities["lost"]
+    # Won deals without a value don't count towards the average
+    won_with_value = sum(row["amount_count"] for row in opportunity_rows if row["status"] == "won")
     return {
         "report_type": "sales_overview",
-        "time_period": {
-            "start_date": date_from.isoformat(),
-            "end_date": date_to.isoformat()
-        },
+        "time_period": _time_period(date_from, date_to),
         "metrics": {
-            "total_revenue": total_revenue,
-            "total_invoices": sum(invoice_counts.values()),
-            "invoices_by_status": invoice_counts,
-            "average_deal_size": avg_deal_size,
-            "win_rate": win_rate,
-            "total_opportunities": sum(opportunity_counts.values()),
-            "opportunities_by_status": opportunity_counts
+            "total_revenue": invoices["paid"]["amount"],
+            "total_invoices": sum(totals["count"] for totals in invoices.values()),
+            "invoices_by_status": {status_: totals["count"] for status_, totals in invoices.items()},
+            "average_deal_size": won["amount"] / won_with_value if won_with_value else 0,
+            "win_rate": _percentage(won["count"], won["count"] + lost["count"]),
+            "total_opportunities": sum(totals["count"] for totals in opportunities.values()),
+            "opportunities_by_status": {status_: totals["count"] for status_, totals in opportunities.items()},
         },
         "generated_at": datetime.now(timezone.utc).isoformat()
     }
@@ -334,13 +335,92 @@ async def generate_client_activity(session, workspace_id, date_from, date_to, cl
 
 async def generate_opportunity_pipeline(session, workspace_id, date_from, date_to, client_id=None, filters=None):
     """Generate opportunity pipeline report."""
-    # Implementation will be added
-    return {"status": "not_implemented", "report_type": "opportunity_pipeline"}
+    opportunities = _status_totals(
+        await _totals(session, workspace_id, "opportunity", date_from, date_to, client_id=client_id),
+        OPPORTUNITY_STATUSES,
+    )
+    total_count = sum(totals["count"] for totals in opportunities.values())
+    open_stages = {
+        status_: totals for status_, totals in opportunities.items() if status_ in OPEN_OPPORTUNITY_STATUSES
+    }
+    won, lost = opportunities["won"], opportunities["lost"]
+
+    return {
+        "report_type": "opportunity_pipeline",
+        "time_period": _time_period(date_from, date_to),
+        "metrics": {
+            "pipeline_value": sum(totals["amount"] for totals in open_stages.values()),
+            "weighted_pipeline_value": sum(
+                totals["amount"] * STAGE_PROBABILITIES.get(status_, 0) for status_, totals in open_stages.items()
+            ),
+            "open_opportunities": sum(totals["count"] for totals in open_stages.values()),
+            "stage_distribution": {
+                status_: {**totals, "percentage": _percentage(totals["count"], total_count)}
+                for status_, totals in opportunities.items()
+            },
+            "win_rate": _percentage(won["count"], won["count"] + lost["count"]),
+            "won_value": won["amount"],
+            "lost_value": lost["amount"],
+            "total_opportunities": total_count,
+        },
+        "generated_at": datetime.now(timezone.utc).isoformat()
+    }
 
 async def generate_invoice_aging(session, workspace_id, date_from, date_to, client_id=None, filters=None):
-    """Generate invoice aging report."""
-    # Implementation will be added
-    return {"status": "not_implemented", "report_type": "invoice_aging"}
+    """Generate invoice aging report.
+
+    The aging buckets are of every invoice outstanding today, whatever the time frame; the
+    payment rate is of the invoices created in the time frame.
+    """
+    today = utc_day(datetime.now(timezone.utc))
+    buckets = {name: {"count": 0, "amount": 0.0} for name, _, _ in AGING_BUCKETS}
+    due_rows = await _totals(
+        session, workspace_id, "invoice_due", statuses=OUTSTANDING_INVOICE_STATUSES, client_id=client_id, by_day=True
+    )
+    for row in due_rows:
+        days_overdue = (today - row["day"]).days
+        for name, first, last in AGING_BUCKETS:
+            if (first is None or days_overdue >= first) and (last is None or days_overdue <= last):
+                buckets[name]["count"] += row["record_count"]
+                buckets[name]["amount"] += row["amount"]
+                break
+
+    # Outstanding invoices without a due date are not in the due-day series
+    outstanding = _status_totals(
+        await _totals(session, workspace_id, "invoice", statuses=OUTSTANDING_INVOICE_STATUSES, client_id=client_id),
+        OUTSTANDING_INVOICE_STATUSES,
+    )
+    outstanding_count = sum(totals["count"] for totals in outstanding.values())
+    outstanding_amount = sum(totals["amount"] for totals in outstanding.values())
+    with_due_date_count = sum(bucket["count"] for bucket in buckets.values())
+    with_due_date_amount = sum(bucket["amount"] for bucket in buckets.values())
+
+    invoices = _status_totals(
+        await _totals(session, workspace_id, "invoice", date_from, date_to, client_id=client_id), INVOICE_STATUSES
+    )
+    overdue = [bucket for name, bucket in buckets.items() if name != "current"]
+
+    return {
+        "report_type": "invoice_aging",
+        "time_period": _time_period(date_from, date_to),
+        "metrics": {
+            "outstanding_amount": outstanding_amount,
+            "outstanding_invoices": outstanding_count,
+            "overdue_amount": sum(bucket["amount"] for bucket in overdue),
+            "overdue_invoices": sum(bucket["count"] for bucket in overdue),
+            "aging_buckets": {
+                **buckets,
+                "no_due_date": {
+                    "count": outstanding_count - with_due_date_count,
+                    "amount": outstanding_amount - with_due_date_amount,
+                },
+            },
+            "payment_rate": _percentage(
+                invoices["paid"]["count"], sum(totals["count"] for totals in invoices.values())
+            ),
+        },
+        "generated_at": datetime.now(timezone.utc).isoformat()
+    }
 
 async def generate_task_completion(session, workspace_id, date_from, date_to, client_id=None, filters=None):
     """Generate task completion report."""
@@ -348,9 +428,49 @@ async def generate_task_completion(session, workspace_id, date_from, date_to, cl
     return {"status": "not_implemented", "report_type": "task_completion"}
 
 async def generate_revenue_forecast(session, workspace_id, date_from, date_to, client_id=None, filters=None):
-    """Generate revenue forecast report."""
-    # Implementation will be added
-    return {"status": "not_implemented", "report_type": "revenue_forecast"}
+    """Generate revenue forecast report.
+
+    Projects the open opportunities expected to close in the next months, weighted by the
+    chance of winning them at their stage, next to the revenue of the paid invoices of the
+    time frame.
+    """
+    history = dict.fromkeys(_months(date_from, date_to), 0.0)
+    paid_rows = await _totals(
+        session, workspace_id, "invoice", date_from, date_to, statuses=["paid"], client_id=client_id, by_day=True
+    )
+    for row in paid_rows:
+        month = _month(row["day"])
+        history[month] = history.get(month, 0.0) + row["amount"]
+
+    today = utc_day(datetime.now(timezone.utc))
+    last_day = _first_of_month(today, FORECAST_MONTHS) - timedelta(days=1)
+    projection = {month: {"pipeline_value": 0.0, "weighted_value": 0.0} for month in _months(today, last_day)}
+    closing_rows = await _totals(
+        session, workspace_id, "opportunity_close", today, last_day, statuses=OPEN_OPPORTUNITY_STATUSES,
+        client_id=client_id, by_day=True,
+    )
+    for row in closing_rows:
+        month = projection[_month(row["day"])]
+        month["pipeline_value"] += row["amount"]
+        month["weighted_value"] += row["amount"] * STAGE_PROBABILITIES.get(row["status"], 0)
+
+    revenues = list(history.values())
+    growth_rate = None
+    if len(revenues) > 1 and revenues[-2]:
+        growth_rate = (revenues[-1] - revenues[-2]) / revenues[-2] * 100
+
+    return {
+        "report_type": "revenue_forecast",
+        "time_period": _time_period(date_from, date_to),
+        "metrics": {
+            "historical_revenue": history,
+            "average_monthly_revenue": sum(revenues) / len(revenues) if revenues else 0,
+            "growth_rate": growth_rate,
+            "projected_revenue": projection,
+            "projected_total": sum(month["weighted_value"] for month in projection.values()),
+        },
+        "generated_at": datetime.now(timezone.utc).isoformat()
+    }
 
 async def generate_custom_report(session, workspace_id, date_from, date_to, metrics, dimensions, client_id=None, filters=None):
     """Generate custom report based on specified metrics and dimensions."""
@@ -0,0 +1,69 @@
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, Query, status
+
+from langflow.api.utils import CurrentActiveUser, DbSession
+from langflow.api.utils.workspace import get_workspace_roles
+from langflow.api.v1.crm.utils import check_workspace_access
+from langflow.services.database.models.crm.search import INDEXED_MODELS, get_search_backend
+
+router = APIRouter(prefix="/crm/search", tags=["Search"])
+
+SEARCH_TYPES = [entity_type for entity_type, _, _ in INDEXED_MODELS.values()]
+
+
+@router.get("", status_code=200)
+async def search_crm(
+    *,
+    session: DbSession,
+    current_user: CurrentActiveUser,
+    q: Annotated[str, Query(min_length=1, description="Search text, the last word is matched as a prefix")],
+    workspace_id: UUID | None = None,
+    types: Annotated[
+        list[str] | None, Query(description=f"Types of records to return ({', '.join(SEARCH_TYPES)})")
+    ] = None,
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+):
+    """Search clients, opportunities and products by name and description.
+
+    Uses the database's full-text index, so the time a search takes depends on the number
+    of matches rather than the size of the catalog. Results are ranked best first, with
+    matches in names ranked above matches in descriptions.
+    """
+    try:
+        if types and (unknown := set(types) - set(SEARCH_TYPES)):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown search types: {', '.join(sorted(unknown))}",
+            )
+
+        if workspace_id:
+            await check_workspace_access(session, workspace_id, current_user)
+            workspace_ids = [workspace_id]
+        else:
+            workspace_ids = list(await get_workspace_roles(session, current_user.id))
+
+        def _search(sync_session):
+            backend = get_search_backend(sync_session.bind.dialect.name)
+            return backend.search(sync_session.connection(), q, workspace_ids, entity_types=types, limit=limit)
+
+        results = await session.run_sync(_search)
+
+        return [
+            {
+                "type": result["entity_type"],
+                "id": str(result["entity_id"]),
+                "workspace_id": str(result["workspace_id"]),
+                "title": result["title"],
+                "rank": float(result["rank"]),
+            }
+            for result in results
+        ]
+    except Exception as e:
+        if isinstance(e, HTTPException):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        ) from e
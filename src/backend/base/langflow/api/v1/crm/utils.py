@@ -1,12 +1,17 @@
 """Utility functions for CRM endpoints."""
+import base64
+import json
 from datetime import datetime, timezone
 from uuid import UUID
 
+from cachetools import TTLCache
 from fastapi import HTTPException
+from sqlalchemy import tuple_
 from .error_handling import get_http_status_code
 from sqlmodel import select, or_, func
 
 from langflow.api.utils import CurrentActiveUser, DbSession
+from langflow.api.utils.workspace import get_workspace_role, has_workspace_role
 from langflow.services.database.models.workspace import Workspace, WorkspaceMember
 # These imports are used in other functions in this module
 from langflow.services.database.models.crm.client import Client
@@ -14,6 +19,10 @@ from langflow.services.database.models.crm.invoice import Invoice
 from langflow.services.database.models.crm.opportunity import Opportunity
 from langflow.services.database.models.crm.task import Task
 
+# Seconds a list total is reused for
+COUNT_CACHE_TTL = 30
+_count_cache: TTLCache[str, int] = TTLCache(maxsize=1024, ttl=COUNT_CACHE_TTL)
+
 
 async def check_workspace_access(
     session: DbSession,
@@ -23,7 +32,9 @@ async def check_workspace_access(
     require_owner_permission: bool = False,
 ):
     """
-    Check if the user has access to the workspace and return the workspace if they do.
+    Check if the user has access to the workspace and return their role in it if they do.
+
+    Roles are served from a short-lived per-user cache, so most checks don't query the database.
 
     Args:
         session: Database session
@@ -33,38 +44,15 @@ async def check_workspace_access(
         require_owner_permission: Whether to require owner permission
 
     Returns:
-        The workspace if the user has access
+        The user's role in the workspace (owner, editor, viewer)
 
     Raises:
         HTTPException: If the user doesn't have access to the workspace
     """
-    # Base query to check if user has access to the workspace
-    query = select(Workspace).where(
-        Workspace.id == workspace_id,
-        or_(
-            # User is the owner of the workspace
-            Workspace.owner_id == current_user.id,
-            # User is a member of the workspace
-            Workspace.id.in_(
-                select(WorkspaceMember.workspace_id)
-                .where(
-                    WorkspaceMember.user_id == current_user.id,
-                    # Add role filter if required
-                    *(
-                        [WorkspaceMember.role == "owner"]
-                        if require_owner_permission
-                        else [WorkspaceMember.role.in_(["owner", "editor"])]
-                        if require_edit_permission
-                        else []
-                    )
-                )
-            )
-        )
-    )
-
-    workspace = (await session.exec(query)).first()
+    required_role = "owner" if require_owner_permission else "editor" if require_edit_permission else None
+    role = await get_workspace_role(session, workspace_id, current_user.id)
 
-    if not workspace:
+    if not has_workspace_role(role, required_role):
         detail = "Workspace not found or access denied"
         if require_edit_permission:
             detail = "Workspace not found or you don't have edit permission"
@@ -76,7 +64,7 @@ async def check_workspace_access(
             detail=detail,
         )
 
-    return workspace
+    return role
 
 
 def get_workspace_access_filter(current_user_id: UUID):
@@ -155,16 +143,122 @@ def update_entity_timestamps(entity, update_data=None, is_new=False):
     return entity
 
 
-async def paginate_query(session, query, skip: int = 0, limit: int = 100, page: int = None):
+def get_keyset(entity_class) -> tuple:
+    """
+    Get the columns entities are ordered by for cursor pagination, newest first.
+
+    Backed by the (workspace_id, created_at, id) indexes of the CRM tables.
+
+    Args:
+        entity_class: Entity class (Client, Invoice, etc.)
+
+    Returns:
+        Tuple of columns
+    """
+    return (entity_class.created_at, entity_class.id)
+
+
+def encode_cursor(values) -> str:
+    """
+    Encode the keyset values of the last item of a page as an opaque cursor.
+
+    Args:
+        values: Values of the keyset columns
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([value.isoformat() if isinstance(value, datetime) else str(value) for value in values])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keyset) -> list:
+    """
+    Decode a cursor into values of the keyset columns.
+
+    Args:
+        cursor: Cursor returned in the metadata of a previous page
+        keyset: Columns the query is ordered by
+
+    Returns:
+        List of values, one per keyset column
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(keyset):
+            raise ValueError
+        decoded = []
+        for column, value in zip(keyset, values, strict=True):
+            python_type = column.type.python_type
+            if python_type is datetime:
+                decoded.append(datetime.fromisoformat(value))
+            elif python_type is UUID:
+                decoded.append(UUID(value))
+            else:
+                decoded.append(python_type(value))
+    except (ValueError, TypeError) as e:
+        raise HTTPException(
+            status_code=get_http_status_code("HTTP_400_BAD_REQUEST"),
+            detail="Invalid pagination cursor",
+        ) from e
+    return decoded
+
+
+async def count_query(session, query) -> int:
+    """
+    Count the rows of a query, caching the result for a few seconds.
+
+    Listing the next page of the same query reuses the count instead of scanning again.
+
+    Args:
+        session: Database session
+        query: The SQLAlchemy query to count
+
+    Returns:
+        Number of rows, possibly up to COUNT_CACHE_TTL seconds old
+    """
+    count_query = query.order_by(None).with_only_columns(func.count())
+    compiled = count_query.compile()
+    key = f"{compiled}|{sorted(compiled.params.items())!r}"
+    total = _count_cache.get(key)
+    if total is None:
+        total = (await session.exec(count_query)).one()
+        _count_cache[key] = total
+    return total
+
+
+async def paginate_query(
+    session,
+    query,
+    skip: int = 0,
+    limit: int = 100,
+    page: int = None,
+    *,
+    keyset=None,
+    cursor: str | None = None,
+    descending: bool = True,
+    include_total: bool = True,
+):
     """
     Apply pagination to a SQLAlchemy query and return both the paginated items and metadata.
 
+    With a keyset, the query is ordered by its columns and the metadata contains a cursor
+    to the next page. Passing that cursor back seeks past the last item with an indexed
+    range condition instead of OFFSET, so deep pages cost the same as the first one.
+
     Args:
         session: Database session
         query: The SQLAlchemy query to paginate
-        skip: Number of records to skip (offset)
+        skip: Number of records to skip (offset), ignored with a cursor
         limit: Maximum number of records to return
         page: Page number (1-based, optional - if provided, skip will be calculated)
+        keyset: Columns that uniquely order the query, required for cursor pagination
+        cursor: Cursor of the page to return, from the metadata of the previous page
+        descending: Whether the keyset is ordered from the largest values
+        include_total: Whether to count the matching items, the count is cached briefly
 
     Returns:
         Tuple of (items, metadata) where:
@@ -177,29 +271,46 @@ async def paginate_query(session, query, skip: int = 0, limit: int = 100, page:
     skip = max(0, skip)
     limit = max(0, limit)
 
-    # If page is provided, calculate skip
-    if page is not None and page > 0:
-        skip = (page - 1) * limit
-    else:
-        # Calculate page from skip and limit
-        page = (skip // limit) + 1 if limit > 0 else 1
+    if cursor is not None and keyset is None:
+        raise HTTPException(
+            status_code=get_http_status_code("HTTP_400_BAD_REQUEST"),
+            detail="Cursor pagination is not supported here",
+        )
 
-    # Get total count using a separate query
-    count_query = query.with_only_columns(func.count())
-    total = (await session.exec(count_query)).one()
+    total = await count_query(session, query) if include_total else None
 
-    # Apply pagination to the original query
-    paginated_query = query.offset(skip).limit(limit)
+    if keyset is not None:
+        query = query.order_by(None).order_by(*(column.desc() if descending else column for column in keyset))
 
-    # Execute the paginated query
-    items = (await session.exec(paginated_query)).all()
+    if cursor is not None:
+        values = decode_cursor(cursor, keyset)
+        position = tuple_(*keyset) < tuple_(*values) if descending else tuple_(*keyset) > tuple_(*values)
+        paginated_query = query.where(position)
+        page = None
+    else:
+        # If page is provided, calculate skip
+        if page is not None and page > 0:
+            skip = (page - 1) * limit
+        else:
+            # Calculate page from skip and limit
+            page = (skip // limit) + 1 if limit > 0 else 1
+        paginated_query = query.offset(skip)
+
+    # Fetch one extra item to know whether there is a next page without counting
+    items = list((await session.exec(paginated_query.limit(limit + 1))).all())
+    has_next = len(items) > limit
+    items = items[:limit]
 
     # Calculate pagination metadata
-    total_pages = (total + limit - 1) // limit if limit > 0 else 1
-    has_next = page < total_pages
-    has_prev = page > 1
-    next_page = page + 1 if has_next else None
-    prev_page = page - 1 if has_prev else None
+    total_pages = None
+    if total is not None:
+        total_pages = (total + limit - 1) // limit if limit > 0 else 1
+    has_prev = cursor is not None or (page is not None and page > 1)
+    next_page = page + 1 if has_next and page is not None else None
+    prev_page = page - 1 if page is not None and page > 1 else None
+    next_cursor = None
+    if has_next and keyset is not None and items:
+        next_cursor = encode_cursor([getattr(items[-1], column.key) for column in keyset])
 
     # Create metadata object
     metadata = PaginationMetadata(
@@ -210,7 +321,8 @@ async def paginate_query(session, query, skip: int = 0, limit: int = 100, page:
         has_next=has_next,
         has_prev=has_prev,
         next_page=next_page,
-        prev_page=prev_page
+        prev_page=prev_page,
+        next_cursor=next_cursor,
     )
 
     return items, metadata
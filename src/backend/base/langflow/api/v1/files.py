@@ -1,15 +1,14 @@
 import hashlib
 from datetime import datetime, timezone
 from http import HTTPStatus
-from io import BytesIO
 from pathlib import Path
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, UploadFile
 
 from langflow.api.utils import CurrentActiveUser, DbSession
+from langflow.api.utils.storage import storage_file_response, upload_chunks
 from langflow.api.v1.schemas import UploadFileResponse
 from langflow.services.database.models.flow import Flow
 from langflow.services.deps import get_settings_service, get_storage_service
@@ -60,12 +59,18 @@ async def upload_file(
         raise HTTPException(status_code=403, detail="You don't have access to this flow")
 
     try:
-        file_content = await file.read()
         timestamp = datetime.now(tz=timezone.utc).astimezone().strftime("%Y-%m-%d_%H-%M-%S")
-        file_name = file.filename or hashlib.sha256(file_content).hexdigest()
+        file_name = file.filename
+        if not file_name:
+            digest = hashlib.sha256()
+            async for chunk in upload_chunks(file):
+                digest.update(chunk)
+            await file.seek(0)
+            file_name = digest.hexdigest()
         full_file_name = f"{timestamp}_{file_name}"
         folder = str(flow.id)
-        await storage_service.save_file(flow_id=folder, file_name=full_file_name, data=file_content)
+        # Streamed to storage, so the upload is never held in memory whole
+        await storage_service.save_file_stream(flow_id=folder, file_name=full_file_name, chunks=upload_chunks(file))
         return UploadFileResponse(flow_id=str(flow.id), file_path=f"{folder}/{full_file_name}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -73,7 +78,10 @@ async def upload_file(
 
 @router.get("/download/{flow_id}/{file_name}")
 async def download_file(
-    file_name: str, flow_id: UUID, storage_service: Annotated[StorageService, Depends(get_storage_service)]
+    file_name: str,
+    flow_id: UUID,
+    storage_service: Annotated[StorageService, Depends(get_storage_service)],
+    range_header: Annotated[str | None, Header(alias="range")] = None,
 ):
     flow_id_str = str(flow_id)
     extension = file_name.split(".")[-1]
@@ -89,19 +97,21 @@ async def download_file(
         raise HTTPException(status_code=500, detail=f"Content type not found for extension {extension}")
 
     try:
-        file_content = await storage_service.get_file(flow_id=flow_id_str, file_name=file_name)
         headers = {
             "Content-Disposition": f"attachment; filename={file_name} filename*=UTF-8''{file_name}",
             "Content-Type": "application/octet-stream",
-            "Content-Length": str(len(file_content)),
         }
-        return StreamingResponse(BytesIO(file_content), media_type=content_type, headers=headers)
+        return await storage_file_response(
+            storage_service, flow_id_str, file_name, media_type=content_type, headers=headers, range_header=range_header
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
 @router.get("/images/{flow_id}/{file_name}")
-async def download_image(file_name: str, flow_id: UUID):
+async def download_image(
+    file_name: str, flow_id: UUID, range_header: Annotated[str | None, Header(alias="range")] = None
+):
     storage_service = get_storage_service()
     extension = file_name.split(".")[-1]
     flow_id_str = str(flow_id)
@@ -119,8 +129,9 @@ async def download_image(file_name: str, flow_id: UUID):
         raise HTTPException(status_code=500, detail=f"Content type {content_type} is not an image")
 
     try:
-        file_content = await storage_service.get_file(flow_id=flow_id_str, file_name=file_name)
-        return StreamingResponse(BytesIO(file_content), media_type=content_type)
+        return await storage_file_response(
+            storage_service, flow_id_str, file_name, media_type=content_type, range_header=range_header
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -137,8 +148,12 @@ async def download_profile_picture(
         config_path = Path(config_dir)  # type: ignore[arg-type]
         folder_path = config_path / "profile_pictures" / folder_name
         content_type = build_content_type_from_extension(extension)
-        file_content = await storage_service.get_file(flow_id=folder_path, file_name=file_name)  # type: ignore[arg-type]
-        return StreamingResponse(BytesIO(file_content), media_type=content_type)
+        return await storage_file_response(
+            storage_service,
+            folder_path,  # type: ignore[arg-type]
+            file_name,
+            media_type=content_type,
+        )
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
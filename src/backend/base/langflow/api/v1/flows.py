@@ -1,9 +1,7 @@
 from __future__ import annotations
 
-import io
 import json
 import re
-import zipfile
 from datetime import datetime, timezone
 from typing import Annotated
 from uuid import UUID
@@ -20,7 +18,13 @@ from sqlmodel import and_, col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.api.utils import CurrentActiveUser, DbSession, cascade_delete_flow, remove_api_keys, validate_is_component
-from langflow.api.utils.workspace import get_folder_workspace_id, verify_folder_access, verify_workspace_access
+from langflow.api.utils.workspace import (
+    get_accessible_workspace_ids,
+    get_folder_workspace_id,
+    verify_folder_access,
+    verify_workspace_access,
+)
+from langflow.api.utils.zip import ZIP_MEDIA_TYPE, stream_zip
 from langflow.api.v1.schemas import FlowListCreate
 from langflow.helpers.user import get_user_by_flow_id_or_endpoint_name
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
@@ -30,7 +34,7 @@ from langflow.services.database.models.flow.model import AccessTypeEnum, FlowHea
 from langflow.services.database.models.flow.utils import get_webhook_component_in_flow
 from langflow.services.database.models.folder.constants import DEFAULT_FOLDER_NAME
 from langflow.services.database.models.folder.model import Folder
-from langflow.services.deps import get_settings_service
+from langflow.services.deps import get_settings_service, session_scope
 from langflow.services.settings.service import SettingsService
 from langflow.utils.compression import compress_response
 
@@ -628,25 +632,19 @@ async def delete_multiple_flows(
             await db.exec(select(Flow).where(col(Flow.id).in_(flow_ids)))
         ).all()
 
-        # Check permissions for each flow
-        authorized_flows = []
-        for flow in flows_to_delete:
-            try:
-                # Check workspace permissions if the flow has a workspace_id
-                if flow.workspace_id:
-                    await verify_workspace_access(
-                        session=db,
-                        workspace_id=flow.workspace_id,
-                        user_id=user.id,
-                        required_role="editor"  # Editor role is required for deleting
-                    )
-                    authorized_flows.append(flow)
-                # If no workspace_id, check if user owns the flow
-                elif flow.user_id == user.id:
-                    authorized_flows.append(flow)
-            except HTTPException:
-                # Skip flows that the user doesn't have permission to delete
-                continue
+        # Check permissions for all flows at once, skipping flows the user can't delete
+        editable_workspace_ids = await get_accessible_workspace_ids(
+            db,
+            {flow.workspace_id for flow in flows_to_delete if flow.workspace_id},
+            user.id,
+            required_role="editor",  # Editor role is required for deleting
+        )
+        authorized_flows = [
+            flow
+            for flow in flows_to_delete
+            # Flows without a workspace can only be deleted by their owner
+            if (flow.workspace_id in editable_workspace_ids if flow.workspace_id else flow.user_id == user.id)
+        ]
 
         # Delete authorized flows
         for flow in authorized_flows:
@@ -658,70 +656,71 @@ async def delete_multiple_flows(
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+# Flows read from the database at a time when streaming a download
+FLOW_DOWNLOAD_BATCH_SIZE = 50
+
+
+async def _flow_zip_entries(flow_ids: list[UUID]):
+    """(file name, JSON) of the flows, read a batch at a time so only one batch is in memory."""
+    # The request's session is closed before the response is streamed
+    async with session_scope() as session:
+        for start in range(0, len(flow_ids), FLOW_DOWNLOAD_BATCH_SIZE):
+            batch = flow_ids[start : start + FLOW_DOWNLOAD_BATCH_SIZE]
+            flows = (await session.exec(select(Flow).where(col(Flow.id).in_(batch)))).all()
+            for flow in flows:
+                flow_json = json.dumps(jsonable_encoder(remove_api_keys(flow.model_dump())))
+                yield f"{flow.name}.json", flow_json.encode()
+            session.expunge_all()
+
+
 @router.post("/download/", status_code=200)
 async def download_multiple_file(
     flow_ids: list[UUID],
     user: CurrentActiveUser,
     db: DbSession,
 ):
-    """Download all flows as a zip file."""
-    # Get all flows to download
-    all_flows = (await db.exec(select(Flow).where(Flow.id.in_(flow_ids)))).all()  # type: ignore[attr-defined]
+    """Download all flows as a zip file.
+
+    The zip is streamed as the flows are read, so it is never held in memory whole.
+    """
+    # Only the columns needed to check permissions, the flows' data is read as it is streamed
+    flow_owners = (
+        await db.exec(select(Flow.id, Flow.workspace_id, Flow.user_id).where(col(Flow.id).in_(flow_ids)))
+    ).all()
 
-    if not all_flows:
+    if not flow_owners:
         raise HTTPException(status_code=404, detail="No flows found.")
 
-    # Check permissions for each flow
-    authorized_flows = []
-    for flow in all_flows:
-        try:
-            # Check workspace permissions if the flow has a workspace_id
-            if flow.workspace_id:
-                await verify_workspace_access(
-                    session=db,
-                    workspace_id=flow.workspace_id,
-                    user_id=user.id,
-                    required_role="viewer"  # Viewer role is sufficient for downloading
-                )
-                authorized_flows.append(flow)
-            # If no workspace_id, check if user owns the flow
-            elif flow.user_id == user.id:
-                authorized_flows.append(flow)
-        except HTTPException:
-            # Skip flows that the user doesn't have permission to download
-            continue
-
-    if not authorized_flows:
+    # Check permissions for all flows at once, skipping flows the user can't download
+    readable_workspace_ids = await get_accessible_workspace_ids(
+        db,
+        {workspace_id for _, workspace_id, _ in flow_owners if workspace_id},
+        user.id,
+        required_role="viewer",  # Viewer role is sufficient for downloading
+    )
+    authorized_flow_ids = [
+        flow_id
+        for flow_id, workspace_id, user_id in flow_owners
+        # Flows without a workspace can only be downloaded by their owner
+        if (workspace_id in readable_workspace_ids if workspace_id else user_id == user.id)
+    ]
+
+    if not authorized_flow_ids:
         raise HTTPException(status_code=404, detail="No flows found or you don't have permission to access them.")
 
-    flows_without_api_keys = [remove_api_keys(flow.model_dump()) for flow in authorized_flows]
-
-    if len(flows_without_api_keys) > 1:
-        # Create a byte stream to hold the ZIP file
-        zip_stream = io.BytesIO()
-
-        # Create a ZIP file
-        with zipfile.ZipFile(zip_stream, "w") as zip_file:
-            for flow in flows_without_api_keys:
-                # Convert the flow object to JSON
-                flow_json = json.dumps(jsonable_encoder(flow))
+    if len(authorized_flow_ids) == 1:
+        flow = await db.get(Flow, authorized_flow_ids[0])
+        return remove_api_keys(flow.model_dump())
 
-                # Write the JSON to the ZIP file
-                zip_file.writestr(f"{flow['name']}.json", flow_json)
+    # Generate the filename with the current datetime
+    current_time = datetime.now(tz=timezone.utc).astimezone().strftime("%Y%m%d_%H%M%S")
+    filename = f"{current_time}_langflow_flows.zip"
 
-        # Seek to the beginning of the byte stream
-        zip_stream.seek(0)
-
-        # Generate the filename with the current datetime
-        current_time = datetime.now(tz=timezone.utc).astimezone().strftime("%Y%m%d_%H%M%S")
-        filename = f"{current_time}_langflow_flows.zip"
-
-        return StreamingResponse(
-            zip_stream,
-            media_type="application/x-zip-compressed",
-            headers={"Content-Disposition": f"attachment; filename={filename}"},
-        )
-    return flows_without_api_keys[0]
+    return StreamingResponse(
+        stream_zip(_flow_zip_entries(authorized_flow_ids)),
+        media_type=ZIP_MEDIA_TYPE,
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
 
 
 all_starter_folder_flows_response: Response | None = None
@@ -11,15 +11,11 @@ from functools import partial
 from typing import Any
 from uuid import UUID, uuid4
 
-import numpy as np
 import requests
 import sqlalchemy
-import webrtcvad
 import websockets
 from cryptography.fernet import InvalidToken
-from elevenlabs import ElevenLabs
 from fastapi import APIRouter, BackgroundTasks
-from openai import OpenAI
 from sqlalchemy import select
 from starlette.websockets import WebSocket, WebSocketDisconnect
 
@@ -182,6 +178,8 @@ class ElevenLabsClientManager:
                     return None
 
             if cls._api_key:
+                from elevenlabs import ElevenLabs
+
                 cls._instance = ElevenLabs(api_key=cls._api_key)
 
         return cls._instance
@@ -222,6 +220,8 @@ class TTSConfig:
             },
         }
         self.tts_session: dict[str, Any] = {}
+        from openai import OpenAI
+
         self.oai_client = OpenAI(api_key=openai_key)
         self.openai_voice = "echo"
 
@@ -525,6 +525,8 @@ async def get_or_create_elevenlabs_client(user_id=None, session=None):
 
 
 def pcm16_to_float_array(pcm_data):
+    import numpy as np
+
     values = np.frombuffer(pcm_data, dtype=np.int16).astype(np.float32)
     return values / 32768.0
 
@@ -764,6 +766,8 @@ async def flow_as_tool_websocket(
             vad_queue: asyncio.Queue = asyncio.Queue()
             vad_audio_buffer = bytearray()
             bot_speaking_flag = [False]
+            import webrtcvad
+
             vad = webrtcvad.Vad(mode=3)
 
             async def process_vad_audio() -> None:
@@ -843,7 +847,7 @@ async def flow_as_tool_websocket(
                 return new_session
 
             class Response:
-                def __init__(self, response_id: str, use_elevenlabs: bool | None = None):
+                def __init__(self, response_id: str, *, use_elevenlabs: bool | None = None):
                     if use_elevenlabs is None:
                         use_elevenlabs = False
                     self.response_id = response_id
@@ -984,7 +988,7 @@ async def flow_as_tool_websocket(
                         if do_forward:
                             msg_handler.client_send(event)
                         if event_type == "response.created":
-                            responses[response_id] = Response(response_id, voice_config.use_elevenlabs)
+                            responses[response_id] = Response(response_id, use_elevenlabs=voice_config.use_elevenlabs)
                             if function_call:
                                 if function_call.is_prog_enabled and not function_call.prog_rsp_id:
                                     function_call.prog_rsp_id = response_id
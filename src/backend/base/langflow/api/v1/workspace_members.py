@@ -6,6 +6,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlmodel import select
 
 from langflow.api.utils import CurrentActiveUser, DbSession
+from langflow.api.utils.workspace import invalidate_workspace_roles
 from langflow.services.database.models.workspace import (
     Workspace,
     WorkspaceMember,
@@ -69,6 +70,7 @@ async def add_workspace_member(
         )
         session.add(db_member)
         await session.commit()
+        invalidate_workspace_roles(member.user_id)
         await session.refresh(db_member)
         
         return db_member
@@ -194,6 +196,7 @@ async def update_workspace_member(
             setattr(db_member, key, value)
         
         await session.commit()
+        invalidate_workspace_roles(user_id)
         await session.refresh(db_member)
         
         return db_member
@@ -261,6 +264,7 @@ async def remove_workspace_member(
         # Remove the member
         await session.delete(db_member)
         await session.commit()
+        invalidate_workspace_roles(user_id)
         
         return None
     except HTTPException:
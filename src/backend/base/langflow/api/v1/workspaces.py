@@ -7,6 +7,7 @@ from sqlalchemy.orm import selectinload
 from sqlmodel import select, or_
 
 from langflow.api.utils import CurrentActiveUser, DbSession
+from langflow.api.utils.workspace import invalidate_workspace_roles
 from langflow.services.database.models.workspace import (
     Workspace,
     WorkspaceCreate,
@@ -47,6 +48,7 @@ async def create_workspace(
         )
         session.add(workspace_member)
         await session.commit()
+        invalidate_workspace_roles(current_user.id)
         
         return db_workspace
     except IntegrityError as e:
@@ -218,6 +220,8 @@ async def delete_workspace(
         # Delete workspace
         await session.delete(db_workspace)
         await session.commit()
+        # Every member loses access, not only the owner
+        invalidate_workspace_roles()
         
         return None
     except HTTPException:
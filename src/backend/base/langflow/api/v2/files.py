@@ -1,20 +1,19 @@
-import io
 import re
 import uuid
-import zipfile
-from collections.abc import AsyncGenerator
 from datetime import datetime
 from http import HTTPStatus
 from pathlib import Path
 from typing import Annotated
 from zoneinfo import ZoneInfo
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, Header, HTTPException, UploadFile
 from fastapi.responses import StreamingResponse
 from sqlmodel import String, cast, col, select
 
 from langflow.api.schemas import UploadFileResponse
 from langflow.api.utils import CurrentActiveUser, DbSession
+from langflow.api.utils.storage import storage_file_response, upload_chunks
+from langflow.api.utils.zip import ZIP_MEDIA_TYPE, fetch_ahead, stream_zip
 from langflow.services.database.models.file import File as UserFile
 from langflow.services.deps import get_settings_service, get_storage_service
 from langflow.services.storage.service import StorageService
@@ -22,12 +21,6 @@ from langflow.services.storage.service import StorageService
 router = APIRouter(tags=["Files"], prefix="/files")
 
 
-async def byte_stream_generator(file_bytes: bytes, chunk_size: int = 8192) -> AsyncGenerator[bytes, None]:
-    """Convert bytes object into an async generator that yields chunks."""
-    for i in range(0, len(file_bytes), chunk_size):
-        yield file_bytes[i : i + chunk_size]
-
-
 async def fetch_file_object(file_id: uuid.UUID, current_user: CurrentActiveUser, session: DbSession):
     # Fetch the file from the DB
     stmt = select(UserFile).where(UserFile.id == file_id)
@@ -76,7 +69,6 @@ async def upload_user_file(
     try:
         # Create a unique file name
         file_id = uuid.uuid4()
-        file_content = await file.read()
 
         # Get file extension of the file
         file_extension = "." + file.filename.split(".")[-1] if file.filename and "." in file.filename else ""
@@ -84,8 +76,10 @@ async def upload_user_file(
 
         # Here we use the current user's id as the folder name
         folder = str(current_user.id)
-        # Save the file using the storage service.
-        await storage_service.save_file(flow_id=folder, file_name=anonymized_file_name, data=file_content)
+        # Stream the file to the storage service, so it is never held in memory whole
+        file_size = await storage_service.save_file_stream(
+            flow_id=folder, file_name=anonymized_file_name, chunks=upload_chunks(file)
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error saving file: {e}") from e
 
@@ -121,9 +115,6 @@ async def upload_user_file(
             # Split the extension from the filename
             root_filename = f"{root_filename} ({count + 1})"
 
-        # Compute the file size based on the path
-        file_size = await storage_service.get_file_size(flow_id=folder, file_name=anonymized_file_name)
-
         # Compute the file path
         file_path = f"{folder}/{anonymized_file_name}"
 
@@ -196,6 +187,12 @@ async def delete_files_batch(
     return {"message": f"{len(files)} files deleted successfully"}
 
 
+# Files read from storage at the same time when streaming a zip of several files, and the
+# chunks each of them reads ahead of the zip
+ZIP_FETCH_CONCURRENCY = 4
+ZIP_FETCH_AHEAD_CHUNKS = 4
+
+
 @router.post("/batch/", status_code=HTTPStatus.OK)
 async def download_files_batch(
     file_ids: list[uuid.UUID],
@@ -203,7 +200,12 @@ async def download_files_batch(
     session: DbSession,
     storage_service: Annotated[StorageService, Depends(get_storage_service)],
 ):
-    """Download multiple files as a zip file by their IDs."""
+    """Download multiple files as a zip file by their IDs.
+
+    The zip is streamed as the files are read from storage, a chunk at a time, so neither the
+    zip nor the files are ever held in memory whole. The next few files are read ahead of the
+    one being written, a bounded number of chunks each.
+    """
     try:
         # Fetch all files from the DB
         stmt = select(UserFile).where(col(UserFile.id).in_(file_ids), col(UserFile.user_id) == current_user.id)
@@ -213,35 +215,22 @@ async def download_files_batch(
         if not files:
             raise HTTPException(status_code=404, detail="No files found")
 
-        # Create a byte stream to hold the ZIP file
-        zip_stream = io.BytesIO()
-
-        # Create a ZIP file
-        with zipfile.ZipFile(zip_stream, "w") as zip_file:
-            for file in files:
-                # Get the file content from storage
-                file_content = await storage_service.get_file(
-                    flow_id=str(current_user.id), file_name=file.path.split("/")[-1]
-                )
-
-                # Get the file extension from the original filename
-                file_extension = Path(file.path).suffix
-                # Create the filename with extension
-                filename_with_extension = f"{file.name}{file_extension}"
-
-                # Write the file to the ZIP with the proper extension
-                zip_file.writestr(filename_with_extension, file_content)
-
-        # Seek to the beginning of the byte stream
-        zip_stream.seek(0)
+        entries = (
+            (
+                # Name the entry with the extension of the original filename
+                f"{file.name}{Path(file.path).suffix}",
+                storage_service.get_file_stream(flow_id=str(current_user.id), file_name=file.path.split("/")[-1]),
+            )
+            for file in files
+        )
 
         # Generate the filename with the current datetime
         current_time = datetime.now(tz=ZoneInfo("UTC")).astimezone().strftime("%Y%m%d_%H%M%S")
         filename = f"{current_time}_langflow_files.zip"
 
         return StreamingResponse(
-            zip_stream,
-            media_type="application/x-zip-compressed",
+            stream_zip(fetch_ahead(entries, limit=ZIP_FETCH_CONCURRENCY, max_chunks=ZIP_FETCH_AHEAD_CHUNKS)),
+            media_type=ZIP_MEDIA_TYPE,
             headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
 
@@ -255,8 +244,12 @@ async def download_file(
     current_user: CurrentActiveUser,
     session: DbSession,
     storage_service: Annotated[StorageService, Depends(get_storage_service)],
+    range_header: Annotated[str | None, Header(alias="range")] = None,
 ):
-    """Download a file by its ID."""
+    """Download a file by its ID.
+
+    Supports HTTP Range requests, so media can be seeked and interrupted downloads resumed.
+    """
     try:
         # Fetch the file from the DB
         file = await fetch_file_object(file_id, current_user, session)
@@ -264,25 +257,22 @@ async def download_file(
         # Get the basename of the file path
         file_name = file.path.split("/")[-1]
 
-        # Get file stream
-        file_stream = await storage_service.get_file(flow_id=str(current_user.id), file_name=file_name)
-
         file_extension = Path(file.path).suffix
         # Create the filename with extension
         filename_with_extension = f"{file.name}{file_extension}"
 
-        # Ensure file_stream is an async iterator returning bytes
-        byte_stream = byte_stream_generator(file_stream)
+        # Return the file as a streaming response
+        return await storage_file_response(
+            storage_service,
+            str(current_user.id),
+            file_name,
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": f'attachment; filename="{filename_with_extension}"'},
+            range_header=range_header,
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error downloading file: {e}") from e
 
-    # Return the file as a streaming response
-    return StreamingResponse(
-        byte_stream,
-        media_type="application/octet-stream",
-        headers={"Content-Disposition": f'attachment; filename="{filename_with_extension}"'},
-    )
-
 
 @router.put("/{file_id}")
 async def edit_file_name(
@@ -8,6 +8,7 @@ from langchain_core.runnables import Runnable
 
 from langflow.base.agents.callback import AgentAsyncHandler
 from langflow.base.agents.events import ExceptionWithMessageError, process_agent_events
+from langflow.base.agents.message_buffer import AgentMessageBuffer
 from langflow.base.agents.utils import data_to_messages
 from langflow.custom import Component
 from langflow.custom.custom_component.component import _get_component_toolkit
@@ -166,7 +167,7 @@ class LCAgentComponent(Component):
                     version="v2",
                 ),
                 agent_message,
-                cast("SendMessageFunctionType", self.send_message),
+                cast("SendMessageFunctionType", AgentMessageBuffer(self)),
             )
         except ExceptionWithMessageError as e:
             if hasattr(e, "agent_message") and hasattr(e.agent_message, "id"):
@@ -7,6 +7,7 @@ from langchain_core.agents import AgentFinish
 from langchain_core.messages import AIMessageChunk, BaseMessage
 from typing_extensions import TypedDict
 
+from langflow.base.agents.message_buffer import AgentMessageBuffer
 from langflow.schema.content_block import ContentBlock
 from langflow.schema.content_types import TextContent, ToolContent
 from langflow.schema.log import SendMessageFunctionType
@@ -301,6 +302,9 @@ async def process_agent_events(
                 chain_handler = CHAIN_EVENT_HANDLERS[event["event"]]
                 agent_message, start_time = await chain_handler(event, agent_message, send_message_method, start_time)
         agent_message.properties.state = "complete"
+        if isinstance(send_message_method, AgentMessageBuffer):
+            # Make sure the last coalesced updates reach the database
+            agent_message = await send_message_method.flush(agent_message)
     except Exception as e:
         raise ExceptionWithMessageError(agent_message, str(e)) from e
     return await Message.create(**agent_message.model_dump())
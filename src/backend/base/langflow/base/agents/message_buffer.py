@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from langflow.custom.custom_component.component import Component
+    from langflow.schema.message import Message
+
+# Persist at most once per interval (seconds) while the agent is running...
+DEFAULT_FLUSH_INTERVAL = 2.0
+# ...unless this many updates have piled up since the last write.
+DEFAULT_MAX_PENDING_UPDATES = 25
+
+
+class AgentMessageBuffer:
+    """Coalesces the database writes of an agent message while it is being built.
+
+    Agents update the same message on every chain start, streamed chunk and tool call. The buffer
+    stores the message once, pushes every later update to the event stream right away and only
+    persists it when `flush_interval` seconds have passed or `max_pending_updates` updates are
+    pending. `flush` must be called once the run is over so the final state is always stored.
+
+    Instances can be used anywhere a `SendMessageFunctionType` is expected.
+    """
+
+    def __init__(
+        self,
+        component: Component,
+        *,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_pending_updates: int = DEFAULT_MAX_PENDING_UPDATES,
+    ) -> None:
+        self._component = component
+        self.flush_interval = flush_interval
+        self.max_pending_updates = max_pending_updates
+        self._pending_updates = 0
+        self._last_flush = perf_counter()
+        self.flush_count = 0
+
+    @property
+    def pending_updates(self) -> int:
+        return self._pending_updates
+
+    async def __call__(self, message: Message | None = None, **kwargs) -> Message:
+        message_id = getattr(message, "id", None)
+        if not message_id:
+            # First time we see this message: store it so it gets an id
+            stored_message = await self._component.send_message(message, **kwargs)
+            self._pending_updates = 0
+            self._last_flush = perf_counter()
+            return stored_message
+
+        await self._component._send_message_event(message, id_=str(message_id))
+        self._pending_updates += 1
+        if self._should_flush():
+            await self._persist(message)
+        return message
+
+    async def flush(self, message: Message) -> Message:
+        """Persist any pending updates of `message`."""
+        if getattr(message, "id", None) and self._pending_updates:
+            await self._persist(message)
+        return message
+
+    def _should_flush(self) -> bool:
+        return (
+            self._pending_updates >= self.max_pending_updates
+            or perf_counter() - self._last_flush >= self.flush_interval
+        )
+
+    async def _persist(self, message: Message) -> None:
+        # The in-memory message is kept (and returned to the caller) so that references held
+        # by the event handlers, e.g. the tool blocks map, keep pointing at the live content.
+        await self._component._update_stored_message(message)
+        self._pending_updates = 0
+        self._last_flush = perf_counter()
+        self.flush_count += 1
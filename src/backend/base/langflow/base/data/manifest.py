@@ -0,0 +1,195 @@
+import contextlib
+import hashlib
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import orjson
+from loguru import logger
+from platformdirs import user_cache_dir
+
+from langflow.schema import Data
+
+MANIFEST_DIR = Path(user_cache_dir("langflow", "langflow")) / "file_manifest"
+
+# Entries kept at most, the least recently used ones are pruned first
+MAX_ENTRIES = 10_000
+# Pruning reads the whole manifest, so it runs at most once per interval
+PRUNE_INTERVAL_SECONDS = 60 * 60
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+_PRUNE_MARKER = ".last_prune"
+
+
+def hash_file(file_path: str | Path) -> str:
+    """Return the sha256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with Path(file_path).open("rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class FileManifest:
+    """Persistent record of parsed files, used to skip re-parsing files that did not change.
+
+    Each entry maps a file path to its size, modification time, content hash and parsed `Data`.
+    A file is considered unchanged when its size and mtime match the entry, or, when only the
+    mtime changed (e.g. the file was touched or copied), when its content hash still matches.
+
+    Entries are stored one file each under `directory`, so large folders don't need the whole
+    manifest to be read or rewritten, and concurrent runs over different files don't conflict.
+    Entries of deleted files and the least recently used entries over `max_entries` are pruned.
+    """
+
+    def __init__(self, directory: str | Path | None = None, max_entries: int = MAX_ENTRIES) -> None:
+        self.directory = Path(directory) if directory is not None else MANIFEST_DIR
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, file_path: str) -> Path:
+        key = hashlib.sha256(str(Path(file_path).resolve()).encode()).hexdigest()
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, file_path: str) -> Data | None:
+        """Return the parsed `Data` of `file_path` if the file did not change since it was stored."""
+        entry_path = self._entry_path(file_path)
+        try:
+            stat = Path(file_path).stat()
+            entry = orjson.loads(entry_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+
+        if entry.get("size") != stat.st_size:
+            return None
+        if entry.get("mtime_ns") != stat.st_mtime_ns:
+            try:
+                if entry.get("sha256") != hash_file(file_path):
+                    return None
+            except OSError:
+                return None
+            # Same content, only the mtime moved: refresh it so the next lookup skips hashing
+            entry["mtime_ns"] = stat.st_mtime_ns
+            self._write_entry(entry_path, entry)
+        else:
+            # The entry's mtime tells when it was last used
+            with contextlib.suppress(OSError):
+                os.utime(entry_path)
+        return Data(data=entry["data"])
+
+    def set(self, file_path: str, data: Data) -> None:
+        """Store the parsed `Data` of `file_path` along with the file's current size, mtime and hash."""
+        try:
+            stat = Path(file_path).stat()
+            entry = {
+                "path": str(Path(file_path).resolve()),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": hash_file(file_path),
+                "data": data.data,
+            }
+        except OSError as e:
+            logger.debug(f"Could not record {file_path} in the file manifest: {e}")
+            return
+        self._write_entry(self._entry_path(file_path), entry)
+
+    def _write_entry(self, entry_path: Path, entry: dict) -> None:
+        try:
+            content = orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError as e:
+            # Parsed content that isn't JSON serializable (e.g. dates in YAML) is simply not cached
+            logger.debug(f"Could not serialize file manifest entry for {entry['path']}: {e}")
+            return
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+        except OSError as e:
+            logger.debug(f"Could not write file manifest entry for {entry['path']}: {e}")
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            Path(tmp_path).replace(entry_path)
+        except OSError as e:
+            logger.debug(f"Could not write file manifest entry for {entry['path']}: {e}")
+            with contextlib.suppress(OSError):
+                Path(tmp_path).unlink()
+
+    def prune(self, *, force: bool = False) -> int:
+        """Remove the entries of files that no longer exist, then the least recently used entries over `max_entries`.
+
+        Args:
+            force (bool): Prune even if the manifest was pruned less than `PRUNE_INTERVAL_SECONDS` ago.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        marker = self.directory / _PRUNE_MARKER
+        if not force:
+            with contextlib.suppress(OSError):
+                if time.time() - marker.stat().st_mtime < PRUNE_INTERVAL_SECONDS:
+                    return 0
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            marker.touch()
+        except OSError as e:
+            logger.debug(f"Could not prune the file manifest: {e}")
+            return 0
+
+        removed = 0
+        kept: list[tuple[float, Path]] = []
+        for entry_path in self.directory.glob("*/*.json"):
+            try:
+                last_used = entry_path.stat().st_mtime
+                if Path(orjson.loads(entry_path.read_bytes())["path"]).exists():
+                    kept.append((last_used, entry_path))
+                    continue
+            except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+                pass
+            removed += self._remove_entry(entry_path)
+
+        kept.sort()
+        for _, entry_path in kept[: max(0, len(kept) - self.max_entries)]:
+            removed += self._remove_entry(entry_path)
+        return removed
+
+    @staticmethod
+    def _remove_entry(entry_path: Path) -> int:
+        try:
+            entry_path.unlink()
+        except OSError:
+            return 0
+        return 1
+
+    def load(
+        self,
+        file_paths: list[str],
+        load_function: Callable[[list[str]], list[Data | None]],
+    ) -> list[Data | None]:
+        """Load `file_paths`, parsing only the files that changed since they were last recorded.
+
+        Args:
+            file_paths (list[str]): The files to load.
+            load_function (Callable[[list[str]], list[Data | None]]): Parses a list of files,
+                returning one result per file in the same order.
+
+        Returns:
+            list[Data | None]: The data of each file, in the order of `file_paths`.
+        """
+        results: dict[str, Data | None] = {file_path: self.get(file_path) for file_path in file_paths}
+        changed = [file_path for file_path, data in results.items() if data is None]
+        self.hits += len(results) - len(changed)
+        self.misses += len(changed)
+
+        if changed:
+            for file_path, data in zip(changed, load_function(changed), strict=True):
+                results[file_path] = data
+                if isinstance(data, Data):
+                    self.set(file_path, data)
+            self.prune()
+
+        return [results[file_path] for file_path in file_paths]
@@ -1,6 +1,8 @@
+import multiprocessing
 import unicodedata
 from collections.abc import Callable
 from concurrent import futures
+from functools import partial
 from pathlib import Path
 
 import chardet
@@ -35,6 +37,9 @@ TEXT_FILE_TYPES = [
 
 IMG_FILE_TYPES = ["jpg", "jpeg", "png", "bmp", "image"]
 
+# Types of files whose parsing is CPU bound, so they are better parsed in a process pool
+CPU_BOUND_FILE_TYPES = ["pdf", "docx"]
+
 
 def normalize_text(text):
     return unicodedata.normalize("NFKD", text)
@@ -189,11 +194,23 @@ def parallel_load_data(
     silent_errors: bool,
     max_concurrency: int,
     load_function: Callable = parse_text_file_to_data,
+    use_processes: bool = False,
 ) -> list[Data | None]:
-    with futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
-        loaded_files = executor.map(
-            lambda file_path: load_function(file_path, silent_errors=silent_errors),
-            file_paths,
+    # A process pool sidesteps the GIL for CPU bound parsers, but needs a picklable `load_function`
+    executor: futures.Executor
+    if use_processes:
+        # Forking the server process would copy its event loop, locks and open connections
+        # into the workers, so they start from a fresh interpreter instead
+        executor = futures.ProcessPoolExecutor(
+            max_workers=max_concurrency, mp_context=multiprocessing.get_context("spawn")
         )
+    else:
+        executor = futures.ThreadPoolExecutor(max_workers=max_concurrency)
+    with executor:
+        loaded_files = executor.map(partial(load_function, silent_errors=silent_errors), file_paths)
     # loaded_files is an iterator, so we need to convert it to a list
     return list(loaded_files)
+
+
+def has_cpu_bound_files(file_paths: list[str]) -> bool:
+    return any(Path(file_path).suffix[1:].lower() in CPU_BOUND_FILE_TYPES for file_path in file_paths)
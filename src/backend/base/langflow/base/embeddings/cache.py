@@ -0,0 +1,195 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import unicodedata
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+from platformdirs import user_cache_dir
+
+from langflow.field_typing import Embeddings
+
+EMBEDDING_CACHE_PATH = Path(user_cache_dir("langflow", "langflow")) / "embeddings.sqlite"
+
+# Number of cache misses sent to the wrapped model in a single `embed_documents` call
+DEFAULT_EMBEDDING_BATCH_SIZE = 256
+
+# Attributes that tell apart the vectors produced by two instances of the same embeddings class
+MODEL_IDENTITY_ATTRIBUTES = (
+    "model",
+    "model_name",
+    "model_id",
+    "deployment",
+    "azure_deployment",
+    "dimensions",
+    "base_url",
+    "openai_api_base",
+    "azure_endpoint",
+    "endpoint_url",
+    "task_type",
+)
+
+# SQLite limits the number of host parameters of a statement
+_MAX_LOOKUP_PARAMETERS = 900
+
+
+class EmbeddingStore:
+    """On-disk store of embedding vectors, saved as float32 blobs in a SQLite database."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "model TEXT NOT NULL, text_hash TEXT NOT NULL, vector BLOB NOT NULL, PRIMARY KEY (model, text_hash))"
+        )
+        self._connection.commit()
+
+    def get_many(self, model: str, text_hashes: list[str]) -> dict[str, list[float]]:
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            for start in range(0, len(text_hashes), _MAX_LOOKUP_PARAMETERS):
+                chunk = text_hashes[start : start + _MAX_LOOKUP_PARAMETERS]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._connection.execute(
+                    f"SELECT text_hash, vector FROM embeddings WHERE model = ? AND text_hash IN ({placeholders})",  # noqa: S608
+                    [model, *chunk],
+                ).fetchall()
+                for text_hash, blob in rows:
+                    found[text_hash] = np.frombuffer(blob, dtype=np.float32).tolist()
+        return found
+
+    def set_many(self, model: str, vectors: dict[str, list[float]]) -> None:
+        rows = [
+            (model, text_hash, np.asarray(vector, dtype=np.float32).tobytes()) for text_hash, vector in vectors.items()
+        ]
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text_hash, vector) VALUES (?, ?, ?)", rows
+            )
+            self._connection.commit()
+
+
+_stores: dict[Path, EmbeddingStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_embedding_store(path: str | Path | None = None) -> EmbeddingStore:
+    """Return the process-wide store saved at `path`, defaulting to the langflow cache directory."""
+    store_path = Path(path) if path is not None else EMBEDDING_CACHE_PATH
+    with _stores_lock:
+        if store_path not in _stores:
+            _stores[store_path] = EmbeddingStore(store_path)
+        return _stores[store_path]
+
+
+def get_model_identity(embeddings: Embeddings) -> str | None:
+    """Identify the model behind `embeddings`, or return None when it can't be told apart from others."""
+    identity = {
+        name: str(value)
+        for name in MODEL_IDENTITY_ATTRIBUTES
+        if (value := getattr(embeddings, name, None)) is not None and not callable(value)
+    }
+    if not identity:
+        return None
+    cls = type(embeddings)
+    return f"{cls.__module__}.{cls.__qualname__}:{json.dumps(identity, sort_keys=True)}"
+
+
+def hash_text(text: str) -> str:
+    return hashlib.sha256(unicodedata.normalize("NFC", text).encode()).hexdigest()
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper that caches document vectors by model identity and text hash.
+
+    Only the texts that are not in the cache are sent to the wrapped model, in batches of
+    `batch_size`. Queries are passed through, since they rarely repeat.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        model_identity: str,
+        *,
+        store: EmbeddingStore | None = None,
+        batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+    ) -> None:
+        self.embeddings = embeddings
+        self.model_identity = model_identity
+        self.store = store or get_embedding_store()
+        self.batch_size = max(1, batch_size)
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def wrap(
+        cls, embeddings: Embeddings, *, store: EmbeddingStore | None = None, batch_size: int | None = None
+    ) -> Embeddings:
+        """Wrap `embeddings` in a cache, or return it unchanged if its model can't be identified."""
+        if isinstance(embeddings, CachedEmbeddings):
+            return embeddings
+        model_identity = get_model_identity(embeddings)
+        if model_identity is None:
+            logger.debug(f"Not caching embeddings of {type(embeddings).__name__}: unknown model")
+            return embeddings
+        return cls(embeddings, model_identity, store=store, batch_size=batch_size or DEFAULT_EMBEDDING_BATCH_SIZE)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __getattr__(self, name: str):
+        # Expose the attributes of the wrapped model, e.g. `model` or `dimensions`
+        if name == "embeddings":
+            raise AttributeError(name)
+        return getattr(self.embeddings, name)
+
+    def _lookup(self, texts: list[str]) -> tuple[list[str], dict[str, list[float]], list[tuple[str, str]]]:
+        text_hashes = [hash_text(text) for text in texts]
+        cached = self.store.get_many(self.model_identity, list(set(text_hashes)))
+        missing: dict[str, str] = {}
+        for text, text_hash in zip(texts, text_hashes, strict=True):
+            if text_hash not in cached:
+                missing.setdefault(text_hash, text)
+        misses = sum(text_hash not in cached for text_hash in text_hashes)
+        self.hits += len(texts) - misses
+        self.misses += misses
+        return text_hashes, cached, list(missing.items())
+
+    def _store(self, cached: dict[str, list[float]], batch: list[tuple[str, str]], vectors: list[list[float]]) -> None:
+        new_vectors = {
+            text_hash: np.asarray(vector, dtype=np.float32).tolist()
+            for (text_hash, _), vector in zip(batch, vectors, strict=True)
+        }
+        self.store.set_many(self.model_identity, new_vectors)
+        cached.update(new_vectors)
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        text_hashes, cached, missing = self._lookup(texts)
+        for start in range(0, len(missing), self.batch_size):
+            batch = missing[start : start + self.batch_size]
+            self._store(cached, batch, self.embeddings.embed_documents([text for _, text in batch]))
+        return [cached[text_hash] for text_hash in text_hashes]
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        # The SQLite store is blocking, so it is accessed from a worker thread
+        text_hashes, cached, missing = await asyncio.to_thread(self._lookup, texts)
+        for start in range(0, len(missing), self.batch_size):
+            batch = missing[start : start + self.batch_size]
+            vectors = await self.embeddings.aembed_documents([text for _, text in batch])
+            await asyncio.to_thread(self._store, cached, batch, vectors)
+        return [cached[text_hash] for text_hash in text_hashes]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embeddings.embed_query(text)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        return await self.embeddings.aembed_query(text)
@@ -19,6 +19,7 @@ from pydantic import BaseModel, Field, create_model
 from sqlmodel import select
 
 from langflow.services.database.models import Flow
+from langflow.services.deps import get_http_client_service
 
 HTTP_ERROR_STATUS_CODE = httpx_codes.BAD_REQUEST  # HTTP status code for client errors
 NULLABLE_TYPE_LENGTH = 2  # Number of types in a nullable union (the type itself + null)
@@ -345,19 +346,20 @@ class MCPSseClient:
             if not parsed.scheme or not parsed.netloc:
                 return False, "Invalid URL format. Must include scheme (http/https) and host."
 
-            async with httpx.AsyncClient() as client:
-                try:
-                    # First try a HEAD request to check if server is reachable
-                    response = await client.head(url, timeout=5.0)
-                    if response.status_code >= HTTP_ERROR_STATUS_CODE:
-                        return False, f"Server returned error status: {response.status_code}"
-
-                except httpx.TimeoutException:
-                    return False, "Connection timed out. Server may be down or unreachable."
-                except httpx.NetworkError:
-                    return False, "Network error. Could not reach the server."
-                else:
-                    return True, ""
+            try:
+                # First try a HEAD request to check if server is reachable
+                response = await get_http_client_service().request(
+                    "HEAD", url, timeout=5.0, max_retries=0, follow_redirects=False
+                )
+                if response.status_code >= HTTP_ERROR_STATUS_CODE:
+                    return False, f"Server returned error status: {response.status_code}"
+
+            except httpx.TimeoutException:
+                return False, "Connection timed out. Server may be down or unreachable."
+            except httpx.NetworkError:
+                return False, "Network error. Could not reach the server."
+            else:
+                return True, ""
 
         except (httpx.HTTPError, ValueError, OSError) as e:
             return False, f"URL validation error: {e!s}"
@@ -367,10 +369,9 @@ class MCPSseClient:
         if url is None:
             return url
         try:
-            async with httpx.AsyncClient(follow_redirects=False) as client:
-                response = await client.request("HEAD", url)
-                if response.status_code == httpx.codes.TEMPORARY_REDIRECT:
-                    return response.headers.get("Location", url)
+            response = await get_http_client_service().request("HEAD", url, follow_redirects=False)
+            if response.status_code == httpx.codes.TEMPORARY_REDIRECT:
+                return response.headers.get("Location", url)
         except (httpx.RequestError, httpx.HTTPError) as e:
             logger.warning(f"Error checking redirects: {e}")
         return url
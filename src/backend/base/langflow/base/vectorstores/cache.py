@@ -0,0 +1,78 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from pathlib import Path
+from typing import Any
+
+# Keep at most this many vector stores loaded in the process...
+DEFAULT_MAX_ENTRIES = 8
+# ...using at most this many bytes, as measured by the size of their files on disk
+DEFAULT_MAX_BYTES = 2 * 1024**3
+
+
+def files_signature(*paths: Path) -> tuple[int, int]:
+    """Returns the latest modification time and the total size of `paths`.
+
+    Used as part of a cache key, so that a vector store is reloaded once its files change.
+    """
+    stats = [path.stat() for path in paths]
+    return max(stat.st_mtime_ns for stat in stats), sum(stat.st_size for stat in stats)
+
+
+class VectorStoreCache:
+    """Process-wide LRU cache of vector stores loaded from disk.
+
+    Entries are keyed by a location (e.g. persist directory and index name) plus a signature
+    of the files the store was loaded from, so a rewritten index is never served stale.
+    The least recently used entries are evicted once `max_entries` stores or `max_bytes`
+    bytes are cached.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[Hashable, Hashable], tuple[Any, int]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def get(self, location: Hashable, signature: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._entries.get((location, signature))
+            if entry is None:
+                return None
+            self._entries.move_to_end((location, signature))
+            return entry[0]
+
+    def set(self, location: Hashable, signature: Hashable, vector_store: Any, size: int) -> None:
+        with self._lock:
+            # Only the latest version of a location is worth keeping
+            self.invalidate(location)
+            if size > self.max_bytes:
+                return
+            self._entries[location, signature] = (vector_store, size)
+            self._size += size
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+
+    def invalidate(self, location: Hashable) -> None:
+        """Drops every cached version of the vector store at `location`."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == location]:
+                _, size = self._entries.pop(key)
+                self._size -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+vector_store_cache = VectorStoreCache()
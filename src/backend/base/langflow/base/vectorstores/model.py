@@ -2,16 +2,23 @@ from abc import abstractmethod
 from functools import wraps
 from typing import TYPE_CHECKING, Any
 
+from langflow.base.embeddings.cache import DEFAULT_EMBEDDING_BATCH_SIZE, CachedEmbeddings
+from langflow.base.vectorstores.utils import document_id
 from langflow.custom import Component
-from langflow.field_typing import Text, VectorStore
+from langflow.field_typing import Embeddings, Text, VectorStore
 from langflow.helpers.data import docs_to_data
 from langflow.inputs.inputs import BoolInput
-from langflow.io import HandleInput, Output, QueryInput
+from langflow.io import HandleInput, IntInput, Output, QueryInput
 from langflow.schema import Data, DataFrame
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from langchain_core.documents import Document
 
+# Number of ids looked up at a time when checking which documents are already stored
+ID_LOOKUP_BATCH_SIZE = 1000
+
 
 def check_cached_vector_store(f):
     """Decorator to check for cached vector stores, and returns them if they exist.
@@ -29,8 +36,14 @@ def check_cached_vector_store(f):
         if should_cache and self._cached_vector_store is not None:
             return self._cached_vector_store
 
+        embedding = self._use_cached_embeddings()
         result = f(self, *args, **kwargs)
         self._cached_vector_store = result
+        if isinstance(embedding, CachedEmbeddings) and (embedding.hits or embedding.misses):
+            self.log(
+                f"Embedding cache: {embedding.hits} hits, {embedding.misses} misses "
+                f"({embedding.hit_rate:.0%} hit rate)."
+            )
         return result
 
     check_cached.is_cached_vector_store_checked = True
@@ -77,6 +90,21 @@ class LCVectorStoreComponent(Component):
             info="If True, the vector store will be cached for the current build of the component. "
             "This is useful for components that have multiple output methods and want to share the same vector store.",
         ),
+        BoolInput(
+            name="cache_embeddings",
+            display_name="Cache Embeddings",
+            value=True,
+            advanced=True,
+            info="If True, document embeddings are cached on disk by model and text, "
+            "so unchanged documents are not embedded again when they are ingested again.",
+        ),
+        IntInput(
+            name="embedding_batch_size",
+            display_name="Embedding Batch Size",
+            value=DEFAULT_EMBEDDING_BATCH_SIZE,
+            advanced=True,
+            info="Number of uncached documents sent to the embedding model at a time.",
+        ),
     ]
 
     outputs = [
@@ -103,6 +131,14 @@ class LCVectorStoreComponent(Component):
                 msg = f"Method '{method_name}' must be defined."
                 raise ValueError(msg)
 
+    def _use_cached_embeddings(self) -> Any:
+        """Wrap the `embedding` input in a persistent cache when `cache_embeddings` is enabled."""
+        embedding = self._attributes.get("embedding")
+        if getattr(self, "cache_embeddings", False) and isinstance(embedding, Embeddings):
+            embedding = CachedEmbeddings.wrap(embedding, batch_size=getattr(self, "embedding_batch_size", None))
+            self._attributes["embedding"] = embedding
+        return embedding
+
     def _prepare_ingest_data(self) -> list[Any]:
         """Prepares ingest_data by converting DataFrame to Data if needed."""
         ingest_data: list | Data | DataFrame = self.ingest_data
@@ -121,6 +157,52 @@ class LCVectorStoreComponent(Component):
                 result.append(_input)
         return result
 
+    def _prepare_documents(self) -> tuple[list["Document"], list[str]]:
+        """Converts ingest_data to documents with deterministic, content based ids.
+
+        Documents with the same content and metadata get the same id, so duplicates within
+        ingest_data are dropped here and documents that are already stored can be skipped
+        by id instead of by comparing their content.
+
+        Returns:
+            tuple[list[Document], list[str]]: The unique documents and their ids.
+        """
+        documents: dict[str, Document] = {}
+        for _input in self._prepare_ingest_data():
+            document = _input.to_lc_document() if isinstance(_input, Data) else _input
+            documents.setdefault(document_id(document), document)
+        return list(documents.values()), list(documents.keys())
+
+    def _get_existing_ids(self, vector_store: VectorStore, ids: "Sequence[str]") -> set[str]:
+        """Returns the subset of `ids` already in the vector store.
+
+        Implementations can override this method when their vector store has a cheaper way to
+        check ids than `get_by_ids`, or doesn't implement it.
+        """
+        try:
+            return {document.id for document in vector_store.get_by_ids(ids) if document.id}
+        except NotImplementedError:
+            return set()
+
+    def _add_new_documents(self, vector_store: VectorStore, documents: list["Document"], ids: list[str]) -> None:
+        """Adds the documents whose ids are not in the vector store yet."""
+        existing_ids: set[str] = set()
+        for start in range(0, len(ids), ID_LOOKUP_BATCH_SIZE):
+            existing_ids |= self._get_existing_ids(vector_store, ids[start : start + ID_LOOKUP_BATCH_SIZE])
+
+        new_documents = [
+            (document, id_) for document, id_ in zip(documents, ids, strict=True) if id_ not in existing_ids
+        ]
+        if existing_ids:
+            self.log(f"Skipping {len(existing_ids)} documents already in the Vector Store.")
+        if new_documents:
+            self.log(f"Adding {len(new_documents)} documents to the Vector Store.")
+            vector_store.add_documents(
+                [document for document, _ in new_documents], ids=[id_ for _, id_ in new_documents]
+            )
+        else:
+            self.log("No documents to add to the Vector Store.")
+
     def search_with_vector_store(
         self,
         input_value: Text,
@@ -1,5 +1,28 @@
+import hashlib
+import uuid
+from typing import TYPE_CHECKING
+
+import orjson
+
 from langflow.schema import Data
 
+if TYPE_CHECKING:
+    from langchain_core.documents import Document
+
+
+def document_id(document: "Document") -> str:
+    """Returns a deterministic id for a document, derived from its content and metadata.
+
+    The id is formatted as a UUID so that it is accepted by every vector store, including
+    the ones that only allow UUIDs (e.g. Qdrant).
+    """
+    payload = orjson.dumps(
+        {"page_content": document.page_content, "metadata": document.metadata},
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        default=str,
+    )
+    return str(uuid.UUID(hex=hashlib.sha256(payload).hexdigest()[:32]))
+
 
 def chroma_collection_to_data(collection_dict: dict):
     """Converts a collection of chroma vectors into a list of data.
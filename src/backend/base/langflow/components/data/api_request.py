@@ -26,7 +26,7 @@ from langflow.io import (
 )
 from langflow.schema import Data
 from langflow.schema.dotdict import dotdict
-from langflow.services.deps import get_settings_service
+from langflow.services.deps import get_http_client_service, get_settings_service
 from langflow.utils.component_utils import set_current_fields, set_field_advanced, set_field_display
 
 # Define fields for each mode
@@ -438,7 +438,8 @@ class APIRequestComponent(Component):
         body = self._process_body(body)
         url = self.add_query_params(url, query_params)
 
-        async with httpx.AsyncClient() as client:
+        # A client of its own per run, reusing the pooled connections of the shared one
+        async with get_http_client_service().get_client() as client:
             result = await self.make_request(
                 client,
                 method,
@@ -1,4 +1,11 @@
-from langflow.base.data.utils import TEXT_FILE_TYPES, parallel_load_data, parse_text_file_to_data, retrieve_file_paths
+from langflow.base.data.manifest import FileManifest
+from langflow.base.data.utils import (
+    TEXT_FILE_TYPES,
+    has_cpu_bound_files,
+    parallel_load_data,
+    parse_text_file_to_data,
+    retrieve_file_paths,
+)
 from langflow.custom import Component
 from langflow.io import BoolInput, IntInput, MessageTextInput, MultiselectInput
 from langflow.schema import Data
@@ -64,6 +71,13 @@ class DirectoryComponent(Component):
             advanced=True,
             info="If true, multithreading will be used.",
         ),
+        BoolInput(
+            name="skip_unchanged_files",
+            display_name="Skip Unchanged Files",
+            advanced=True,
+            value=True,
+            info="If true, files that did not change since they were last loaded are not parsed again.",
+        ),
     ]
 
     outputs = [
@@ -99,11 +113,22 @@ class DirectoryComponent(Component):
             resolved_path, load_hidden=load_hidden, recursive=recursive, depth=depth, types=valid_types
         )
 
-        loaded_data = []
-        if use_multithreading:
-            loaded_data = parallel_load_data(file_paths, silent_errors=silent_errors, max_concurrency=max_concurrency)
+        def load_files(paths: list[str]) -> list[Data | None]:
+            if use_multithreading:
+                return parallel_load_data(
+                    paths,
+                    silent_errors=silent_errors,
+                    max_concurrency=max_concurrency,
+                    use_processes=has_cpu_bound_files(paths),
+                )
+            return [parse_text_file_to_data(file_path, silent_errors=silent_errors) for file_path in paths]
+
+        if self.skip_unchanged_files:
+            manifest = FileManifest()
+            loaded_data = manifest.load(file_paths, load_files)
+            self.log(f"Loaded {manifest.hits} unchanged files from the manifest and parsed {manifest.misses} files.")
         else:
-            loaded_data = [parse_text_file_to_data(file_path, silent_errors=silent_errors) for file_path in file_paths]
+            loaded_data = load_files(file_paths)
 
         valid_data = [x for x in loaded_data if x is not None and isinstance(x, Data)]
         self.status = valid_data
@@ -1,4 +1,7 @@
+from pathlib import Path
+
 from langflow.base.data import BaseFileComponent
+from langflow.base.data.manifest import FileManifest
 from langflow.base.data.utils import TEXT_FILE_TYPES, parallel_load_data, parse_text_file_to_data
 from langflow.io import BoolInput, IntInput
 from langflow.schema import Data
@@ -34,6 +37,13 @@ class FileComponent(BaseFileComponent):
             info="When multiple files are being processed, the number of files to process concurrently.",
             value=1,
         ),
+        BoolInput(
+            name="skip_unchanged_files",
+            display_name="Skip Unchanged Files",
+            advanced=True,
+            value=True,
+            info="If true, files that did not change since they were last loaded are not parsed again.",
+        ),
     ]
 
     outputs = [
@@ -72,22 +82,37 @@ class FileComponent(BaseFileComponent):
             raise ValueError(msg)
 
         concurrency = 1 if not self.use_multithreading else max(1, self.concurrency_multithreading)
-        file_count = len(file_list)
 
-        parallel_processing_threshold = 2
-        if concurrency < parallel_processing_threshold or file_count < parallel_processing_threshold:
-            if file_count > 1:
-                self.log(f"Processing {file_count} files sequentially.")
-            processed_data = [process_file(str(file.path), silent_errors=self.silent_errors) for file in file_list]
-        else:
-            self.log(f"Starting parallel processing of {file_count} files with concurrency: {concurrency}.")
-            file_paths = [str(file.path) for file in file_list]
-            processed_data = parallel_load_data(
+        def process_paths(file_paths: list[str]) -> list[Data | None]:
+            parallel_processing_threshold = 2
+            if concurrency < parallel_processing_threshold or len(file_paths) < parallel_processing_threshold:
+                if len(file_paths) > 1:
+                    self.log(f"Processing {len(file_paths)} files sequentially.")
+                return [process_file(file_path, silent_errors=self.silent_errors) for file_path in file_paths]
+            self.log(f"Starting parallel processing of {len(file_paths)} files with concurrency: {concurrency}.")
+            return parallel_load_data(
                 file_paths,
                 silent_errors=self.silent_errors,
                 load_function=process_file,
                 max_concurrency=concurrency,
             )
 
+        file_paths = [str(file.path) for file in file_list]
+        if self.skip_unchanged_files:
+            # Unpacked bundles and files deleted after processing get a new path on every run
+            temp_dirs = [Path(temp_dir.name) for temp_dir in getattr(self, "_temp_dirs", [])]
+            cacheable = [
+                not file.delete_after_processing and not any(file.path.is_relative_to(d) for d in temp_dirs)
+                for file in file_list
+            ]
+            manifest = FileManifest()
+            cached_data = manifest.load([p for p, c in zip(file_paths, cacheable, strict=True) if c], process_paths)
+            uncached_data = process_paths([p for p, c in zip(file_paths, cacheable, strict=True) if not c])
+            processed_data = [*cached_data, *uncached_data]
+            if manifest.hits:
+                self.log(f"Skipped parsing {manifest.hits} unchanged files.")
+        else:
+            processed_data = process_paths(file_paths)
+
         # Use rollup_basefile_data to merge processed data with BaseFile objects
         return self.rollup_data(file_list, processed_data)
@@ -7,6 +7,7 @@ from langchain_core.agents import AgentFinish
 from loguru import logger
 
 from langflow.base.agents.events import ExceptionWithMessageError, process_agent_events
+from langflow.base.agents.message_buffer import AgentMessageBuffer
 from langflow.base.astra_assistants.util import (
     get_patched_openai_client,
     litellm_model_names,
@@ -294,7 +295,7 @@ class AstraAssistantManager(ComponentWithCache):
                 processed_result = await process_agent_events(
                     step_iterator(),
                     agent_message,
-                    cast("SendMessageFunctionType", self.send_message),
+                    cast("SendMessageFunctionType", AgentMessageBuffer(self)),
                 )
                 self.status = processed_result
         except ExceptionWithMessageError as e:
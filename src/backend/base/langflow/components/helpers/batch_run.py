@@ -1,17 +1,26 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import time
 from typing import TYPE_CHECKING, Any, cast
 
+import pandas as pd
 import toml  # type: ignore[import-untyped]
 from loguru import logger
 
 from langflow.custom import Component
-from langflow.io import BoolInput, DataFrameInput, HandleInput, MessageTextInput, MultilineInput, Output
+from langflow.io import BoolInput, DataFrameInput, HandleInput, IntInput, MessageTextInput, MultilineInput, Output
 from langflow.schema import DataFrame
+from langflow.services.cache.utils import CACHE_MISS
+from langflow.services.deps import get_shared_component_cache_service
 
 if TYPE_CHECKING:
     from langchain_core.runnables import Runnable
 
+# Base delay between retries of failed rows, doubled on every attempt
+RETRY_BACKOFF_SECONDS = 1.0
+
 
 class BatchRunComponent(Component):
     display_name = "Batch Run"
@@ -65,6 +74,34 @@ class BatchRunComponent(Component):
             required=False,
             advanced=True,
         ),
+        IntInput(
+            name="chunk_size",
+            display_name="Chunk Size",
+            info="Number of rows sent to the model at a time. Results are reported after each chunk.",
+            value=100,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrency",
+            info="Maximum number of requests in flight at the same time.",
+            value=10,
+            advanced=True,
+        ),
+        IntInput(
+            name="requests_per_minute",
+            display_name="Requests per Minute",
+            info="Maximum number of rows sent to the model per minute. 0 disables rate limiting.",
+            value=0,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_retries",
+            display_name="Max Retries",
+            info="Number of times a failed row is retried before its error is recorded.",
+            value=2,
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -110,9 +147,95 @@ class BatchRunComponent(Component):
                 "processing_status": "failed",
             }
 
+    def _get_checkpoint_key(self, df: DataFrame, system_msg: str, col_name: str, chunk_size: int) -> str | None:
+        """Build a key identifying this batch job, so an interrupted run can resume from its completed chunks."""
+        try:
+            content_hash = pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes()
+        except TypeError:
+            # Unhashable cells (e.g. dicts or lists): the job can't be identified, so it is not resumable
+            return None
+        digest = hashlib.sha256(content_hash)
+        parts = (
+            self._model_identity(),
+            system_msg,
+            col_name,
+            self.output_column_name,
+            str(chunk_size),
+            repr(list(df.columns)),
+        )
+        for part in parts:
+            digest.update(part.encode())
+        return f"batch_run:{self._id}:{digest.hexdigest()}"
+
+    def _model_identity(self) -> str:
+        """Describe the model by its class and identifying config (model name, temperature, etc.).
+
+        Responses checkpointed by one model are not reused once the model or its config changes.
+        """
+        model_class = type(self.model)
+        params = getattr(self.model, "_identifying_params", None) or {}
+        return f"{model_class.__module__}.{model_class.__qualname__}:{sorted(dict(params).items())}"
+
+    async def _run_chunk(self, model: Runnable, conversations: list[list[dict[str, str]]]) -> list[Any]:
+        """Run the conversations of one chunk, retrying the rows that failed.
+
+        Returns:
+            list[Any]: The model response for each conversation, or the exception of its last attempt.
+        """
+        results: list[Any] = [None] * len(conversations)
+        pending = list(range(len(conversations)))
+        max_concurrency = max(1, self.max_concurrency or 1)
+
+        for attempt in range(max(0, self.max_retries) + 1):
+            if attempt:
+                await asyncio.sleep(RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+            try:
+                outputs = await model.abatch(
+                    [conversations[i] for i in pending],
+                    config={"max_concurrency": max_concurrency},
+                    return_exceptions=True,
+                )
+            except Exception as e:  # noqa: BLE001
+                outputs = [e] * len(pending)
+
+            failed = []
+            for i, output in zip(pending, outputs, strict=True):
+                results[i] = output
+                if isinstance(output, Exception):
+                    failed.append(i)
+            if not failed:
+                break
+            logger.warning(f"{len(failed)} rows failed on attempt {attempt + 1}")
+            pending = failed
+
+        return results
+
+    def _build_rows(
+        self, records: list[dict[str, Any]], responses: list[Any], start: int, system_msg: str
+    ) -> list[dict[str, Any]]:
+        """Combine the original rows of a chunk with their model responses or errors."""
+        rows: list[dict[str, Any]] = []
+        for offset, (original_row, response) in enumerate(zip(records, responses, strict=True)):
+            if isinstance(response, Exception):
+                row = self._create_base_row(original_row, model_response="", batch_index=start + offset)
+                self._add_metadata(row, success=False, error=str(response))
+            else:
+                response_text = response.content if hasattr(response, "content") else str(response)
+                row = self._create_base_row(original_row, model_response=response_text, batch_index=start + offset)
+                self._add_metadata(row, success=True, system_msg=system_msg)
+            rows.append(row)
+        return rows
+
     async def run_batch(self) -> DataFrame:
         """Process each row in df[column_name] with the language model asynchronously.
 
+        Rows are sent to the model in chunks of `chunk_size` rows, with at most
+        `max_concurrency` requests in flight and an optional `requests_per_minute` limit.
+        Failed rows are retried up to `max_retries` times and then recorded with an empty
+        response (and their error in the metadata) instead of failing the whole batch.
+        Each completed chunk is logged as soon as it is done and checkpointed, so running
+        the same batch again after an interruption resumes after the last completed chunk.
+
         Returns:
             DataFrame: A new DataFrame containing:
                 - All original columns
@@ -139,24 +262,10 @@ class BatchRunComponent(Component):
             raise ValueError(msg)
 
         try:
-            # Determine text input for each row
-            if col_name:
-                user_texts = df[col_name].astype(str).tolist()
-            else:
-                user_texts = [
-                    self._format_row_as_toml(cast(dict[str, Any], row)) for row in df.to_dict(orient="records")
-                ]
-
-            total_rows = len(user_texts)
-            logger.info(f"Processing {total_rows} rows with batch run")
-
-            # Prepare the batch of conversations
-            conversations = [
-                [{"role": "system", "content": system_msg}, {"role": "user", "content": text}]
-                if system_msg
-                else [{"role": "user", "content": text}]
-                for text in user_texts
-            ]
+            total_rows = len(df)
+            chunk_size = max(1, self.chunk_size or total_rows or 1)
+            total_chunks = -(-total_rows // chunk_size)
+            logger.info(f"Processing {total_rows} rows with batch run in {total_chunks} chunks")
 
             # Configure the model with project info and callbacks
             model = model.with_config(
@@ -166,33 +275,61 @@ class BatchRunComponent(Component):
                     "callbacks": self.get_langchain_callbacks(),
                 }
             )
-            # Process batches and track progress
-            responses_with_idx = list(
-                zip(
-                    range(len(conversations)),
-                    await model.abatch(list(conversations)),
-                    strict=True,
-                )
-            )
 
-            # Sort by index to maintain order
-            responses_with_idx.sort(key=lambda x: x[0])
+            cache = get_shared_component_cache_service()
+            checkpoint_key = self._get_checkpoint_key(df, system_msg, col_name, chunk_size)
+            checkpoint = cache.get(checkpoint_key) if checkpoint_key else CACHE_MISS
+            completed_chunks: dict[int, list[dict[str, Any]]] = {} if checkpoint is CACHE_MISS else checkpoint
+            if completed_chunks:
+                logger.info(f"Resuming batch run after {len(completed_chunks)} completed chunks")
 
-            # Build the final data with enhanced metadata
             rows: list[dict[str, Any]] = []
-            for idx, (original_row, response) in enumerate(
-                zip(df.to_dict(orient="records"), responses_with_idx, strict=False)
-            ):
-                response_text = response[1].content if hasattr(response[1], "content") else str(response[1])
-                row = self._create_base_row(
-                    cast(dict[str, Any], original_row), model_response=response_text, batch_index=idx
-                )
-                self._add_metadata(row, success=True, system_msg=system_msg)
-                rows.append(row)
+            failed_rows = 0
+            for chunk_index, start in enumerate(range(0, total_rows, chunk_size)):
+                if chunk_index in completed_chunks:
+                    rows.extend(completed_chunks[chunk_index])
+                    continue
+
+                chunk_started = time.monotonic()
+                chunk_df = df.iloc[start : start + chunk_size]
+                records = cast("list[dict[str, Any]]", chunk_df.to_dict(orient="records"))
+
+                # Determine text input for each row of the chunk
+                if col_name:
+                    user_texts = chunk_df[col_name].astype(str).tolist()
+                else:
+                    user_texts = [self._format_row_as_toml(row) for row in records]
+
+                conversations = [
+                    [{"role": "system", "content": system_msg}, {"role": "user", "content": text}]
+                    if system_msg
+                    else [{"role": "user", "content": text}]
+                    for text in user_texts
+                ]
+
+                responses = await self._run_chunk(model, conversations)
+                chunk_rows = self._build_rows(records, responses, start, system_msg)
+                chunk_failures = sum(isinstance(response, Exception) for response in responses)
+                failed_rows += chunk_failures
+                rows.extend(chunk_rows)
+
+                # Only fully successful chunks are checkpointed, so failed rows are retried on resume
+                if checkpoint_key and not chunk_failures:
+                    completed_chunks[chunk_index] = chunk_rows
+                    cache.set(checkpoint_key, completed_chunks)
+
+                # Stream the partial results as soon as the chunk is done
+                self.log(chunk_rows, name=f"Chunk {chunk_index + 1}/{total_chunks}")
+                logger.info(f"Processed {len(rows)}/{total_rows} rows ({failed_rows} failed)")
+
+                if self.requests_per_minute and self.requests_per_minute > 0:
+                    min_chunk_seconds = len(conversations) * 60 / self.requests_per_minute
+                    remaining = min_chunk_seconds - (time.monotonic() - chunk_started)
+                    if remaining > 0:
+                        await asyncio.sleep(remaining)
 
-                # Log progress
-                if (idx + 1) % max(1, total_rows // 10) == 0:
-                    logger.info(f"Processed {idx + 1}/{total_rows} rows")
+            if checkpoint_key and not failed_rows:
+                cache.delete(checkpoint_key)
 
             logger.info("Batch processing completed successfully")
             return DataFrame(rows)
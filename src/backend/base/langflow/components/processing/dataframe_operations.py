@@ -181,6 +181,7 @@ class DataFrameOperationsComponent(Component):
 
     # Existing methods
     def filter_rows_by_value(self, df: DataFrame) -> DataFrame:
+        # Typed equality: 1 only matches 1, not the string "1"
         return DataFrame(df[df[self.column_name] == self.filter_value])
 
     def sort_by_column(self, df: DataFrame) -> DataFrame:
@@ -1,8 +1,9 @@
-from typing import Any
+import pandas as pd
 
 from langflow.custom import Component
 from langflow.io import DataInput, DropdownInput, MessageTextInput, Output
 from langflow.schema import Data
+from langflow.schema.dataframe import compare_column
 
 
 class DataFilterComponent(Component):
@@ -46,19 +47,6 @@ class DataFilterComponent(Component):
         Output(display_name="Filtered Data", name="filtered_data", method="filter_data"),
     ]
 
-    def compare_values(self, item_value: Any, filter_value: str, operator: str) -> bool:
-        if operator == "equals":
-            return str(item_value) == filter_value
-        if operator == "not equals":
-            return str(item_value) != filter_value
-        if operator == "contains":
-            return filter_value in str(item_value)
-        if operator == "starts with":
-            return str(item_value).startswith(filter_value)
-        if operator == "ends with":
-            return str(item_value).endswith(filter_value)
-        return False
-
     def filter_data(self) -> list[Data]:
         # Extract inputs
         input_data: list[Data] = self.input_data
@@ -75,14 +63,13 @@ class DataFilterComponent(Component):
             self.status = "Filter key or value is missing."
             return input_data
 
-        # Filter the data
-        filtered_data = []
-        for item in input_data:
-            if isinstance(item.data, dict) and filter_key in item.data:
-                if self.compare_values(item.data[filter_key], filter_value, operator):
-                    filtered_data.append(item)
-            else:
-                self.status = f"Warning: Some items don't have the key '{filter_key}' or are not dictionaries."
+        # Filter the data, comparing the whole column of values at once
+        keyed_data = [item for item in input_data if isinstance(item.data, dict) and filter_key in item.data]
+        if len(keyed_data) < len(input_data):
+            self.status = f"Warning: Some items don't have the key '{filter_key}' or are not dictionaries."
+        values = pd.Series([item.data[filter_key] for item in keyed_data], dtype=object)
+        mask = compare_column(values, filter_value, operator)
+        filtered_data = [item for item, keep in zip(keyed_data, mask, strict=True) if keep]
 
         self.status = filtered_data
         return filtered_data
@@ -1,5 +1,6 @@
 from langflow.custom import Component
 from langflow.io import DataFrameInput, MultilineInput, Output, StrInput
+from langflow.schema import DataFrame
 from langflow.schema.message import Message
 
 
@@ -43,7 +44,7 @@ class ParseDataFrameComponent(Component):
     ]
 
     def _clean_args(self):
-        dataframe = self.df
+        dataframe = self.df if isinstance(self.df, DataFrame) else DataFrame(self.df)
         template = self.template or "{text}"
         sep = self.sep or "\n"
         return dataframe, template, sep
@@ -55,12 +56,8 @@ class ParseDataFrameComponent(Component):
         """
         dataframe, template, sep = self._clean_args()
 
-        lines = []
-        # For each row in the DataFrame, build a dict and format
-        for _, row in dataframe.iterrows():
-            row_dict = row.to_dict()
-            text_line = template.format(**row_dict)  # e.g. template="{text}", row_dict={"text": "Hello"}
-            lines.append(text_line)
+        # Format all rows at once, e.g. template="{text}" renders the "text" column
+        lines = dataframe.format_rows(template)
 
         # Join all lines with the provided separator
         result_string = sep.join(lines)
@@ -127,9 +127,7 @@ class ParserComponent(Component):
 
         lines = []
         if df is not None:
-            for _, row in df.iterrows():
-                formatted_text = self.pattern.format(**row.to_dict())
-                lines.append(formatted_text)
+            lines = df.format_rows(self.pattern)
         elif data is not None:
             formatted_text = self.pattern.format(**data.data)
             lines.append(formatted_text)
@@ -1,4 +1,4 @@
-from copy import deepcopy
+from typing import TYPE_CHECKING
 
 from chromadb.config import Settings
 from langchain_chroma import Chroma
@@ -9,6 +9,9 @@ from langflow.base.vectorstores.utils import chroma_collection_to_data
 from langflow.io import BoolInput, DropdownInput, HandleInput, IntInput, StrInput
 from langflow.schema import Data, DataFrame
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 
 class ChromaVectorStoreComponent(LCVectorStoreComponent):
     """Chroma Vector Store with search capabilities."""
@@ -79,7 +82,7 @@ class ChromaVectorStoreComponent(LCVectorStoreComponent):
             name="limit",
             display_name="Limit",
             advanced=True,
-            info="Limit the number of records to compare when Allow Duplicates is False.",
+            info="Limit the number of records shown in the component status.",
         ),
     ]
 
@@ -128,28 +131,21 @@ class ChromaVectorStoreComponent(LCVectorStoreComponent):
             return
 
         # Convert DataFrame to Data if needed using parent's method
-        ingest_data = self._prepare_ingest_data()
-
-        stored_documents_without_id = []
-        if self.allow_duplicates:
-            stored_data = []
-        else:
-            stored_data = chroma_collection_to_data(vector_store.get(limit=self.limit))
-            for value in deepcopy(stored_data):
-                del value.id
-                stored_documents_without_id.append(value)
-
-        documents = []
-        for _input in ingest_data or []:
-            if isinstance(_input, Data):
-                if _input not in stored_documents_without_id:
-                    documents.append(_input.to_lc_document())
-            else:
-                msg = "Vector Store Inputs must be Data objects."
-                raise TypeError(msg)
+        if any(not isinstance(_input, Data) for _input in self._prepare_ingest_data()):
+            msg = "Vector Store Inputs must be Data objects."
+            raise TypeError(msg)
 
-        if documents and self.embedding is not None:
+        if self.embedding is None:
+            self.log("No documents to add to the Vector Store.")
+        elif self.allow_duplicates:
+            documents = [_input.to_lc_document() for _input in self._prepare_ingest_data()]
             self.log(f"Adding {len(documents)} documents to the Vector Store.")
             vector_store.add_documents(documents)
         else:
-            self.log("No documents to add to the Vector Store.")
+            # Documents get content based ids, so the ones already stored are skipped by id
+            documents, ids = self._prepare_documents()
+            self._add_new_documents(vector_store, documents, ids)
+
+    @override
+    def _get_existing_ids(self, vector_store: "Chroma", ids: "Sequence[str]") -> set[str]:
+        return set(vector_store.get(ids=list(ids), include=[])["ids"])
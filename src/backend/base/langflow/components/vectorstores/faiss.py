@@ -1,7 +1,9 @@
+import pickle
 from pathlib import Path
 
 from langchain_community.vectorstores import FAISS
 
+from langflow.base.vectorstores.cache import files_signature, vector_store_cache
 from langflow.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
 from langflow.helpers.data import docs_to_data
 from langflow.io import BoolInput, HandleInput, IntInput, StrInput
@@ -44,6 +46,14 @@ class FaissVectorStoreComponent(LCVectorStoreComponent):
             advanced=True,
             value=4,
         ),
+        BoolInput(
+            name="memory_map_index",
+            display_name="Memory Map Index",
+            info="Set to True to memory-map the index file instead of reading it into memory. "
+            "Useful for indexes larger than the available memory.",
+            advanced=True,
+            value=False,
+        ),
     ]
 
     @staticmethod
@@ -69,34 +79,74 @@ class FaissVectorStoreComponent(LCVectorStoreComponent):
         path = self.get_persist_directory()
         path.mkdir(parents=True, exist_ok=True)
 
-        # Convert DataFrame to Data if needed using parent's method
-        self.ingest_data = self._prepare_ingest_data()
+        # Content based ids drop duplicated documents and keep the docstore ids stable across runs
+        documents, ids = self._prepare_documents()
 
-        documents = []
-        for _input in self.ingest_data or []:
-            if isinstance(_input, Data):
-                documents.append(_input.to_lc_document())
-            else:
-                documents.append(_input)
-
-        faiss = FAISS.from_documents(documents=documents, embedding=self.embedding)
+        faiss = FAISS.from_documents(documents=documents, embedding=self.embedding, ids=ids)
         faiss.save_local(str(path), self.index_name)
+        # The index on disk was rewritten: cache the new one so searches don't read it back
+        self._cache_index(faiss)
         return faiss
 
-    def search_documents(self) -> list[Data]:
-        """Search for documents in the FAISS vector store."""
+    def _index_files(self) -> tuple[Path, Path]:
         path = self.get_persist_directory()
-        index_path = path / f"{self.index_name}.faiss"
+        return path / f"{self.index_name}.faiss", path / f"{self.index_name}.pkl"
+
+    def _index_location(self) -> tuple[str, str]:
+        return str(self.get_persist_directory().resolve()), self.index_name
+
+    def _cache_index(self, vector_store: FAISS) -> None:
+        signature = files_signature(*self._index_files())
+        vector_store_cache.set(self._index_location(), signature, vector_store, size=signature[1])
 
-        if not index_path.exists():
-            vector_store = self.build_vector_store()
-        else:
-            vector_store = FAISS.load_local(
+    def _read_index(self) -> FAISS:
+        """Reads the FAISS index from disk, memory-mapping it if `memory_map_index` is set."""
+        path = self.get_persist_directory()
+        if not self.memory_map_index:
+            return FAISS.load_local(
                 folder_path=str(path),
                 embeddings=self.embedding,
                 index_name=self.index_name,
                 allow_dangerous_deserialization=self.allow_dangerous_deserialization,
             )
+        import faiss
+
+        index_file, docstore_file = self._index_files()
+        index = faiss.read_index(str(index_file), faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+        with docstore_file.open("rb") as f:
+            docstore, index_to_docstore_id = pickle.load(f)  # noqa: S301
+        return FAISS(self.embedding, index, docstore, index_to_docstore_id)
+
+    def load_vector_store(self) -> FAISS:
+        """Returns the FAISS index on disk, reusing the copy loaded by a previous run when it is unchanged."""
+        # Checked before the cache too: a copy loaded by a run that allowed it isn't reused by one that doesn't
+        if not self.allow_dangerous_deserialization:
+            msg = (
+                "Loading a FAISS index relies on loading a pickle file. "
+                "Set Allow Dangerous Deserialization to True if you trust the source of the index."
+            )
+            raise ValueError(msg)
+        signature = files_signature(*self._index_files())
+        cached = vector_store_cache.get(self._index_location(), signature)
+        if cached is None:
+            cached = self._read_index()
+            vector_store_cache.set(self._index_location(), signature, cached, size=signature[1])
+        # Share the index and docstore, but embed queries with this run's embedding model
+        return FAISS(
+            self.embedding,
+            cached.index,
+            cached.docstore,
+            cached.index_to_docstore_id,
+            normalize_L2=cached._normalize_L2,
+            distance_strategy=cached.distance_strategy,
+        )
+
+    def search_documents(self) -> list[Data]:
+        """Search for documents in the FAISS vector store."""
+        path = self.get_persist_directory()
+        index_path = path / f"{self.index_name}.faiss"
+
+        vector_store = self.load_vector_store() if index_path.exists() else self.build_vector_store()
 
         if not vector_store:
             msg = "Failed to load the FAISS index."
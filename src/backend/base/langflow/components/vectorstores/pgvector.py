@@ -1,4 +1,8 @@
+from collections.abc import Sequence
+
 from langchain_community.vectorstores import PGVector
+from sqlalchemy.orm import Session
+from typing_extensions import override
 
 from langflow.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
 from langflow.helpers.data import docs_to_data
@@ -29,34 +33,33 @@ class PGVectorStoreComponent(LCVectorStoreComponent):
 
     @check_cached_vector_store
     def build_vector_store(self) -> PGVector:
-        # Convert DataFrame to Data if needed using parent's method
-        self.ingest_data = self._prepare_ingest_data()
-
-        documents = []
-        for _input in self.ingest_data or []:
-            if isinstance(_input, Data):
-                documents.append(_input.to_lc_document())
-            else:
-                documents.append(_input)
+        documents, ids = self._prepare_documents()
 
         connection_string_parsed = transform_connection_string(self.pg_server_url)
 
+        pgvector = PGVector.from_existing_index(
+            embedding=self.embedding,
+            collection_name=self.collection_name,
+            connection_string=connection_string_parsed,
+        )
         if documents:
-            pgvector = PGVector.from_documents(
-                embedding=self.embedding,
-                documents=documents,
-                collection_name=self.collection_name,
-                connection_string=connection_string_parsed,
-            )
-        else:
-            pgvector = PGVector.from_existing_index(
-                embedding=self.embedding,
-                collection_name=self.collection_name,
-                connection_string=connection_string_parsed,
-            )
+            self._add_new_documents(pgvector, documents, ids)
 
         return pgvector
 
+    @override
+    def _get_existing_ids(self, vector_store: PGVector, ids: Sequence[str]) -> set[str]:
+        embedding_store = vector_store.EmbeddingStore
+        with Session(vector_store._bind) as session:
+            collection = vector_store.get_collection(session)
+            if collection is None:
+                return set()
+            rows = session.query(embedding_store.custom_id).filter(
+                embedding_store.collection_id == collection.uuid,
+                embedding_store.custom_id.in_(list(ids)),
+            )
+            return {custom_id for (custom_id,) in rows}
+
     def search_documents(self) -> list[Data]:
         vector_store = self.build_vector_store()
 
@@ -70,22 +70,17 @@ class QdrantVectorStoreComponent(LCVectorStoreComponent):
 
         server_kwargs = {k: v for k, v in server_kwargs.items() if v is not None}
 
-        # Convert DataFrame to Data if needed using parent's method
-        self.ingest_data = self._prepare_ingest_data()
-
-        documents = []
-        for _input in self.ingest_data or []:
-            if isinstance(_input, Data):
-                documents.append(_input.to_lc_document())
-            else:
-                documents.append(_input)
+        # Qdrant upserts points by id, so content based ids make re-ingesting a document a no-op
+        documents, ids = self._prepare_documents()
 
         if not isinstance(self.embedding, Embeddings):
             msg = "Invalid embedding object"
             raise TypeError(msg)
 
         if documents:
-            qdrant = Qdrant.from_documents(documents, embedding=self.embedding, **qdrant_kwargs, **server_kwargs)
+            qdrant = Qdrant.from_documents(
+                documents, embedding=self.embedding, ids=ids, **qdrant_kwargs, **server_kwargs
+            )
         else:
             from qdrant_client import QdrantClient
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 import ast
 import asyncio
 import inspect
-from collections.abc import AsyncIterator, Iterator
+from collections.abc import AsyncIterator, Iterator, Mapping
 from copy import deepcopy
 from textwrap import dedent
 from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, get_type_hints
@@ -12,7 +12,7 @@ from uuid import UUID
 import nanoid
 import pandas as pd
 import yaml
-from langchain_core.tools import StructuredTool
+from langchain_core.tools import StructuredTool, Tool
 from pydantic import BaseModel, ValidationError
 
 from langflow.base.tools.constants import (
@@ -23,7 +23,6 @@ from langflow.base.tools.constants import (
 )
 from langflow.custom.tree_visitor import RequiredInputsVisitor
 from langflow.exceptions.component import StreamingError
-from langflow.field_typing import Tool  # noqa: TC001 Needed by _add_toolkit_output
 from langflow.graph.state.model import create_state_model
 from langflow.graph.utils import has_chat_output
 from langflow.helpers.custom import format_type
@@ -38,10 +37,11 @@ from langflow.template.frontend_node.custom_components import ComponentFrontendN
 from langflow.utils.async_helpers import run_until_complete
 from langflow.utils.util import find_closest_match
 
+from .component_template import COMPONENT_TEMPLATES, ComponentTemplate, TemplateCopies, get_module_code
 from .custom_component import CustomComponent
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, MutableMapping
 
     from langflow.base.tools.component_tool import ComponentToolkit
     from langflow.events.event_manager import EventManager
@@ -109,8 +109,8 @@ class Component(CustomComponent):
         self._logs: list[Log] = []
 
         # Initialize component-specific collections
-        self._inputs: dict[str, InputTypes] = {}
-        self._outputs_map: dict[str, Output] = {}
+        self._inputs: MutableMapping[str, InputTypes] = {}
+        self._outputs_map: MutableMapping[str, Output] = {}
         self._results: dict[str, Any] = {}
         self._attributes: dict[str, Any] = {}
         self._edges: list[EdgeData] = []
@@ -149,14 +149,18 @@ class Component(CustomComponent):
         if not hasattr(self, "trace_type"):
             self.trace_type = "chain"
 
-        # Setup inputs and outputs
+        # Setup inputs and outputs from the class template, they are copied when first used
         self._reset_all_output_values()
+        template = self._get_component_template()
         if self.inputs is not None:
-            self.map_inputs(self.inputs)
-        self.map_outputs()
+            self._inputs = TemplateCopies(template.inputs)
+        if self._vertex and self._vertex.outputs:
+            self.map_outputs()
+            self._set_output_types(list(self._outputs_map.values()))
+        else:
+            self._outputs_map = TemplateCopies(template.outputs)
 
         # Final setup
-        self._set_output_types(list(self._outputs_map.values()))
         self.set_class_code()
         self._set_output_required_inputs()
 
@@ -253,7 +257,7 @@ class Component(CustomComponent):
         self._event_manager = event_manager
 
     def _reset_all_output_values(self) -> None:
-        if isinstance(self._outputs_map, dict):
+        if isinstance(self._outputs_map, Mapping):
             for output in self._outputs_map.values():
                 output.value = UNDEFINED
 
@@ -295,21 +299,49 @@ class Component(CustomComponent):
         memo[id(self)] = new_component
         return new_component
 
+    def _get_component_template(self) -> ComponentTemplate:
+        """Get the template of the component's class, building it for its first instance."""
+        template = COMPONENT_TEMPLATES.get(type(self))
+        if template is None or not template.is_built_from(self.inputs, self.outputs):
+            template = self._build_component_template()
+            COMPONENT_TEMPLATES[type(self)] = template
+        return template
+
+    def _build_component_template(self) -> ComponentTemplate:
+        """Build what every instance of the component's class starts from.
+
+        Copying the inputs and outputs and finding the output types only depends on the class,
+        so it is done once rather than for every instance.
+
+        Raises:
+            ValueError: If an input or output doesn't have a name.
+        """
+        template = ComponentTemplate(class_inputs=self.inputs, class_outputs=self.outputs)
+        for input_ in self.inputs or []:
+            if input_.name is None:
+                msg = self.build_component_error_message("Input name cannot be None")
+                raise ValueError(msg)
+            template.inputs[input_.name] = deepcopy(input_)
+        for output in self.outputs:
+            if output.name is None:
+                msg = "Output name cannot be None."
+                raise ValueError(msg)
+            template.outputs[output.name] = deepcopy(output)
+        self._set_output_types(list(template.outputs.values()))
+        return template
+
     def set_class_code(self) -> None:
         # Get the source code of the calling class
         if self._code:
             return
-        try:
-            module = inspect.getmodule(self.__class__)
-            if module is None:
-                msg = "Could not find module for class"
-                raise ValueError(msg)
-
-            class_code = inspect.getsource(module)
-            self._code = class_code
-        except (OSError, TypeError) as e:
+        template = self._get_component_template()
+        if template.code is None:
+            template.code = get_module_code(type(self))
+        class_code = template.code
+        if class_code is None:
             msg = f"Could not find source code for {self.__class__.__name__}"
-            raise ValueError(msg) from e
+            raise ValueError(msg)
+        self._code = class_code
 
     def set(self, **kwargs):
         """Connects the component to other components or sets parameters and attributes.
@@ -522,6 +554,19 @@ class Component(CustomComponent):
         output.set_selected()
 
     def _set_output_required_inputs(self) -> None:
+        template = self._get_component_template()
+        # Methods whose source can't be found are looked up in the code of the component
+        required_inputs = template.required_inputs.get(self._code)
+        if required_inputs is None:
+            required_inputs = template.required_inputs[self._code] = self._find_required_inputs(template.inputs)
+        for output in self.outputs:
+            if output.name in required_inputs:
+                output.required_inputs = required_inputs[output.name]
+
+    def _find_required_inputs(self, inputs: Mapping[str, InputTypes]) -> dict[str, list[str]]:
+        """Find the required inputs each output method uses, by output name."""
+        required_inputs: dict[str, list[str]] = {}
+        code_tree = None
         for output in self.outputs:
             if not output.method:
                 continue
@@ -532,11 +577,14 @@ class Component(CustomComponent):
                 source_code = inspect.getsource(method)
                 ast_tree = ast.parse(dedent(source_code))
             except Exception:  # noqa: BLE001
-                ast_tree = ast.parse(dedent(self._code or ""))
+                if code_tree is None:
+                    code_tree = ast.parse(dedent(self._code or ""))
+                ast_tree = code_tree
 
-            visitor = RequiredInputsVisitor(self._inputs)
+            visitor = RequiredInputsVisitor(inputs)
             visitor.visit(ast_tree)
-            output.required_inputs = sorted(visitor.required_inputs)
+            required_inputs[output.name] = sorted(visitor.required_inputs)
+        return required_inputs
 
     def get_output_by_method(self, method: Callable):
         # method is a callable and output.method is a string
@@ -787,10 +835,17 @@ class Component(CustomComponent):
                 raise ValueError(msg) from e
 
     def _get_method_return_type(self, method_name: str) -> list[str]:
+        # The return types only depend on the class, they are kept in its template once it's built
+        template = COMPONENT_TEMPLATES.get(type(self))
+        if template is not None and method_name in template.return_types:
+            return list(template.return_types[method_name])
         method = getattr(self, method_name)
         return_type = get_type_hints(method)["return"]
         extracted_return_types = self._extract_return_type(return_type)
-        return [format_type(extracted_return_type) for extracted_return_type in extracted_return_types]
+        return_types = [format_type(extracted_return_type) for extracted_return_type in extracted_return_types]
+        if template is not None:
+            template.return_types[method_name] = return_types
+        return list(return_types)
 
     def _update_template(self, frontend_node: dict):
         return frontend_node
@@ -1316,16 +1371,14 @@ class Component(CustomComponent):
                 data_dict["id"] = id_
             category = category or data_dict.get("category", None)
 
-            def _send_event():
-                match category:
-                    case "error":
-                        self._event_manager.on_error(data=data_dict)
-                    case "remove_message":
-                        self._event_manager.on_remove_message(data={"id": data_dict["id"]})
-                    case _:
-                        self._event_manager.on_message(data=data_dict)
-
-            await asyncio.to_thread(_send_event)
+            # Sending an event only enqueues it, so there is no need to hop to a worker thread
+            match category:
+                case "error":
+                    self._event_manager.on_error(data=data_dict)
+                case "remove_message":
+                    self._event_manager.on_remove_message(data={"id": data_dict["id"]})
+                case _:
+                    self._event_manager.on_message(data=data_dict)
 
     def _should_stream_message(self, stored_message: Message, original_message: Message) -> bool:
         return bool(
@@ -1393,8 +1446,7 @@ class Component(CustomComponent):
                 msg_copy = message.model_copy()
                 msg_copy.text = complete_message
                 await self._send_message_event(msg_copy, id_=message_id)
-            await asyncio.to_thread(
-                self._event_manager.on_token,
+            self._event_manager.on_token(
                 data={
                     "chunk": chunk,
                     "id": str(message_id),
@@ -0,0 +1,102 @@
+"""What the instances of a component class are created from, computed once per class."""
+
+from __future__ import annotations
+
+import inspect
+from collections.abc import Iterator, MutableMapping
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, TypeVar
+from weakref import WeakKeyDictionary
+
+if TYPE_CHECKING:
+    from langflow.inputs.inputs import InputTypes
+    from langflow.template.field.base import Output
+
+T = TypeVar("T")
+
+
+@dataclass
+class ComponentTemplate:
+    """The inputs, outputs and code of a component class, shared by all its instances.
+
+    Attributes:
+        class_inputs: The `inputs` of the class the template was built from.
+        class_outputs: The `outputs` of the class the template was built from.
+        inputs: Copies of the inputs, by name.
+        outputs: Copies of the outputs, by name, with their types set.
+        code: The source code of the module of the class, once it was needed.
+        return_types: The formatted return types of the output methods, by method name.
+        required_inputs: The required inputs of each output, by the code they were found in.
+    """
+
+    class_inputs: list[InputTypes]
+    class_outputs: list[Output]
+    inputs: dict[str, InputTypes] = field(default_factory=dict)
+    outputs: dict[str, Output] = field(default_factory=dict)
+    code: str | None = None
+    return_types: dict[str, list[str]] = field(default_factory=dict)
+    required_inputs: dict[str | None, dict[str, list[str]]] = field(default_factory=dict)
+
+    def is_built_from(self, class_inputs: list[InputTypes], class_outputs: list[Output]) -> bool:
+        """Whether the class still has the inputs and outputs the template was built from."""
+        return self.class_inputs is class_inputs and self.class_outputs is class_outputs
+
+
+# Weak, so the classes created from the code of a flow are freed with their template
+COMPONENT_TEMPLATES: WeakKeyDictionary[type, ComponentTemplate] = WeakKeyDictionary()
+
+
+def get_module_code(cls: type) -> str | None:
+    """Get the source code of the module `cls` is defined in, None if it can't be found."""
+    module = inspect.getmodule(cls)
+    if module is None:
+        return None
+    try:
+        return inspect.getsource(module)
+    except (OSError, TypeError):
+        return None
+
+
+class TemplateCopies(MutableMapping[str, T]):
+    """The inputs or outputs of a component, each copied from the template when it is first used.
+
+    Instances only pay for copying what they use, and whatever they change is their own copy, so
+    the template is never modified.
+    """
+
+    def __init__(self, template: dict[str, T]) -> None:
+        self._items: dict[str, T] = dict(template)
+        self._copied: set[str] = set()
+
+    def __getitem__(self, key: str) -> T:
+        item = self._items[key]
+        if key not in self._copied:
+            item = self._items[key] = deepcopy(item)
+            self._copied.add(key)
+        return item
+
+    def __setitem__(self, key: str, value: T) -> None:
+        self._items[key] = value
+        self._copied.add(key)
+
+    def __delitem__(self, key: str) -> None:
+        del self._items[key]
+        self._copied.discard(key)
+
+    def __contains__(self, key: object) -> bool:
+        # Checking for a key doesn't copy the item
+        return key in self._items
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._items)})"
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[str, T]:
+        # A deep copy doesn't need to share the template, it is a dict of copies
+        return {key: deepcopy(value, memo) for key, value in self._items.items()}
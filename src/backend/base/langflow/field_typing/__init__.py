@@ -1,8 +1,6 @@
 from typing import Any
 
 from .constants import (
-    AgentExecutor,
-    BaseChatMemory,
     BaseChatModel,
     BaseDocumentCompressor,
     BaseLanguageModel,
@@ -13,7 +11,6 @@ from .constants import (
     BasePromptTemplate,
     BaseRetriever,
     Callable,
-    Chain,
     ChatPromptTemplate,
     Code,
     Data,
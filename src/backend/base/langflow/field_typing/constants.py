@@ -1,9 +1,6 @@
 from collections.abc import Callable
-from typing import Text, TypeAlias, TypeVar
+from typing import TYPE_CHECKING, Text, TypeAlias, TypeVar
 
-from langchain.agents.agent import AgentExecutor
-from langchain.chains.base import Chain
-from langchain.memory.chat_memory import BaseChatMemory
 from langchain_core.chat_history import BaseChatMessageHistory
 from langchain_core.document_loaders import BaseLoader
 from langchain_core.documents import Document
@@ -22,6 +19,16 @@ from langchain_text_splitters import TextSplitter
 from langflow.schema.data import Data
 from langflow.schema.dataframe import DataFrame
 from langflow.schema.message import Message
+from langflow.utils.lazy_load import lazy_exports
+
+if TYPE_CHECKING:
+    from langflow.field_typing.langchain_types import (
+        CUSTOM_COMPONENT_SUPPORTED_TYPES,
+        LANGCHAIN_BASE_TYPES,
+        AgentExecutor,
+        BaseChatMemory,
+        Chain,
+    )
 
 NestedDict: TypeAlias = dict[str, str | dict]
 LanguageModel = TypeVar("LanguageModel", BaseLanguageModel, BaseLLM, BaseChatModel)
@@ -48,43 +55,6 @@ class Code:
     pass
 
 
-LANGCHAIN_BASE_TYPES = {
-    "Chain": Chain,
-    "AgentExecutor": AgentExecutor,
-    "BaseTool": BaseTool,
-    "Tool": Tool,
-    "BaseLLM": BaseLLM,
-    "BaseLanguageModel": BaseLanguageModel,
-    "PromptTemplate": PromptTemplate,
-    "ChatPromptTemplate": ChatPromptTemplate,
-    "BasePromptTemplate": BasePromptTemplate,
-    "BaseLoader": BaseLoader,
-    "Document": Document,
-    "TextSplitter": TextSplitter,
-    "VectorStore": VectorStore,
-    "Embeddings": Embeddings,
-    "BaseRetriever": BaseRetriever,
-    "BaseOutputParser": BaseOutputParser,
-    "BaseMemory": BaseMemory,
-    "BaseChatMemory": BaseChatMemory,
-    "BaseChatModel": BaseChatModel,
-    "Memory": Memory,
-    "BaseDocumentCompressor": BaseDocumentCompressor,
-}
-# Langchain base types plus Python base types
-CUSTOM_COMPONENT_SUPPORTED_TYPES = {
-    **LANGCHAIN_BASE_TYPES,
-    "NestedDict": NestedDict,
-    "Data": Data,
-    "Message": Message,
-    "Text": Text,  # noqa: UP019
-    "Object": Object,
-    "Callable": Callable,
-    "LanguageModel": LanguageModel,
-    "Retriever": Retriever,
-    "DataFrame": DataFrame,
-}
-
 DEFAULT_IMPORT_STRING = """from langchain.agents.agent import AgentExecutor
 from langchain.chains.base import Chain
 from langchain.memory.chat_memory import BaseChatMemory
@@ -133,3 +103,56 @@ from langflow.schema.data import Data
 from langflow.schema.dataframe import DataFrame
 from langflow.schema.message import Message
 """
+
+
+# langchain's agents, chains and memory take about a second to import, so they and the types
+# that include them are only imported once they are used
+__getattr__ = lazy_exports(
+    __name__,
+    dict.fromkeys(
+        ("AgentExecutor", "Chain", "BaseChatMemory", "LANGCHAIN_BASE_TYPES", "CUSTOM_COMPONENT_SUPPORTED_TYPES"),
+        "langflow.field_typing.langchain_types",
+    ),
+)
+
+__all__ = [
+    "CUSTOM_COMPONENT_SUPPORTED_TYPES",
+    "DEFAULT_IMPORT_STRING",
+    "LANGCHAIN_BASE_TYPES",
+    "AgentExecutor",
+    "BaseChatMemory",
+    "BaseChatMessageHistory",
+    "BaseChatModel",
+    "BaseDocumentCompressor",
+    "BaseLLM",
+    "BaseLLMOutputParser",
+    "BaseLanguageModel",
+    "BaseLoader",
+    "BaseMemory",
+    "BaseOutputParser",
+    "BasePromptTemplate",
+    "BaseRetriever",
+    "BaseTool",
+    "Callable",
+    "Chain",
+    "ChatPromptTemplate",
+    "Code",
+    "Data",
+    "DataFrame",
+    "Document",
+    "Embeddings",
+    "LanguageModel",
+    "Memory",
+    "Message",
+    "NestedDict",
+    "Object",
+    "OutputParser",
+    "PromptTemplate",
+    "Retriever",
+    "Text",
+    "TextSplitter",
+    "Tool",
+    "ToolEnabledLanguageModel",
+    "VectorStore",
+    "VectorStoreRetriever",
+]
@@ -0,0 +1,76 @@
+"""The field types that need langchain's agents, chains and memory.
+
+Importing those takes about a second, so `langflow.field_typing.constants` only imports this
+module once one of its types is used.
+"""
+
+from langchain.agents.agent import AgentExecutor
+from langchain.chains.base import Chain
+from langchain.memory.chat_memory import BaseChatMemory
+
+from langflow.field_typing.constants import (
+    BaseChatModel,
+    BaseDocumentCompressor,
+    BaseLanguageModel,
+    BaseLLM,
+    BaseLoader,
+    BaseMemory,
+    BaseOutputParser,
+    BasePromptTemplate,
+    BaseRetriever,
+    BaseTool,
+    Callable,
+    ChatPromptTemplate,
+    Data,
+    DataFrame,
+    Document,
+    Embeddings,
+    LanguageModel,
+    Memory,
+    Message,
+    NestedDict,
+    Object,
+    PromptTemplate,
+    Retriever,
+    Text,
+    TextSplitter,
+    Tool,
+    VectorStore,
+)
+
+LANGCHAIN_BASE_TYPES = {
+    "Chain": Chain,
+    "AgentExecutor": AgentExecutor,
+    "BaseTool": BaseTool,
+    "Tool": Tool,
+    "BaseLLM": BaseLLM,
+    "BaseLanguageModel": BaseLanguageModel,
+    "PromptTemplate": PromptTemplate,
+    "ChatPromptTemplate": ChatPromptTemplate,
+    "BasePromptTemplate": BasePromptTemplate,
+    "BaseLoader": BaseLoader,
+    "Document": Document,
+    "TextSplitter": TextSplitter,
+    "VectorStore": VectorStore,
+    "Embeddings": Embeddings,
+    "BaseRetriever": BaseRetriever,
+    "BaseOutputParser": BaseOutputParser,
+    "BaseMemory": BaseMemory,
+    "BaseChatMemory": BaseChatMemory,
+    "BaseChatModel": BaseChatModel,
+    "Memory": Memory,
+    "BaseDocumentCompressor": BaseDocumentCompressor,
+}
+# Langchain base types plus Python base types
+CUSTOM_COMPONENT_SUPPORTED_TYPES = {
+    **LANGCHAIN_BASE_TYPES,
+    "NestedDict": NestedDict,
+    "Data": Data,
+    "Message": Message,
+    "Text": Text,
+    "Object": Object,
+    "Callable": Callable,
+    "LanguageModel": LanguageModel,
+    "Retriever": Retriever,
+    "DataFrame": DataFrame,
+}
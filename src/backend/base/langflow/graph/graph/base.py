@@ -41,7 +41,7 @@ from langflow.logging.logger import LogConfig, configure
 from langflow.schema.dotdict import dotdict
 from langflow.schema.schema import INPUT_FIELD_NAME, InputType, OutputValue
 from langflow.services.cache.utils import CacheMiss
-from langflow.services.deps import get_chat_service, get_tracing_service
+from langflow.services.deps import get_chat_service, get_tracing_service, get_variable_service, session_scope
 from langflow.utils.async_helpers import run_until_complete
 
 if TYPE_CHECKING:
@@ -663,6 +663,30 @@ class Graph:
                 user_id=self.user_id,
                 session_id=self.session_id,
             )
+        await self.prefetch_variables()
+
+    async def prefetch_variables(self) -> None:
+        """Loads the variables referenced by the graph's components with a single query.
+
+        The variable service keeps them in its cache, so the components of this run don't
+        query and decrypt each of their variables separately.
+        """
+        if not self.user_id:
+            return
+        names = {
+            vertex.params[field]
+            for vertex in self.vertices
+            for field in vertex.load_from_db_fields
+            if isinstance(vertex.params.get(field), str) and vertex.params[field]
+        }
+        if not names:
+            return
+        try:
+            async with session_scope() as session:
+                await get_variable_service().prefetch_variables(uuid.UUID(str(self.user_id)), names, session)
+        except Exception as e:  # noqa: BLE001
+            # Variables are still loaded one by one when the components are built
+            logger.debug(f"Could not prefetch variables: {e}")
 
     def _end_all_traces_async(self, outputs: dict[str, Any] | None = None, error: Exception | None = None) -> None:
         task = asyncio.create_task(self.end_all_traces(outputs, error))
@@ -5,6 +5,7 @@ import json
 import os
 import re
 import shutil
+import sys
 import zipfile
 from collections import defaultdict
 from copy import deepcopy
@@ -15,7 +16,6 @@ from typing import AnyStr
 from uuid import UUID
 
 import anyio
-import httpx
 import orjson
 import sqlalchemy as sa
 from aiofile import async_open
@@ -34,7 +34,13 @@ from langflow.services.database.models.flow.model import Flow, FlowCreate
 from langflow.services.database.models.folder.constants import DEFAULT_FOLDER_NAME
 from langflow.services.database.models.folder.model import Folder, FolderCreate, FolderRead
 from langflow.services.database.models.user.crud import get_user_by_username
-from langflow.services.deps import get_settings_service, get_storage_service, get_variable_service, session_scope
+from langflow.services.deps import (
+    get_http_client_service,
+    get_settings_service,
+    get_storage_service,
+    get_variable_service,
+    session_scope,
+)
 from langflow.template.field.prompt import DEFAULT_PROMPT_INTUT_TYPES
 from langflow.utils.util import escape_json_dump
 
@@ -731,11 +737,10 @@ async def detect_github_url(url: str) -> str:
 
         repo = repo.removesuffix(".git")
 
-        async with httpx.AsyncClient(follow_redirects=True) as client:
-            response = await client.get(f"https://api.github.com/repos/{owner}/{repo}")
-            response.raise_for_status()
-            default_branch = response.json().get("default_branch")
-            return f"https://github.com/{owner}/{repo}/archive/refs/heads/{default_branch}.zip"
+        response = await get_http_client_service().get(f"https://api.github.com/repos/{owner}/{repo}")
+        response.raise_for_status()
+        default_branch = response.json().get("default_branch")
+        return f"https://github.com/{owner}/{repo}/archive/refs/heads/{default_branch}.zip"
 
     if matched := re.match(r"https?://(?:www\.)?github\.com/([\w.-]+)/([\w.-]+)/tree/([\w\\/.-]+)", url):
         owner, repo, branch = matched.groups()
@@ -763,6 +768,9 @@ async def load_bundles_from_urls() -> tuple[list[TemporaryDirectory], list[str]]
     bundle_urls = settings_service.settings.bundle_urls
     if not bundle_urls:
         return [], []
+    bundle_max_size = settings_service.settings.bundle_max_size
+    # Not capped by the shared client's response size limit unless a bundle size limit is set
+    max_bundle_bytes = bundle_max_size * 1024 * 1024 if bundle_max_size else sys.maxsize
     if not settings_service.auth_settings.AUTO_LOGIN:
         logger.warning("AUTO_LOGIN is disabled, not loading flows from URLs")
 
@@ -776,9 +784,8 @@ async def load_bundles_from_urls() -> tuple[list[TemporaryDirectory], list[str]]
         for url in bundle_urls:
             url_ = await detect_github_url(url)
 
-            async with httpx.AsyncClient(follow_redirects=True) as client:
-                response = await client.get(url_)
-                response.raise_for_status()
+            response = await get_http_client_service().get(url_, max_response_size=max_bundle_bytes)
+            response.raise_for_status()
 
             with zipfile.ZipFile(io.BytesIO(response.content)) as zfile:
                 dir_names = [f.filename for f in zfile.infolist() if f.is_dir() and "/" not in f.filename[:-1]]
@@ -17,6 +17,8 @@ class ComponentCache:
     def __init__(self):
         self.all_types_dict: dict[str, Any] | None = None
         self.fully_loaded_components: dict[str, bool] = {}
+        # Input type -> {"category.name": [field names]}, built from `all_types_dict` by the AI assistant
+        self.input_type_index: dict[str, dict[str, list[str]]] | None = None
 
 
 # Singleton instance
@@ -37,6 +39,7 @@ async def get_and_cache_all_types_dict(
         else:
             # Traditional full loading
             component_cache.all_types_dict = await aget_all_types_dict(settings_service.settings.components_path)
+        component_cache.input_type_index = None
 
         # Log loading stats
         component_count = sum(len(comps) for comps in component_cache.all_types_dict.get("components", {}).values())
@@ -198,6 +201,7 @@ async def ensure_component_loaded(component_type: str, component_name: str, sett
         if full_component:
             # Replace the stub with the fully loaded component
             component_cache.all_types_dict["components"][component_type][component_name] = full_component
+            component_cache.input_type_index = None
             # Remove lazy_loaded flag if it exists
             if "lazy_loaded" in component_cache.all_types_dict["components"][component_type][component_name]:
                 del component_cache.all_types_dict["components"][component_type][component_name]["lazy_loaded"]
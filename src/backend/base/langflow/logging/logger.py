@@ -1,9 +1,10 @@
 import asyncio
-import json
 import logging
 import os
 import sys
-from collections import deque
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from threading import Lock, Semaphore
 from typing import TypedDict
@@ -29,81 +30,148 @@ DEFAULT_LOG_FORMAT = (
 class SizedLogBuffer:
     def __init__(
         self,
-        max_readers: int = 20,  # max number of concurrent readers for the buffer
+        max_readers: int = 20,  # max number of concurrent subscribers to the buffer
+        max_pending: int = 1000,  # max number of messages waiting to be sent to a subscriber
     ):
         """A buffer for storing log messages for the log retrieval API.
 
         The buffer can be overwritten by an env variable LANGFLOW_LOG_RETRIEVER_BUFFER_SIZE
         because the logger is initialized before the settings_service are loaded.
+
+        Messages are kept in a ring ordered by when they were written. Along with its timestamp,
+        each message has a key that never decreases, so the messages around a timestamp are found
+        by bisecting. Readers never lock, writers only lock each other out.
         """
-        self.buffer: deque = deque()
+        # Slot seq % capacity holds the (seq, key, timestamp, text) of the message written seq-th
+        self._ring: list[tuple[int, int, int, str] | None] = []
+        self._next_seq = 0
+        # The seq of the oldest message kept when the ring was last resized
+        self._first_seq = 0
+        self._last_key = 0
 
         self._max_readers = max_readers
+        self._max_pending = max_pending
         self._wlock = Lock()
         self._rsemaphore = Semaphore(max_readers)
+        self._subscribers: tuple[tuple[asyncio.AbstractEventLoop, asyncio.Queue[tuple[int, str]]], ...] = ()
         self._max = 0
 
     def get_write_lock(self) -> Lock:
         return self._wlock
 
     def write(self, message: str) -> None:
-        record = json.loads(message)
+        record = orjson.loads(message)
         log_entry = record["text"]
         epoch = int(record["record"]["time"]["timestamp"] * 1000)
         with self._wlock:
-            if len(self.buffer) >= self.max:
-                for _ in range(len(self.buffer) - self.max + 1):
-                    self.buffer.popleft()
-            self.buffer.append((epoch, log_entry))
+            if len(self._ring) != self.max:
+                self._resize(self.max)
+            if not self._ring:
+                return
+            self._last_key = max(self._last_key, epoch)
+            seq = self._next_seq
+            self._ring[seq % len(self._ring)] = (seq, self._last_key, epoch, log_entry)
+            self._next_seq = seq + 1
+        for loop, queue in self._subscribers:
+            try:
+                loop.call_soon_threadsafe(self._push, queue, (epoch, log_entry))
+            except RuntimeError:
+                # The loop of the subscriber is closed
+                continue
+
+    def _resize(self, capacity: int) -> None:
+        entries = self._entries()[-capacity:] if capacity > 0 else []
+        ring: list[tuple[int, int, int, str] | None] = [None] * capacity
+        for entry in entries:
+            ring[entry[0] % capacity] = entry
+        first_seq = self._next_seq - len(entries)
+        # Readers still holding the previous ring keep reading it unchanged
+        self._ring = ring
+        self._first_seq = first_seq
+
+    def _entries(self, start: int | None = None, stop: int | None = None) -> list[tuple[int, int, int, str]]:
+        """The messages written from the start-th until the stop-th, without locking.
+
+        Messages overwritten while they were read are left out.
+        """
+        ring = self._ring
+        capacity = len(ring)
+        next_seq = self._next_seq
+        first = max(next_seq - capacity, self._first_seq)
+        start = first if start is None else max(start, first)
+        stop = next_seq if stop is None else min(stop, next_seq)
+        return [entry for seq in range(start, stop) if (entry := ring[seq % capacity]) and entry[0] == seq]
+
+    def _bisect(self, timestamp: int) -> tuple[int, int, int]:
+        """The seq of the first message at or after the timestamp, and the seqs of the messages kept."""
+        ring = self._ring
+        capacity = len(ring)
+        stop = self._next_seq
+        start = max(stop - capacity, self._first_seq)
+
+        def key(seq: int) -> int:
+            entry = ring[seq % capacity]
+            # A message overwritten meanwhile is older than any kept
+            return entry[1] if entry and entry[0] == seq else -1
+
+        index = bisect_left(range(start, stop), timestamp, key=key)
+        return start + index, start, stop
+
+    @staticmethod
+    def _push(queue: asyncio.Queue[tuple[int, str]], entry: tuple[int, str]) -> None:
+        if queue.full():
+            # Slow subscribers miss the oldest messages rather than holding them all
+            queue.get_nowait()
+        queue.put_nowait(entry)
+
+    @property
+    def buffer(self) -> list[tuple[int, str]]:
+        """The (timestamp, text) of the messages kept, oldest first."""
+        return [(ts, msg) for _, _, ts, msg in self._entries()]
 
     def __len__(self) -> int:
-        return len(self.buffer)
+        return min(self._next_seq - self._first_seq, len(self._ring))
 
     def get_after_timestamp(self, timestamp: int, lines: int = 5) -> dict[int, str]:
-        rc = {}
-
-        self._rsemaphore.acquire()
-        try:
-            with self._wlock:
-                for ts, msg in self.buffer:
-                    if lines == 0:
-                        break
-                    if ts >= timestamp and lines > 0:
-                        rc[ts] = msg
-                        lines -= 1
-        finally:
-            self._rsemaphore.release()
-
-        return rc
+        if lines <= 0 or not self._ring:
+            return {}
+        first, _, _ = self._bisect(timestamp)
+        return {ts: msg for _, _, ts, msg in self._entries(first, first + lines)}
 
     def get_before_timestamp(self, timestamp: int, lines: int = 5) -> dict[int, str]:
-        self._rsemaphore.acquire()
-        try:
-            with self._wlock:
-                as_list = list(self.buffer)
-            max_index = -1
-            for i, (ts, _) in enumerate(as_list):
-                if ts >= timestamp:
-                    max_index = i
-                    break
-            if max_index == -1:
-                return self.get_last_n(lines)
-            rc = {}
-            start_from = max(max_index - lines, 0)
-            for i, (ts, msg) in enumerate(as_list):
-                if start_from <= i < max_index:
-                    rc[ts] = msg
-            return rc
-        finally:
-            self._rsemaphore.release()
+        if not self._ring:
+            return {}
+        first, start, stop = self._bisect(timestamp)
+        if first == stop:
+            return self.get_last_n(lines)
+        return {ts: msg for _, _, ts, msg in self._entries(max(first - lines, start), first)}
 
     def get_last_n(self, last_idx: int) -> dict[int, str]:
-        self._rsemaphore.acquire()
+        start = self._next_seq - last_idx if last_idx > 0 else None
+        return {ts: msg for _, _, ts, msg in self._entries(start)}
+
+    @contextmanager
+    def subscribe(self) -> Iterator[asyncio.Queue[tuple[int, str]]]:
+        """Receive the (timestamp, text) of the messages written from now on, in a queue.
+
+        The queue belongs to the running event loop. It holds up to `max_pending` messages, the
+        oldest are dropped when it is full.
+
+        Raises:
+            RuntimeError: If there are already `max_readers` subscribers.
+        """
+        if not self._rsemaphore.acquire(blocking=False):
+            msg = "Too many log subscribers"
+            raise RuntimeError(msg)
+        subscriber = (asyncio.get_running_loop(), asyncio.Queue(maxsize=self._max_pending))
+        # Writers iterate over the subscribers without locking, so they are replaced, not changed
+        with self._wlock:
+            self._subscribers = (*self._subscribers, subscriber)
         try:
-            with self._wlock:
-                as_list = list(self.buffer)
-            return dict(as_list[-last_idx:])
+            yield subscriber[1]
         finally:
+            with self._wlock:
+                self._subscribers = tuple(s for s in self._subscribers if s is not subscriber)
             self._rsemaphore.release()
 
     @property
@@ -12,9 +12,26 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.schema.message import Message
 from langflow.services.database.models.message.model import MessageRead, MessageTable
-from langflow.services.deps import session_scope
+from langflow.services.database.models.message.window import MessageWindows
+from langflow.services.deps import get_settings_service, session_scope
 from langflow.utils.async_helpers import run_until_complete
 
+_message_windows: MessageWindows | None = None
+
+
+def get_message_windows() -> MessageWindows | None:
+    """The windows of recent messages of chat sessions, None if they are disabled.
+
+    They are disabled with several workers, since each would only see its own writes.
+    """
+    global _message_windows  # noqa: PLW0603
+    settings = get_settings_service().settings
+    if settings.workers > 1 or settings.message_history_window <= 0:
+        return None
+    if _message_windows is None:
+        _message_windows = MessageWindows(settings.message_history_window, ttl=settings.message_history_window_ttl)
+    return _message_windows
+
 
 def _get_variable_query(
     sender: str | None = None,
@@ -94,6 +111,15 @@ async def aget_messages(
         List[Data]: A list of Data objects representing the retrieved messages.
     """
     async with session_scope() as session:
+        windows = get_message_windows()
+        if windows is not None and session_id and order_by == "timestamp":
+            # Answered from the recent messages of the session if they include all that are asked for
+            await windows.load(session, str(session_id))
+            rows = windows.find(
+                str(session_id), sender=sender, sender_name=sender_name, flow_id=flow_id, order=order, limit=limit
+            )
+            if rows is not None:
+                return [await Message.create(**row) for row in rows]
         stmt = _get_variable_query(sender, sender_name, session_id, order_by, order, flow_id, limit)
         messages = await session.exec(stmt)
         return [await Message.create(**d.model_dump()) for d in messages]
@@ -152,9 +178,18 @@ async def aupdate_messages(messages: Message | list[Message]) -> list[Message]:
 
 
 async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession):
+    """Insert messages in a single batch and commit them once.
+
+    All their fields are set before they are inserted, so they aren't read back.
+    """
+    for msg in messages:
+        msg.properties = json.loads(msg.properties) if isinstance(msg.properties, str) else msg.properties  # type: ignore[arg-type]
+        msg.content_blocks = [json.loads(j) if isinstance(j, str) else j for j in msg.content_blocks]  # type: ignore[arg-type]
+        msg.category = msg.category or ""
+    new_messages = [MessageRead.model_validate(message, from_attributes=True) for message in messages]
+
     try:
-        for message in messages:
-            session.add(message)
+        session.add_all(messages)
         try:
             await session.commit()
             # This is a hack.
@@ -162,8 +197,6 @@ async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession
             # while build_flow does not.
         except asyncio.CancelledError:
             await session.commit()
-        for message in messages:
-            await session.refresh(message)
     except asyncio.CancelledError as e:
         logger.exception(e)
         error_msg = "Operation cancelled"
@@ -172,14 +205,7 @@ async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession
         logger.exception(e)
         raise
 
-    new_messages = []
-    for msg in messages:
-        msg.properties = json.loads(msg.properties) if isinstance(msg.properties, str) else msg.properties  # type: ignore[arg-type]
-        msg.content_blocks = [json.loads(j) if isinstance(j, str) else j for j in msg.content_blocks]  # type: ignore[arg-type]
-        msg.category = msg.category or ""
-        new_messages.append(msg)
-
-    return [MessageRead.model_validate(message, from_attributes=True) for message in new_messages]
+    return new_messages
 
 
 def delete_messages(session_id: str) -> None:
@@ -307,16 +333,17 @@ class LCBuiltinChatMemory(BaseChatMessageHistory):
         return [m.to_lc_message() for m in messages if not m.error]  # Exclude error messages
 
     def add_messages(self, messages: Sequence[BaseMessage]) -> None:
-        for lc_message in messages:
-            message = Message.from_lc_message(lc_message)
-            message.session_id = self.session_id
-            store_message(message, flow_id=self.flow_id)
+        run_until_complete(self.aadd_messages(messages))
 
     async def aadd_messages(self, messages: Sequence[BaseMessage]) -> None:
+        # The messages of a turn are stored together, with a single commit
+        new_messages = []
         for lc_message in messages:
             message = Message.from_lc_message(lc_message)
             message.session_id = self.session_id
-            await astore_message(message, flow_id=self.flow_id)
+            new_messages.append(message)
+        if new_messages:
+            await aadd_messages(new_messages, flow_id=self.flow_id)
 
     def clear(self) -> None:
         delete_messages(self.session_id)
@@ -1,11 +1,66 @@
-from typing import cast
+from string import Formatter
+from typing import Any, Literal, cast
 
+import numpy as np
 import pandas as pd
 from langchain_core.documents import Document
 from pandas import DataFrame as pandas_DataFrame
 
 from langflow.schema.data import Data
 
+ComparisonOperator = Literal["equals", "not equals", "contains", "starts with", "ends with"]
+
+
+def _parse_column_template(template: str) -> list[tuple[str, str | None]] | None:
+    """Split a `str.format` template into (literal, column) pairs.
+
+    Returns None if the template uses anything other than plain named fields
+    (format specs, conversions, attribute/index access or positional fields),
+    in which case it has to be rendered with `str.format`.
+    """
+    parts = []
+    for literal, field_name, format_spec, conversion in Formatter().parse(template):
+        if field_name is not None and (
+            format_spec or conversion or not field_name.isidentifier() or "." in field_name or "[" in field_name
+        ):
+            return None
+        parts.append((literal, field_name))
+    return parts
+
+
+def column_as_str(series: pd.Series) -> pd.Series:
+    """Convert a column to its `str()` representation, the same way `str.format` would."""
+    if pd.api.types.is_datetime64_any_dtype(series) or pd.api.types.is_timedelta64_dtype(series):
+        # astype(str) drops the time part of midnight timestamps, str() does not
+        return series.map(str)
+    return series.astype(str)
+
+
+def compare_column(series: pd.Series, value: Any, operator: ComparisonOperator) -> pd.Series:
+    """Compare a column against a value using the string comparison operators of the processing components.
+
+    Args:
+        series: The column to compare.
+        value: The value to compare with. It is compared using its string representation.
+        operator: The comparison operator.
+
+    Returns:
+        pd.Series: A boolean mask with one entry per row.
+    """
+    values = column_as_str(series)
+    value = str(value)
+    if operator == "equals":
+        return values == value
+    if operator == "not equals":
+        return values != value
+    if operator == "contains":
+        return values.str.contains(value, regex=False)
+    if operator == "starts with":
+        return values.str.startswith(value)
+    if operator == "ends with":
+        return values.str.endswith(value)
+    return pd.Series(data=False, index=series.index)
+
 
 class DataFrame(pandas_DataFrame):
     """A pandas DataFrame subclass specialized for handling collections of Data objects.
@@ -88,8 +143,54 @@ class DataFrame(pandas_DataFrame):
     def to_data_list(self) -> list[Data]:
         """Converts the DataFrame back to a list of Data objects."""
         list_of_dicts = self.to_dict(orient="records")
-        # suggested change: [Data(**row) for row in list_of_dicts]
-        return [Data(data=row) for row in list_of_dicts]
+        # Rows are always plain dicts, so the Data validator has nothing to do
+        return [Data.model_construct(data=row) for row in list_of_dicts]
+
+    def format_rows(self, template: str) -> list[str]:
+        """Renders `template` once per row, using the columns as format fields.
+
+        Templates made only of plain `{column}` fields are rendered column by
+        column; anything else falls back to `str.format` on each row.
+
+        Args:
+            template: A `str.format` template, e.g. "{name}: {text}".
+
+        Returns:
+            list[str]: One rendered string per row.
+
+        Raises:
+            KeyError: If the template references a column that does not exist.
+        """
+        if self.empty:
+            return []
+
+        parts = _parse_column_template(template)
+        if parts is None:
+            return [template.format(**row) for row in self.to_dict(orient="records")]
+
+        rendered = np.full(len(self), "", dtype=object)
+        for literal, column in parts:
+            if literal:
+                rendered += literal
+            if column is None:
+                continue
+            if column not in self.columns:
+                raise KeyError(column)
+            rendered += column_as_str(self[column]).to_numpy(dtype=object)
+        return rendered.tolist()
+
+    def filter_rows(self, column: str, value: Any, operator: ComparisonOperator = "equals") -> "DataFrame":
+        """Returns the rows whose `column` matches `value` according to `operator`.
+
+        Args:
+            column: The column to compare.
+            value: The value to compare with, using its string representation.
+            operator: One of "equals", "not equals", "contains", "starts with" or "ends with".
+
+        Returns:
+            DataFrame: A new DataFrame with the matching rows.
+        """
+        return cast("DataFrame", self[compare_column(self[column], value, operator)])
 
     def add_row(self, data: dict | Data) -> "DataFrame":
         """Adds a single row to the dataset.
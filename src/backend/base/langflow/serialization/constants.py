@@ -1,2 +1,4 @@
 MAX_TEXT_LENGTH = 2000
 MAX_ITEMS_LENGTH = 100
+# Values nested deeper than this are not serialized
+MAX_DEPTH = 100
@@ -1,6 +1,8 @@
-from collections.abc import AsyncIterator, Generator, Iterator
+from collections.abc import AsyncIterator, Callable, Generator, Iterator
 from datetime import datetime, timezone
 from decimal import Decimal
+from functools import lru_cache
+from itertools import islice
 from typing import Any, cast
 from uuid import UUID
 
@@ -11,7 +13,7 @@ from loguru import logger
 from pydantic import BaseModel
 from pydantic.v1 import BaseModel as BaseModelV1
 
-from langflow.serialization.constants import MAX_ITEMS_LENGTH, MAX_TEXT_LENGTH
+from langflow.serialization.constants import MAX_DEPTH, MAX_ITEMS_LENGTH, MAX_TEXT_LENGTH
 
 
 # Sentinel variable to signal a failed serialization.
@@ -24,16 +26,27 @@ class _UnserializableSentinel:
 
 UNSERIALIZABLE_SENTINEL = _UnserializableSentinel()
 
+# Replaces the values nested deeper than the depth budget
+MAX_DEPTH_MARKER = "... [max depth reached]"
 
-def _serialize_str(obj: str, max_length: int | None, _) -> str:
+# Serializers are called with (obj, max_length, max_items, max_depth)
+Serializer = Callable[[Any, int | None, int | None, int | None], Any]
+
+
+def _deeper(max_depth: int | None) -> int | None:
+    """The depth budget left for the values inside a container."""
+    return None if max_depth is None else max_depth - 1
+
+
+def _serialize_str(obj: str, max_length: int | None, *_) -> str:
     """Truncate long strings with ellipsis if max_length provided."""
     if max_length is None or len(obj) <= max_length:
         return obj
     return obj[:max_length] + "..."
 
 
-def _serialize_bytes(obj: bytes, max_length: int | None, _) -> str:
-    """Decode bytes to string and truncate if max_length provided."""
+def _serialize_bytes(obj: bytes, max_length: int | None, *_) -> str:
+    """Truncate bytes if max_length provided, then decode them to string."""
     if max_length is not None:
         return (
             obj[:max_length].decode("utf-8", errors="ignore") + "..."
@@ -58,9 +71,9 @@ def _serialize_uuid(obj: UUID, *_) -> str:
     return str(obj)
 
 
-def _serialize_document(obj: Document, max_length: int | None, max_items: int | None) -> Any:
+def _serialize_document(obj: Document, max_length: int | None, max_items: int | None, max_depth: int | None) -> Any:
     """Serialize Langchain Document recursively."""
-    return serialize(obj.to_json(), max_length, max_items)
+    return serialize(obj.to_json(), max_length, max_items, max_depth=max_depth)
 
 
 def _serialize_iterator(_: AsyncIterator | Generator | Iterator, *__) -> str:
@@ -68,38 +81,49 @@ def _serialize_iterator(_: AsyncIterator | Generator | Iterator, *__) -> str:
     return "Unconsumed Stream"
 
 
-def _serialize_pydantic(obj: BaseModel, max_length: int | None, max_items: int | None) -> Any:
+def _serialize_pydantic(obj: BaseModel, max_length: int | None, max_items: int | None, max_depth: int | None) -> Any:
     """Handle modern Pydantic models."""
     serialized = obj.model_dump()
-    return {k: serialize(v, max_length, max_items) for k, v in serialized.items()}
+    depth = _deeper(max_depth)
+    return {k: serialize(v, max_length, max_items, max_depth=depth) for k, v in serialized.items()}
 
 
-def _serialize_pydantic_v1(obj: BaseModelV1, max_length: int | None, max_items: int | None) -> Any:
+def _serialize_pydantic_v1(
+    obj: BaseModelV1, max_length: int | None, max_items: int | None, max_depth: int | None
+) -> Any:
     """Backwards-compatible handling for Pydantic v1 models."""
     if hasattr(obj, "to_json"):
-        return serialize(obj.to_json(), max_length, max_items)
-    return serialize(obj.dict(), max_length, max_items)
+        return serialize(obj.to_json(), max_length, max_items, max_depth=max_depth)
+    return serialize(obj.dict(), max_length, max_items, max_depth=max_depth)
 
 
-def _serialize_dict(obj: dict, max_length: int | None, max_items: int | None) -> dict:
-    """Recursively process dictionary values."""
-    return {k: serialize(v, max_length, max_items) for k, v in obj.items()}
+def _serialize_dict(obj: dict, max_length: int | None, max_items: int | None, max_depth: int | None) -> dict:
+    """Truncate large dictionaries and process values recursively."""
+    depth = _deeper(max_depth)
+    if max_items is None or len(obj) <= max_items:
+        return {k: serialize(v, max_length, max_items, max_depth=depth) for k, v in obj.items()}
+    # Only the items that are kept are serialized
+    serialized = {k: serialize(v, max_length, max_items, max_depth=depth) for k, v in islice(obj.items(), max_items)}
+    serialized["..."] = f"[truncated {len(obj) - max_items} items]"
+    return serialized
 
 
-def _serialize_list_tuple(obj: list | tuple, max_length: int | None, max_items: int | None) -> list:
+def _serialize_list_tuple(
+    obj: list | tuple, max_length: int | None, max_items: int | None, max_depth: int | None
+) -> list:
     """Truncate long lists and process items recursively."""
-    if max_items is not None and len(obj) > max_items:
-        truncated = list(obj)[:max_items]
-        truncated.append(f"... [truncated {len(obj) - max_items} items]")
-        obj = truncated
-    return [serialize(item, max_length, max_items) for item in obj]
+    depth = _deeper(max_depth)
+    if max_items is None or len(obj) <= max_items:
+        return [serialize(item, max_length, max_items, max_depth=depth) for item in obj]
+    # Only the items that are kept are serialized
+    serialized = [serialize(item, max_length, max_items, max_depth=depth) for item in islice(obj, max_items)]
+    serialized.append(f"... [truncated {len(obj) - max_items} items]")
+    return serialized
 
 
 def _serialize_primitive(obj: Any, *_) -> Any:
     """Handle primitive types without conversion."""
-    if obj is None or isinstance(obj, int | float | bool | complex):
-        return obj
-    return UNSERIALIZABLE_SENTINEL
+    return obj
 
 
 def _serialize_instance(obj: Any, *_) -> str:
@@ -116,29 +140,29 @@ def _truncate_value(value: Any, max_length: int | None, max_items: int | None) -
     return value
 
 
-def _serialize_dataframe(obj: pd.DataFrame, max_length: int | None, max_items: int | None) -> list[dict]:
+def _serialize_dataframe(
+    obj: pd.DataFrame, max_length: int | None, max_items: int | None, max_depth: int | None
+) -> list[dict]:
     """Serialize pandas DataFrame to a dictionary format."""
+    # Only convert the rows and columns that are kept
     if max_items is not None and len(obj) > max_items:
         obj = obj.head(max_items)
+    if max_items is not None and len(obj.columns) > max_items:
+        obj = obj.iloc[:, :max_items]
 
     data = obj.to_dict(orient="records")
 
-    return serialize(data, max_length, max_items)
+    return serialize(data, max_length, max_items, max_depth=max_depth)
 
 
-def _serialize_series(obj: pd.Series, max_length: int | None, max_items: int | None) -> dict:
+def _serialize_series(obj: pd.Series, max_length: int | None, max_items: int | None, *_) -> dict:
     """Serialize pandas Series to a dictionary format."""
     if max_items is not None and len(obj) > max_items:
         obj = obj.head(max_items)
     return {index: _truncate_value(value, max_length, max_items) for index, value in obj.items()}
 
 
-def _is_numpy_type(obj: Any) -> bool:
-    """Check if an object is a numpy type by checking its type's module name."""
-    return hasattr(type(obj), "__module__") and type(obj).__module__ == np.__name__
-
-
-def _serialize_numpy_type(obj: Any, max_length: int | None, max_items: int | None) -> Any:
+def _serialize_numpy_type(obj: Any, max_length: int | None, max_items: int | None, *_) -> Any:
     """Serialize numpy types."""
     try:
         # For single-element arrays
@@ -164,68 +188,75 @@ def _serialize_numpy_type(obj: Any, max_length: int | None, max_items: int | Non
     return UNSERIALIZABLE_SENTINEL
 
 
-def _serialize_dispatcher(obj: Any, max_length: int | None, max_items: int | None) -> Any | _UnserializableSentinel:
-    """Dispatch object to appropriate serializer."""
-    # Handle primitive types first
+def _serialize_type(obj: Any, *_) -> Any:
+    """Serialize classes and the typing constructs that are instances of type."""
+    if hasattr(obj, "_name_"):  # Enum case
+        return f"{obj.__class__.__name__}.{obj._name_}"
+    if hasattr(obj, "__name__") and hasattr(obj, "__bound__"):  # TypeVar case
+        return repr(obj)
+    if hasattr(obj, "__origin__") or hasattr(obj, "__parameters__"):  # Type alias/generic case
+        return repr(obj)
+    # Handle numpy numeric types (int, float, bool, complex)
+    if hasattr(obj, "dtype"):
+        if np.issubdtype(obj.dtype, np.number) and hasattr(obj, "item"):
+            return obj.item()
+        if np.issubdtype(obj.dtype, np.bool_):
+            return bool(obj)
+        if np.issubdtype(obj.dtype, np.complexfloating):
+            return complex(cast("complex", obj))
+        if np.issubdtype(obj.dtype, np.str_):
+            return str(obj)
+        if np.issubdtype(obj.dtype, np.bytes_) and hasattr(obj, "tobytes"):
+            return obj.tobytes().decode("utf-8", errors="ignore")
+        if np.issubdtype(obj.dtype, np.object_) and hasattr(obj, "item"):
+            return serialize(obj.item())
+    return UNSERIALIZABLE_SENTINEL
+
+
+# (base types, serializer of their instances), in the order they are checked, so an object
+# of several of the types (e.g. an Enum that is also a str) uses the first serializer
+_SERIALIZERS_BY_TYPE: tuple[tuple[type | tuple[type, ...], Serializer], ...] = (
+    ((int, float, bool, complex), _serialize_primitive),
+    (str, _serialize_str),
+    (bytes, _serialize_bytes),
+    (datetime, _serialize_datetime),
+    (Decimal, _serialize_decimal),
+    (UUID, _serialize_uuid),
+    (Document, _serialize_document),
+    ((AsyncIterator, Generator, Iterator), _serialize_iterator),
+    (BaseModel, _serialize_pydantic),
+    (BaseModelV1, _serialize_pydantic_v1),
+    (dict, _serialize_dict),
+    (pd.DataFrame, _serialize_dataframe),
+    (pd.Series, _serialize_series),
+    ((list, tuple), _serialize_list_tuple),
+)
+
+
+@lru_cache(maxsize=1024)
+def _serializer_for(cls: type) -> Serializer:
+    """Find the serializer of instances of `cls`.
+
+    Cached, so the types are only checked the first time an object of a type is serialized.
+    """
+    for types, serializer in _SERIALIZERS_BY_TYPE:
+        if issubclass(cls, types):
+            return serializer
+    if cls.__module__ == np.__name__:
+        return _serialize_numpy_type
+    if issubclass(cls, type):
+        return _serialize_type
+    # Any instance that's not a class
+    return _serialize_instance
+
+
+def _serialize_dispatcher(
+    obj: Any, max_length: int | None, max_items: int | None, max_depth: int | None = None
+) -> Any | _UnserializableSentinel:
+    """Dispatch object to the serializer of its type."""
     if obj is None:
         return obj
-    primitive = _serialize_primitive(obj, max_length, max_items)
-    if primitive is not UNSERIALIZABLE_SENTINEL:
-        return primitive
-
-    match obj:
-        case str():
-            return _serialize_str(obj, max_length, max_items)
-        case bytes():
-            return _serialize_bytes(obj, max_length, max_items)
-        case datetime():
-            return _serialize_datetime(obj, max_length, max_items)
-        case Decimal():
-            return _serialize_decimal(obj, max_length, max_items)
-        case UUID():
-            return _serialize_uuid(obj, max_length, max_items)
-        case Document():
-            return _serialize_document(obj, max_length, max_items)
-        case AsyncIterator() | Generator() | Iterator():
-            return _serialize_iterator(obj, max_length, max_items)
-        case BaseModel():
-            return _serialize_pydantic(obj, max_length, max_items)
-        case BaseModelV1():
-            return _serialize_pydantic_v1(obj, max_length, max_items)
-        case dict():
-            return _serialize_dict(obj, max_length, max_items)
-        case pd.DataFrame():
-            return _serialize_dataframe(obj, max_length, max_items)
-        case pd.Series():
-            return _serialize_series(obj, max_length, max_items)
-        case list() | tuple():
-            return _serialize_list_tuple(obj, max_length, max_items)
-        case object() if _is_numpy_type(obj):
-            return _serialize_numpy_type(obj, max_length, max_items)
-        case object() if not isinstance(obj, type):  # Match any instance that's not a class
-            return _serialize_instance(obj, max_length, max_items)
-        case object() if hasattr(obj, "_name_"):  # Enum case
-            return f"{obj.__class__.__name__}.{obj._name_}"
-        case object() if hasattr(obj, "__name__") and hasattr(obj, "__bound__"):  # TypeVar case
-            return repr(obj)
-        case object() if hasattr(obj, "__origin__") or hasattr(obj, "__parameters__"):  # Type alias/generic case
-            return repr(obj)
-        case _:
-            # Handle numpy numeric types (int, float, bool, complex)
-            if hasattr(obj, "dtype"):
-                if np.issubdtype(obj.dtype, np.number) and hasattr(obj, "item"):
-                    return obj.item()
-                if np.issubdtype(obj.dtype, np.bool_):
-                    return bool(obj)
-                if np.issubdtype(obj.dtype, np.complexfloating):
-                    return complex(cast("complex", obj))
-                if np.issubdtype(obj.dtype, np.str_):
-                    return str(obj)
-                if np.issubdtype(obj.dtype, np.bytes_) and hasattr(obj, "tobytes"):
-                    return obj.tobytes().decode("utf-8", errors="ignore")
-                if np.issubdtype(obj.dtype, np.object_) and hasattr(obj, "item"):
-                    return serialize(obj.item())
-            return UNSERIALIZABLE_SENTINEL
+    return _serializer_for(type(obj))(obj, max_length, max_items, max_depth)
 
 
 def serialize(
@@ -234,23 +265,30 @@ def serialize(
     max_items: int | None = None,
     *,
     to_str: bool = False,
+    max_depth: int | None = MAX_DEPTH,
 ) -> Any:
     """Unified serialization with optional truncation support.
 
     Coordinates specialized serializers through a dispatcher pattern.
-    Maintains recursive processing for nested structures.
+    Maintains recursive processing for nested structures. Strings, bytes, lists, dicts and
+    DataFrames are truncated before they are converted, so with limits the work done doesn't
+    grow with the size of the object.
 
     Args:
         obj: Object to serialize
         max_length: Maximum length for string values, None for no truncation
         max_items: Maximum items in list-like structures, None for no truncation
         to_str: If True, return a string representation of the object if serialization fails
+        max_depth: Maximum nesting of the values kept, deeper ones are replaced by a marker,
+            None for no limit
     """
     if obj is None:
         return None
+    if max_depth is not None and max_depth < 0:
+        return MAX_DEPTH_MARKER
     try:
         # First try type-specific serialization
-        result = _serialize_dispatcher(obj, max_length, max_items)
+        result = _serialize_dispatcher(obj, max_length, max_items, max_depth)
         if result is not UNSERIALIZABLE_SENTINEL:  # Special check for None since it's a valid result
             return result
 
@@ -269,9 +307,9 @@ def serialize(
 
         # Fallback to common serialization patterns
         if hasattr(obj, "model_dump"):
-            return serialize(obj.model_dump(), max_length, max_items)
+            return serialize(obj.model_dump(), max_length, max_items, max_depth=max_depth)
         if hasattr(obj, "dict") and not isinstance(obj, type):
-            return serialize(obj.dict(), max_length, max_items)
+            return serialize(obj.dict(), max_length, max_items, max_depth=max_depth)
 
         # Final fallback to string conversion only if explicitly requested
         if to_str:
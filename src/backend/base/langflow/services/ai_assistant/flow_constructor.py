@@ -196,6 +196,22 @@ class FlowConstructor:
             source_field = requirement.source_field
             target_field = requirement.target_field
 
+            # Use the type index to make sure the target field accepts the source output
+            source_output_types = source_node.data["node"].get("output_types") or source_node.data["node"].get(
+                "template", {}
+            ).get("output_types", [])
+            compatible_fields = await self.knowledge_base.get_compatible_fields(
+                source_output_types,
+                target_node.data["type"],
+                self._get_component_name(target_node),
+            )
+            if compatible_fields and target_field not in compatible_fields:
+                logger.debug(
+                    f"Field {target_field} of {target_node.id} is not compatible with {source_node.id}, "
+                    f"using {compatible_fields[0]} instead"
+                )
+                target_field = compatible_fields[0]
+
             # Create source and target handles
             source_handle = f"{source_node.id}|{source_field}"
             target_handle = f"{target_node.id}|{target_field}"
@@ -227,6 +243,17 @@ class FlowConstructor:
 
         return edges
 
+    def _get_component_name(self, node: FlowNode) -> str:
+        """Get the component name of a node created by `_select_components`.
+
+        Args:
+            node: The node.
+
+        Returns:
+            The component name.
+        """
+        return node.id.rsplit("-", 1)[0]
+
     async def _get_api_key(self, key_name: str) -> str:
         """Get an API key from the environment or variable service.
 
@@ -40,7 +40,11 @@ class ComponentKnowledgeBase:
         self.categories: Dict[str, List[str]] = {}
 
         # Input/output type compatibility
-        self.type_compatibility: Dict[str, List[str]] = {}
+        self.type_compatibility: Dict[str, Set[str]] = {}
+
+        # Inverted index of input type to the components (and fields) accepting it
+        # {input_type: {target_component: [target_field, ...]}}
+        self.input_type_index: Dict[str, Dict[str, List[str]]] = {}
 
         # Common component combinations
         self.common_combinations: List[Dict[str, Any]] = []
@@ -57,16 +61,13 @@ class ComponentKnowledgeBase:
         logger.info("Building component knowledge base from registry")
 
         # Import here to avoid circular imports
-        from langflow.interface.components import get_and_cache_all_types_dict, aget_all_types_dict, component_cache
+        from langflow.interface.components import get_and_cache_all_types_dict, aget_all_types_dict
 
         # Log component paths for debugging
         logger.info(f"Component paths: {settings_service.settings.components_path}")
 
-        # Clear component cache to ensure fresh data
-        component_cache.all_types_dict = None
-        component_cache.fully_loaded_components = {}
-
-        # Get all component types
+        # Reuse the types cached at startup, which include the components of bundles since they are
+        # loaded first. refresh_knowledge_base clears the cache to load the components again.
         all_types_dict = await get_and_cache_all_types_dict(settings_service)
 
         if not all_types_dict or "components" not in all_types_dict or not all_types_dict["components"]:
@@ -146,7 +147,9 @@ class ComponentKnowledgeBase:
         """Analyze component connection compatibility.
 
         This method builds a graph representation of valid component connections
-        based on input/output type compatibility.
+        based on input/output type compatibility. Targets are looked up in the
+        inverted input type index, so the whole pass is linear in the number of
+        component outputs instead of comparing every pair of components.
         """
         logger.info("Analyzing component connection compatibility")
 
@@ -154,7 +157,15 @@ class ComponentKnowledgeBase:
         self.connection_graph = defaultdict(lambda: defaultdict(dict))
 
         # Initialize type compatibility
-        self.type_compatibility = defaultdict(list)
+        self.type_compatibility = defaultdict(set)
+
+        self.input_type_index = self._get_input_type_index()
+        target_input_types = {
+            f"{category}.{comp_name}": set(self._get_input_types(comp_data["template"]))
+            for category, components in self.components.items()
+            for comp_name, comp_data in components.items()
+            if "template" in comp_data
+        }
 
         # For each component category
         for category, components in self.components.items():
@@ -166,94 +177,87 @@ class ComponentKnowledgeBase:
                 if "template" not in comp_data:
                     continue
 
-                template = comp_data["template"]
+                # For each output type, look up the components accepting it
+                for output_type in self._get_output_types(comp_data["template"]):
+                    for target_id, target_fields in self.input_type_index.get(output_type, {}).items():
+                        # Skip self-connections
+                        if source_id == target_id:
+                            continue
 
-                # Extract output types
-                output_types = template.get("output_types", [])
-                if not output_types and "output_type" in template:
-                    output_types = [template["output_type"]]
+                        # Default output field is 'output'
+                        for target_field in target_fields:
+                            self.connection_graph[source_id][target_id]["output"] = target_field
 
-                # For each output type, find compatible input types
-                for output_type in output_types:
-                    # For each potential target component category
-                    for target_category, target_components in self.components.items():
-                        # For each potential target component
-                        for target_name, target_data in target_components.items():
-                            target_id = f"{target_category}.{target_name}"
+                        self.type_compatibility[output_type].update(target_input_types.get(target_id, ()))
 
-                            # Skip self-connections
-                            if source_id == target_id:
-                                continue
+        logger.info(f"Built connection graph with {len(self.connection_graph)} source components")
 
-                            # Skip if no template
-                            if "template" not in target_data:
-                                continue
+    def build_input_type_index(self) -> Dict[str, Dict[str, List[str]]]:
+        """Build the inverted index from input type to the components accepting it.
 
-                            target_template = target_data["template"]
+        The index is built in a single pass over the component templates and maps
+        each input type to ``{"category.name": [compatible field names]}``. A
+        component that declares template-level ``input_types`` accepts exactly
+        those types, even if none of its fields matches.
 
-                            # Check if target accepts this output type
-                            if self._is_compatible(output_type, target_template):
-                                # Find compatible fields
-                                compatible_fields = self._find_compatible_fields(
-                                    output_type, target_template)
+        Returns:
+            The input type index.
+        """
+        index: Dict[str, Dict[str, List[str]]] = defaultdict(dict)
 
-                                # Add to connection graph
-                                for source_field, target_field in compatible_fields:
-                                    self.connection_graph[source_id][target_id][source_field] = target_field
+        for category, components in self.components.items():
+            for comp_name, comp_data in components.items():
+                if "template" not in comp_data:
+                    continue
 
-                                # Add to type compatibility
-                                if output_type not in self.type_compatibility:
-                                    self.type_compatibility[output_type] = []
+                target_id = f"{category}.{comp_name}"
+                template = comp_data["template"]
+                accepted_types = set(template["input_types"]) if "input_types" in template else None
 
-                                for input_type in self._get_input_types(target_template):
-                                    if input_type not in self.type_compatibility[output_type]:
-                                        self.type_compatibility[output_type].append(input_type)
+                for accepted_type in accepted_types or ():
+                    index[accepted_type].setdefault(target_id, [])
 
-        logger.info(f"Built connection graph with {len(self.connection_graph)} source components")
+                for field_name, field_info in template.get("inputs", {}).items():
+                    if not isinstance(field_info, dict) or "type" not in field_info:
+                        continue
+                    field_type = field_info["type"]
+                    if accepted_types is not None and field_type not in accepted_types:
+                        continue
+                    index[field_type].setdefault(target_id, []).append(field_name)
 
-    def _is_compatible(self, output_type: str, target_template: Dict[str, Any]) -> bool:
-        """Check if an output type is compatible with a target component.
+        return dict(index)
 
-        Args:
-            output_type: The output type to check.
-            target_template: The template of the target component.
+    def _get_input_type_index(self) -> Dict[str, Dict[str, List[str]]]:
+        """Get the input type index, reusing the one stored with the component registry.
 
-        Returns:
-            True if the output type is compatible with the target component.
+        The index is stored in the component cache next to the types dict it was
+        built from, so it is only rebuilt when the registry itself is reloaded.
         """
-        # Check if target accepts this output type
-        if "input_types" in target_template:
-            return output_type in target_template["input_types"]
+        from langflow.interface.components import component_cache
 
-        # Check individual fields
-        for field_name, field_info in target_template.get("inputs", {}).items():
-            if isinstance(field_info, dict) and field_info.get("type") == output_type:
-                return True
+        registry = component_cache.all_types_dict
+        is_registry = registry is not None and registry.get("components") is self.components
+        if is_registry and component_cache.input_type_index is not None:
+            return component_cache.input_type_index
 
-        return False
+        index = self.build_input_type_index()
+        if is_registry:
+            component_cache.input_type_index = index
+        return index
 
-    def _find_compatible_fields(self, output_type: str,
-                               target_template: Dict[str, Any]) -> List[Tuple[str, str]]:
-        """Find compatible fields between an output type and a target component.
+    def _get_output_types(self, template: Dict[str, Any]) -> List[str]:
+        """Get all output types produced by a component.
 
         Args:
-            output_type: The output type to check.
-            target_template: The template of the target component.
+            template: The component template.
 
         Returns:
-            A list of tuples (source_field, target_field) of compatible fields.
+            A list of output types.
         """
-        compatible_fields = []
-
-        # Default output field is 'output'
-        source_field = "output"
-
-        # Check individual input fields
-        for field_name, field_info in target_template.get("inputs", {}).items():
-            if isinstance(field_info, dict) and field_info.get("type") == output_type:
-                compatible_fields.append((source_field, field_name))
-
-        return compatible_fields
+        output_types = template.get("output_types", [])
+        if not output_types and "output_type" in template:
+            output_types = [template["output_type"]]
+        return output_types
 
     def _get_input_types(self, template: Dict[str, Any]) -> List[str]:
         """Get all input types accepted by a component.
@@ -410,13 +414,25 @@ class ComponentKnowledgeBase:
             A list of dictionaries containing information about compatible components.
         """
         source_id = f"{component_type}.{component_name}"
+        source_info = self.components.get(component_type, {}).get(component_name)
 
-        if source_id not in self.connection_graph:
+        if not source_info or "template" not in source_info:
             return []
 
+        field_mappings_by_target: Dict[str, Dict[str, str]] = defaultdict(dict)
+        for output_type in self._get_output_types(source_info["template"]):
+            for target_id, target_fields in self.input_type_index.get(output_type, {}).items():
+                if target_id == source_id:
+                    continue
+                for target_field in target_fields:
+                    field_mappings_by_target[target_id]["output"] = target_field
+
         compatible_components = []
 
-        for target_id, field_mappings in self.connection_graph[source_id].items():
+        for target_id, field_mappings in field_mappings_by_target.items():
+            if not field_mappings:
+                continue
+
             target_type, target_name = target_id.split(".", 1)
 
             if target_type in self.components and target_name in self.components[target_type]:
@@ -426,6 +442,27 @@ class ComponentKnowledgeBase:
 
         return compatible_components
 
+    async def get_compatible_fields(self, output_types: List[str], target_type: str, target_name: str) -> List[str]:
+        """Get the fields of a target component that accept any of the given output types.
+
+        Args:
+            output_types: The output types of the source component.
+            target_type: The type of the target component.
+            target_name: The name of the target component.
+
+        Returns:
+            The names of the compatible target fields, in index order.
+        """
+        target_id = f"{target_type}.{target_name}"
+        compatible_fields: List[str] = []
+
+        for output_type in output_types:
+            for target_field in self.input_type_index.get(output_type, {}).get(target_id, []):
+                if target_field not in compatible_fields:
+                    compatible_fields.append(target_field)
+
+        return compatible_fields
+
     def _create_fallback_components(self) -> Dict[str, Any]:
         """Create fallback standard components when the registry is empty.
 
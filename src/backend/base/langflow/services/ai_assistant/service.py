@@ -325,6 +325,7 @@ class AIAssistantService(Service):
             from langflow.interface.components import component_cache
             component_cache.all_types_dict = None
             component_cache.fully_loaded_components = {}
+            component_cache.input_type_index = None
 
             # Get all component types with fresh data
             all_types_dict = await get_and_cache_all_types_dict(self.settings_service)
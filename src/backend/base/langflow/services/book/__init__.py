@@ -1,6 +1,15 @@
+from typing import TYPE_CHECKING
+
+from langflow.utils.lazy_load import lazy_exports
+
 from .factory import BookServiceFactory
 from .service import BookService
 from .export_service import BookExportService
-from .pdf_generator import BookPDFGenerator
+
+if TYPE_CHECKING:
+    from .pdf_generator import BookPDFGenerator
+
+# ReportLab is only loaded once PDFs are generated
+__getattr__ = lazy_exports(__name__, {"BookPDFGenerator": ".pdf_generator"})
 
 __all__ = ["BookService", "BookServiceFactory", "BookExportService", "BookPDFGenerator"]
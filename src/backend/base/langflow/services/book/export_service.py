@@ -1,14 +1,46 @@
 """Export service for the Book Creator module."""
 
 import io
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
 from uuid import UUID
 
 from fastapi import HTTPException
-from sqlalchemy.ext.asyncio import AsyncSession
+from loguru import logger
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from langflow.services.book.pdf_generator import BookPDFGenerator
+from langflow.services.book.pdf_renderer import book_export_key, book_export_snapshot, render_pool
 from langflow.services.database.models.book import Book, BookCover, BookInterior, BookPage, BookTemplate
+from langflow.services.deps import get_storage_service
+
+# Folder of the storage service that rendered PDFs are cached in, with a folder per book
+EXPORT_CACHE_FOLDER = "book_exports"
+
+
+@dataclass
+class BookExport:
+    """A book loaded for export, keyed by a hash of its content and the export options."""
+
+    key: str
+    book_id: UUID
+    book_name: str
+    snapshot: Dict[str, Any]
+    include_cover: bool
+    include_bleed: bool
+    quality: int
+
+    @property
+    def folder(self) -> str:
+        return f"{EXPORT_CACHE_FOLDER}/{self.book_id}"
+
+    @property
+    def file_name(self) -> str:
+        # A single file per book and export options, overwritten once the book is edited,
+        # so the cache doesn't grow with every edit
+        bleed = "bleed" if self.include_bleed else "trim"
+        cover = "cover" if self.include_cover else "no-cover"
+        return f"{self.quality}dpi-{bleed}-{cover}.pdf"
 
 
 class BookExportService:
@@ -49,7 +81,7 @@ class BookExportService:
         Returns:
             The book cover, or None if not found
         """
-        return await self.session.get(BookCover, {"book_id": book_id})
+        return (await self.session.exec(select(BookCover).where(BookCover.book_id == book_id))).first()
 
     async def get_book_interior(self, book_id: UUID) -> Optional[BookInterior]:
         """Get a book interior by book ID.
@@ -63,7 +95,7 @@ class BookExportService:
         Raises:
             HTTPException: If the book interior is not found
         """
-        interior = await self.session.get(BookInterior, {"book_id": book_id})
+        interior = (await self.session.exec(select(BookInterior).where(BookInterior.book_id == book_id))).first()
         if not interior:
             raise HTTPException(status_code=404, detail="Book interior not found")
         return interior
@@ -77,10 +109,8 @@ class BookExportService:
         Returns:
             The book pages
         """
-        pages_query = await self.session.execute(
-            f"SELECT * FROM book_page WHERE book_id = '{book_id}' ORDER BY page_number"
-        )
-        return pages_query.all()
+        pages_query = select(BookPage).where(BookPage.book_id == book_id).order_by(BookPage.page_number)
+        return list((await self.session.exec(pages_query)).all())
 
     async def get_book_templates(self, template_ids: List[UUID]) -> Dict[UUID, BookTemplate]:
         """Get book templates by IDs.
@@ -94,13 +124,10 @@ class BookExportService:
         if not template_ids:
             return {}
         
-        templates_query = await self.session.execute(
-            f"SELECT * FROM book_template WHERE id IN ({','.join([f'\\'{tid}\\'' for tid in template_ids])})"
-        )
-        templates = templates_query.all()
+        templates = (await self.session.exec(select(BookTemplate).where(BookTemplate.id.in_(template_ids)))).all()
         return {template.id: template for template in templates}
 
-    async def export_book_as_pdf(
+    async def prepare_export(
         self,
         book_id: UUID,
         user_id: UUID,
@@ -108,8 +135,8 @@ class BookExportService:
         include_bleed: bool = False,
         quality: int = 300,
         format: str = "pdf",
-    ) -> io.BytesIO:
-        """Export a book as PDF.
+    ) -> BookExport:
+        """Load everything a book's PDF is rendered from, without rendering it.
         
         Args:
             book_id: The book ID
@@ -120,49 +147,135 @@ class BookExportService:
             format: The export format (pdf, print-ready)
             
         Returns:
-            A BytesIO object containing the PDF
+            The export, keyed by a hash of the book content and the export options
             
         Raises:
             HTTPException: If the book is not found or the user doesn't have access
         """
-        # Get book
         book = await self.get_book(book_id, user_id)
-        
-        # Get book cover if requested
-        cover = None
-        if include_cover:
-            cover = await self.get_book_cover(book_id)
-        
-        # Get book interior
+        cover = await self.get_book_cover(book_id) if include_cover else None
         interior = await self.get_book_interior(book_id)
-        
-        # Get book pages
         pages = await self.get_book_pages(book_id)
         
-        # Get template IDs
-        template_ids = []
-        if interior and interior.template_id:
-            template_ids.append(interior.template_id)
+        template_ids = {page.template_id for page in pages if page.template_id}
+        if interior.template_id:
+            template_ids.add(interior.template_id)
+        templates = await self.get_book_templates(list(template_ids))
         
-        for page in pages:
-            if page.template_id:
-                template_ids.append(page.template_id)
+        # Print-ready exports always include bleed
+        include_bleed = include_bleed or format == "print-ready"
+        snapshot = book_export_snapshot(book, cover, interior, pages, templates)
+        return BookExport(
+            key=book_export_key(snapshot, include_bleed=include_bleed, quality=quality),
+            book_id=book.id,
+            book_name=book.name,
+            snapshot=snapshot,
+            include_cover=include_cover,
+            include_bleed=include_bleed,
+            quality=quality,
+        )
+
+    async def get_cached_pdf(self, export: BookExport) -> Optional[bytes]:
+        """Get a previously rendered PDF from the storage service.
         
-        # Get templates
-        templates = await self.get_book_templates(template_ids)
+        Args:
+            export: The export to get the PDF of
+            
+        Returns:
+            The PDF, or None if this version of the book hasn't been rendered yet
+        """
+        try:
+            cached = await get_storage_service().get_file(export.folder, export.file_name)
+        except Exception:  # noqa: BLE001
+            # Storage backends raise different errors for missing files, either way the PDF is rendered again
+            return None
+        # Cached PDFs start with the key of the book version they were rendered from
+        key, _, pdf = cached.partition(b"\n")
+        return pdf if key == export.key.encode() else None
+
+    async def render_pdf(
+        self,
+        export: BookExport,
+        on_progress: Optional[Callable[[int, int], Any]] = None,
+    ) -> bytes:
+        """Render a PDF in the render pool and cache it in the storage service.
         
-        # Create PDF generator
-        pdf_generator = BookPDFGenerator(
-            book=book,
-            cover=cover,
-            interior=interior,
-            pages=pages,
-            templates=templates,
+        Args:
+            export: The export to render
+            on_progress: Called with the number of rendered pages and the expected total
+            
+        Returns:
+            The PDF
+        """
+        pdf = await render_pool.render(
+            export.snapshot,
+            include_bleed=export.include_bleed,
+            quality=export.quality,
+            on_progress=on_progress,
         )
+        try:
+            await get_storage_service().save_file(export.folder, export.file_name, export.key.encode() + b"\n" + pdf)
+        except Exception:  # noqa: BLE001
+            logger.exception(f"Could not cache the PDF of book {export.book_name}")
+        return pdf
+
+    @staticmethod
+    async def delete_cached_pdfs(book_id: UUID) -> None:
+        """Delete the cached PDFs of a book.
+
+        Args:
+            book_id: The book ID
+        """
+        storage = get_storage_service()
+        folder = f"{EXPORT_CACHE_FOLDER}/{book_id}"
+        try:
+            for file_name in await storage.list_files(folder):
+                await storage.delete_file(folder, file_name)
+        except Exception:  # noqa: BLE001
+            # Books that were never exported have no folder
+            logger.debug(f"Could not delete the cached PDFs of book {book_id}")
+
+    async def get_or_render_pdf(self, export: BookExport) -> bytes:
+        """Get the cached PDF of an export, rendering it first if needed.
+        
+        Args:
+            export: The export to get the PDF of
+            
+        Returns:
+            The PDF
+        """
+        pdf = await self.get_cached_pdf(export)
+        if pdf is None:
+            pdf = await self.render_pdf(export)
+        return pdf
+
+    async def export_book_as_pdf(
+        self,
+        book_id: UUID,
+        user_id: UUID,
+        include_cover: bool = True,
+        include_bleed: bool = False,
+        quality: int = 300,
+        format: str = "pdf",
+    ) -> io.BytesIO:
+        """Export a book as PDF.
+        
+        The PDF is rendered in a worker process and cached, so exporting an unchanged book
+        again doesn't render it again.
         
-        # Generate PDF
-        if format == "print-ready":
-            # For print-ready, always include bleed
-            return pdf_generator.generate_pdf(include_bleed=True, quality=quality)
-        else:
-            return pdf_generator.generate_pdf(include_bleed=include_bleed, quality=quality)
+        Args:
+            book_id: The book ID
+            user_id: The user ID
+            include_cover: Whether to include the cover
+            include_bleed: Whether to include bleed area
+            quality: The quality of the PDF in DPI
+            format: The export format (pdf, print-ready)
+            
+        Returns:
+            A BytesIO object containing the PDF
+            
+        Raises:
+            HTTPException: If the book is not found or the user doesn't have access
+        """
+        export = await self.prepare_export(book_id, user_id, include_cover, include_bleed, quality, format)
+        return io.BytesIO(await self.get_or_render_pdf(export))
@@ -1,7 +1,8 @@
 """PDF generation service for the Book Creator module."""
 
 import io
-from typing import Dict, List, Optional, Tuple, Union
+import json
+from typing import Callable, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
 from reportlab.lib import colors
@@ -13,18 +14,28 @@ from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.pdfgen import canvas
 from reportlab.platypus import (
     BaseDocTemplate,
+    Flowable,
     Frame,
     Image,
     PageBreak,
     PageTemplate,
     Paragraph,
-    Spacer,
     Table,
     TableStyle,
 )
 
 from langflow.services.database.models.book import Book, BookCover, BookInterior, BookPage, BookTemplate
 
+# The page content settings each page background is drawn from. Pages of the same type, with
+# the same settings and page size, share a single background.
+BACKGROUND_SETTINGS = {
+    "lined": ("line_spacing", "line_color"),
+    "grid": ("grid_size", "grid_color"),
+    "dot": ("dot_spacing", "dot_size", "dot_color"),
+    "planner": ("layout",),
+    "tracker": ("rows", "columns"),
+}
+
 
 class BookPDFGenerator:
     """PDF generator for books."""
@@ -36,6 +47,7 @@ class BookPDFGenerator:
         interior: Optional[BookInterior] = None,
         pages: List[BookPage] = None,
         templates: Dict[str, BookTemplate] = None,
+        reuse_backgrounds: bool = True,
     ):
         """Initialize the PDF generator.
         
@@ -45,12 +57,25 @@ class BookPDFGenerator:
             interior: The book interior
             pages: The book pages
             templates: A dictionary of templates by ID
+            reuse_backgrounds: Whether identical page backgrounds are drawn once, as a form
+                XObject referenced by every page, instead of being drawn again on each page
         """
         self.book = book
         self.cover = cover
         self.interior = interior
         self.pages = pages or []
         self.templates = templates or {}
+        self.reuse_backgrounds = reuse_backgrounds
+        
+        # Names of the background forms drawn so far, by background key
+        self._background_forms: Dict[tuple, str] = {}
+        self._background_renderers = {
+            "lined": self._render_lined_page,
+            "grid": self._render_grid_page,
+            "dot": self._render_dot_grid_page,
+            "planner": self._render_planner_page,
+            "tracker": self._render_tracker_page,
+        }
         
         # Register custom fonts
         self._register_fonts()
@@ -602,48 +627,62 @@ class BookPDFGenerator:
         
         # Create a custom drawing function for this page
         def draw_page(canvas_obj, doc):
-            canvas_obj.saveState()
+            render_background = self._background_renderers.get(page_type)
+            if render_background is None:
+                return
             
             # Get page dimensions
             page_width, page_height = doc.pagesize
             
-            # Draw page content based on type
-            if page_type == "lined":
-                self._render_lined_page(canvas_obj, page_content, page_width, page_height)
-            elif page_type == "grid":
-                self._render_grid_page(canvas_obj, page_content, page_width, page_height)
-            elif page_type == "dot":
-                self._render_dot_grid_page(canvas_obj, page_content, page_width, page_height)
-            elif page_type == "planner":
-                self._render_planner_page(canvas_obj, page_content, page_width, page_height)
-            elif page_type == "tracker":
-                self._render_tracker_page(canvas_obj, page_content, page_width, page_height)
-            # Add more page types as needed
+            if not self.reuse_backgrounds:
+                canvas_obj.saveState()
+                render_background(canvas_obj, page_content, page_width, page_height)
+                canvas_obj.restoreState()
+                return
             
-            canvas_obj.restoreState()
-        
-        # Add a spacer to trigger the page drawing
-        elements.append(Spacer(1, 1))
-        
-        # Add a callback to draw the page
+            settings = {name: page_content[name] for name in BACKGROUND_SETTINGS[page_type] if name in page_content}
+            key = (page_type, json.dumps(settings, sort_keys=True, default=str), page_width, page_height)
+            form_name = self._background_forms.get(key)
+            if form_name is None:
+                # Forms belong to the document, so each background is drawn once and referenced by every page
+                form_name = f"PageBackground{len(self._background_forms)}"
+                canvas_obj.beginForm(form_name)
+                render_background(canvas_obj, page_content, page_width, page_height)
+                canvas_obj.endForm()
+                self._background_forms[key] = form_name
+            canvas_obj.doForm(form_name)
+        
+        # Draw the background on the page the book page lands on
+        elements.append(PageBackground(draw_page))
+        
+        # Start a new page for the next book page
         elements.append(PageBreak())
         
         return elements, draw_page
 
-    def generate_pdf(self, include_bleed: bool = False, quality: int = 300) -> io.BytesIO:
+    def generate_pdf(
+        self,
+        include_bleed: bool = False,
+        quality: int = 300,
+        progress_callback: Optional[Callable[[str, int], None]] = None,
+    ) -> io.BytesIO:
         """Generate a PDF for the book.
         
         Args:
             include_bleed: Whether to include bleed area
             quality: The quality of the PDF in DPI
+            progress_callback: Called by ReportLab while building, e.g. with ("PAGE", page_number)
             
         Returns:
             A BytesIO object containing the PDF
         """
         buffer = io.BytesIO()
+        self._background_forms = {}
         
         # Create document
         doc = self._create_document(buffer, include_bleed)
+        if progress_callback:
+            doc.setProgressCallBack(progress_callback)
         
         # Create page templates
         page_templates = self._create_page_templates(doc)
@@ -675,6 +714,21 @@ class BookPDFGenerator:
         return buffer
 
 
+class PageBackground(Flowable):
+    """A zero-size flowable that draws a background on the page it is placed on."""
+
+    def __init__(self, draw_background):
+        super().__init__()
+        self.draw_background = draw_background
+
+    def wrap(self, availWidth, availHeight):
+        return 0, 0
+
+    def drawOn(self, canvas, x, y, _sW=0):
+        # Backgrounds are positioned on the page, not relative to the frame the flowable is in
+        self.draw_background(canvas, canvas._doctemplate)
+
+
 class NumberedCanvas(canvas.Canvas):
     """A canvas that adds page numbers."""
     
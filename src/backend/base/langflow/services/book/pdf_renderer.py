@@ -0,0 +1,201 @@
+"""Rendering of book PDFs in worker processes, keyed by the content they are rendered from."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from multiprocessing.managers import SyncManager
+
+    from langflow.services.database.models.book import Book, BookCover, BookInterior, BookPage, BookTemplate
+
+# Bump whenever BookPDFGenerator renders the same content differently, so cached PDFs are not served stale
+RENDERER_VERSION = 2
+DEFAULT_MAX_WORKERS = 2
+PROGRESS_POLL_INTERVAL = 0.2
+
+
+def book_export_snapshot(
+    book: Book,
+    cover: BookCover | None,
+    interior: BookInterior | None,
+    pages: list[BookPage],
+    templates: dict[Any, BookTemplate],
+) -> dict[str, Any]:
+    """Returns everything the PDF of a book is rendered from, as plain JSON-serializable data.
+
+    Ids and timestamps are left out, so that two books with the same content share a PDF and
+    saving a book without changing it doesn't invalidate its PDF.
+    """
+    return {
+        "book": {"name": book.name, "user_id": str(book.user_id), "dimensions": book.dimensions},
+        "cover": None
+        if cover is None
+        else {
+            "front_design": cover.front_design,
+            "back_design": cover.back_design,
+            "spine_design": cover.spine_design,
+        },
+        "interior": None
+        if interior is None
+        else {
+            "template_id": str(interior.template_id) if interior.template_id else None,
+            "layout_settings": interior.layout_settings,
+        },
+        "pages": [
+            {
+                "page_number": page.page_number,
+                "template_id": str(page.template_id) if page.template_id else None,
+                "content": page.content,
+            }
+            for page in sorted(pages, key=lambda page: page.page_number)
+        ],
+        "templates": {
+            str(template_id): {"template_type": template.template_type, "content": template.content}
+            for template_id, template in templates.items()
+        },
+    }
+
+
+def book_export_key(snapshot: dict[str, Any], *, include_bleed: bool, quality: int) -> str:
+    """Returns a hash of a book snapshot and the options it is rendered with."""
+    payload = {
+        "version": RENDERER_VERSION,
+        "snapshot": snapshot,
+        "include_bleed": include_bleed,
+        "quality": quality,
+    }
+    serialized = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def render_book_pdf(
+    snapshot: dict[str, Any],
+    *,
+    include_bleed: bool = False,
+    quality: int = 300,
+    progress_queue: Any | None = None,
+) -> bytes:
+    """Renders a book snapshot to PDF.
+
+    Runs in a worker process of the render pool, so it only takes and returns picklable data.
+    The number of each rendered page is put on `progress_queue`, if given.
+    """
+    # ReportLab is only loaded by the processes that render
+    from langflow.services.book.pdf_generator import BookPDFGenerator
+
+    # BookPDFGenerator only reads attributes, so the snapshot doesn't need to become models again
+    generator = BookPDFGenerator(
+        book=SimpleNamespace(**snapshot["book"]),
+        cover=SimpleNamespace(**snapshot["cover"]) if snapshot["cover"] else None,
+        interior=SimpleNamespace(**snapshot["interior"]) if snapshot["interior"] else None,
+        pages=[SimpleNamespace(**page) for page in snapshot["pages"]],
+        templates={template_id: SimpleNamespace(**template) for template_id, template in snapshot["templates"].items()},
+    )
+
+    def progress_callback(kind: str, value: int) -> None:
+        if kind == "PAGE" and progress_queue is not None:
+            progress_queue.put(value)
+
+    buffer = generator.generate_pdf(include_bleed=include_bleed, quality=quality, progress_callback=progress_callback)
+    return buffer.getvalue()
+
+
+class PDFRenderPool:
+    """Process pool that renders book PDFs off the event loop.
+
+    ReportLab is pure Python and holds the GIL, so rendering a large book in a thread would
+    still stall the server. The pool and the manager used to report progress across processes
+    are only started on first use.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        self.max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._manager: SyncManager | None = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # Forking a process that runs an event loop and threads is unsafe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def _get_manager(self) -> SyncManager:
+        with self._lock:
+            if self._manager is None:
+                self._manager = multiprocessing.get_context("spawn").Manager()
+            return self._manager
+
+    async def render(
+        self,
+        snapshot: dict[str, Any],
+        *,
+        include_bleed: bool = False,
+        quality: int = 300,
+        on_progress: Callable[[int, int], Any] | None = None,
+    ) -> bytes:
+        """Renders a book snapshot to PDF in a worker process.
+
+        Args:
+            snapshot: The book, as returned by `book_export_snapshot`.
+            include_bleed: Whether to include the bleed area.
+            quality: The quality of the PDF in DPI.
+            on_progress: Called with the number of rendered pages and the expected total.
+        """
+        # Starting the pool and the manager spawns processes, which must not block the event loop
+        executor = await asyncio.to_thread(self._get_executor)
+        if on_progress is None:
+            future = await asyncio.to_thread(
+                executor.submit, render_book_pdf, snapshot, include_bleed=include_bleed, quality=quality
+            )
+            return await asyncio.wrap_future(future)
+
+        manager = await asyncio.to_thread(self._get_manager)
+        progress_queue = await asyncio.to_thread(manager.Queue)
+        total_pages = len(snapshot["pages"]) + (snapshot["cover"] is not None)
+        future = asyncio.wrap_future(
+            await asyncio.to_thread(
+                executor.submit,
+                render_book_pdf,
+                snapshot,
+                include_bleed=include_bleed,
+                quality=quality,
+                progress_queue=progress_queue,
+            )
+        )
+        while True:
+            try:
+                page_number = await asyncio.to_thread(progress_queue.get, timeout=PROGRESS_POLL_INTERVAL)
+            except queue.Empty:
+                # Pages are reported before the render finishes, so none are left once it has
+                if future.done():
+                    break
+                continue
+            # The cover can take more than one page, so the count is capped at the expected total
+            on_progress(min(page_number, total_pages), total_pages)
+        return await future
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+            if self._manager is not None:
+                self._manager.shutdown()
+                self._manager = None
+
+
+render_pool = PDFRenderPool()
@@ -5,6 +5,7 @@ from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.services.base import Service
+from langflow.services.book.pdf_renderer import render_pool
 from langflow.services.database.models.book import (
     Book,
     BookCover,
@@ -20,6 +21,9 @@ class BookService(Service):
 
     name = "book_service"
 
+    async def teardown(self) -> None:
+        render_pool.shutdown()
+
     async def get_book_by_id(self, book_id: UUID, user_id: UUID) -> Optional[Book]:
         """Get a book by ID."""
         async with get_session() as session:
@@ -7,7 +7,17 @@ from .transactions import TransactionTable
 from .user import User
 from .variable import Variable
 from .workspace import Workspace, WorkspaceMember
-from .crm import Client, Invoice, Opportunity, Task
+from .crm import (
+    CatalogSyncCheckpoint,
+    Client,
+    CRMActivity,
+    CRMDailyRollup,
+    CRMSearchDocument,
+    Invoice,
+    Opportunity,
+    Task,
+    WorkspaceStats,
+)
 from .book import Book, BookCover, BookInterior, BookPage, BookTemplate
 
 __all__ = [
@@ -25,6 +35,11 @@ __all__ = [
     "Invoice",
     "Opportunity",
     "Task",
+    "WorkspaceStats",
+    "CRMActivity",
+    "CRMDailyRollup",
+    "CRMSearchDocument",
+    "CatalogSyncCheckpoint",
     "Book",
     "BookCover",
     "BookInterior",
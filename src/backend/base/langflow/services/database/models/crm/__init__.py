@@ -1,9 +1,17 @@
+from .catalog_sync import CatalogSyncCheckpoint
 from .client import Client, ClientBase, ClientCreate, ClientRead, ClientUpdate
+from .daily_rollup import CRMDailyRollup
 from .invoice import Invoice, InvoiceBase, InvoiceCreate, InvoiceRead, InvoiceUpdate
 from .opportunity import Opportunity, OpportunityBase, OpportunityCreate, OpportunityRead, OpportunityUpdate
+from .rollup import CRMActivity, WorkspaceStats
+from .search import CRMSearchDocument
 from .task import Task, TaskBase, TaskCreate, TaskRead, TaskUpdate
 
 __all__ = [
+    "CRMActivity",
+    "CRMDailyRollup",
+    "CRMSearchDocument",
+    "CatalogSyncCheckpoint",
     "Client",
     "ClientBase",
     "ClientCreate",
@@ -24,4 +32,5 @@ __all__ = [
     "TaskCreate",
     "TaskRead",
     "TaskUpdate",
+    "WorkspaceStats",
 ]
@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Uuid
+from sqlmodel import Field, SQLModel
+
+from langflow.schema.serialize import UUIDstr
+
+
+class CatalogSyncCheckpoint(SQLModel, table=True):  # type: ignore[call-arg]
+    """When the last successful sync of a store's catalog into a workspace started.
+
+    Incremental syncs only fetch the products changed after it.
+    """
+
+    __tablename__ = "crm_catalog_sync_checkpoint"
+
+    workspace_id: UUIDstr = Field(
+        sa_column=Column(Uuid(), ForeignKey("workspace.id", ondelete="CASCADE"), primary_key=True)
+    )
+    source: str = Field(primary_key=True)  # woocommerce, shopify
+    site: str = Field(primary_key=True)
+    synced_at: datetime = Field(sa_column=Column(DateTime(timezone=True), nullable=False))
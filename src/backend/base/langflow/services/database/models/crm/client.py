@@ -2,7 +2,7 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import Text, Column
+from sqlalchemy import Text, Column, Index
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -29,6 +29,8 @@ class ClientBase(SQLModel):
 class Client(ClientBase, table=True):  # type: ignore[call-arg]
     """Client model for database."""
     __tablename__ = "client"
+    # Cursor pagination of list endpoints
+    __table_args__ = (Index("ix_client_workspace_id_created_at_id", "workspace_id", "created_at", "id"),)
 
     id: UUIDstr = Field(
         default_factory=uuid4,
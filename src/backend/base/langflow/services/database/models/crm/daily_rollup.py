@@ -0,0 +1,285 @@
+"""Per-workspace daily CRM totals that the reports read instead of the invoice and opportunity tables.
+
+Each series adds up one kind of record by the day of one of its dates and by status: invoices
+by the day they were created and by the day they are due, opportunities by the day they were
+created and by the day they are expected to close. Every flush that creates, updates or deletes
+an invoice or opportunity adjusts the rows of its days in `crm_daily_rollup`, in the same
+transaction as the write, so a report over years of data reads a few hundred rows. Days are UTC
+days. As with the dashboard counters, writes that bypass the ORM are not seen,
+`rebuild_daily_rollups` repairs the rollups after those.
+"""
+
+from datetime import date, datetime, time, timedelta, timezone
+
+from sqlalchemy import Column, Date, Float, ForeignKey, Uuid, event, func, insert, literal, select
+from sqlalchemy import delete as sa_delete
+from sqlalchemy.orm import Session
+from sqlmodel import Field, SQLModel
+
+from langflow.schema.serialize import UUIDstr
+from langflow.services.database.models.crm.invoice import Invoice
+from langflow.services.database.models.crm.opportunity import Opportunity
+from langflow.services.database.models.crm.rollup import _committed_values, upsert_increments
+
+
+class CRMDailyRollup(SQLModel, table=True):  # type: ignore[call-arg]
+    """Number and total amount of a workspace's CRM records of a day, series and status."""
+
+    __tablename__ = "crm_daily_rollup"
+
+    workspace_id: UUIDstr = Field(
+        sa_column=Column(Uuid(), ForeignKey("workspace.id", ondelete="CASCADE"), primary_key=True)
+    )
+    series: str = Field(primary_key=True)  # see ROLLUP_SERIES
+    day: date = Field(primary_key=True)
+    status: str = Field(primary_key=True)
+    record_count: int = Field(default=0)
+    # The records that have an amount, which averages are taken over
+    amount_count: int = Field(default=0)
+    amount: float = Field(default=0.0, sa_column=Column(Float, nullable=False, default=0.0))
+
+
+# For each series: the model it adds up, the date field that gives the day and the amount field
+ROLLUP_SERIES = {
+    "invoice": (Invoice, "created_at", "amount"),
+    "invoice_due": (Invoice, "due_date", "amount"),
+    "opportunity": (Opportunity, "created_at", "value"),
+    "opportunity_close": (Opportunity, "expected_close_date", "value"),
+}
+
+_MODEL_SERIES: dict[type, list[tuple[str, str, str]]] = {}
+for _series, (_model, _date_field, _amount_field) in ROLLUP_SERIES.items():
+    _MODEL_SERIES.setdefault(_model, []).append((_series, _date_field, _amount_field))
+
+
+def utc_day(value: datetime) -> date:
+    """The UTC day of a datetime, naive datetimes being UTC already."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.date()
+
+
+def _start_of(day: date) -> datetime:
+    # Dates are stored as naive UTC datetimes
+    return datetime.combine(day, time.min)
+
+
+def _tracked_fields(model) -> tuple[str, ...]:
+    fields = ["workspace_id", "status"]
+    for _, date_field, amount_field in _MODEL_SERIES[model]:
+        fields.extend(field for field in (date_field, amount_field) if field not in fields)
+    return tuple(fields)
+
+
+def _add_totals(deltas: dict, model, values: dict, sign: int) -> None:
+    """Add a record, as `values` of its tracked fields, to the deltas of every series of its model."""
+    for series, date_field, amount_field in _MODEL_SERIES[model]:
+        if values[date_field] is None:
+            continue
+        key = (values["workspace_id"], series, utc_day(values[date_field]), values["status"])
+        count, amount_count, amount = deltas.get(key, (0, 0, 0.0))
+        has_amount = values[amount_field] is not None
+        deltas[key] = (count + sign, amount_count + sign * has_amount, amount + sign * (values[amount_field] or 0.0))
+
+
+def fact_totals_query(
+    series: str,
+    *,
+    workspace_ids=None,
+    day_from: date | None = None,
+    day_to: date | None = None,
+    statuses=None,
+    client_id=None,
+    by_day: bool = True,
+):
+    """Totals of a series aggregated from the invoice or opportunity table, grouped by workspace and status.
+
+    Uses the (workspace_id, status, created_at) indexes of the tables for created-day series.
+    """
+    model, date_field, amount_field = ROLLUP_SERIES[series]
+    facts = model.__table__
+    date_column = facts.c[date_field]
+    groups = [facts.c.workspace_id, facts.c.status]
+    if by_day:
+        groups.append(func.date(date_column, type_=Date).label("day"))
+    query = (
+        select(
+            *groups,
+            func.count().label("record_count"),
+            func.count(facts.c[amount_field]).label("amount_count"),
+            func.coalesce(func.sum(facts.c[amount_field]), 0.0).label("amount"),
+        )
+        .where(date_column.is_not(None))
+        .group_by(*groups)
+    )
+    if workspace_ids is not None:
+        query = query.where(facts.c.workspace_id.in_(list(workspace_ids)))
+    if statuses is not None:
+        query = query.where(facts.c.status.in_(list(statuses)))
+    if client_id is not None:
+        query = query.where(facts.c.client_id == client_id)
+    if day_from is not None:
+        query = query.where(date_column >= _start_of(day_from))
+    if day_to is not None:
+        query = query.where(date_column < _start_of(day_to + timedelta(days=1)))
+    return query
+
+
+def rollup_totals_query(
+    series: str,
+    *,
+    workspace_ids=None,
+    day_from: date | None = None,
+    day_to: date | None = None,
+    statuses=None,
+    by_day: bool = False,
+):
+    """The same totals as `fact_totals_query`, read from the daily rollups."""
+    rollup = CRMDailyRollup.__table__
+    groups = [rollup.c.workspace_id, rollup.c.status]
+    if by_day:
+        groups.append(rollup.c.day)
+    query = (
+        select(
+            *groups,
+            func.sum(rollup.c.record_count).label("record_count"),
+            func.sum(rollup.c.amount_count).label("amount_count"),
+            func.sum(rollup.c.amount).label("amount"),
+        )
+        .where(rollup.c.series == series)
+        .group_by(*groups)
+    )
+    if workspace_ids is not None:
+        query = query.where(rollup.c.workspace_id.in_(list(workspace_ids)))
+    if statuses is not None:
+        query = query.where(rollup.c.status.in_(list(statuses)))
+    if day_from is not None:
+        query = query.where(rollup.c.day >= day_from)
+    if day_to is not None:
+        query = query.where(rollup.c.day <= day_to)
+    return query
+
+
+def report_totals(
+    connection,
+    workspace_id,
+    series: str,
+    day_from: date | None = None,
+    day_to: date | None = None,
+    *,
+    statuses=None,
+    client_id=None,
+    by_day: bool = False,
+) -> list[dict]:
+    """Number and total amount of a workspace's records of a series, by status.
+
+    Reads the daily rollups, or the invoice or opportunity table when the totals are for a
+    single client, which the rollups don't break down.
+
+    Args:
+        connection: A synchronous connection or session
+        workspace_id: The workspace of the records
+        series: One of ROLLUP_SERIES
+        day_from: First day of the records, if given
+        day_to: Last day of the records, if given
+        statuses: Only count records with these statuses, if given
+        client_id: Only count the records of this client, if given
+        by_day: Also group the totals by day
+
+    Returns:
+        Rows with the status, the day if `by_day`, the record_count, the amount_count (the
+        records with an amount) and the amount
+    """
+    options = {"workspace_ids": [workspace_id], "day_from": day_from, "day_to": day_to, "statuses": statuses}
+    if client_id is None:
+        query = rollup_totals_query(series, by_day=by_day, **options)
+    else:
+        query = fact_totals_query(series, client_id=client_id, by_day=by_day, **options)
+    return [
+        {
+            **row,
+            "record_count": row["record_count"] or 0,
+            "amount_count": row["amount_count"] or 0,
+            "amount": float(row["amount"] or 0.0),
+        }
+        for row in connection.execute(query).mappings()
+    ]
+
+
+def _apply_deltas(connection, deltas: dict) -> None:
+    table = CRMDailyRollup.__table__
+    for (workspace_id, series, day, status), (count, amount_count, amount) in deltas.items():
+        if not count and not amount_count and not amount:
+            continue
+        # Increment in SQL, so that concurrent writes to the same day don't lose updates. The
+        # records stored before the rollups existed were rolled up when they were created, so
+        # a day without a row has no records yet.
+        changes = {"record_count": count, "amount_count": amount_count, "amount": amount}
+        key = {"workspace_id": workspace_id, "series": series, "day": day, "status": status}
+        upsert_increments(connection, table, key, changes, changes)
+
+
+@event.listens_for(Session, "before_flush")
+def _roll_up_crm_changes(session: Session, flush_context, instances) -> None:  # noqa: ARG001
+    deltas: dict = {}
+
+    for obj in session.new:
+        if (model := type(obj)) in _MODEL_SERIES:
+            _add_totals(deltas, model, {field: getattr(obj, field) for field in _tracked_fields(model)}, 1)
+
+    for obj in session.dirty:
+        if (model := type(obj)) not in _MODEL_SERIES or not session.is_modified(obj):
+            continue
+        fields = _tracked_fields(model)
+        _add_totals(deltas, model, _committed_values(obj, fields), -1)
+        _add_totals(deltas, model, {field: getattr(obj, field) for field in fields}, 1)
+
+    for obj in session.deleted:
+        if (model := type(obj)) in _MODEL_SERIES:
+            _add_totals(deltas, model, _committed_values(obj, _tracked_fields(model)), -1)
+
+    if deltas:
+        _apply_deltas(session.connection(), deltas)
+
+
+def _rebuild(session: Session, workspace_ids) -> int:
+    connection = session.connection()
+    table = CRMDailyRollup.__table__
+    delete_query = sa_delete(table)
+    if workspace_ids is not None:
+        delete_query = delete_query.where(table.c.workspace_id.in_(workspace_ids))
+    connection.execute(delete_query)
+    rows = 0
+    for series in ROLLUP_SERIES:
+        facts = fact_totals_query(series, workspace_ids=workspace_ids).subquery()
+        result = connection.execute(
+            insert(table).from_select(
+                ["workspace_id", "series", "day", "status", "record_count", "amount_count", "amount"],
+                select(
+                    facts.c.workspace_id,
+                    literal(series),
+                    facts.c.day,
+                    facts.c.status,
+                    facts.c.record_count,
+                    facts.c.amount_count,
+                    facts.c.amount,
+                ),
+            )
+        )
+        rows += max(result.rowcount, 0)
+    return rows
+
+
+async def rebuild_daily_rollups(session, workspace_ids=None) -> int:
+    """Recompute the daily rollups of workspaces from the invoice and opportunity tables.
+
+    The caller commits the session.
+
+    Args:
+        session: An async database session
+        workspace_ids: The workspaces to rebuild, or None to rebuild every workspace
+
+    Returns:
+        The number of rollup rows written
+    """
+    return await session.run_sync(_rebuild, None if workspace_ids is None else list(workspace_ids))
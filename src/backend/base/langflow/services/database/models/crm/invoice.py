@@ -2,7 +2,7 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import Text, Column
+from sqlalchemy import Text, Column, Index
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -28,6 +28,12 @@ class InvoiceBase(SQLModel):
 class Invoice(InvoiceBase, table=True):  # type: ignore[call-arg]
     """Invoice model for database."""
     __tablename__ = "invoice"
+    __table_args__ = (
+        # Cursor pagination of list endpoints
+        Index("ix_invoice_workspace_id_created_at_id", "workspace_id", "created_at", "id"),
+        # Reports and daily rollups, by status over a date range
+        Index("ix_invoice_workspace_id_status_created_at", "workspace_id", "status", "created_at"),
+    )
 
     id: UUIDstr = Field(
         default_factory=uuid4,
@@ -2,7 +2,7 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import Text, Column
+from sqlalchemy import Text, Column, Index
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -27,6 +27,12 @@ class OpportunityBase(SQLModel):
 class Opportunity(OpportunityBase, table=True):  # type: ignore[call-arg]
     """Opportunity model for database."""
     __tablename__ = "opportunity"
+    __table_args__ = (
+        # Cursor pagination of list endpoints
+        Index("ix_opportunity_workspace_id_created_at_id", "workspace_id", "created_at", "id"),
+        # Reports and daily rollups, by status over a date range
+        Index("ix_opportunity_workspace_id_status_created_at", "workspace_id", "status", "created_at"),
+    )
 
     id: UUIDstr = Field(
         default_factory=uuid4,
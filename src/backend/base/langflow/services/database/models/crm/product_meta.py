@@ -2,7 +2,7 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Optional, Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import Text, Column, JSON
+from sqlalchemy import Text, Column, JSON, Index
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -21,6 +21,8 @@ class ProductMetaBase(SQLModel):
 class ProductMeta(ProductMetaBase, table=True):  # type: ignore[call-arg]
     """ProductMeta model for database."""
     __tablename__ = "product_meta"
+    # Cursor pagination of list endpoints
+    __table_args__ = (Index("ix_product_meta_product_id_key_id", "product_id", "key", "id"),)
 
     id: UUIDstr = Field(
         default_factory=uuid4,
@@ -2,7 +2,7 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Optional, List, Dict, Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import Text, Column, JSON
+from sqlalchemy import Text, Column, JSON, Index
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -46,6 +46,8 @@ class ProductVariationBase(SQLModel):
 class ProductVariation(ProductVariationBase, table=True):  # type: ignore[call-arg]
     """ProductVariation model for database."""
     __tablename__ = "product_variation"
+    # Cursor pagination of list endpoints
+    __table_args__ = (Index("ix_product_variation_product_id_created_at_id", "product_id", "created_at", "id"),)
 
     id: UUIDstr = Field(
         default_factory=uuid4,
@@ -0,0 +1,350 @@
+"""Per-workspace CRM counters and activity feed, maintained as CRM records are written.
+
+The dashboard used to aggregate the client, invoice, opportunity and task tables on every
+load. Instead, every flush that creates, updates or deletes one of those records adjusts the
+counters of its workspace in `crm_workspace_stats` and appends to `crm_activity`, in the same
+transaction as the write. Writes that bypass the ORM (bulk `update()`/`delete()` statements)
+are not seen, `rebuild_workspace_stats` repairs the counters after those.
+"""
+
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+from sqlalchemy import JSON, Column, DateTime, Float, ForeignKey, Index, Uuid, case, event, func, insert, select, update
+from sqlalchemy import delete as sa_delete
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from sqlmodel import Field, SQLModel
+
+from langflow.schema.serialize import UUIDstr
+from langflow.services.database.models.crm.client import Client
+from langflow.services.database.models.crm.invoice import Invoice
+from langflow.services.database.models.crm.opportunity import Opportunity
+from langflow.services.database.models.crm.task import Task
+
+OPEN_OPPORTUNITY_STATUSES = ("new", "qualified", "proposal", "negotiation")
+
+# INSERT ... ON CONFLICT DO UPDATE of each supported dialect
+_UPSERT_INSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+
+class WorkspaceStats(SQLModel, table=True):  # type: ignore[call-arg]
+    """Rolled-up CRM counters of a workspace."""
+
+    __tablename__ = "crm_workspace_stats"
+
+    workspace_id: UUIDstr = Field(
+        sa_column=Column(Uuid(), ForeignKey("workspace.id", ondelete="CASCADE"), primary_key=True)
+    )
+    client_count: int = Field(default=0)
+    active_client_count: int = Field(default=0)
+    inactive_client_count: int = Field(default=0)
+    lead_client_count: int = Field(default=0)
+    invoice_count: int = Field(default=0)
+    paid_invoice_total: float = Field(default=0.0, sa_column=Column(Float, nullable=False, default=0.0))
+    opportunity_count: int = Field(default=0)
+    open_opportunity_value: float = Field(default=0.0, sa_column=Column(Float, nullable=False, default=0.0))
+    open_task_count: int = Field(default=0)
+    in_progress_task_count: int = Field(default=0)
+    completed_task_count: int = Field(default=0)
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class CRMActivity(SQLModel, table=True):  # type: ignore[call-arg]
+    """An entry of a workspace's CRM activity feed."""
+
+    __tablename__ = "crm_activity"
+
+    id: UUIDstr = Field(default_factory=uuid4, primary_key=True)
+    workspace_id: UUIDstr = Field(
+        sa_column=Column(Uuid(), ForeignKey("workspace.id", ondelete="CASCADE"), nullable=False)
+    )
+    entity_type: str  # client, invoice, opportunity, task
+    entity_id: UUIDstr
+    action: str  # created, updated, deleted
+    details: dict = Field(default_factory=dict, sa_column=Column(JSON))
+    created_by: UUIDstr | None = Field(default=None)
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc), sa_column=Column(DateTime(timezone=True), nullable=False)
+    )
+
+    __table_args__ = (Index("ix_crm_activity_workspace_id_created_at", "workspace_id", "created_at"),)
+
+
+STATS_COLUMNS = (
+    "client_count",
+    "active_client_count",
+    "inactive_client_count",
+    "lead_client_count",
+    "invoice_count",
+    "paid_invoice_total",
+    "opportunity_count",
+    "open_opportunity_value",
+    "open_task_count",
+    "in_progress_task_count",
+    "completed_task_count",
+)
+
+
+def _client_stats(values: dict) -> dict:
+    return {
+        "client_count": 1,
+        "active_client_count": int(values["status"] == "active"),
+        "inactive_client_count": int(values["status"] == "inactive"),
+        "lead_client_count": int(values["status"] == "lead"),
+    }
+
+
+def _invoice_stats(values: dict) -> dict:
+    return {
+        "invoice_count": 1,
+        "paid_invoice_total": (values["amount"] or 0.0) if values["status"] == "paid" else 0.0,
+    }
+
+
+def _opportunity_stats(values: dict) -> dict:
+    return {
+        "opportunity_count": 1,
+        "open_opportunity_value": (values["value"] or 0.0) if values["status"] in OPEN_OPPORTUNITY_STATUSES else 0.0,
+    }
+
+
+def _task_stats(values: dict) -> dict:
+    return {
+        "open_task_count": int(values["status"] == "open"),
+        "in_progress_task_count": int(values["status"] == "in_progress"),
+        "completed_task_count": int(values["status"] == "completed"),
+    }
+
+
+# For each tracked model: its activity type, the fields the counters depend on, how it adds
+# to the counters, and the fields shown in the activity feed
+TRACKED_MODELS = {
+    Client: ("client", ("status",), _client_stats, ("name", "status")),
+    Invoice: ("invoice", ("status", "amount"), _invoice_stats, ("invoice_number", "amount", "status")),
+    Opportunity: ("opportunity", ("status", "value"), _opportunity_stats, ("name", "value", "status")),
+    Task: ("task", ("status",), _task_stats, ("title", "status", "priority")),
+}
+
+
+def _committed_values(obj, fields) -> dict:
+    """The values of `fields` as they are in the database, before pending changes."""
+    state = sa_inspect(obj)
+    values = {}
+    unloaded = []
+    for field in fields:
+        history = state.attrs[field].history
+        if history.deleted:
+            values[field] = history.deleted[0]
+        elif history.added:
+            if state.key is None:
+                # A new object, its value is the one set
+                values[field] = history.added[0]
+            else:
+                # Set without the previous value having been loaded
+                unloaded.append(field)
+        else:
+            values[field] = getattr(obj, field)
+    if unloaded:
+        # Not flushed yet, so the row still has the previous values
+        table = state.mapper.local_table
+        primary_key = state.mapper.primary_key
+        row = (
+            state.session.connection()
+            .execute(
+                select(*(table.c[field] for field in unloaded)).where(
+                    *(column == value for column, value in zip(primary_key, state.identity, strict=True))
+                )
+            )
+            .mappings()
+            .first()
+        )
+        values.update({field: row[field] if row else None for field in unloaded})
+    return values
+
+
+def _add_stats(deltas: dict, workspace_id, stats: dict, sign: int) -> None:
+    workspace_deltas = deltas.setdefault(workspace_id, dict.fromkeys(STATS_COLUMNS, 0))
+    for name, value in stats.items():
+        workspace_deltas[name] += sign * value
+
+
+def _activity(obj, entity_type: str, action: str, detail_fields) -> CRMActivity:
+    return CRMActivity(
+        workspace_id=obj.workspace_id,
+        entity_type=entity_type,
+        entity_id=obj.id,
+        action=action,
+        details={field: getattr(obj, field) for field in detail_fields},
+        created_by=obj.created_by,
+    )
+
+
+def _stats_queries(workspace_ids=None):
+    """Aggregates of every tracked table by workspace, optionally only for `workspace_ids`."""
+    queries = [
+        select(
+            Client.workspace_id,
+            func.count().label("client_count"),
+            func.sum(case((Client.status == "active", 1), else_=0)).label("active_client_count"),
+            func.sum(case((Client.status == "inactive", 1), else_=0)).label("inactive_client_count"),
+            func.sum(case((Client.status == "lead", 1), else_=0)).label("lead_client_count"),
+        ).group_by(Client.workspace_id),
+        select(
+            Invoice.workspace_id,
+            func.count().label("invoice_count"),
+            func.sum(case((Invoice.status == "paid", Invoice.amount), else_=0)).label("paid_invoice_total"),
+        ).group_by(Invoice.workspace_id),
+        select(
+            Opportunity.workspace_id,
+            func.count().label("opportunity_count"),
+            func.sum(
+                case((Opportunity.status.in_(OPEN_OPPORTUNITY_STATUSES), func.coalesce(Opportunity.value, 0)), else_=0)
+            ).label("open_opportunity_value"),
+        ).group_by(Opportunity.workspace_id),
+        select(
+            Task.workspace_id,
+            func.sum(case((Task.status == "open", 1), else_=0)).label("open_task_count"),
+            func.sum(case((Task.status == "in_progress", 1), else_=0)).label("in_progress_task_count"),
+            func.sum(case((Task.status == "completed", 1), else_=0)).label("completed_task_count"),
+        ).group_by(Task.workspace_id),
+    ]
+    if workspace_ids is not None:
+        queries = [query.where(query.selected_columns.workspace_id.in_(workspace_ids)) for query in queries]
+    return queries
+
+
+def compute_workspace_stats(connection, workspace_ids=None) -> dict[UUID, dict]:
+    """Aggregate the counters of workspaces from the CRM tables.
+
+    Args:
+        connection: A synchronous connection or session
+        workspace_ids: The workspaces to aggregate, or None for every workspace with CRM records
+
+    Returns:
+        The counters by workspace ID
+    """
+    stats: dict[UUID, dict] = {}
+    if workspace_ids is not None:
+        stats = {workspace_id: dict.fromkeys(STATS_COLUMNS, 0) for workspace_id in workspace_ids}
+    for query in _stats_queries(workspace_ids):
+        for row in connection.execute(query).mappings():
+            workspace_stats = stats.setdefault(row["workspace_id"], dict.fromkeys(STATS_COLUMNS, 0))
+            workspace_stats.update({name: value or 0 for name, value in row.items() if name != "workspace_id"})
+    return stats
+
+
+def upsert_increments(connection, table, key: dict, row: dict, increments: dict, values: dict | None = None) -> None:
+    """Insert `row`, or add `increments` to the columns of the row that already has its `key`.
+
+    This is a single statement, so transactions that write the first row of a key at the same
+    time don't fail on its primary key: the one that inserts second adds its increments instead.
+
+    Args:
+        connection: A synchronous connection
+        table: The table of the row
+        key: The primary key columns of the row and their values
+        row: The other columns of the row if it is inserted
+        increments: What to add to each column if the row already exists
+        values: Columns set to these values either way
+    """
+    values = values or {}
+    insert_ = _UPSERT_INSERTS[connection.dialect.name]
+    connection.execute(
+        insert_(table)
+        .values(**key, **row, **values)
+        .on_conflict_do_update(
+            index_elements=list(key),
+            set_={**{name: table.c[name] + value for name, value in increments.items()}, **values},
+        )
+    )
+
+
+def _apply_deltas(connection, deltas: dict) -> None:
+    table = WorkspaceStats.__table__
+    now = datetime.now(timezone.utc)
+    for workspace_id, workspace_deltas in deltas.items():
+        changes = {name: value for name, value in workspace_deltas.items() if value}
+        if not changes:
+            continue
+        # Increment in SQL, so that concurrent writes to the same workspace don't lose updates
+        result = connection.execute(
+            update(table)
+            .where(table.c.workspace_id == workspace_id)
+            .values({**{name: table.c[name] + value for name, value in changes.items()}, "updated_at": now})
+        )
+        if result.rowcount == 0:
+            # No counters yet: aggregate what is already stored, the pending changes aren't flushed yet
+            stats = compute_workspace_stats(connection, [workspace_id])[workspace_id]
+            for name, value in changes.items():
+                stats[name] += value
+            upsert_increments(connection, table, {"workspace_id": workspace_id}, stats, changes, {"updated_at": now})
+
+
+@event.listens_for(Session, "before_flush")
+def _track_crm_changes(session: Session, flush_context, instances) -> None:  # noqa: ARG001
+    deltas: dict = {}
+    activities = []
+
+    for obj in session.new:
+        if (tracked := TRACKED_MODELS.get(type(obj))) is None:
+            continue
+        entity_type, stats_fields, stats, detail_fields = tracked
+        _add_stats(deltas, obj.workspace_id, stats({field: getattr(obj, field) for field in stats_fields}), 1)
+        activities.append(_activity(obj, entity_type, "created", detail_fields))
+
+    for obj in session.dirty:
+        if (tracked := TRACKED_MODELS.get(type(obj))) is None or not session.is_modified(obj):
+            continue
+        entity_type, stats_fields, stats, detail_fields = tracked
+        (old_workspace_id,) = _committed_values(obj, ("workspace_id",)).values()
+        _add_stats(deltas, old_workspace_id, stats(_committed_values(obj, stats_fields)), -1)
+        _add_stats(deltas, obj.workspace_id, stats({field: getattr(obj, field) for field in stats_fields}), 1)
+        activities.append(_activity(obj, entity_type, "updated", detail_fields))
+
+    for obj in session.deleted:
+        if (tracked := TRACKED_MODELS.get(type(obj))) is None:
+            continue
+        entity_type, stats_fields, stats, detail_fields = tracked
+        values = _committed_values(obj, (*stats_fields, "workspace_id"))
+        _add_stats(deltas, values.pop("workspace_id"), stats(values), -1)
+        activities.append(_activity(obj, entity_type, "deleted", detail_fields))
+
+    if deltas:
+        _apply_deltas(session.connection(), deltas)
+    # Adding objects in before_flush includes them in the flush that is starting
+    session.add_all(activities)
+
+
+def _rebuild(session: Session, workspace_ids) -> int:
+    connection = session.connection()
+    table = WorkspaceStats.__table__
+    stats = compute_workspace_stats(connection, workspace_ids)
+    delete_query = sa_delete(table)
+    if workspace_ids is not None:
+        delete_query = delete_query.where(table.c.workspace_id.in_(workspace_ids))
+    connection.execute(delete_query)
+    now = datetime.now(timezone.utc)
+    if stats:
+        connection.execute(
+            insert(table),
+            [{"workspace_id": workspace_id, "updated_at": now, **values} for workspace_id, values in stats.items()],
+        )
+    return len(stats)
+
+
+async def rebuild_workspace_stats(session, workspace_ids=None) -> int:
+    """Recompute the counters of workspaces from the CRM tables, e.g. to repair drift.
+
+    The caller commits the session.
+
+    Args:
+        session: An async database session
+        workspace_ids: The workspaces to rebuild, or None to rebuild every workspace
+
+    Returns:
+        The number of workspaces whose counters were written
+    """
+    return await session.run_sync(_rebuild, None if workspace_ids is None else list(workspace_ids))
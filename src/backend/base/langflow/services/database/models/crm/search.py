@@ -0,0 +1,259 @@
+"""Full-text search index of CRM clients, opportunities and products.
+
+Every flush that creates, updates or deletes one of those records rewrites its row in
+`crm_search_document`, in the same transaction as the write, so imports and syncs are
+indexed as they are saved. The text of the rows is indexed by the database: an FTS5 table
+kept in sync by triggers on SQLite, a GIN index over a weighted tsvector on PostgreSQL.
+`get_search_backend` picks the matching query for the dialect in use.
+"""
+
+import re
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+from sqlalchemy import (
+    DDL,
+    Column,
+    ForeignKey,
+    Index,
+    Text,
+    Uuid,
+    case,
+    column,
+    event,
+    func,
+    insert,
+    literal_column,
+    or_,
+    select,
+    table,
+    text,
+)
+from sqlalchemy import delete as sa_delete
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import Session
+from sqlmodel import Field, SQLModel
+
+from langflow.schema.serialize import UUIDstr
+from langflow.services.database.models.crm.client import Client
+from langflow.services.database.models.crm.opportunity import Opportunity
+from langflow.services.database.models.crm.product import Product
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+# Tokens shorter than this would match too much of the catalog as prefixes
+MIN_PREFIX_LENGTH = 2
+MAX_QUERY_TOKENS = 8
+
+# For each indexed model: its search type, the field shown as the title, and the other
+# fields that are searched
+INDEXED_MODELS = {
+    Client: ("client", "name", ("company", "email", "description")),
+    Opportunity: ("opportunity", "name", ("description",)),
+    Product: ("product", "name", ("sku", "short_description", "description")),
+}
+
+
+# The PostgreSQL tsvector of a document, with matches in the title ranked higher. Queries must
+# filter on this same expression, see `search_vector`, for PostgreSQL to use the index.
+SEARCH_VECTOR_SQL = "setweight(to_tsvector('simple', title), 'A') || setweight(to_tsvector('simple', body), 'B')"
+
+
+class CRMSearchDocument(SQLModel, table=True):  # type: ignore[call-arg]
+    """The searchable text of a CRM record."""
+
+    __tablename__ = "crm_search_document"
+    __table_args__ = (
+        Index("ix_crm_search_document_entity", "entity_type", "entity_id", unique=True),
+        Index("ix_crm_search_document_vector", text(f"({SEARCH_VECTOR_SQL})"), postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
+    )
+
+    # Integer, so that the SQLite FTS table can use it as its rowid
+    id: int | None = Field(default=None, primary_key=True)
+    workspace_id: UUIDstr = Field(
+        sa_column=Column(Uuid(), ForeignKey("workspace.id", ondelete="CASCADE"), nullable=False, index=True)
+    )
+    entity_type: str  # client, opportunity, product
+    entity_id: UUIDstr = Field(sa_column=Column(Uuid(), nullable=False))
+    title: str = Field(default="", sa_column=Column(Text, nullable=False, default=""))
+    body: str = Field(default="", sa_column=Column(Text, nullable=False, default=""))
+
+
+def search_vector(columns):
+    """The expression of SEARCH_VECTOR_SQL, with the columns of a document table."""
+    return func.setweight(func.to_tsvector(literal_column("'simple'"), columns.title), literal_column("'A'")).op("||")(
+        func.setweight(func.to_tsvector(literal_column("'simple'"), columns.body), literal_column("'B'"))
+    )
+
+
+SQLITE_FTS_TABLE = "crm_search_document_fts"
+SQLITE_FTS_DDL = [
+    (
+        "CREATE VIRTUAL TABLE IF NOT EXISTS crm_search_document_fts USING fts5("
+        "title, body, content='crm_search_document', content_rowid='id', "
+        "tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS crm_search_document_ai AFTER INSERT ON crm_search_document BEGIN "
+        "INSERT INTO crm_search_document_fts(rowid, title, body) VALUES (new.id, new.title, new.body); END"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS crm_search_document_ad AFTER DELETE ON crm_search_document BEGIN "
+        "INSERT INTO crm_search_document_fts(crm_search_document_fts, rowid, title, body) "
+        "VALUES ('delete', old.id, old.title, old.body); END"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS crm_search_document_au AFTER UPDATE ON crm_search_document BEGIN "
+        "INSERT INTO crm_search_document_fts(crm_search_document_fts, rowid, title, body) "
+        "VALUES ('delete', old.id, old.title, old.body); "
+        "INSERT INTO crm_search_document_fts(rowid, title, body) VALUES (new.id, new.title, new.body); END"
+    ),
+]
+
+for statement in SQLITE_FTS_DDL:
+    event.listen(CRMSearchDocument.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+
+
+def search_tokens(query: str) -> list[str]:
+    """Split a search query into lowercase word tokens, dropping operators and punctuation."""
+    return [token.lower() for token in re.findall(r"\w+", query)][:MAX_QUERY_TOKENS]
+
+
+class SearchBackend(ABC):
+    """Finds CRM records whose documents match every token of a query, the last one as a prefix.
+
+    The last token is the one being typed, so "acme wid" finds "Acme Widgets".
+    """
+
+    @abstractmethod
+    def match(self, statement, tokens: list[str]):
+        """Restrict a select from `crm_search_document` to the matching documents.
+
+        Returns:
+            The restricted select, and an expression that is higher for better matches
+        """
+
+    def search(self, connection, query: str, workspace_ids, *, entity_types=None, limit: int = 20) -> list[dict]:
+        """Search the documents of `workspace_ids`.
+
+        Args:
+            connection: A synchronous connection or session
+            query: The text typed by the user
+            workspace_ids: The workspaces to search in
+            entity_types: Only return these types of records, if given
+            limit: Maximum number of results
+
+        Returns:
+            The matching records, best first
+        """
+        tokens = search_tokens(query)
+        if not tokens or not workspace_ids:
+            return []
+        documents = CRMSearchDocument.__table__
+        statement = select(
+            documents.c.entity_type, documents.c.entity_id, documents.c.workspace_id, documents.c.title
+        ).where(documents.c.workspace_id.in_(list(workspace_ids)))
+        if entity_types:
+            statement = statement.where(documents.c.entity_type.in_(list(entity_types)))
+        statement, rank = self.match(statement, tokens)
+        statement = statement.add_columns(rank.label("rank")).order_by(rank.desc(), documents.c.id).limit(limit)
+        return [dict(row) for row in connection.execute(statement).mappings()]
+
+
+class SQLiteSearchBackend(SearchBackend):
+    """Matches with the FTS5 index, ranked by BM25 with title matches weighted higher."""
+
+    def match(self, statement, tokens):
+        # Quoted, so tokens are never read as FTS5 operators
+        terms = [f'"{token}"' for token in tokens[:-1]]
+        last = tokens[-1]
+        terms.append(f'"{last}"*' if len(last) >= MIN_PREFIX_LENGTH else f'"{last}"')
+        fts = table(SQLITE_FTS_TABLE, column("rowid"))
+        documents = CRMSearchDocument.__table__
+        statement = statement.join(fts, fts.c.rowid == documents.c.id).where(
+            text(f"{SQLITE_FTS_TABLE} MATCH :match_query").bindparams(match_query=" ".join(terms))
+        )
+        # bm25 is lower for better matches
+        return statement, -func.bm25(literal_column(SQLITE_FTS_TABLE), 10.0, 1.0)
+
+
+class PostgresSearchBackend(SearchBackend):
+    """Matches with the GIN index over the documents' tsvector, ranked by ts_rank."""
+
+    def match(self, statement, tokens):
+        terms = [*tokens[:-1], f"{tokens[-1]}:*" if len(tokens[-1]) >= MIN_PREFIX_LENGTH else tokens[-1]]
+        # Tokens only contain word characters, so they can't be tsquery operators
+        ts_query = func.to_tsquery(literal_column("'simple'"), " & ".join(terms))
+        vector = search_vector(CRMSearchDocument.__table__.c)
+        return statement.where(vector.op("@@")(ts_query)), func.ts_rank(vector, ts_query)
+
+
+class LikeSearchBackend(SearchBackend):
+    """Unindexed fallback for other databases, ranking title matches first."""
+
+    def match(self, statement, tokens):
+        documents = CRMSearchDocument.__table__
+        rank = literal_column("0")
+        for token in tokens:
+            pattern = f"%{token}%"
+            statement = statement.where(or_(documents.c.title.ilike(pattern), documents.c.body.ilike(pattern)))
+            rank = rank + case((documents.c.title.ilike(pattern), 1), else_=0)
+        return statement, rank
+
+
+SEARCH_BACKENDS: dict[str, type[SearchBackend]] = {
+    "sqlite": SQLiteSearchBackend,
+    "postgresql": PostgresSearchBackend,
+}
+
+
+def get_search_backend(dialect_name: str) -> SearchBackend:
+    """The search backend for a database dialect."""
+    return SEARCH_BACKENDS.get(dialect_name, LikeSearchBackend)()
+
+
+def search_document(obj) -> dict:
+    """The document of an indexed CRM record."""
+    entity_type, title_field, body_fields = INDEXED_MODELS[type(obj)]
+    return {
+        "workspace_id": obj.workspace_id,
+        "entity_type": entity_type,
+        "entity_id": obj.id,
+        "title": getattr(obj, title_field) or "",
+        "body": " ".join(str(value) for field in body_fields if (value := getattr(obj, field))),
+    }
+
+
+def _indexed_fields_changed(obj) -> bool:
+    _, title_field, body_fields = INDEXED_MODELS[type(obj)]
+    state = sa_inspect(obj)
+    return any(state.attrs[field].history.has_changes() for field in ("workspace_id", title_field, *body_fields))
+
+
+@event.listens_for(Session, "before_flush")
+def _index_crm_changes(session: Session, flush_context, instances) -> None:  # noqa: ARG001
+    removed: dict[str, list[UUID]] = {}
+
+    documents = [search_document(obj) for obj in session.new if type(obj) in INDEXED_MODELS]
+    for obj in session.dirty:
+        if type(obj) in INDEXED_MODELS and _indexed_fields_changed(obj):
+            document = search_document(obj)
+            removed.setdefault(document["entity_type"], []).append(document["entity_id"])
+            documents.append(document)
+    for obj in session.deleted:
+        if type(obj) in INDEXED_MODELS:
+            removed.setdefault(INDEXED_MODELS[type(obj)][0], []).append(obj.id)
+
+    if not removed and not documents:
+        return
+    connection = session.connection()
+    table_ = CRMSearchDocument.__table__
+    for entity_type, entity_ids in removed.items():
+        connection.execute(
+            sa_delete(table_).where(table_.c.entity_type == entity_type, table_.c.entity_id.in_(entity_ids))
+        )
+    if documents:
+        connection.execute(insert(table_), documents)
@@ -2,7 +2,7 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import Text, Column
+from sqlalchemy import Text, Column, Index
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -28,6 +28,8 @@ class TaskBase(SQLModel):
 class Task(TaskBase, table=True):  # type: ignore[call-arg]
     """Task model for database."""
     __tablename__ = "task"
+    # Cursor pagination of list endpoints
+    __table_args__ = (Index("ix_task_workspace_id_created_at_id", "workspace_id", "created_at", "id"),)
 
     id: UUIDstr = Field(
         default_factory=uuid4,
@@ -3,9 +3,8 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Annotated
 from uuid import UUID, uuid4
 
-from litellm import ConfigDict
-from pydantic import field_serializer, field_validator
-from sqlalchemy import Text
+from pydantic import ConfigDict, field_serializer, field_validator
+from sqlalchemy import Index, Text
 from sqlmodel import JSON, Column, Field, SQLModel
 
 from langflow.schema.content_block import ContentBlock
@@ -118,6 +117,8 @@ class MessageBase(SQLModel):
 class MessageTable(MessageBase, table=True):  # type: ignore[call-arg]
     model_config = ConfigDict(validate_assignment=True, arbitrary_types_allowed=True)
     __tablename__ = "message"
+    # The history of a chat session is read by session, flow and time
+    __table_args__ = (Index("ix_message_session_id_flow_id_timestamp", "session_id", "flow_id", "timestamp"),)
     id: UUID = Field(default_factory=uuid4, primary_key=True)
 
     flow_id: UUID | None = Field(default=None)
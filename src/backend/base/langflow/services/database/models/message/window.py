@@ -0,0 +1,220 @@
+"""In-process windows of the most recent messages of chat sessions.
+
+Chat components read the history of their session on every turn. The most recent messages of
+the sessions read lately are kept in memory, so those reads are answered without querying and
+sorting the session's history again.
+
+The windows are written through: the messages added by a session that commits are added to the
+window of their chat session, while updating or deleting messages drops the windows they are in,
+to be read again. Only the writes of this process are seen, so each window is also read again
+once it is `ttl` seconds old, which bounds how long the writes of other processes are missed.
+"""
+
+from __future__ import annotations
+
+import time
+from bisect import insort
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import chain
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import Session
+from sqlmodel import col, select
+
+from langflow.services.database.models.message.model import MessageTable
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import ORMExecuteState
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+# The most chat sessions windows are kept for, the least recently read are dropped first
+MAX_WINDOW_SESSIONS = 1024
+# Seconds after which a window is read from the database again
+DEFAULT_WINDOW_TTL = 10.0
+
+# Keys of Session.info holding what a transaction changed until it commits
+_ADDED_KEY = "message_window_added"
+_CHANGED_KEY = "message_window_changed"
+_CLEAR_KEY = "message_window_clear"
+
+MessageRow = dict[str, Any]
+
+
+def _utc(timestamp: datetime | str) -> datetime:
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp)
+    return timestamp if timestamp.tzinfo else timestamp.replace(tzinfo=timezone.utc)
+
+
+def message_row(message: MessageTable) -> tuple[datetime, MessageRow]:
+    """The time and fields of a message, as they are read from the database."""
+    return _utc(message.timestamp), message.model_dump()
+
+
+@dataclass
+class _Window:
+    # (timestamp, row) of the most recent messages of the session without errors, oldest first
+    entries: list[tuple[datetime, MessageRow]]
+    # Whether these are all the messages of the session
+    complete: bool
+    # When it was read from the database, as time.monotonic()
+    loaded_at: float
+
+
+class MessageWindows:
+    """The `size` most recent messages of each chat session read lately.
+
+    Creating the windows starts following the changes to messages of every session, `close`
+    stops it. Windows older than `ttl` seconds are read again.
+    """
+
+    def __init__(self, size: int, max_sessions: int = MAX_WINDOW_SESSIONS, ttl: float = DEFAULT_WINDOW_TTL) -> None:
+        self.size = size
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._windows: OrderedDict[str, _Window] = OrderedDict()
+        # Windows being read from the database, dropped if the session changes in the meantime
+        self._loading: dict[str, object] = {}
+        self._listeners = [
+            ("after_flush", self._after_flush),
+            ("after_commit", self._after_commit),
+            ("after_rollback", self._after_rollback),
+            ("do_orm_execute", self._after_orm_execute),
+        ]
+        for name, listener in self._listeners:
+            event.listen(Session, name, listener)
+
+    def close(self) -> None:
+        """Stop following the changes to messages and drop the windows."""
+        for name, listener in self._listeners:
+            event.remove(Session, name, listener)
+        self.clear()
+
+    def clear(self) -> None:
+        self._windows.clear()
+        self._loading.clear()
+
+    def invalidate(self, session_id: str) -> None:
+        """Drop the window of a chat session, to be read again."""
+        self._windows.pop(session_id, None)
+        self._loading.pop(session_id, None)
+
+    async def load(self, db_session: AsyncSession, session_id: str) -> None:
+        """Read the window of a chat session, if it isn't kept already."""
+        if session_id in self._windows:
+            return
+        token = self._loading[session_id] = object()
+        stmt = (
+            select(MessageTable)
+            .where(MessageTable.session_id == session_id, MessageTable.error == False)  # noqa: E712
+            .order_by(col(MessageTable.timestamp).desc())
+            .limit(self.size + 1)
+        )
+        messages = (await db_session.exec(stmt)).all()
+        # Only keep it if no message of the session was written while it was read
+        if self._loading.get(session_id) is not token:
+            return
+        del self._loading[session_id]
+        entries = sorted((message_row(message) for message in messages[: self.size]), key=itemgetter(0))
+        self._windows[session_id] = _Window(
+            entries=entries, complete=len(messages) <= self.size, loaded_at=time.monotonic()
+        )
+        while len(self._windows) > self.max_sessions:
+            self._windows.popitem(last=False)
+
+    def find(
+        self,
+        session_id: str,
+        *,
+        sender: str | None = None,
+        sender_name: str | None = None,
+        flow_id: UUID | str | None = None,
+        order: str | None = "DESC",
+        limit: int | None = None,
+    ) -> list[MessageRow] | None:
+        """The messages of a chat session, by timestamp, if its window has all of them.
+
+        Returns:
+            The rows of the messages, None if the window isn't kept, is older than `ttl` or the
+            messages might include older ones that are not in it.
+        """
+        window = self._windows.get(session_id)
+        if window is None:
+            return None
+        if time.monotonic() - window.loaded_at > self.ttl:
+            # Other processes may have written to the session since, read it again
+            self.invalidate(session_id)
+            return None
+        self._windows.move_to_end(session_id)
+        if flow_id is not None and not isinstance(flow_id, UUID):
+            flow_id = UUID(flow_id)
+        rows = [
+            row
+            for _, row in window.entries
+            if (not sender or row["sender"] == sender)
+            and (not sender_name or row["sender_name"] == sender_name)
+            and (not flow_id or row["flow_id"] == flow_id)
+        ]
+        if order == "DESC":
+            rows.reverse()
+        if window.complete:
+            return rows[:limit] if limit else rows
+        # The newest messages are all in the window, the oldest might not be
+        if order == "DESC" and limit and len(rows) >= limit:
+            return rows[:limit]
+        return None
+
+    def _add(self, session_id: str, timestamp: datetime, row: MessageRow) -> None:
+        self._loading.pop(session_id, None)
+        window = self._windows.get(session_id)
+        if window is None:
+            return
+        if not window.complete and window.entries and timestamp < window.entries[0][0]:
+            # Older than the messages in the window
+            return
+        insort(window.entries, (timestamp, row), key=itemgetter(0))
+        if len(window.entries) > self.size:
+            del window.entries[: len(window.entries) - self.size]
+            window.complete = False
+
+    def _after_flush(self, session: Session, flush_context) -> None:  # noqa: ARG002
+        added = session.info.setdefault(_ADDED_KEY, [])
+        changed = session.info.setdefault(_CHANGED_KEY, set())
+        for obj in session.new:
+            if isinstance(obj, MessageTable) and not obj.error:
+                added.append((obj.session_id, *message_row(obj)))
+        for obj in chain(session.dirty, session.deleted):
+            if isinstance(obj, MessageTable):
+                # Also the chat session it was moved from
+                session_ids = {obj.session_id, *sa_inspect(obj).attrs.session_id.history.deleted}
+                changed.update(session_ids)
+                for session_id in session_ids:
+                    self.invalidate(session_id)
+
+    def _after_orm_execute(self, orm_execute_state: ORMExecuteState) -> None:
+        # Bulk updates and deletes of messages can change any session
+        table = getattr(orm_execute_state.statement, "table", None)
+        if (orm_execute_state.is_update or orm_execute_state.is_delete) and (
+            getattr(table, "name", None) == MessageTable.__tablename__
+        ):
+            orm_execute_state.session.info[_CLEAR_KEY] = True
+            self.clear()
+
+    def _after_commit(self, session: Session) -> None:
+        if session.info.pop(_CLEAR_KEY, False):
+            self.clear()
+        # Drop them again, in case they were read before the changes were committed
+        for session_id in session.info.pop(_CHANGED_KEY, ()):
+            self.invalidate(session_id)
+        for session_id, timestamp, row in session.info.pop(_ADDED_KEY, ()):
+            self._add(session_id, timestamp, row)
+
+    def _after_rollback(self, session: Session) -> None:
+        for key in (_ADDED_KEY, _CHANGED_KEY, _CLEAR_KEY):
+            session.info.pop(key, None)
@@ -17,6 +17,7 @@ if TYPE_CHECKING:
     from langflow.services.cache.service import AsyncBaseCacheService, CacheService
     from langflow.services.chat.service import ChatService
     from langflow.services.database.service import DatabaseService
+    from langflow.services.http_client.service import HttpClientService
     from langflow.services.job_queue.service import JobQueueService
     from langflow.services.session.service import SessionService
     from langflow.services.settings.service import SettingsService
@@ -282,3 +283,14 @@ def get_book_service() -> BookService:
     from langflow.services.book.factory import BookServiceFactory
 
     return get_service(ServiceType.BOOK_SERVICE, BookServiceFactory())
+
+
+def get_http_client_service() -> HttpClientService:
+    """Retrieves the HttpClientService instance from the service manager.
+
+    Returns:
+        HttpClientService: The HttpClientService instance.
+    """
+    from langflow.services.http_client.factory import HttpClientServiceFactory
+
+    return get_service(ServiceType.HTTP_CLIENT_SERVICE, HttpClientServiceFactory())
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import urllib.request
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import TYPE_CHECKING, Any
+
+import httpx
+from loguru import logger
+
+from langflow.services.base import Service
+
+if TYPE_CHECKING:
+    from langflow.services.settings.service import SettingsService
+
+# Methods that can be sent again without side effects, even if the server may have received them
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# Status codes worth retrying: rate limiting and transient gateway failures
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+RETRY_BACKOFF_SECONDS = 0.5
+MAX_RETRY_DELAY_SECONDS = 10.0
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+
+class ResponseTooLargeError(httpx.RequestError):
+    """Raised when a response body exceeds the configured size cap."""
+
+
+class _RejectCookiesPolicy(DefaultCookiePolicy):
+    """Neither stores nor sends cookies, so the shared client carries no session state between callers."""
+
+    def set_ok(self, cookie, request) -> bool:  # noqa: ARG002
+        return False
+
+    def return_ok(self, cookie, request) -> bool:  # noqa: ARG002
+        return False
+
+
+def _environment_proxies() -> dict[str, str]:
+    """The proxy of each URL scheme set in the environment, from the variables httpx reads with `trust_env`."""
+    proxies = urllib.request.getproxies()
+    return {
+        scheme: proxies.get(scheme) or proxies["all"]
+        for scheme in ("http", "https")
+        if proxies.get(scheme) or proxies.get("all")
+    }
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """Sends requests over the connection pools of an event loop.
+
+    Closing it leaves the pools open for the other clients using them, the service closes them.
+    """
+
+    def __init__(self, pools: _LoopClient) -> None:
+        self.pools = pools
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self.pools.transport_for(request.url).handle_async_request(request)
+
+
+class _LoopClient:
+    """The connection pools, pooled client and per-host limits used by a single event loop."""
+
+    def __init__(self, limits: httpx.Limits, *, http2: bool, max_connections_per_host: int, **client_kwargs) -> None:
+        self.transport = httpx.AsyncHTTPTransport(limits=limits, http2=http2)
+        # An explicit transport turns off the client's own proxy support, so proxies get pools of their own
+        self.proxy_transports = {
+            scheme: httpx.AsyncHTTPTransport(limits=limits, http2=http2, proxy=proxy)
+            for scheme, proxy in _environment_proxies().items()
+        }
+        self.client = httpx.AsyncClient(transport=_SharedTransport(self), **client_kwargs)
+        self.max_connections_per_host = max_connections_per_host
+        self.host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def transport_for(self, url: httpx.URL) -> httpx.AsyncHTTPTransport:
+        proxy_transport = self.proxy_transports.get(url.scheme)
+        if proxy_transport is not None and not urllib.request.proxy_bypass(url.host):
+            return proxy_transport
+        return self.transport
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+        for transport in [self.transport, *self.proxy_transports.values()]:
+            await transport.aclose()
+
+    def host_semaphore(self, host: str) -> asyncio.Semaphore:
+        if host not in self.host_semaphores:
+            self.host_semaphores[host] = asyncio.Semaphore(self.max_connections_per_host)
+        return self.host_semaphores[host]
+
+
+class HttpClientService(Service):
+    """Owns long-lived, connection-pooled HTTP clients for outbound requests.
+
+    Opening a new `httpx.AsyncClient` per call pays TCP and TLS setup every time. This
+    service keeps one pooled client per event loop, so connections are kept alive and
+    reused across requests, and adds per-host concurrency limits, retries with
+    exponential backoff and a cap on response sizes on top of it.
+    """
+
+    name = "http_client_service"
+
+    def __init__(self, settings_service: SettingsService) -> None:
+        settings = settings_service.settings
+        self.limits = httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+        )
+        self.max_connections_per_host = settings.http_max_connections_per_host
+        self.max_retries = settings.http_max_retries
+        self.max_response_size = settings.http_max_response_size * 1024 * 1024
+        self.http2 = settings.http2_enabled and importlib.util.find_spec("h2") is not None
+        if settings.http2_enabled and not self.http2:
+            logger.warning("HTTP/2 is enabled but the 'h2' package is not installed, falling back to HTTP/1.1")
+        self.headers = {"User-Agent": settings.user_agent}
+        self._clients: dict[asyncio.AbstractEventLoop, _LoopClient] = {}
+        self._metrics = {
+            "requests": 0,
+            "retries": 0,
+            "errors": 0,
+            "new_connections": 0,
+            "bytes_received": 0,
+            "responses_too_large": 0,
+        }
+
+    def _loop_client(self) -> _LoopClient:
+        # Connections belong to the loop that opened them, so each loop gets its own pool
+        loop = asyncio.get_running_loop()
+        for stale_loop in [stale_loop for stale_loop in self._clients if stale_loop.is_closed()]:
+            del self._clients[stale_loop]
+        if loop not in self._clients:
+            self._clients[loop] = _LoopClient(
+                self.limits,
+                http2=self.http2,
+                max_connections_per_host=self.max_connections_per_host,
+                timeout=DEFAULT_TIMEOUT,
+                headers=self.headers,
+                cookies=CookieJar(policy=_RejectCookiesPolicy()),
+                follow_redirects=True,
+            )
+        return self._clients[loop]
+
+    def get_client(self) -> httpx.AsyncClient:
+        """Return a new client that sends its requests over the pooled connections of the running event loop.
+
+        Cookies, headers and other settings of the client are its own, so nothing set by one
+        caller reaches another. Closing it, or using it as a context manager, leaves the pooled
+        connections open.
+        """
+        return httpx.AsyncClient(
+            transport=_SharedTransport(self._loop_client()),
+            timeout=DEFAULT_TIMEOUT,
+            headers=self.headers,
+        )
+
+    async def _trace(self, event_name: str, _info: dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            self._metrics["new_connections"] += 1
+
+    async def _read(self, response: httpx.Response, max_response_size: int) -> None:
+        content_length = response.headers.get("Content-Length")
+        if content_length and content_length.isdigit() and int(content_length) > max_response_size:
+            msg = f"Response from {response.url} is larger than {max_response_size} bytes"
+            raise ResponseTooLargeError(msg, request=response.request)
+        chunks = []
+        size = 0
+        async for chunk in response.aiter_bytes():
+            size += len(chunk)
+            if size > max_response_size:
+                msg = f"Response from {response.url} is larger than {max_response_size} bytes"
+                raise ResponseTooLargeError(msg, request=response.request)
+            chunks.append(chunk)
+        # Same as `Response.aread`, with the size checked as the body arrives
+        response._content = b"".join(chunks)
+        self._metrics["bytes_received"] += size
+
+    @staticmethod
+    def _retry_delay(attempt: int, response: httpx.Response | None = None) -> float:
+        retry_after = response.headers.get("Retry-After", "") if response is not None else ""
+        if retry_after.isdigit():
+            return min(float(retry_after), MAX_RETRY_DELAY_SECONDS)
+        return min(RETRY_BACKOFF_SECONDS * 2**attempt, MAX_RETRY_DELAY_SECONDS)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        max_retries: int | None = None,
+        max_response_size: int | None = None,
+        follow_redirects: bool = True,
+        auth: httpx.Auth | tuple[str, str] | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request through the pooled client of the running event loop.
+
+        Connection failures are always retried; responses with a retryable status code
+        (429, 502, 503 and 504) and other transport errors only for idempotent methods.
+        The body is read as it arrives and the request fails with `ResponseTooLargeError`
+        once it exceeds `max_response_size` bytes.
+
+        Args:
+            method: The HTTP method.
+            url: The URL to send the request to.
+            max_retries: Overrides the configured number of retries.
+            max_response_size: Overrides the configured response size cap, in bytes.
+            follow_redirects: Whether redirects are followed.
+            auth: Authentication to send the request with.
+            **kwargs: Passed on to `httpx.AsyncClient.build_request`, e.g. `headers`, `params`,
+                `json` or `timeout`.
+
+        Returns:
+            The response, with its body already read. Status codes are not checked.
+        """
+        loop_client = self._loop_client()
+        method = method.upper()
+        max_retries = self.max_retries if max_retries is None else max_retries
+        max_response_size = max_response_size or self.max_response_size
+        request = loop_client.client.build_request(method, url, **kwargs)
+        request.extensions["trace"] = self._trace
+
+        attempt = 0
+        while True:
+            self._metrics["requests"] += 1
+            try:
+                async with loop_client.host_semaphore(request.url.host):
+                    response = await loop_client.client.send(
+                        request, stream=True, auth=auth, follow_redirects=follow_redirects
+                    )
+                    try:
+                        await self._read(response, max_response_size)
+                    finally:
+                        await response.aclose()
+            except ResponseTooLargeError:
+                self._metrics["responses_too_large"] += 1
+                raise
+            except httpx.TransportError as exc:
+                retryable = isinstance(exc, httpx.ConnectError | httpx.ConnectTimeout | httpx.PoolTimeout)
+                if attempt >= max_retries or not (retryable or method in IDEMPOTENT_METHODS):
+                    self._metrics["errors"] += 1
+                    raise
+                delay = self._retry_delay(attempt)
+                logger.debug(f"{method} {url} failed ({exc!r}), retrying in {delay}s")
+            else:
+                if (
+                    attempt >= max_retries
+                    or response.status_code not in RETRY_STATUS_CODES
+                    or method not in IDEMPOTENT_METHODS
+                ):
+                    return response
+                delay = self._retry_delay(attempt, response)
+                logger.debug(f"{method} {url} returned {response.status_code}, retrying in {delay}s")
+            attempt += 1
+            self._metrics["retries"] += 1
+            await asyncio.sleep(delay)
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    def get_metrics(self) -> dict[str, int]:
+        """Return request counters and the number of pooled clients."""
+        return {
+            **self._metrics,
+            "reused_connections": max(self._metrics["requests"] - self._metrics["new_connections"], 0),
+            "clients": len(self._clients),
+        }
+
+    async def teardown(self) -> None:
+        current_loop = asyncio.get_running_loop()
+        for loop, loop_client in list(self._clients.items()):
+            # Clients of other loops can't be closed from here, their connections go away with the loop
+            if loop is current_loop:
+                await loop_client.aclose()
+        self._clients.clear()
@@ -23,3 +23,4 @@ class ServiceType(str, Enum):
     JOB_QUEUE_SERVICE = "job_queue_service"
     AI_ASSISTANT_SERVICE = "ai_assistant_service"
     SUPABASE_AUTH_SERVICE = "supabase_auth_service"
+    HTTP_CLIENT_SERVICE = "http_client_service"
@@ -139,6 +139,8 @@ class Settings(BaseSettings):
     langchain_cache: str = "InMemoryCache"
     load_flows_path: str | None = None
     bundle_urls: list[str] = []
+    bundle_max_size: int | None = None
+    """The maximum size in MB of a bundle downloaded from `bundle_urls`. Bundles of any size are loaded if not set."""
 
     # Redis
     redis_host: str = "localhost"
@@ -228,6 +230,12 @@ class Settings(BaseSettings):
     """The maximum number of vertex builds to keep in the database."""
     max_vertex_builds_per_vertex: int = 2
     """The maximum number of builds to keep per vertex. Older builds will be deleted."""
+    message_history_window: int = 0
+    """The number of most recent messages of each chat session kept in memory, 0 (the default) to
+    disable it. Only the writes of this process update it, so it is always disabled with more than
+    one worker; with several replicas, keep message_history_window_ttl short."""
+    message_history_window_ttl: float = 10.0
+    """Seconds after which the kept messages of a chat session are read from the database again."""
     webhook_polling_interval: int = 5000
     """The polling interval for the webhook in ms."""
     fs_flows_polling_interval: int = 10000
@@ -237,6 +245,23 @@ class Settings(BaseSettings):
     ssl_key_file: str | None = None
     """Path to the SSL key file on the local system."""
 
+    # Outbound HTTP
+    http_max_connections: int = 100
+    """The maximum number of concurrent outbound HTTP connections of the shared HTTP client."""
+    http_max_connections_per_host: int = 20
+    """The maximum number of concurrent outbound HTTP requests to a single host."""
+    http_max_keepalive_connections: int = 20
+    """The maximum number of idle outbound HTTP connections kept open for reuse."""
+    http_keepalive_expiry: float = 30.0
+    """The time in seconds after which an idle outbound HTTP connection is closed."""
+    http2_enabled: bool = False
+    """If set to True, outbound HTTP requests will use HTTP/2 when the server supports it."""
+    http_max_retries: int = 2
+    """The number of times a failed outbound HTTP request is retried."""
+    http_max_response_size: int = 100
+    """The maximum size in MB of a response to a request sent through the shared HTTP client, e.g. by the store
+    service or the API Request component. Bundle downloads are capped by `bundle_max_size` instead."""
+
     # MCP Server
     mcp_server_enabled: bool = True
     """If set to False, Langflow will not enable the MCP server."""
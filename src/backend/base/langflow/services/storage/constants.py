@@ -1,3 +1,6 @@
+# Size of the chunks files are read and written in when streamed
+DEFAULT_CHUNK_SIZE = 256 * 1024
+
 EXTENSION_TO_CONTENT_TYPE = {
     "json": "application/json",
     "txt": "text/plain",
@@ -1,7 +1,11 @@
+from collections.abc import AsyncIterable, AsyncIterator
+from uuid import uuid4
+
 import anyio
 from aiofile import async_open
 from loguru import logger
 
+from .constants import DEFAULT_CHUNK_SIZE
 from .service import StorageService
 
 
@@ -67,6 +71,84 @@ class LocalStorageService(StorageService):
         logger.debug(f"File {file_name} retrieved successfully from flow {flow_id}.")
         return content
 
+    async def get_file_stream(
+        self,
+        flow_id: str,
+        file_name: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Read a file from the local storage in chunks.
+
+        Args:
+            flow_id: The identifier for the flow.
+            file_name: The name of the file to be read.
+            start: The position of the first byte to read.
+            end: The position of the last byte to read, the end of the file if None.
+            chunk_size: The most bytes to read at a time.
+
+        Yields:
+            The chunks of the file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        file_path = self.data_dir / flow_id / file_name
+        if not await file_path.exists():
+            logger.warning(f"File {file_name} not found in flow {flow_id}.")
+            msg = f"File {file_name} not found in flow {flow_id}"
+            raise FileNotFoundError(msg)
+
+        async with async_open(str(file_path), "rb") as f:
+            f.seek(start)
+            remaining = None if end is None else end + 1 - start
+            while remaining is None or remaining > 0:
+                chunk = await f.read(chunk_size if remaining is None else min(chunk_size, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    async def save_file_stream(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> int:
+        """Save a file in the local storage a chunk at a time.
+
+        The chunks are written to a temporary file that replaces the file once complete, so
+        readers never see a partial file.
+
+        Args:
+            flow_id: The identifier for the flow.
+            file_name: The name of the file to be saved.
+            chunks: The byte content of the file, in chunks.
+
+        Returns:
+            The size of the file.
+        """
+        folder_path = self.data_dir / flow_id
+        await folder_path.mkdir(parents=True, exist_ok=True)
+        file_path = folder_path / file_name
+        partial_path = folder_path / f".{file_name}.{uuid4().hex}.part"
+
+        size = 0
+        try:
+            async with async_open(str(partial_path), "wb") as f:
+                async for chunk in chunks:
+                    await f.write(chunk)
+                    size += len(chunk)
+            await partial_path.rename(file_path)
+        except Exception:
+            logger.exception(f"Error saving file {file_name} in flow {flow_id}")
+            await partial_path.unlink(missing_ok=True)
+            raise
+        logger.info(f"File {file_name} saved successfully in flow {flow_id}.")
+        return size
+
+    def get_local_path(self, flow_id: str, file_name: str) -> str | None:
+        """The path of a file in the local storage."""
+        return self.build_full_path(str(flow_id), file_name)
+
     async def list_files(self, flow_id: str):
         """List all files in a specified flow.
 
@@ -113,7 +195,7 @@ class LocalStorageService(StorageService):
         """Perform any cleanup operations when the service is being torn down."""
         # No specific teardown actions required for local
 
-    async def get_file_size(self, flow_id: str, file_name: str) -> None:
+    async def get_file_size(self, flow_id: str, file_name: str) -> int:
         """Get the size of a file in the local storage."""
         # Get the file size from the file path
         file_path = self.data_dir / flow_id / file_name
@@ -1,9 +1,17 @@
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator
+
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 from loguru import logger
 
+from .constants import DEFAULT_CHUNK_SIZE
 from .service import StorageService
 
+# Size of the parts of multipart uploads, and so the most of an upload held in memory. S3
+# requires every part but the last to be at least 5MB.
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+
 
 class S3StorageService(StorageService):
     """A service class for handling operations with AWS S3 storage."""
@@ -57,6 +65,123 @@ class S3StorageService(StorageService):
             logger.exception(f"Error retrieving file {file_name} from folder {folder}")
             raise
 
+    async def get_file_stream(
+        self,
+        folder: str,
+        file_name: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Read a file, or a range of it, from the S3 bucket in chunks.
+
+        Only the requested range is fetched from S3.
+
+        Args:
+            folder: The folder in the bucket where the file is stored.
+            file_name: The name of the file to be read.
+            start: The position of the first byte to read.
+            end: The position of the last byte to read, the end of the file if None.
+            chunk_size: The most bytes to read at a time.
+
+        Yields:
+            The chunks of the file.
+        """
+        request = {"Bucket": self.bucket, "Key": f"{folder}/{file_name}"}
+        if start or end is not None:
+            request["Range"] = f"bytes={start}-{'' if end is None else end}"
+        try:
+            response = await asyncio.to_thread(self.s3_client.get_object, **request)
+        except ClientError:
+            logger.exception(f"Error retrieving file {file_name} from folder {folder}")
+            raise
+
+        body = response["Body"]
+        try:
+            while chunk := await asyncio.to_thread(body.read, chunk_size):
+                yield chunk
+        finally:
+            body.close()
+
+    async def save_file_stream(self, folder: str, file_name: str, chunks: AsyncIterable[bytes]) -> int:
+        """Save a file to the S3 bucket with a multipart upload, one part in memory at a time.
+
+        Files smaller than one part are saved with a single request instead.
+
+        Args:
+            folder: The folder in the bucket to save the file.
+            file_name: The name of the file to be saved.
+            chunks: The byte content of the file, in chunks.
+
+        Returns:
+            The size of the file.
+        """
+        key = f"{folder}/{file_name}"
+        buffer = bytearray()
+        size = 0
+        upload_id = None
+        parts: list[dict] = []
+
+        async def upload_part(data: bytes) -> None:
+            part_number = len(parts) + 1
+            response = await asyncio.to_thread(
+                self.s3_client.upload_part,
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=data,
+            )
+            parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+        try:
+            async for chunk in chunks:
+                buffer.extend(chunk)
+                size += len(chunk)
+                while len(buffer) >= MULTIPART_PART_SIZE:
+                    if upload_id is None:
+                        response = await asyncio.to_thread(
+                            self.s3_client.create_multipart_upload, Bucket=self.bucket, Key=key
+                        )
+                        upload_id = response["UploadId"]
+                    await upload_part(bytes(buffer[:MULTIPART_PART_SIZE]))
+                    del buffer[:MULTIPART_PART_SIZE]
+
+            if upload_id is None:
+                await asyncio.to_thread(self.s3_client.put_object, Bucket=self.bucket, Key=key, Body=bytes(buffer))
+            else:
+                if buffer:
+                    await upload_part(bytes(buffer))
+                await asyncio.to_thread(
+                    self.s3_client.complete_multipart_upload,
+                    Bucket=self.bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+        except Exception:
+            logger.exception(f"Error saving file {file_name} in folder {folder}")
+            if upload_id is not None:
+                # Parts of unfinished uploads are stored, and billed, until aborted
+                await asyncio.to_thread(
+                    self.s3_client.abort_multipart_upload, Bucket=self.bucket, Key=key, UploadId=upload_id
+                )
+            raise
+        logger.info(f"File {file_name} saved successfully in folder {folder}.")
+        return size
+
+    async def get_file_size(self, folder: str, file_name: str) -> int:
+        """Get the size of a file in the S3 bucket without downloading it."""
+        try:
+            response = await asyncio.to_thread(
+                self.s3_client.head_object, Bucket=self.bucket, Key=f"{folder}/{file_name}"
+            )
+        except ClientError:
+            logger.exception(f"Error getting the size of file {file_name} in folder {folder}")
+            raise
+        return response["ContentLength"]
+
     async def list_files(self, folder: str):
         """List all files in a specified folder of the S3 bucket.
 
@@ -6,8 +6,11 @@ from typing import TYPE_CHECKING
 import anyio
 
 from langflow.services.base import Service
+from langflow.services.storage.constants import DEFAULT_CHUNK_SIZE
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
     from langflow.services.session.service import SessionService
     from langflow.services.settings.service import SettingsService
 
@@ -35,6 +38,41 @@ class StorageService(Service):
     async def get_file(self, flow_id: str, file_name: str) -> bytes:
         raise NotImplementedError
 
+    async def get_file_stream(
+        self,
+        flow_id: str,
+        file_name: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Read a file, or the bytes from `start` to `end` inclusive, in chunks.
+
+        Backends that can read part of a file override this, the default reads the whole file.
+        """
+        content = await self.get_file(flow_id, file_name)
+        stop = len(content) if end is None else end + 1
+        for position in range(start, stop, chunk_size):
+            yield content[position : min(position + chunk_size, stop)]
+
+    async def save_file_stream(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> int:
+        """Save a file from chunks of bytes, returning its size.
+
+        Backends that can write a file a chunk at a time override this, the default joins the chunks.
+        """
+        data = b"".join([chunk async for chunk in chunks])
+        await self.save_file(flow_id, file_name, data)
+        return len(data)
+
+    async def get_file_size(self, flow_id: str, file_name: str) -> int:
+        """Get the size of a file in bytes."""
+        return len(await self.get_file(flow_id, file_name))
+
+    def get_local_path(self, flow_id: str, file_name: str) -> str | None:  # noqa: ARG002
+        """The path of a file on the local filesystem, if it is stored there, so it can be sent without copies."""
+        return None
+
     @abstractmethod
     async def list_files(self, flow_id: str) -> list[str]:
         raise NotImplementedError
@@ -3,6 +3,8 @@ from typing import TYPE_CHECKING
 import httpx
 from loguru import logger
 
+from langflow.services.deps import get_http_client_service
+
 if TYPE_CHECKING:
     from langflow.services.store.schema import ListComponentResponse
     from langflow.services.store.service import StoreService
@@ -43,8 +45,7 @@ async def update_components_with_user_data(
 # Get the latest released version of langflow (https://pypi.org/project/langflow/)
 async def get_lf_version_from_pypi():
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get("https://pypi.org/pypi/langflow/json")
+        response = await get_http_client_service().get("https://pypi.org/pypi/langflow/json")
         if response.status_code != httpx.codes.OK:
             return None
         return response.json()["info"]["version"]
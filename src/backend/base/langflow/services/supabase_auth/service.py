@@ -13,7 +13,6 @@ from uuid import UUID
 
 from loguru import logger
 from sqlmodel import select
-from supabase import Client, create_client
 
 from langflow.services.base import Service
 
@@ -51,6 +50,8 @@ class SupabaseAuthService(Service):
                 return
 
             # Create Supabase client
+            from supabase import create_client
+
             self.supabase_client = create_client(self.supabase_url, self.supabase_key)
             logger.info("Supabase Auth client initialized successfully.")
         except Exception as e:
@@ -1,4 +1,5 @@
 import abc
+from collections.abc import Collection
 from uuid import UUID
 
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -35,6 +36,17 @@ class VariableService(Service):
             The value of the variable.
         """
 
+    async def prefetch_variables(self, user_id: UUID | str, names: Collection[str], session: AsyncSession) -> None:
+        """Load several variables at once so that the following `get_variable` calls are served from memory.
+
+        Services without a cache don't need to implement this.
+
+        Args:
+            user_id: The user ID.
+            names: The names of the variables.
+            session: The database session.
+        """
+
     @abc.abstractmethod
     async def list_variables(self, user_id: UUID | str, session: AsyncSession) -> list[str | None]:
         """List all variables.
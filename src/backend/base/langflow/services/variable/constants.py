@@ -1,2 +1,8 @@
 CREDENTIAL_TYPE = "Credential"
 GENERIC_TYPE = "Generic"
+
+# Decrypted variable values are cached for a short time, so that a flow run reads each
+# variable at most once. Updates and deletes invalidate the cache of the current worker;
+# the TTL bounds how long other workers may serve a stale value.
+VARIABLE_CACHE_TTL = 30
+VARIABLE_CACHE_MAX_SIZE = 1024
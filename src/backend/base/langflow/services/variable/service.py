@@ -4,18 +4,24 @@ import os
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
+from cachetools import TTLCache
 from loguru import logger
-from sqlmodel import select
+from sqlmodel import col, select
 from typing_extensions import override
 
 from langflow.services.auth import utils as auth_utils
 from langflow.services.base import Service
 from langflow.services.database.models.variable.model import Variable, VariableCreate, VariableRead, VariableUpdate
 from langflow.services.variable.base import VariableService
-from langflow.services.variable.constants import CREDENTIAL_TYPE, GENERIC_TYPE
+from langflow.services.variable.constants import (
+    CREDENTIAL_TYPE,
+    GENERIC_TYPE,
+    VARIABLE_CACHE_MAX_SIZE,
+    VARIABLE_CACHE_TTL,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Collection, Sequence
     from uuid import UUID
 
     from sqlmodel.ext.asyncio.session import AsyncSession
@@ -26,6 +32,22 @@ if TYPE_CHECKING:
 class DatabaseVariableService(VariableService, Service):
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
+        # (user id, variable name) -> (variable type, decrypted value)
+        self._value_cache: TTLCache[tuple[str, str], tuple[str | None, str]] = TTLCache(
+            maxsize=VARIABLE_CACHE_MAX_SIZE, ttl=VARIABLE_CACHE_TTL
+        )
+
+    def _cache_variable(self, user_id: UUID | str, variable: Variable) -> tuple[str | None, str]:
+        cached = (variable.type, auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service))
+        self._value_cache[str(user_id), variable.name] = cached
+        return cached
+
+    def _invalidate(self, user_id: UUID | str, *names: str) -> None:
+        for name in names:
+            self._value_cache.pop((str(user_id), name), None)
+
+    def clear_cache(self) -> None:
+        self._value_cache.clear()
 
     async def initialize_user_variables(self, user_id: UUID | str, session: AsyncSession) -> None:
         if not self.settings_service.settings.store_environment_variables:
@@ -61,24 +83,43 @@ class DatabaseVariableService(VariableService, Service):
         field: str,
         session: AsyncSession,
     ) -> str:
-        # we get the credential from the database
-        # credential = session.query(Variable).filter(Variable.user_id == user_id, Variable.name == name).first()
-        stmt = select(Variable).where(Variable.user_id == user_id, Variable.name == name)
-        variable = (await session.exec(stmt)).first()
+        cached = self._value_cache.get((str(user_id), name))
+        if cached is None:
+            # we get the credential from the database
+            stmt = select(Variable).where(Variable.user_id == user_id, Variable.name == name)
+            variable = (await session.exec(stmt)).first()
 
-        if not variable or not variable.value:
-            msg = f"{name} variable not found."
-            raise ValueError(msg)
+            if not variable or not variable.value:
+                msg = f"{name} variable not found."
+                raise ValueError(msg)
+
+            # we decrypt the value once and keep it for the following lookups
+            cached = self._cache_variable(user_id, variable)
 
-        if variable.type == CREDENTIAL_TYPE and field == "session_id":
+        variable_type, value = cached
+        if variable_type == CREDENTIAL_TYPE and field == "session_id":
             msg = (
                 f"variable {name} of type 'Credential' cannot be used in a Session ID field "
                 "because its purpose is to prevent the exposure of values."
             )
             raise TypeError(msg)
 
-        # we decrypt the value
-        return auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+        return value
+
+    @override
+    async def prefetch_variables(self, user_id: UUID | str, names: Collection[str], session: AsyncSession) -> None:
+        missing = [name for name in set(names) if (str(user_id), name) not in self._value_cache]
+        if not missing:
+            return
+        stmt = select(Variable).where(Variable.user_id == user_id, col(Variable.name).in_(missing))
+        for variable in (await session.exec(stmt)).all():
+            if not variable.value:
+                continue
+            try:
+                self._cache_variable(user_id, variable)
+            except Exception as e:  # noqa: BLE001
+                # get_variable will report the error if the variable is actually used
+                logger.debug(f"Could not prefetch variable '{variable.name}': {e}")
 
     async def get_all(self, user_id: UUID | str, session: AsyncSession) -> list[VariableRead]:
         stmt = select(Variable).where(Variable.user_id == user_id)
@@ -137,6 +178,7 @@ class DatabaseVariableService(VariableService, Service):
         session.add(variable)
         await session.commit()
         await session.refresh(variable)
+        self._invalidate(user_id, name)
         return variable
 
     async def update_variable_fields(
@@ -148,6 +190,7 @@ class DatabaseVariableService(VariableService, Service):
     ):
         query = select(Variable).where(Variable.id == variable_id, Variable.user_id == user_id)
         db_variable = (await session.exec(query)).one()
+        previous_name = db_variable.name
         db_variable.updated_at = datetime.now(timezone.utc)
 
         variable.value = variable.value or ""
@@ -161,6 +204,7 @@ class DatabaseVariableService(VariableService, Service):
         session.add(db_variable)
         await session.commit()
         await session.refresh(db_variable)
+        self._invalidate(user_id, previous_name, db_variable.name)
         return db_variable
 
     @override
@@ -177,6 +221,7 @@ class DatabaseVariableService(VariableService, Service):
             raise ValueError(msg)
         await session.delete(variable)
         await session.commit()
+        self._invalidate(user_id, name)
 
     @override
     async def delete_variable_by_id(self, user_id: UUID | str, variable_id: UUID, session: AsyncSession) -> None:
@@ -185,8 +230,10 @@ class DatabaseVariableService(VariableService, Service):
         if not variable:
             msg = f"{variable_id} variable not found."
             raise ValueError(msg)
+        name = variable.name
         await session.delete(variable)
         await session.commit()
+        self._invalidate(user_id, name)
 
     async def create_variable(
         self,
@@ -208,4 +255,5 @@ class DatabaseVariableService(VariableService, Service):
         session.add(variable)
         await session.commit()
         await session.refresh(variable)
+        self._invalidate(user_id, name)
         return variable
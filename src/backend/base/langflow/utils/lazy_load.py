@@ -1,3 +1,9 @@
+import sys
+from collections.abc import Callable
+from importlib import import_module
+from typing import Any
+
+
 class LazyLoadDictBase:
     def __init__(self) -> None:
         self._all_types_dict = None
@@ -13,3 +19,25 @@ class LazyLoadDictBase:
 
     def get_type_dict(self):
         raise NotImplementedError
+
+
+def lazy_exports(package: str, exports: dict[str, str]) -> Callable[[str], Any]:
+    """Returns a module `__getattr__` that imports the `exports` of a package when first used.
+
+    Args:
+        package: The name of the package, its `__name__`.
+        exports: The name of the module each attribute is imported from, relative to the package.
+
+    Heavy or optional dependencies of a package are then only loaded by the processes that use them.
+    """
+
+    def getattr_(name: str) -> Any:
+        if name not in exports:
+            msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        value = getattr(import_module(exports[name], package), name)
+        # Later uses don't go through __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return getattr_
@@ -9,7 +9,8 @@ from langchain_core._api.deprecation import LangChainDeprecationWarning
 from loguru import logger
 from pydantic import ValidationError
 
-from langflow.field_typing.constants import CUSTOM_COMPONENT_SUPPORTED_TYPES, DEFAULT_IMPORT_STRING
+from langflow.field_typing import constants as field_typing_constants
+from langflow.field_typing.constants import DEFAULT_IMPORT_STRING
 
 
 def add_type_ignores() -> None:
@@ -358,7 +359,7 @@ def get_default_imports(code_string):
         "Dict": dict,
         "Union": Union,
     }
-    langflow_imports = list(CUSTOM_COMPONENT_SUPPORTED_TYPES.keys())
+    langflow_imports = list(field_typing_constants.CUSTOM_COMPONENT_SUPPORTED_TYPES.keys())
     necessary_imports = find_names_in_code(code_string, langflow_imports)
     langflow_module = importlib.import_module("langflow.field_typing")
     default_imports.update({name: getattr(langflow_module, name) for name in necessary_imports})
@@ -2,9 +2,6 @@ import asyncio
 import base64
 from pathlib import Path
 
-import numpy as np
-from scipy.signal import resample
-
 from langflow.logging import logger
 
 SAMPLE_RATE_24K = 24000
@@ -32,6 +29,10 @@ def resample_24k_to_16k(frame_24k_bytes):
         msg = f"Expected exactly {BYTES_PER_24K_FRAME} bytes for 24kHz frame, got {len(frame_24k_bytes)}"
         raise ValueError(msg)
 
+    # Audio dependencies are only loaded once voice mode is used
+    import numpy as np
+    from scipy.signal import resample
+
     # Convert bytes to numpy array of int16
     frame_24k = np.frombuffer(frame_24k_bytes, dtype=np.int16)
 
@@ -0,0 +1,35 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from langflow.services.book.pdf_generator import BookPDFGenerator
+
+PAGE_COUNT = 30
+
+
+def render(page_type, *, reuse_backgrounds):
+    generator = BookPDFGenerator(
+        book=SimpleNamespace(name="Journal", user_id="user", dimensions={"width": 6, "height": 9, "units": "in"}),
+        interior=SimpleNamespace(layout_settings={}),
+        pages=[SimpleNamespace(page_number=number, content={"type": page_type}) for number in range(PAGE_COUNT)],
+        reuse_backgrounds=reuse_backgrounds,
+    )
+    start = time.perf_counter()
+    pdf = generator.generate_pdf(include_bleed=True).getvalue()
+    return time.perf_counter() - start, len(pdf)
+
+
+@pytest.mark.parametrize("page_type", ["dot", "grid", "lined", "planner", "tracker"])
+def test_reused_page_backgrounds(page_type):
+    """Benchmark print-ready exports with page backgrounds drawn once against drawn on every page."""
+    redrawn_time, redrawn_size = render(page_type, reuse_backgrounds=False)
+    reused_time, reused_size = render(page_type, reuse_backgrounds=True)
+
+    print(  # noqa: T201
+        f"{page_type}: {redrawn_size} -> {reused_size} bytes, {redrawn_time:.3f}s -> {reused_time:.3f}s"
+    )
+    assert reused_size < redrawn_size
+    if page_type == "dot":
+        # Dot grids are by far the most drawing operations per page
+        assert reused_size * 10 < redrawn_size
+        assert reused_time * 2 < redrawn_time
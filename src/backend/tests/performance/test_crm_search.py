@@ -0,0 +1,54 @@
+import random
+import time
+from uuid import uuid4
+
+import pytest
+from langflow.services.database.models.crm.search import CRMSearchDocument, LikeSearchBackend, SQLiteSearchBackend
+from sqlalchemy import create_engine, insert
+
+WORKSPACE_ID = uuid4()
+WORDS = [f"word{i}" for i in range(5_000)]
+
+
+def catalog(size):
+    engine = create_engine("sqlite://")
+    CRMSearchDocument.__table__.create(engine)
+    rng = random.Random(size)  # noqa: S311
+    with engine.begin() as connection:
+        connection.execute(
+            insert(CRMSearchDocument.__table__),
+            [
+                {
+                    "workspace_id": WORKSPACE_ID,
+                    "entity_type": "product",
+                    "entity_id": uuid4(),
+                    "title": " ".join(rng.sample(WORDS, 3)),
+                    "body": " ".join(rng.sample(WORDS, 20)),
+                }
+                for _ in range(size)
+            ],
+        )
+    return engine
+
+
+def search_time(engine, backend, query, repeat=20):
+    with engine.connect() as connection:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            backend.search(connection, query, [WORKSPACE_ID])
+        return (time.perf_counter() - start) / repeat
+
+
+@pytest.mark.parametrize("size", [1_000, 100_000])
+def test_search_latency(size):
+    """Benchmark searching the full-text index against scanning every document."""
+    engine = catalog(size)
+    try:
+        indexed = search_time(engine, SQLiteSearchBackend(), "word1234 word4321")
+        scanned = search_time(engine, LikeSearchBackend(), "word1234 word4321", repeat=3)
+    finally:
+        engine.dispose()
+
+    print(f"{size} documents: indexed {indexed * 1000:.2f}ms, scanned {scanned * 1000:.2f}ms")  # noqa: T201
+    if size >= 100_000:
+        assert indexed * 10 < scanned
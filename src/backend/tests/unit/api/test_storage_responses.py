@@ -0,0 +1,73 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.responses import FileResponse, StreamingResponse
+from langflow.api.utils.storage import RangeNotSatisfiableError, parse_range, storage_file_response
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, None),
+        ("bytes=0-99", (0, 99)),
+        ("bytes=100-", (100, 999)),
+        ("bytes=-100", (900, 999)),
+        ("bytes=900-5000", (900, 999)),
+        ("bytes=-5000", (0, 999)),
+        # Multiple ranges and other units are answered with the whole file
+        ("bytes=0-1,5-6", None),
+        ("items=0-1", None),
+        ("bytes=-", None),
+    ],
+)
+def test_parse_range(header, expected):
+    assert parse_range(header, 1000) == expected
+
+
+@pytest.mark.parametrize("header", ["bytes=1000-", "bytes=5-4"])
+def test_unsatisfiable_ranges(header):
+    with pytest.raises(RangeNotSatisfiableError):
+        parse_range(header, 1000)
+
+
+@pytest.fixture
+def remote_storage():
+    storage = MagicMock()
+    storage.get_file_size = AsyncMock(return_value=1000)
+    storage.get_local_path.return_value = None
+    return storage
+
+
+async def test_ranges_are_streamed_from_remote_storage(remote_storage):
+    response = await storage_file_response(
+        remote_storage, "folder", "video.mp4", media_type="video/mp4", range_header="bytes=100-199"
+    )
+
+    assert isinstance(response, StreamingResponse)
+    assert response.status_code == 206
+    assert response.headers["content-range"] == "bytes 100-199/1000"
+    assert response.headers["content-length"] == "100"
+    remote_storage.get_file_stream.assert_called_once_with("folder", "video.mp4", start=100, end=199)
+
+
+async def test_whole_files_and_unsatisfiable_ranges(remote_storage):
+    response = await storage_file_response(remote_storage, "folder", "video.mp4", media_type="video/mp4")
+    assert response.status_code == 200
+    assert response.headers["content-length"] == "1000"
+    assert response.headers["accept-ranges"] == "bytes"
+
+    response = await storage_file_response(
+        remote_storage, "folder", "video.mp4", media_type="video/mp4", range_header="bytes=2000-"
+    )
+    assert response.status_code == 416
+    assert response.headers["content-range"] == "bytes */1000"
+
+
+async def test_local_files_are_sent_from_disk(remote_storage, tmp_path):
+    path = tmp_path / "video.mp4"
+    remote_storage.get_local_path.return_value = str(path)
+
+    response = await storage_file_response(remote_storage, "folder", "video.mp4", media_type="video/mp4")
+
+    assert isinstance(response, FileResponse)
+    assert response.path == str(path)
@@ -0,0 +1,73 @@
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from langflow.api.utils.workspace import (
+    get_accessible_workspace_ids,
+    get_workspace_role,
+    invalidate_workspace_roles,
+    verify_workspace_access,
+)
+
+USER_ID = uuid4()
+OWNED, EDITED, VIEWED, OTHER = (uuid4() for _ in range(4))
+
+
+@pytest.fixture
+def load_roles():
+    invalidate_workspace_roles()
+    roles = {OWNED: "owner", EDITED: "editor", VIEWED: "viewer"}
+    with patch("langflow.api.utils.workspace._load_workspace_roles", AsyncMock(return_value=roles)) as load_roles:
+        yield load_roles
+    invalidate_workspace_roles()
+
+
+async def test_roles_are_loaded_once_per_user(load_roles):
+    for _ in range(3):
+        assert await get_workspace_role(None, EDITED, USER_ID) == "editor"
+        await verify_workspace_access(None, OWNED, USER_ID, required_role="owner")
+
+    assert load_roles.await_count == 1
+
+
+async def test_unknown_workspaces_reload_the_roles(load_roles):
+    assert await get_workspace_role(None, OTHER, USER_ID) is None
+    assert load_roles.await_count == 2
+
+    # Access granted since the roles were cached is picked up
+    load_roles.return_value = {**load_roles.return_value, OTHER: "viewer"}
+    assert await get_workspace_role(None, OTHER, USER_ID) == "viewer"
+
+
+async def test_invalidation(load_roles):
+    await get_workspace_role(None, EDITED, USER_ID)
+    load_roles.return_value = {**load_roles.return_value, EDITED: "viewer"}
+    assert await get_workspace_role(None, EDITED, USER_ID) == "editor"
+
+    invalidate_workspace_roles(USER_ID)
+
+    assert await get_workspace_role(None, EDITED, USER_ID) == "viewer"
+
+
+async def test_verify_workspace_access(load_roles):  # noqa: ARG001
+    await verify_workspace_access(None, VIEWED, USER_ID)
+    await verify_workspace_access(None, EDITED, USER_ID, required_role="viewer")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await verify_workspace_access(None, VIEWED, USER_ID, required_role="editor")
+    assert exc_info.value.status_code == 403
+
+    with pytest.raises(HTTPException) as exc_info:
+        await verify_workspace_access(None, OTHER, USER_ID)
+    assert exc_info.value.status_code == 404
+
+
+async def test_bulk_access_check(load_roles):
+    workspace_ids = [OWNED, EDITED, VIEWED, OTHER]
+
+    assert await get_accessible_workspace_ids(None, workspace_ids, USER_ID) == {OWNED, EDITED, VIEWED}
+    assert await get_accessible_workspace_ids(None, workspace_ids, USER_ID, required_role="editor") == {OWNED, EDITED}
+    assert await get_accessible_workspace_ids(None, [OWNED, VIEWED], USER_ID, required_role="owner") == {OWNED}
+    # One load, plus a reload for each check that includes the unknown workspace
+    assert load_roles.await_count == 3
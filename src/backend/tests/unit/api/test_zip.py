@@ -0,0 +1,86 @@
+import asyncio
+import io
+import zipfile
+
+import pytest
+from langflow.api.utils.zip import ZIP_CHUNK_SIZE, fetch_ahead, stream_zip
+
+
+async def chunks(*parts):
+    for part in parts:
+        yield part
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+async def test_stream_zip_writes_a_readable_archive():
+    large = bytes(range(256)) * 1024
+
+    async def entries():
+        yield "small.json", b'{"name": "flow"}'
+        yield "large.bin", large
+        yield "streamed.txt", chunks(b"hello ", b"world")
+        yield "empty.txt", b""
+
+    archive = await collect(stream_zip(entries()))
+
+    with zipfile.ZipFile(io.BytesIO(b"".join(archive))) as zip_file:
+        assert zip_file.namelist() == ["small.json", "large.bin", "streamed.txt", "empty.txt"]
+        assert zip_file.read("small.json") == b'{"name": "flow"}'
+        assert zip_file.read("large.bin") == large
+        assert zip_file.read("streamed.txt") == b"hello world"
+        assert zip_file.read("empty.txt") == b""
+    # Entries are sent in bounded pieces rather than as one buffer
+    assert max(len(chunk) for chunk in archive) < ZIP_CHUNK_SIZE + 1024
+
+
+async def test_stream_zip_sends_entries_before_reading_the_next():
+    read = []
+
+    async def entries():
+        for name in ("a.json", "b.json"):
+            read.append(name)
+            yield name, b"{}"
+
+    stream = stream_zip(entries())
+    first = await anext(stream)
+
+    assert first.startswith(b"PK")
+    assert read == ["a.json"]
+    await collect(stream)
+    assert read == ["a.json", "b.json"]
+
+
+async def test_fetch_ahead_reads_a_bounded_number_of_entries_ahead():
+    started = []
+
+    async def read(name):
+        started.append(name)
+        for part in range(10):
+            yield f"{name}{part}".encode()
+
+    entries = fetch_ahead(((name, read(name)) for name in "abcdef"), limit=3, max_chunks=2)
+    name, content = await anext(entries)
+    await asyncio.sleep(0)
+
+    assert name == "a"
+    assert started == ["a", "b", "c"]
+    assert [chunk async for chunk in content] == [f"a{part}".encode() for part in range(10)]
+    assert [(name, b"".join([chunk async for chunk in content])) async for name, content in entries] == [
+        (name, b"".join(f"{name}{part}".encode() for part in range(10))) for name in "bcdef"
+    ]
+
+
+async def test_fetch_ahead_raises_read_errors_to_the_consumer():
+    async def failing():
+        yield b"partial"
+        msg = "storage unavailable"
+        raise OSError(msg)
+
+    entries = fetch_ahead([("a", failing())], limit=2, max_chunks=2)
+    _, content = await anext(entries)
+
+    with pytest.raises(OSError, match="storage unavailable"):
+        await collect(content)
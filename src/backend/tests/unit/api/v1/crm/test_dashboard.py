@@ -0,0 +1,114 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from langflow.api.v1.crm import dashboard
+from langflow.services.database.models.crm.client import Client
+from langflow.services.database.models.crm.invoice import Invoice
+from langflow.services.database.models.crm.opportunity import Opportunity
+from langflow.services.database.models.crm.rollup import (
+    STATS_COLUMNS,
+    CRMActivity,
+    WorkspaceStats,
+    _add_stats,
+    _client_stats,
+    _invoice_stats,
+    _opportunity_stats,
+)
+from langflow.services.database.models.crm.search import CRMSearchDocument
+from langflow.services.database.models.crm.task import Task
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+WORKSPACE_ID = uuid4()
+
+
+def test_updates_move_records_between_counters():
+    deltas = {}
+    _add_stats(deltas, WORKSPACE_ID, _client_stats({"status": "lead"}), -1)
+    _add_stats(deltas, WORKSPACE_ID, _client_stats({"status": "active"}), 1)
+    _add_stats(deltas, WORKSPACE_ID, _invoice_stats({"status": "sent", "amount": 120.0}), -1)
+    _add_stats(deltas, WORKSPACE_ID, _invoice_stats({"status": "paid", "amount": 100.0}), 1)
+    _add_stats(deltas, WORKSPACE_ID, _opportunity_stats({"status": "new", "value": None}), 1)
+
+    changes = {name: value for name, value in deltas[WORKSPACE_ID].items() if value}
+    assert changes == {
+        "lead_client_count": -1,
+        "active_client_count": 1,
+        "paid_invoice_total": 100.0,
+        "opportunity_count": 1,
+    }
+
+
+def make_stats(**counters):
+    return SimpleNamespace(**{**dict.fromkeys(STATS_COLUMNS, 0), **counters})
+
+
+@pytest.fixture
+def session():
+    session = MagicMock()
+    session.get = AsyncMock()
+    session.commit = AsyncMock()
+    with patch.object(dashboard, "check_workspace_access", AsyncMock(return_value="owner")):
+        yield session
+
+
+async def test_stats_are_read_from_the_rollup(session):
+    session.get.return_value = make_stats(client_count=3, active_client_count=2, paid_invoice_total=50.0)
+
+    with patch.object(dashboard, "rebuild_workspace_stats", AsyncMock()) as rebuild:
+        stats = await dashboard.get_workspace_stats(session=session, workspace_id=WORKSPACE_ID, current_user=None)
+
+    rebuild.assert_not_awaited()
+    assert stats["clients"] == {"total": 3, "active": 2}
+    assert stats["invoices"] == {"total": 0, "revenue": 50.0}
+
+
+async def test_missing_rollup_is_rebuilt(session):
+    session.get.side_effect = [None, make_stats(lead_client_count=4)]
+
+    with patch.object(dashboard, "rebuild_workspace_stats", AsyncMock(return_value=1)) as rebuild:
+        distribution = await dashboard.get_client_distribution(
+            session=session, workspace_id=WORKSPACE_ID, current_user=None
+        )
+
+    rebuild.assert_awaited_once_with(session, [WORKSPACE_ID])
+    session.commit.assert_awaited_once()
+    assert distribution == {"active": 0, "inactive": 0, "lead": 4}
+
+
+@pytest.fixture
+async def db_session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        for model in (Client, Invoice, Opportunity, Task, WorkspaceStats, CRMActivity, CRMSearchDocument):
+            await conn.run_sync(model.__table__.create)
+    async with AsyncSession(engine) as session:
+        yield session
+    await engine.dispose()
+
+
+def client(status):
+    return {"id": uuid4(), "workspace_id": WORKSPACE_ID, "created_by": uuid4(), "name": "Client", "status": status}
+
+
+async def test_writes_update_the_stored_counters(db_session):
+    # Written before the counters were kept, so only an aggregate counts it
+    existing = client("lead")
+    await db_session.execute(insert(Client.__table__).values(**existing))
+    await db_session.commit()
+
+    # The first write of a workspace stores its aggregated counters
+    db_session.add(Client(**client("lead")))
+    await db_session.commit()
+    stats = await db_session.get(WorkspaceStats, WORKSPACE_ID)
+    assert (stats.client_count, stats.lead_client_count) == (2, 2)
+
+    # Changed without the previous status having been loaded
+    stored = await db_session.get(Client, existing["id"])
+    db_session.expire(stored, ["status"])
+    stored.status = "active"
+    await db_session.commit()
+    stats = await db_session.get(WorkspaceStats, WORKSPACE_ID, populate_existing=True)
+    assert (stats.client_count, stats.lead_client_count, stats.active_client_count) == (2, 1, 1)
@@ -0,0 +1,215 @@
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+import respx
+from httpx import Response
+from langflow.api.v1.crm import ecommerce_sync
+from langflow.api.v1.crm.ecommerce_sync import (
+    CatalogSyncError,
+    ShopifySource,
+    WooCommerceSource,
+    get_sync_checkpoint,
+    sync_catalog,
+    upsert_products,
+)
+from langflow.services.database.models.crm.catalog_sync import CatalogSyncCheckpoint
+from langflow.services.database.models.crm.product import Product
+from langflow.services.database.models.crm.search import CRMSearchDocument
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+WOO_URL = "https://shop.example.com/wp-json/wc/v3/products"
+SHOPIFY_URL = "https://demo.myshopify.com/admin/api/2023-04/products.json"
+
+
+class FakeWooCommerce:
+    """Serves a catalog of `total` products through the paginated WooCommerce products API."""
+
+    def __init__(self, total: int) -> None:
+        self.products = [{"id": i, "name": f"Product {i}", "sku": f"SKU-{i}", "price": "9.5"} for i in range(total)]
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        per_page = int(request.url.params["per_page"])
+        page = int(request.url.params["page"])
+        total_pages = max(1, -(-len(self.products) // per_page))
+        chunk = self.products[(page - 1) * per_page : page * per_page]
+        return Response(200, json=chunk, headers={"X-WP-TotalPages": str(total_pages)})
+
+
+class FakeShopify:
+    """Serves a catalog of `total` products through the cursor-paginated Shopify products API."""
+
+    def __init__(self, total: int) -> None:
+        self.products = [
+            {"id": i, "title": f"Product {i}", "handle": f"product-{i}", "variants": [{"sku": f"SKU-{i}"}]}
+            for i in range(total)
+        ]
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        limit = int(request.url.params.get("limit", 50))
+        offset = int(request.url.params.get("page_info", 0))
+        chunk = self.products[offset : offset + limit]
+        headers = {}
+        if offset + limit < len(self.products):
+            headers["Link"] = f'<{SHOPIFY_URL}?limit={limit}&page_info={offset + limit}>; rel="next"'
+        return Response(200, json={"products": chunk}, headers=headers)
+
+
+@pytest.fixture
+async def database(monkeypatch):
+    """Run the syncs against an in-memory database, returning its session scope."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        for model in (Product, CRMSearchDocument, CatalogSyncCheckpoint):
+            await conn.run_sync(model.__table__.create)
+
+    @asynccontextmanager
+    async def test_session_scope():
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
+            await session.commit()
+
+    monkeypatch.setattr(ecommerce_sync, "session_scope", test_session_scope)
+    yield test_session_scope
+    await engine.dispose()
+
+
+@pytest.fixture
+def upserted(monkeypatch, database):  # noqa: ARG001
+    """Record the batches written to the database instead of writing them."""
+    batches = []
+
+    async def fake_upsert(_session, products_data, **_kwargs):
+        batches.append(products_data)
+        return products_data, [], []
+
+    monkeypatch.setattr(ecommerce_sync, "upsert_products", fake_upsert)
+    return batches
+
+
+async def stored_checkpoint(source, workspace_id):
+    async with ecommerce_sync.session_scope() as session:
+        return await get_sync_checkpoint(session, source, workspace_id)
+
+
+@respx.mock
+async def test_woocommerce_pages_through_the_catalog():
+    server = FakeWooCommerce(total=25)
+    respx.get(WOO_URL).mock(side_effect=server)
+    source = WooCommerceSource("https://shop.example.com/", "key", "secret", page_size=10, max_concurrency=2)
+
+    updated_after = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    pages = [page async for page in source.fetch_pages(updated_after)]
+
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert [request.url.params["page"] for request in server.requests] == ["1", "2", "3"]
+    assert all(request.url.params["modified_after"] == updated_after.isoformat() for request in server.requests)
+    assert all(request.url.params["dates_are_gmt"] == "true" for request in server.requests)
+
+
+@respx.mock
+async def test_shopify_follows_the_cursor():
+    server = FakeShopify(total=5)
+    respx.get(SHOPIFY_URL).mock(side_effect=server)
+    source = ShopifySource("https://demo.myshopify.com", "token", page_size=2)
+
+    pages = [page async for page in source.fetch_pages()]
+
+    assert [[product["id"] for product in page] for page in pages] == [[0, 1], [2, 3], [4]]
+    assert len(server.requests) == 3
+
+
+@respx.mock
+async def test_sync_catalog_upserts_in_batches_and_reports_progress(upserted):
+    respx.get(WOO_URL).mock(side_effect=FakeWooCommerce(total=25))
+    source = WooCommerceSource("https://shop.example.com", "key", "secret", page_size=10)
+    workspace_id = uuid4()
+    reports = []
+
+    progress = await sync_catalog(
+        source,
+        workspace_id=workspace_id,
+        user_id=uuid4(),
+        batch_size=20,
+        on_progress=lambda progress: reports.append(progress.fetched),
+    )
+
+    assert [len(batch) for batch in upserted] == [20, 5]
+    assert upserted[0][0]["sku"] == "SKU-0"
+    assert upserted[0][0]["price"] == 9.5
+    assert reports == [10, 20, 25]
+    assert (progress.pages, progress.fetched, progress.created, progress.failed) == (3, 25, 25, 0)
+    assert await stored_checkpoint(source, workspace_id) == progress.checkpoint
+
+
+@respx.mock
+async def test_incremental_sync_resumes_from_the_checkpoint(upserted):  # noqa: ARG001
+    server = FakeShopify(total=3)
+    respx.get(SHOPIFY_URL).mock(side_effect=server)
+    source = ShopifySource("demo.myshopify.com", "token")
+    workspace_id = uuid4()
+
+    first = await sync_catalog(source, workspace_id=workspace_id, user_id=uuid4())
+    await sync_catalog(source, workspace_id=workspace_id, user_id=uuid4())
+    await sync_catalog(source, workspace_id=workspace_id, user_id=uuid4(), incremental=False)
+
+    assert "updated_at_min" not in server.requests[0].url.params
+    assert server.requests[1].url.params["updated_at_min"] == first.checkpoint.isoformat()
+    assert "updated_at_min" not in server.requests[2].url.params
+
+
+@respx.mock
+async def test_failed_sync_keeps_the_previous_checkpoint(upserted):  # noqa: ARG001
+    respx.get(WOO_URL).mock(return_value=Response(401, json={"message": "invalid key"}))
+    source = WooCommerceSource("https://shop.example.com", "key", "wrong")
+    workspace_id = uuid4()
+
+    with pytest.raises(CatalogSyncError, match="401"):
+        await sync_catalog(source, workspace_id=workspace_id, user_id=uuid4())
+
+    assert await stored_checkpoint(source, workspace_id) is None
+
+
+def product(workspace_id, name, slug, sku, price=0.0):
+    return {"name": name, "slug": slug, "sku": sku, "price": price, "workspace_id": str(workspace_id)}
+
+
+async def test_upsert_products_matches_by_sku_then_slug(database):
+    workspace_id, user_id = uuid4(), uuid4()
+    async with database() as session:
+        created, updated, errors = await upsert_products(
+            session,
+            [
+                product(workspace_id, "Mug", "mug", "MUG-1", price=5.0),
+                product(workspace_id, "Poster", "poster", ""),
+                product(workspace_id, "Broken", "broken", "BROKEN-1", price="not a price"),
+            ],
+            workspace_id=workspace_id,
+            user_id=user_id,
+        )
+    assert (len(created), len(updated), [error["product"] for error in errors]) == (2, 0, ["Broken"])
+
+    async with database() as session:
+        created, updated, _ = await upsert_products(
+            session,
+            [
+                product(workspace_id, "Mug", "renamed-mug", "MUG-1", price=6.0),
+                product(workspace_id, "Poster v2", "poster", ""),
+            ],
+            workspace_id=workspace_id,
+            user_id=user_id,
+        )
+        stored = (await session.exec(select(Product).where(Product.workspace_id == workspace_id))).all()
+    assert (len(created), len(updated)) == (0, 2)
+    assert sorted((item.name, item.slug, item.price) for item in stored) == [
+        ("Mug", "renamed-mug", 6.0),
+        ("Poster v2", "poster", 0.0),
+    ]
@@ -0,0 +1,45 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from langflow.api.v1.crm import utils
+from langflow.api.v1.crm.utils import count_query, decode_cursor, encode_cursor
+from sqlalchemy import Column, DateTime, MetaData, String, Table, Uuid, select
+
+items = Table(
+    "items",
+    MetaData(),
+    Column("id", Uuid, primary_key=True),
+    Column("created_at", DateTime(timezone=True)),
+    Column("key", String),
+)
+
+
+def test_cursor_round_trip():
+    values = [datetime(2026, 1, 2, 3, 4, 5, 678, tzinfo=timezone.utc), uuid4()]
+    keyset = (items.c.created_at, items.c.id)
+
+    assert decode_cursor(encode_cursor(values), keyset) == values
+    assert decode_cursor(encode_cursor(["b", values[1]]), (items.c.key, items.c.id)) == ["b", values[1]]
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor(["2026-01-01"]), encode_cursor(["x", "y"])])
+def test_invalid_cursors_are_rejected(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor, (items.c.created_at, items.c.id))
+    assert exc_info.value.status_code == 400
+
+
+async def test_counts_are_cached_per_query():
+    utils._count_cache.clear()
+    session = MagicMock()
+    session.exec = AsyncMock(return_value=MagicMock(one=MagicMock(return_value=42)))
+
+    assert await count_query(session, select(items).where(items.c.key == "a")) == 42
+    assert await count_query(session, select(items).where(items.c.key == "a").order_by(items.c.id)) == 42
+    assert session.exec.await_count == 1
+
+    await count_query(session, select(items).where(items.c.key == "b"))
+    assert session.exec.await_count == 2
@@ -0,0 +1,217 @@
+from datetime import date, datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from langflow.api.v1.crm import reports
+from langflow.services.database.models.crm.client import Client
+from langflow.services.database.models.crm.daily_rollup import (
+    CRMDailyRollup,
+    _add_totals,
+    _apply_deltas,
+    rebuild_daily_rollups,
+    report_totals,
+)
+from langflow.services.database.models.crm.invoice import Invoice
+from langflow.services.database.models.crm.opportunity import Opportunity
+from langflow.services.database.models.crm.rollup import CRMActivity, WorkspaceStats
+from langflow.services.database.models.crm.task import Task
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+WORKSPACE_ID, CLIENT_ID, OTHER_CLIENT_ID = uuid4(), uuid4(), uuid4()
+NOW = datetime.now(timezone.utc).replace(tzinfo=None)
+TODAY = NOW.date()
+
+
+def invoice(client_id, status, amount, created_days_ago, due_days_ago=None):
+    return {
+        "id": uuid4(),
+        "workspace_id": WORKSPACE_ID,
+        "client_id": client_id,
+        "created_by": uuid4(),
+        "invoice_number": "INV",
+        "amount": amount,
+        "status": status,
+        "issue_date": NOW,
+        "due_date": None if due_days_ago is None else NOW - timedelta(days=due_days_ago),
+        "created_at": NOW - timedelta(days=created_days_ago),
+        "updated_at": NOW,
+    }
+
+
+def opportunity(client_id, status, value, created_days_ago, closes_in_days=None):
+    return {
+        "id": uuid4(),
+        "workspace_id": WORKSPACE_ID,
+        "client_id": client_id,
+        "created_by": uuid4(),
+        "name": "Deal",
+        "value": value,
+        "status": status,
+        "expected_close_date": None if closes_in_days is None else NOW + timedelta(days=closes_in_days),
+        "created_at": NOW - timedelta(days=created_days_ago),
+        "updated_at": NOW,
+    }
+
+
+@pytest.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        # Writes through the session also update the workspace counters and activity feed
+        for model in (Client, Invoice, Opportunity, Task, WorkspaceStats, CRMActivity, CRMDailyRollup):
+            await conn.run_sync(model.__table__.create)
+        await conn.execute(
+            insert(Invoice.__table__),
+            [
+                invoice(CLIENT_ID, "paid", 100.0, created_days_ago=2),
+                invoice(CLIENT_ID, "paid", 50.0, created_days_ago=2),
+                invoice(CLIENT_ID, "sent", 30.0, created_days_ago=3, due_days_ago=-5),
+                invoice(OTHER_CLIENT_ID, "overdue", 20.0, created_days_ago=60, due_days_ago=45),
+                invoice(OTHER_CLIENT_ID, "sent", 10.0, created_days_ago=1),
+            ],
+        )
+        await conn.execute(
+            insert(Opportunity.__table__),
+            [
+                opportunity(CLIENT_ID, "won", 200.0, created_days_ago=5),
+                opportunity(OTHER_CLIENT_ID, "won", None, created_days_ago=6),
+                opportunity(CLIENT_ID, "lost", 80.0, created_days_ago=5),
+                opportunity(CLIENT_ID, "proposal", 400.0, created_days_ago=4, closes_in_days=10),
+                opportunity(OTHER_CLIENT_ID, "won", 100.0, created_days_ago=400),
+                opportunity(OTHER_CLIENT_ID, "new", None, created_days_ago=1, closes_in_days=20),
+            ],
+        )
+    async with AsyncSession(engine) as session:
+        await rebuild_daily_rollups(session)
+        yield session
+    await engine.dispose()
+
+
+async def test_sales_overview(session):
+    report = await reports.generate_sales_overview(session, WORKSPACE_ID, NOW - timedelta(days=30), NOW)
+
+    metrics = report["metrics"]
+    assert metrics["total_revenue"] == 150.0
+    assert metrics["invoices_by_status"] == {"draft": 0, "sent": 2, "paid": 2, "overdue": 0}
+    assert metrics["opportunities_by_status"]["won"] == 2
+    assert metrics["total_opportunities"] == 5
+    # The won deal without a value is left out of the average
+    assert metrics["average_deal_size"] == 200.0
+    assert metrics["win_rate"] == 2 / 3 * 100
+
+
+async def test_client_reports_match_the_rollups(session):
+    date_from = NOW - timedelta(days=30)
+    for_client = await reports.generate_sales_overview(session, WORKSPACE_ID, date_from, NOW, client_id=CLIENT_ID)
+
+    assert for_client["metrics"]["total_revenue"] == 150.0
+    assert for_client["metrics"]["invoices_by_status"] == {"draft": 0, "sent": 1, "paid": 2, "overdue": 0}
+
+    # The rollups and the invoice table give the same totals
+    def totals(sync_session, client_id=None):
+        connection = sync_session.connection()
+        return report_totals(
+            connection, WORKSPACE_ID, "invoice", date_from.date(), TODAY, by_day=True, client_id=client_id
+        )
+
+    from_facts = await session.run_sync(totals, CLIENT_ID)
+    assert sorted((row["day"], row["status"]) for row in from_facts) == [
+        (TODAY - timedelta(days=3), "sent"),
+        (TODAY - timedelta(days=2), "paid"),
+    ]
+    from_rollups = await session.run_sync(totals)
+    assert sum(row["amount"] for row in from_rollups) == 190.0
+
+
+async def test_invoice_aging(session):
+    report = await reports.generate_invoice_aging(session, WORKSPACE_ID, NOW - timedelta(days=30), NOW)
+
+    metrics = report["metrics"]
+    assert metrics["outstanding_amount"] == 60.0
+    assert metrics["overdue_amount"] == 20.0
+    assert metrics["aging_buckets"]["current"] == {"count": 1, "amount": 30.0}
+    assert metrics["aging_buckets"]["31_60_days"] == {"count": 1, "amount": 20.0}
+    assert metrics["aging_buckets"]["no_due_date"] == {"count": 1, "amount": 10.0}
+    assert metrics["payment_rate"] == 50.0
+
+
+async def test_pipeline_and_forecast(session):
+    pipeline = await reports.generate_opportunity_pipeline(session, WORKSPACE_ID, NOW - timedelta(days=30), NOW)
+    assert pipeline["metrics"]["pipeline_value"] == 400.0
+    assert pipeline["metrics"]["weighted_pipeline_value"] == 200.0
+    assert pipeline["metrics"]["open_opportunities"] == 2
+
+    forecast = await reports.generate_revenue_forecast(session, WORKSPACE_ID, NOW - timedelta(days=30), NOW)
+    metrics = forecast["metrics"]
+    assert sum(metrics["historical_revenue"].values()) == 150.0
+    assert len(metrics["projected_revenue"]) == reports.FORECAST_MONTHS
+    assert metrics["projected_total"] == 200.0
+
+
+def test_updates_move_records_between_days_and_statuses():
+    old = {"workspace_id": WORKSPACE_ID, "status": "sent", "amount": 30.0, "created_at": NOW, "due_date": None}
+    new = {**old, "status": "paid", "due_date": datetime(2026, 1, 1, 23, 30, tzinfo=timezone(timedelta(hours=-2)))}
+    deltas = {}
+    _add_totals(deltas, Invoice, old, -1)
+    _add_totals(deltas, Invoice, new, 1)
+
+    assert deltas == {
+        (WORKSPACE_ID, "invoice", TODAY, "sent"): (-1, -1, -30.0),
+        (WORKSPACE_ID, "invoice", TODAY, "paid"): (1, 1, 30.0),
+        # Days are UTC days
+        (WORKSPACE_ID, "invoice_due", date(2026, 1, 2), "paid"): (1, 1, 30.0),
+    }
+
+
+async def test_rebuild_rolls_up_every_series(session):
+    rollup = CRMDailyRollup.__table__
+    rows = (await session.execute(select(rollup.c.series, rollup.c.record_count))).all()
+    totals = {}
+    for series, count in rows:
+        totals[series] = totals.get(series, 0) + count
+    assert totals == {"invoice": 5, "invoice_due": 2, "opportunity": 6, "opportunity_close": 2}
+
+
+def day_totals(sync_session, series, day):
+    return {
+        row["status"]: (row["record_count"], row["amount_count"], row["amount"])
+        for row in report_totals(sync_session.connection(), WORKSPACE_ID, series, day, day)
+    }
+
+
+async def test_writes_roll_up_their_day(session):
+    created = invoice(CLIENT_ID, "sent", 40.0, created_days_ago=10)
+    day = created["created_at"].date()
+
+    # The first write of a day creates its rollup rows
+    session.add(Invoice(**created))
+    await session.commit()
+    assert await session.run_sync(day_totals, "invoice", day) == {"sent": (1, 1, 40.0)}
+
+    # A second write of the day adds to them
+    session.add(Invoice(**invoice(CLIENT_ID, "sent", 2.0, created_days_ago=10)))
+    await session.commit()
+    assert await session.run_sync(day_totals, "invoice", day) == {"sent": (2, 2, 42.0)}
+
+    # Changed without the previous status having been loaded
+    stored = await session.get(Invoice, created["id"])
+    session.expire(stored, ["status"])
+    stored.status = "paid"
+    await session.commit()
+    assert await session.run_sync(day_totals, "invoice", day) == {"sent": (1, 1, 2.0), "paid": (1, 1, 40.0)}
+
+    await session.delete(await session.get(Invoice, created["id"]))
+    await session.commit()
+    assert await session.run_sync(day_totals, "invoice", day) == {"sent": (1, 1, 2.0), "paid": (0, 0, 0.0)}
+
+
+async def test_rollup_rows_written_by_another_transaction_are_added_to(session):
+    day = TODAY - timedelta(days=20)
+    key = (WORKSPACE_ID, "invoice", day, "draft")
+
+    # Both transactions found no row for the day, the second one to write adds to the first's
+    await session.run_sync(lambda sync_session: _apply_deltas(sync_session.connection(), {key: (1, 1, 5.0)}))
+    await session.run_sync(lambda sync_session: _apply_deltas(sync_session.connection(), {key: (1, 0, 0.0)}))
+
+    assert await session.run_sync(day_totals, "invoice", day) == {"draft": (2, 1, 5.0)}
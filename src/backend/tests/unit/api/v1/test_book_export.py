@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from langflow.api.v1.book import export as export_api
+from langflow.services.auth.utils import get_current_active_user
+from langflow.services.book.export_service import BookExport
+from langflow.services.deps import get_session
+
+BOOK_ID = uuid4()
+
+
+@pytest.fixture
+async def client():
+    app = FastAPI()
+    app.include_router(export_api.router)
+    app.dependency_overrides[get_current_active_user] = lambda: SimpleNamespace(id=uuid4())
+    app.dependency_overrides[get_session] = lambda: None
+    export = BookExport(
+        key="abc123",
+        book_id=BOOK_ID,
+        book_name="Planner",
+        snapshot={},
+        include_cover=True,
+        include_bleed=False,
+        quality=300,
+    )
+    with (
+        patch.object(export_api.BookExportService, "prepare_export", AsyncMock(return_value=export)),
+        patch.object(export_api.BookExportService, "get_or_render_pdf", AsyncMock(return_value=b"%PDF-")) as render,
+    ):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
+            client.render = render
+            yield client
+
+
+async def test_export_sends_the_pdf_with_its_etag(client):
+    response = await client.get(f"/books/{BOOK_ID}/export")
+
+    assert response.status_code == 200
+    assert response.content == b"%PDF-"
+    assert response.headers["etag"] == '"abc123"'
+    assert response.headers["cache-control"] == "private, no-cache"
+
+
+@pytest.mark.parametrize("if_none_match", ['"abc123"', 'W/"abc123"', '"other", "abc123"', "*"])
+async def test_export_with_a_matching_etag_is_not_modified(client, if_none_match):
+    response = await client.get(f"/books/{BOOK_ID}/export", headers={"If-None-Match": if_none_match})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == '"abc123"'
+    client.render.assert_not_awaited()
+
+
+async def test_export_with_a_stale_etag_is_sent_again(client):
+    response = await client.get(f"/books/{BOOK_ID}/export", headers={"If-None-Match": '"old"'})
+
+    assert response.status_code == 200
+    assert response.content == b"%PDF-"
@@ -0,0 +1,113 @@
+import os
+from pathlib import Path
+
+from langflow.base.data.manifest import FileManifest
+from langflow.schema import Data
+
+
+def _data(path):
+    return Data(data={"file_path": str(path), "text": path.read_text(encoding="utf-8")})
+
+
+def test_manifest_reuses_unchanged_files(tmp_path):
+    manifest = FileManifest(tmp_path / "manifest")
+    file_path = tmp_path / "doc.txt"
+    file_path.write_text("content", encoding="utf-8")
+
+    assert manifest.get(str(file_path)) is None
+    manifest.set(str(file_path), _data(file_path))
+
+    cached = manifest.get(str(file_path))
+    assert cached is not None
+    assert cached.data == {"file_path": str(file_path), "text": "content"}
+
+
+def test_manifest_uses_content_hash_when_only_mtime_changed(tmp_path):
+    manifest = FileManifest(tmp_path / "manifest")
+    file_path = tmp_path / "doc.txt"
+    file_path.write_text("content", encoding="utf-8")
+    manifest.set(str(file_path), _data(file_path))
+
+    stat = file_path.stat()
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert manifest.get(str(file_path)) is not None
+
+    file_path.write_text("other!!", encoding="utf-8")  # same size, new content
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+    assert manifest.get(str(file_path)) is None
+
+
+def test_manifest_load_only_parses_changed_files(tmp_path):
+    manifest = FileManifest(tmp_path / "manifest")
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"doc{i}.txt"
+        path.write_text(f"content{i}", encoding="utf-8")
+        paths.append(str(path))
+
+    parsed: list[str] = []
+
+    def load_function(file_paths):
+        parsed.extend(file_paths)
+        return [_data(Path(file_path)) for file_path in file_paths]
+
+    first = manifest.load(paths, load_function)
+    (tmp_path / "doc2.txt").write_text("changed content", encoding="utf-8")
+    second = manifest.load(paths, load_function)
+
+    assert parsed == [*paths, paths[2]]
+    assert [data.text for data in first] == ["content0", "content1", "content2"]
+    assert [data.text for data in second] == ["content0", "content1", "changed content"]
+    assert (manifest.hits, manifest.misses) == (2, 4)
+
+
+def test_manifest_skips_unserializable_data(tmp_path):
+    manifest = FileManifest(tmp_path / "manifest")
+    file_path = tmp_path / "doc.yaml"
+    file_path.write_text("a: 1", encoding="utf-8")
+
+    manifest.set(str(file_path), Data(data={"file_path": str(file_path), "text": object()}))
+
+    assert manifest.get(str(file_path)) is None
+
+
+def test_manifest_prunes_entries_of_deleted_files(tmp_path):
+    manifest = FileManifest(tmp_path / "manifest")
+    kept, deleted = tmp_path / "kept.txt", tmp_path / "deleted.txt"
+    for path in (kept, deleted):
+        path.write_text("content", encoding="utf-8")
+        manifest.set(str(path), _data(path))
+    deleted.unlink()
+
+    assert manifest.prune(force=True) == 1
+    assert len(list((tmp_path / "manifest").glob("*/*.json"))) == 1
+    assert manifest.get(str(kept)) is not None
+
+
+def test_manifest_prunes_least_recently_used_entries(tmp_path):
+    manifest = FileManifest(tmp_path / "manifest", max_entries=2)
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"doc{i}.txt"
+        path.write_text(f"content{i}", encoding="utf-8")
+        manifest.set(str(path), _data(path))
+        paths.append(str(path))
+    # Make the entries' ages distinct, doc0 being the most recently used
+    for age, path in enumerate(paths[::-1]):
+        os.utime(manifest._entry_path(path), (1000 + age, 1000 + age))
+
+    assert manifest.prune(force=True) == 1
+    assert [manifest.get(path) is not None for path in paths] == [True, True, False]
+
+
+def test_manifest_prunes_at_most_once_per_interval(tmp_path):
+    manifest = FileManifest(tmp_path / "manifest")
+    path = tmp_path / "doc.txt"
+    path.write_text("content", encoding="utf-8")
+    manifest.set(str(path), _data(path))
+    path.unlink()
+
+    assert manifest.prune() == 1
+    manifest.set(str(tmp_path), Data(data={"text": "a directory"}))
+    tmp_path.joinpath("manifest", ".last_prune").touch()
+    assert manifest.prune() == 0
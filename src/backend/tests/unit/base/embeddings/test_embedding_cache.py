@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+from langchain_core.embeddings import Embeddings
+from langflow.base.embeddings.cache import CachedEmbeddings, EmbeddingStore, get_model_identity
+from langflow.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
+from langflow.io import HandleInput
+
+
+class CountingEmbeddings(Embeddings):
+    def __init__(self, model: str = "counting-1") -> None:
+        self.model = model
+        self.calls: list[list[str]] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(texts)
+        return [[float(len(text)), 0.1] for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return [float(len(text)), 0.1]
+
+
+class AnonymousEmbeddings(Embeddings):
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [[0.0] for _ in texts]
+
+    def embed_query(self, text: str) -> list[float]:  # noqa: ARG002
+        return [0.0]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return EmbeddingStore(tmp_path / "embeddings.sqlite")
+
+
+def test_cached_embeddings_only_embeds_misses_in_batches(store):
+    model = CountingEmbeddings()
+    embeddings = CachedEmbeddings.wrap(model, store=store, batch_size=2)
+
+    first = embeddings.embed_documents(["a", "bb", "ccc", "a"])
+    second = embeddings.embed_documents(["bb", "dddd", "a"])
+
+    assert model.calls == [["a", "bb"], ["ccc"], ["dddd"]]
+    assert first == [list(np.float32([n, 0.1])) for n in (1, 2, 3, 1)]
+    assert second == [list(np.float32([n, 0.1])) for n in (2, 4, 1)]
+    assert (embeddings.hits, embeddings.misses) == (2, 5)
+    assert embeddings.hit_rate == pytest.approx(2 / 7)
+
+
+def test_cached_embeddings_are_persisted_per_model(store):
+    CachedEmbeddings.wrap(CountingEmbeddings(), store=store).embed_documents(["hello"])
+
+    same_model = CountingEmbeddings()
+    CachedEmbeddings.wrap(same_model, store=store).embed_documents(["hello"])
+    other_model = CountingEmbeddings(model="counting-2")
+    CachedEmbeddings.wrap(other_model, store=store).embed_documents(["hello"])
+
+    assert same_model.calls == []
+    assert other_model.calls == [["hello"]]
+
+
+async def test_cached_embeddings_async(store):
+    model = CountingEmbeddings()
+    embeddings = CachedEmbeddings.wrap(model, store=store)
+
+    await embeddings.aembed_documents(["x", "y"])
+    result = await embeddings.aembed_documents(["y", "x"])
+
+    assert model.calls == [["x", "y"]]
+    assert result == [list(np.float32([1, 0.1]))] * 2
+
+
+def test_unidentified_models_are_not_cached(store):
+    model = AnonymousEmbeddings()
+    assert get_model_identity(model) is None
+    assert CachedEmbeddings.wrap(model, store=store) is model
+
+
+def test_vector_store_components_use_the_embedding_cache(store, monkeypatch):
+    monkeypatch.setattr("langflow.base.embeddings.cache.get_embedding_store", lambda: store)
+
+    class DummyVectorStoreComponent(LCVectorStoreComponent):
+        inputs = [
+            *LCVectorStoreComponent.inputs,
+            HandleInput(name="embedding", display_name="Embedding", input_types=["Embeddings"]),
+        ]
+
+        @check_cached_vector_store
+        def build_vector_store(self):
+            return self.embedding.embed_documents(["one", "two"])
+
+    model = CountingEmbeddings()
+    for _ in range(2):
+        component = DummyVectorStoreComponent(embedding=model)
+        component.build_vector_store()
+
+    assert model.calls == [["one", "two"]]
+    assert isinstance(component.embedding, CachedEmbeddings)
+    assert component.embedding.hit_rate == 1.0
+
+    component = DummyVectorStoreComponent(embedding=model, cache_embeddings=False)
+    component.build_vector_store()
+    assert component.embedding is model
@@ -0,0 +1,60 @@
+import uuid
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.vectorstores import InMemoryVectorStore
+from langflow.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
+from langflow.base.vectorstores.utils import document_id
+from langflow.io import HandleInput
+from langflow.schema import Data, DataFrame
+
+
+class InMemoryVectorStoreComponent(LCVectorStoreComponent):
+    inputs = [
+        *LCVectorStoreComponent.inputs,
+        HandleInput(name="embedding", display_name="Embedding", input_types=["Embeddings"]),
+    ]
+
+    @check_cached_vector_store
+    def build_vector_store(self) -> InMemoryVectorStore:
+        documents, ids = self._prepare_documents()
+        self._add_new_documents(self.store, documents, ids)
+        return self.store
+
+
+def test_document_id_is_deterministic_uuid():
+    document = Document(page_content="hello", metadata={"b": 1, "a": 2})
+
+    assert document_id(document) == document_id(Document(page_content="hello", metadata={"a": 2, "b": 1}))
+    assert document_id(document) != document_id(Document(page_content="hello", metadata={"a": 3, "b": 1}))
+    assert str(uuid.UUID(document_id(document))) == document_id(document)
+
+
+def test_prepare_documents_drops_duplicates():
+    component = InMemoryVectorStoreComponent(
+        ingest_data=[
+            Data(text="one"),
+            Data(text="one"),
+            DataFrame([{"text": "two"}, {"text": "one"}]),
+        ]
+    )
+
+    documents, ids = component._prepare_documents()
+
+    assert [document.page_content for document in documents] == ["one", "two"]
+    assert ids == [document_id(document) for document in documents]
+
+
+def test_reingestion_only_adds_new_documents():
+    store = InMemoryVectorStore(embedding=DeterministicFakeEmbedding(size=4))
+
+    component = InMemoryVectorStoreComponent(ingest_data=[Data(text="one"), Data(text="two")], cache_embeddings=False)
+    component.store = store
+    component.build_vector_store()
+
+    component = InMemoryVectorStoreComponent(ingest_data=[Data(text="two"), Data(text="three")], cache_embeddings=False)
+    component.store = store
+    component.build_vector_store()
+
+    assert sorted(document["text"] for document in store.store.values()) == ["one", "three", "two"]
+    assert len(store.store) == 3
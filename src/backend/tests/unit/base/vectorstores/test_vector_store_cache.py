@@ -0,0 +1,115 @@
+from unittest.mock import patch
+
+import pytest
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langflow.base.vectorstores.cache import VectorStoreCache, vector_store_cache
+from langflow.schema import Data
+
+
+def test_cache_evicts_least_recently_used_entries():
+    cache = VectorStoreCache(max_entries=2, max_bytes=100)
+    cache.set("a", 1, "store-a", size=10)
+    cache.set("b", 1, "store-b", size=10)
+    assert cache.get("a", 1) == "store-a"  # "a" is now the most recently used
+
+    cache.set("c", 1, "store-c", size=10)
+
+    assert cache.get("b", 1) is None
+    assert cache.get("a", 1) == "store-a"
+    assert cache.get("c", 1) == "store-c"
+
+
+def test_cache_evicts_by_size():
+    cache = VectorStoreCache(max_entries=10, max_bytes=100)
+    cache.set("a", 1, "store-a", size=60)
+    cache.set("b", 1, "store-b", size=60)
+    cache.set("huge", 1, "store-huge", size=101)
+
+    assert cache.get("a", 1) is None
+    assert cache.get("b", 1) == "store-b"
+    assert cache.get("huge", 1) is None
+    assert cache.size == 60
+
+
+def test_cache_keeps_only_the_latest_signature():
+    cache = VectorStoreCache()
+    cache.set("a", 1, "old", size=10)
+    cache.set("a", 2, "new", size=20)
+
+    assert cache.get("a", 1) is None
+    assert cache.get("a", 2) == "new"
+    assert (len(cache), cache.size) == (1, 20)
+
+    cache.invalidate("a")
+    assert (len(cache), cache.size) == (0, 0)
+
+
+class TestFaissIndexCache:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        pytest.importorskip("faiss")
+        vector_store_cache.clear()
+        yield
+        vector_store_cache.clear()
+
+    @pytest.fixture
+    def component_kwargs(self, tmp_path):
+        return {
+            "persist_directory": str(tmp_path),
+            "embedding": DeterministicFakeEmbedding(size=8),
+            "ingest_data": [Data(text="apples"), Data(text="bananas")],
+            "search_query": "apples",
+            "number_of_results": 1,
+            "cache_embeddings": False,
+        }
+
+    def test_search_reuses_loaded_index(self, component_kwargs):
+        from langflow.components.vectorstores.faiss import FAISS, FaissVectorStoreComponent
+
+        FaissVectorStoreComponent(**component_kwargs).build_vector_store()
+        vector_store_cache.clear()
+
+        with patch.object(FAISS, "load_local", wraps=FAISS.load_local) as load_local:
+            for _ in range(3):
+                results = FaissVectorStoreComponent(**component_kwargs).search_documents()
+                assert [result.text for result in results] == ["apples"]
+
+        assert load_local.call_count == 1
+
+    def test_rebuilding_the_index_replaces_the_cached_copy(self, component_kwargs):
+        from langflow.components.vectorstores.faiss import FAISS, FaissVectorStoreComponent
+
+        FaissVectorStoreComponent(**component_kwargs).build_vector_store()
+        component_kwargs["ingest_data"] = [Data(text="cherries")]
+        component_kwargs["search_query"] = "cherries"
+        FaissVectorStoreComponent(**component_kwargs).build_vector_store()
+
+        with patch.object(FAISS, "load_local") as load_local:
+            results = FaissVectorStoreComponent(**component_kwargs).search_documents()
+
+        load_local.assert_not_called()
+        assert [result.text for result in results] == ["cherries"]
+        assert len(vector_store_cache) == 1
+
+    @pytest.mark.parametrize("memory_map_index", [False, True])
+    def test_cached_index_requires_dangerous_deserialization(self, component_kwargs, memory_map_index):
+        from langflow.components.vectorstores.faiss import FaissVectorStoreComponent
+
+        FaissVectorStoreComponent(**component_kwargs).build_vector_store()
+        assert len(vector_store_cache) == 1
+
+        component = FaissVectorStoreComponent(
+            **component_kwargs, allow_dangerous_deserialization=False, memory_map_index=memory_map_index
+        )
+        with pytest.raises(ValueError, match="Allow Dangerous Deserialization"):
+            component.search_documents()
+
+    def test_memory_mapped_index(self, component_kwargs):
+        from langflow.components.vectorstores.faiss import FaissVectorStoreComponent
+
+        FaissVectorStoreComponent(**component_kwargs).build_vector_store()
+        vector_store_cache.clear()
+
+        results = FaissVectorStoreComponent(**component_kwargs, memory_map_index=True).search_documents()
+
+        assert [result.text for result in results] == ["apples"]
@@ -1,6 +1,7 @@
 from collections.abc import AsyncIterator
 from typing import Any
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
 
 from langchain_core.agents import AgentFinish
 from langflow.base.agents.agent import process_agent_events
@@ -12,6 +13,7 @@ from langflow.base.agents.events import (
     handle_on_tool_error,
     handle_on_tool_start,
 )
+from langflow.base.agents.message_buffer import AgentMessageBuffer
 from langflow.schema.content_block import ContentBlock
 from langflow.schema.content_types import ToolContent
 from langflow.schema.message import Message
@@ -541,3 +543,70 @@ async def test_handle_on_chain_stream_no_output():
     assert updated_message.text == ""
     assert updated_message.properties.state == "partial"
     assert isinstance(start_time, float)
+
+
+def _create_buffered_component():
+    """Helper that mimics the component methods used by AgentMessageBuffer."""
+
+    async def _store(message):
+        message.id = uuid4()
+        return message
+
+    component = MagicMock()
+    component.send_message = AsyncMock(side_effect=_store)
+    component._send_message_event = AsyncMock()
+    component._update_stored_message = AsyncMock(side_effect=lambda message: message)
+    return component
+
+
+async def test_message_buffer_coalesces_database_writes():
+    """Every update is streamed, but only the final state is persisted."""
+    component = _create_buffered_component()
+    buffer = AgentMessageBuffer(component, flush_interval=60, max_pending_updates=100)
+    output = AgentFinish(return_values={"output": "final output"}, log="test log")
+
+    events = [{"event": "on_chain_start", "data": {"input": {"input": "initial input", "chat_history": []}}}]
+    for i in range(30):
+        events.extend(
+            [
+                {"event": "on_tool_start", "name": "tool", "run_id": str(i), "data": {"input": {"q": i}}},
+                {"event": "on_tool_end", "name": "tool", "run_id": str(i), "data": {"output": f"out {i}"}},
+            ]
+        )
+    events.append({"event": "on_chain_end", "data": {"output": output}})
+
+    agent_message = Message(
+        sender=MESSAGE_SENDER_AI,
+        sender_name="Agent",
+        properties={"icon": "Bot", "state": "partial"},
+        content_blocks=[ContentBlock(title="Agent Steps", contents=[])],
+        session_id="test_session_id",
+    )
+
+    result = await process_agent_events(create_event_iterator(events), agent_message, buffer)
+
+    assert component.send_message.await_count == 1
+    assert component._send_message_event.await_count == len(events)
+    assert component._update_stored_message.await_count == 1
+    assert buffer.pending_updates == 0
+    assert result.text == "final output"
+    tool_contents = [c for c in result.content_blocks[0].contents if isinstance(c, ToolContent)]
+    assert len(tool_contents) == 30
+    assert all(content.output is not None for content in tool_contents)
+
+
+async def test_message_buffer_flushes_when_too_many_updates_are_pending():
+    """The size threshold triggers intermediate writes."""
+    component = _create_buffered_component()
+    buffer = AgentMessageBuffer(component, flush_interval=60, max_pending_updates=5)
+    message = await buffer(message=Message(text="", sender=MESSAGE_SENDER_AI, sender_name="Agent"))
+
+    for _ in range(12):
+        message = await buffer(message=message)
+
+    assert component._update_stored_message.await_count == 2
+    assert buffer.pending_updates == 2
+
+    await buffer.flush(message)
+    assert component._update_stored_message.await_count == 3
+    assert buffer.pending_updates == 0
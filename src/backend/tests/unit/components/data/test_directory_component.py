@@ -3,6 +3,7 @@ from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
+from langflow.base.data.utils import parse_text_file_to_data
 from langflow.components.data import DirectoryComponent
 from langflow.schema import Data, DataFrame
 
@@ -15,6 +16,13 @@ class TestDirectoryComponent(ComponentTestBaseWithoutClient):
         """Return the component class to test."""
         return DirectoryComponent
 
+    @pytest.fixture(autouse=True)
+    def isolated_manifest(self, tmp_path, monkeypatch):
+        """Keep the file manifest of each test out of the user cache directory."""
+        manifest_dir = tmp_path / "file_manifest"
+        monkeypatch.setattr("langflow.base.data.manifest.MANIFEST_DIR", manifest_dir)
+        return manifest_dir
+
     @pytest.fixture
     def default_kwargs(self, tmp_path):
         """Return the default kwargs for the component."""
@@ -65,6 +73,7 @@ class TestDirectoryComponent(ComponentTestBaseWithoutClient):
                 "recursive": recursive,
                 "silent_errors": silent_errors,
                 "use_multithreading": use_multithreading,
+                "skip_unchanged_files": False,
                 "types": ["py"],  # Add file types without dots
             }
         )
@@ -83,6 +92,7 @@ class TestDirectoryComponent(ComponentTestBaseWithoutClient):
             mock_retrieve_file_paths.return_value,
             max_concurrency=max_concurrency,
             silent_errors=silent_errors,
+            use_processes=False,
         )
 
     def test_directory_without_mocks(self):
@@ -376,3 +386,37 @@ class TestDirectoryComponent(ComponentTestBaseWithoutClient):
             actual_texts = [r.text for r in results]
             expected_texts = ["content1", "content2"]
             assert actual_texts == expected_texts, f"Expected texts {expected_texts}, got {actual_texts}"
+
+    def test_directory_skips_unchanged_files(self, tmp_path):
+        """Only files that changed since the previous run are parsed again."""
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        for i in range(3):
+            (docs / f"doc{i}.txt").write_text(f"content{i}", encoding="utf-8")
+
+        def load():
+            component = DirectoryComponent()
+            component.set_attributes({"path": str(docs), "types": ["txt"], "silent_errors": False})
+            return sorted(result.text for result in component.load_directory())
+
+        assert load() == ["content0", "content1", "content2"]
+
+        (docs / "doc1.txt").write_text("changed", encoding="utf-8")
+        with patch(
+            "langflow.components.data.directory.parse_text_file_to_data", wraps=parse_text_file_to_data
+        ) as mock_parse:
+            assert load() == ["changed", "content0", "content2"]
+        assert [call.args[0] for call in mock_parse.call_args_list] == [str(docs / "doc1.txt")]
+
+    def test_directory_multithreading_uses_processes_for_cpu_bound_files(self, tmp_path):
+        (tmp_path / "doc.txt").write_text("content", encoding="utf-8")
+        (tmp_path / "doc.pdf").write_bytes(b"%PDF-1.4")
+
+        with patch("langflow.components.data.directory.parallel_load_data", return_value=[None, None]) as mock_load:
+            component = DirectoryComponent()
+            component.set_attributes(
+                {"path": str(tmp_path), "types": ["txt", "pdf"], "use_multithreading": True, "silent_errors": True}
+            )
+            assert component.load_directory() == []
+
+        assert mock_load.call_args.kwargs["use_processes"] is True
@@ -1,6 +1,8 @@
+import asyncio
 import re
 
 import pytest
+from langflow.components.helpers import batch_run
 from langflow.components.helpers.batch_run import BatchRunComponent
 from langflow.schema import DataFrame
 
@@ -102,7 +104,7 @@ class TestBatchRunComponent(ComponentTestBaseWithoutClient):
             def with_config(self, *_, **__):
                 return self
 
-            async def abatch(self, *_):
+            async def abatch(self, *_, **__):
                 msg = "Mock error during batch processing"
                 raise AttributeError(msg)
 
@@ -111,19 +113,20 @@ class TestBatchRunComponent(ComponentTestBaseWithoutClient):
             df=DataFrame({"text": ["test1", "test2"]}),
             column_name="text",
             enable_metadata=True,
+            max_retries=0,
         )
 
         result = await component.run_batch()
         assert isinstance(result, DataFrame)
-        assert len(result) == 1  # Component returns a single error row
-        error_row = result.iloc[0]
-        # Verify error metadata
-        assert error_row["metadata"]["processing_status"] == "failed"
-        assert "Mock error during batch processing" in error_row["metadata"]["error"]
-        # Verify base row structure
-        assert error_row["text"] == ""
-        assert error_row["model_response"] == ""
-        assert error_row["batch_index"] == -1
+        assert len(result) == 2  # Errors are captured per row
+        for idx, error_row in result.iterrows():
+            # Verify error metadata
+            assert error_row["metadata"]["processing_status"] == "failed"
+            assert "Mock error during batch processing" in error_row["metadata"]["error"]
+            # Verify the original row is kept
+            assert error_row["text"] == f"test{idx + 1}"
+            assert error_row["model_response"] == ""
+            assert error_row["batch_index"] == idx
 
     async def test_operational_error_without_metadata(self):
         # Create a mock model that raises an AttributeError during processing
@@ -131,7 +134,7 @@ class TestBatchRunComponent(ComponentTestBaseWithoutClient):
             def with_config(self, *_, **__):
                 return self
 
-            async def abatch(self, *_):
+            async def abatch(self, *_, **__):
                 msg = "Mock error during batch processing"
                 raise AttributeError(msg)
 
@@ -140,18 +143,144 @@ class TestBatchRunComponent(ComponentTestBaseWithoutClient):
             df=DataFrame({"text": ["test1", "test2"]}),
             column_name="text",
             enable_metadata=False,
+            max_retries=0,
         )
 
         result = await component.run_batch()
         assert isinstance(result, DataFrame)
-        assert len(result) == 1  # Component returns a single error row
-        error_row = result.iloc[0]
+        assert len(result) == 2  # Errors are captured per row
         # Verify no metadata
-        assert "metadata" not in error_row
-        # Verify base row structure
-        assert error_row["text"] == ""
-        assert error_row["model_response"] == ""
-        assert error_row["batch_index"] == -1
+        assert "metadata" not in result.columns
+        assert result["text"].tolist() == ["test1", "test2"]
+        assert result["model_response"].tolist() == ["", ""]
+        assert result["batch_index"].tolist() == [0, 1]
+
+    async def test_chunked_run_reports_each_chunk(self):
+        calls = []
+
+        class RecordingModel(MockLanguageModel):
+            async def abatch(self, messages, *args, **kwargs):
+                calls.append((len(messages), kwargs.get("config")))
+                return await super().abatch(messages, *args, **kwargs)
+
+        component = BatchRunComponent(
+            model=RecordingModel(),
+            df=DataFrame({"text": [f"row {i}" for i in range(5)]}),
+            column_name="text",
+            chunk_size=2,
+            max_concurrency=3,
+        )
+
+        result = await component.run_batch()
+
+        assert result["batch_index"].tolist() == [0, 1, 2, 3, 4]
+        assert result["model_response"].tolist() == [f"Response for row {i}" for i in range(5)]
+        assert calls == [(2, {"max_concurrency": 3}), (2, {"max_concurrency": 3}), (1, {"max_concurrency": 3})]
+        assert [log.name for log in component._logs] == ["Chunk 1/3", "Chunk 2/3", "Chunk 3/3"]
+
+    async def test_failed_rows_are_retried(self, monkeypatch):
+        monkeypatch.setattr(batch_run, "RETRY_BACKOFF_SECONDS", 0)
+        attempts: dict[str, int] = {}
+
+        class FlakyModel(MockLanguageModel):
+            async def abatch(self, messages, *args, **kwargs):
+                responses = await super().abatch(messages, *args, **kwargs)
+                results = []
+                for message, response in zip(messages, responses, strict=True):
+                    content = message[-1]["content"]
+                    attempts[content] = attempts.get(content, 0) + 1
+                    failing = content == "always" or (content == "flaky" and attempts[content] == 1)
+                    results.append(ValueError(f"{content} failed") if failing else response)
+                return results
+
+        component = BatchRunComponent(
+            model=FlakyModel(),
+            df=DataFrame({"text": ["ok", "flaky", "always"]}),
+            column_name="text",
+            enable_metadata=True,
+            max_retries=2,
+        )
+
+        result = await component.run_batch()
+
+        assert attempts == {"ok": 1, "flaky": 2, "always": 3}
+        assert result["model_response"].tolist() == ["Response for ok", "Response for flaky", ""]
+        assert result["metadata"].iloc[2] == {"error": "always failed", "processing_status": "failed"}
+
+    async def test_resume_from_completed_chunks(self):
+        texts = DataFrame({"text": ["a", "b", "c", "d"]})
+        interrupted = True
+        seen = []
+
+        class InterruptedModel(MockLanguageModel):
+            async def abatch(self, messages, *args, **kwargs):
+                if interrupted and messages[0][-1]["content"] == "c":
+                    raise asyncio.CancelledError
+                seen.extend(message[-1]["content"] for message in messages)
+                return await super().abatch(messages, *args, **kwargs)
+
+        component = BatchRunComponent(
+            model=InterruptedModel(), df=texts, column_name="text", chunk_size=2, _id="BatchRun-resume"
+        )
+        with pytest.raises(asyncio.CancelledError):
+            await component.run_batch()
+
+        interrupted = False
+        seen.clear()
+        component = BatchRunComponent(
+            model=InterruptedModel(), df=texts, column_name="text", chunk_size=2, _id="BatchRun-resume"
+        )
+        result = await component.run_batch()
+
+        assert seen == ["c", "d"]
+        assert result["model_response"].tolist() == [f"Response for {text}" for text in "abcd"]
+
+    @pytest.mark.parametrize(
+        ("resumed_model_name", "resumed_class"),
+        [("model-b", "same"), ("model-a", "other")],
+        ids=["model_config", "model_class"],
+    )
+    async def test_changed_model_does_not_resume(self, resumed_model_name, resumed_class):
+        texts = DataFrame({"text": ["a", "b", "c", "d"]})
+        interrupted = True
+        seen = []
+
+        class NamedModel(MockLanguageModel):
+            model_name: str = "model-a"
+
+            @property
+            def _identifying_params(self):
+                return {"model_name": self.model_name}
+
+            async def abatch(self, messages, *args, **kwargs):
+                if interrupted and messages[0][-1]["content"] == "c":
+                    raise asyncio.CancelledError
+                seen.extend(message[-1]["content"] for message in messages)
+                return await super().abatch(messages, *args, **kwargs)
+
+        class OtherModel(NamedModel):
+            pass
+
+        component = BatchRunComponent(
+            model=NamedModel(), df=texts, column_name="text", chunk_size=2, _id="BatchRun-changed"
+        )
+        with pytest.raises(asyncio.CancelledError):
+            await component.run_batch()
+
+        interrupted = False
+        seen.clear()
+        model_class = NamedModel if resumed_class == "same" else OtherModel
+        component = BatchRunComponent(
+            model=model_class(model_name=resumed_model_name),
+            df=texts,
+            column_name="text",
+            chunk_size=2,
+            _id="BatchRun-changed",
+        )
+        await component.run_batch()
+
+        # The responses of the first model are not reused
+        assert seen == ["a", "b", "c", "d"]
 
     def test_create_base_row(self):
         component = BatchRunComponent()
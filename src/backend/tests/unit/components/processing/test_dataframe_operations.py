@@ -58,6 +58,18 @@ def test_operations(sample_dataframe, operation, expected_columns, expected_valu
         assert list(result.iloc[0]) == expected_values
 
 
+def test_filter_compares_typed_values():
+    component = DataFrameOperationsComponent()
+    component.df = pd.DataFrame({"A": [1, "1", 2]})
+    component.operation = "Filter"
+    component.column_name = "A"
+    component.filter_value = 1
+
+    result = component.perform_operation()
+
+    assert list(result["A"]) == [1]
+
+
 def test_empty_dataframe():
     component = DataFrameOperationsComponent()
     component.df = pd.DataFrame()
@@ -204,11 +204,11 @@ class TestMCPSseClient:
         test_url = "http://test.url"
         redirect_url = "http://redirect.url"
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("langflow.services.http_client.service.HttpClientService.request") as mock_request:
             mock_response = MagicMock()
             mock_response.status_code = 307
             mock_response.headers.get.return_value = redirect_url
-            mock_client.return_value.__aenter__.return_value.request.return_value = mock_response
+            mock_request.return_value = mock_response
 
             result = await sse_client.pre_check_redirect(test_url)
             assert result == redirect_url
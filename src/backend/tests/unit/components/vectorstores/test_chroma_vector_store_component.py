@@ -217,7 +217,7 @@ class TestChromaVectorStoreComponent(ComponentTestBaseWithoutClient):
         documents = results["documents"]
 
         # The documents are returned in a list structure
-        assert len(documents) == 3  # All documents are added, even duplicates
+        assert len(documents) == 2  # Duplicates within the ingested data are dropped too
 
         # Count unique texts
         unique_texts = set(documents)
@@ -0,0 +1,69 @@
+from langflow.components.inputs.chat import ChatInput
+from langflow.custom.custom_component.component import Component
+from langflow.custom.custom_component.component_template import COMPONENT_TEMPLATES, TemplateCopies
+from langflow.io import MessageTextInput, Output
+from langflow.schema.message import Message
+
+
+class TemplatedComponent(Component):
+    inputs = [MessageTextInput(name="text", required=True)]
+    outputs = [Output(name="message", method="build_message")]
+
+    def build_message(self) -> Message:
+        return Message(text=self.text)
+
+
+def test_template_is_built_once_per_class():
+    first = TemplatedComponent()
+    template = COMPONENT_TEMPLATES[TemplatedComponent]
+    second = TemplatedComponent()
+
+    assert COMPONENT_TEMPLATES[TemplatedComponent] is template
+    assert first._code == second._code == template.code
+    assert second._outputs_map["message"].types == ["Message"]
+    assert TemplatedComponent.outputs[0].required_inputs == ["text"]
+
+
+def test_instances_change_their_own_copies():
+    first = TemplatedComponent(text="first")
+    second = TemplatedComponent()
+    first.set_on_output("message", cache=False)
+    first.set_output_value("message", "value")
+
+    template = COMPONENT_TEMPLATES[TemplatedComponent]
+    assert first.text == "first"
+    assert second.text == ""
+    assert template.inputs["text"].value == ""
+    assert second._outputs_map["message"].cache is True
+    assert template.outputs["message"].cache is True
+    assert first._inputs["text"] is not template.inputs["text"]
+
+
+def test_template_is_rebuilt_when_the_class_changes():
+    class ChangedComponent(TemplatedComponent):
+        pass
+
+    ChangedComponent()
+    ChangedComponent.inputs = [*TemplatedComponent.inputs, MessageTextInput(name="extra")]
+
+    assert list(ChangedComponent()._inputs) == ["text", "extra"]
+
+
+def test_template_copies_only_copy_what_is_used():
+    prototypes = {"a": [1], "b": [2]}
+    copies = TemplateCopies(prototypes)
+
+    assert "a" in copies
+    assert list(copies) == ["a", "b"]
+    copies["a"].append(3)
+
+    assert prototypes == {"a": [1], "b": [2]}
+    assert copies._items["b"] is prototypes["b"]
+    assert dict(copies) == {"a": [1, 3], "b": [2]}
+
+
+def test_to_frontend_node_lists_the_inputs_and_outputs():
+    node = ChatInput().to_frontend_node()["data"]["node"]
+
+    assert "input_value" in node["template"]
+    assert [output["name"] for output in node["outputs"]] == ["message"]
@@ -64,3 +64,54 @@ class TestDataFrameSchema:
 
         non_empty_df = DataFrame({"name": ["John"], "text": ["name is John"]})
         assert bool(non_empty_df)
+
+    def test_format_rows(self):
+        """Test rendering a template for every row."""
+        data_frame = DataFrame(
+            {
+                "name": ["John", None],
+                "age": [30, float("nan")],
+                "born": pd.to_datetime(["2023-01-01", "2023-01-02"]),
+            }
+        )
+        expected = ["{name} is {age} ({born})".format(**row) for row in data_frame.to_dict(orient="records")]
+        assert data_frame.format_rows("{name} is {age} ({born})") == expected
+        assert data_frame.format_rows("{{literal}} {name}") == ["{literal} John", "{literal} None"]
+        # Templates with format specs fall back to str.format
+        assert data_frame.format_rows("{age:.0f}") == ["30", "nan"]
+        assert DataFrame({"text": []}).format_rows("{text}") == []
+
+    def test_format_rows_missing_column(self):
+        """Test that unknown template keys raise like str.format."""
+        with pytest.raises(KeyError):
+            DataFrame({"text": ["Hello"]}).format_rows("{missing}")
+
+    @pytest.mark.parametrize(
+        ("operator", "value", "expected"),
+        [
+            ("equals", "2", [2]),
+            ("not equals", "2", [1, 12, 20]),
+            ("contains", "2", [2, 12, 20]),
+            ("starts with", "2", [2, 20]),
+            ("ends with", "2", [2, 12]),
+        ],
+    )
+    def test_filter_rows(self, operator, value, expected):
+        """Test column-wise filtering."""
+        data_frame = DataFrame({"number": [1, 2, 12, 20]})
+        filtered = data_frame.filter_rows("number", value, operator)
+        assert isinstance(filtered, DataFrame)
+        assert filtered["number"].tolist() == expected
+
+    @pytest.mark.benchmark
+    def test_format_rows_large_dataframe(self):
+        """Render and convert a 1M-row frame."""
+        size = 1_000_000
+        data_frame = DataFrame({"id": range(size), "text": ["row"] * size})
+
+        lines = data_frame.format_rows("{id}: {text}")
+        assert len(lines) == size
+        assert lines[-1] == f"{size - 1}: row"
+
+        filtered = data_frame.filter_rows("id", "99", "ends with")
+        assert len(filtered) == size // 100
@@ -1,13 +1,15 @@
 import math
 from datetime import datetime, timezone
+from enum import Enum
 from typing import Any
 
 import numpy as np
 import pandas as pd
+import pytest
 from hypothesis import given, settings
 from hypothesis import strategies as st
 from langchain_core.documents import Document
-from langflow.serialization.constants import MAX_ITEMS_LENGTH, MAX_TEXT_LENGTH
+from langflow.serialization.constants import MAX_DEPTH, MAX_ITEMS_LENGTH, MAX_TEXT_LENGTH
 from langflow.serialization.serialization import serialize, serialize_or_str
 from pydantic import BaseModel as PydanticBaseModel
 from pydantic.v1 import BaseModel as PydanticV1BaseModel
@@ -342,3 +344,78 @@ class TestSerializationHypothesis:
         assert isinstance(result, dict)
         assert len(result) == MAX_ITEMS_LENGTH
         assert all(isinstance(v, int) for v in result.values())
+
+
+class TestSerializationBudget:
+    """Truncation before conversion, the depth budget and the dispatch cache."""
+
+    def test_dict_truncation(self) -> None:
+        dct = {f"key_{i}": i for i in range(MAX_ITEMS_LENGTH + 10)}
+        result = serialize(dct, max_items=MAX_ITEMS_LENGTH)
+        assert len(result) == MAX_ITEMS_LENGTH + 1
+        assert result["key_0"] == 0
+        assert f"key_{MAX_ITEMS_LENGTH}" not in result
+        assert result["..."] == "[truncated 10 items]"
+
+    def test_tuple_truncation(self) -> None:
+        result = serialize(tuple(range(5)), max_items=2)
+        assert result == [0, 1, "... [truncated 3 items]"]
+
+    def test_truncated_items_are_not_serialized(self) -> None:
+        class Counted:
+            serialized = 0
+
+            def __str__(self) -> str:
+                Counted.serialized += 1
+                return "counted"
+
+        serialize([Counted() for _ in range(1000)], max_items=10)
+        assert Counted.serialized == 10
+
+    def test_wide_dataframe_truncation(self) -> None:
+        wide_df = pd.DataFrame([range(MAX_ITEMS_LENGTH + 10)] * 3)
+        result = serialize(wide_df, max_items=MAX_ITEMS_LENGTH)
+        assert len(result) == 3
+        assert all(len(row) == MAX_ITEMS_LENGTH for row in result)
+
+    def test_max_depth(self) -> None:
+        nested: Any = "leaf"
+        for _ in range(5):
+            nested = {"child": [nested]}
+        assert serialize(nested, max_depth=None) == nested
+        assert serialize(nested, max_depth=3) == {"child": [{"child": ["... [max depth reached]"]}]}
+
+    def test_deep_nesting_uses_the_default_depth(self) -> None:
+        nested: Any = []
+        for _ in range(2000):
+            nested = [nested]
+        result = serialize(nested)
+        for _ in range(MAX_DEPTH + 1):
+            result = result[0]
+        assert result == "... [max depth reached]"
+
+    def test_subclasses_use_the_first_matching_serializer(self) -> None:
+        class StrEnum(str, Enum):
+            A = "a"
+
+        class IntList(list):
+            pass
+
+        assert serialize(StrEnum.A) == StrEnum.A
+        assert serialize(IntList([1, 2, 3]), max_items=2) == [1, 2, "... [truncated 1 items]"]
+        # Resolved from the cache the second time
+        assert serialize(IntList([4])) == [4]
+
+    @pytest.mark.benchmark
+    def test_serialize_large_outputs(self) -> None:
+        """Serialize outputs much larger than the limits."""
+        text = "x" * 10_000_000
+        rows = [{"id": i, "text": "row " * 1000} for i in range(100_000)]
+        data_frame = pd.DataFrame({"id": range(1_000_000), "text": ["row"] * 1_000_000})
+
+        result = serialize_or_str({"text": text, "rows": rows, "frame": data_frame, "bytes": text.encode()})
+
+        assert len(result["text"]) == MAX_TEXT_LENGTH + 3
+        assert len(result["rows"]) == MAX_ITEMS_LENGTH + 1
+        assert len(result["frame"]) == MAX_ITEMS_LENGTH
+        assert len(result["bytes"]) == MAX_TEXT_LENGTH + 3
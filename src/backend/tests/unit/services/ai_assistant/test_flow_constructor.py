@@ -26,6 +26,7 @@ def knowledge_base_mock():
         }
     
     knowledge_base.get_component_info = AsyncMock(side_effect=get_component_info)
+    knowledge_base.get_compatible_fields = AsyncMock(return_value=[])
     
     return knowledge_base
 
@@ -186,3 +187,16 @@ async def test_position_nodes(knowledge_base_mock):
     # Check that the nodes have different positions
     positions = [node.position for node in nodes]
     assert len(set(tuple(pos.values()) for pos in positions)) == len(nodes)
+
+
+@pytest.mark.asyncio
+async def test_create_connections_uses_compatible_field(knowledge_base_mock, parsed_instruction):
+    """Test that an incompatible target field is replaced by one from the type index."""
+    knowledge_base_mock.get_compatible_fields = AsyncMock(return_value=["input_value"])
+    flow_constructor = FlowConstructor(knowledge_base_mock)
+
+    nodes = await flow_constructor._select_components(parsed_instruction.components)
+    edges = await flow_constructor._create_connections(parsed_instruction.connections, nodes)
+
+    assert all(edge.data["targetHandle"]["fieldName"] == "input_value" for edge in edges)
+    knowledge_base_mock.get_compatible_fields.assert_any_call(["str"], "chains", "llm_chain")
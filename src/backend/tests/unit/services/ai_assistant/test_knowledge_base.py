@@ -1,8 +1,10 @@
 """Tests for the ComponentKnowledgeBase class."""
 
 import pytest
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from langflow.interface.components import component_cache, get_and_cache_all_types_dict
 from langflow.services.ai_assistant.knowledge_base import ComponentKnowledgeBase
 
 
@@ -71,6 +73,37 @@ async def test_build_from_registry(knowledge_base, mock_settings_service):
     assert "prompt" in knowledge_base.categories["prompts"]
 
 
+@pytest.mark.asyncio
+async def test_build_from_registry_includes_bundle_components(knowledge_base, mock_settings_service, monkeypatch):
+    """Test that the knowledge base reuses the types cached at startup, bundles included."""
+    loaded_paths = []
+
+    async def load_components(components_paths):
+        loaded_paths.append(list(components_paths))
+        return {
+            "components": {
+                Path(path).name: {f"{Path(path).name}_component": {"display_name": Path(path).name, "template": {}}}
+                for path in components_paths
+            }
+        }
+
+    monkeypatch.setattr("langflow.interface.components.aget_all_types_dict", load_components)
+    monkeypatch.setattr(component_cache, "all_types_dict", None)
+    monkeypatch.setattr(component_cache, "input_type_index", None)
+    mock_settings_service.settings.lazy_load_components = False
+
+    # As the server's lifespan does: bundles are added to the components path, then the types are cached
+    mock_settings_service.settings.components_path.append("/bundles/acme")
+    await get_and_cache_all_types_dict(mock_settings_service)
+
+    await knowledge_base.build_from_registry(mock_settings_service)
+
+    assert "acme_component" in knowledge_base.components["acme"]
+    assert "components_component" in knowledge_base.components["components"]
+    # The components were loaded once, at startup
+    assert loaded_paths == [["/path/to/components", "/bundles/acme"]]
+
+
 @pytest.mark.asyncio
 async def test_analyze_connection_compatibility(knowledge_base):
     """Test analyzing component connection compatibility."""
@@ -179,3 +212,72 @@ async def test_get_component_info(knowledge_base):
     # Test with non-existent component
     component_info = await knowledge_base.get_component_info("non_existent", "component")
     assert component_info == {}
+
+
+@pytest.mark.asyncio
+async def test_input_type_index(knowledge_base):
+    """Test building the inverted input type index."""
+    knowledge_base.components = {
+        "chains": {
+            "llm_chain": {
+                "template": {
+                    "inputs": {
+                        "llm": {"type": "language_model"},
+                        "prompt": {"type": "prompt"},
+                    },
+                },
+            }
+        },
+        "agents": {
+            "agent": {
+                "template": {
+                    "input_types": ["language_model"],
+                    "inputs": {
+                        "llm": {"type": "language_model"},
+                        "prompt": {"type": "prompt"},
+                    },
+                },
+            }
+        },
+    }
+
+    index = knowledge_base.build_input_type_index()
+
+    assert index["language_model"] == {"chains.llm_chain": ["llm"], "agents.agent": ["llm"]}
+    # The agent only accepts the template-level input types
+    assert index["prompt"] == {"chains.llm_chain": ["prompt"]}
+
+
+@pytest.mark.asyncio
+async def test_get_compatible_components_and_fields(knowledge_base):
+    """Test answering compatibility questions from the type index."""
+    knowledge_base.components = {
+        "llms": {
+            "openai": {
+                "display_name": "OpenAI",
+                "template": {"output_types": ["language_model"]},
+            }
+        },
+        "chains": {
+            "llm_chain": {
+                "display_name": "LLM Chain",
+                "template": {
+                    "inputs": {
+                        "llm": {"type": "language_model"},
+                        "prompt": {"type": "prompt"},
+                    },
+                },
+            }
+        },
+    }
+
+    await knowledge_base.analyze_connection_compatibility()
+
+    compatible = await knowledge_base.get_compatible_components("llms", "openai")
+    assert [component["display_name"] for component in compatible] == ["LLM Chain"]
+    assert compatible[0]["field_mappings"] == {"output": "llm"}
+    assert dict(knowledge_base.connection_graph["llms.openai"]) == {"chains.llm_chain": {"output": "llm"}}
+
+    assert await knowledge_base.get_compatible_fields(["language_model"], "chains", "llm_chain") == ["llm"]
+    assert await knowledge_base.get_compatible_fields(["prompt"], "llms", "openai") == []
+    assert await knowledge_base.get_compatible_components("chains", "llm_chain") == []
@@ -0,0 +1,44 @@
+from types import SimpleNamespace
+
+import pytest
+from langflow.services.book.pdf_generator import BookPDFGenerator
+
+
+def generate(pages, **kwargs):
+    generator = BookPDFGenerator(
+        book=SimpleNamespace(name="Journal", user_id="user", dimensions={"width": 6, "height": 9, "units": "in"}),
+        interior=SimpleNamespace(layout_settings={}),
+        pages=[SimpleNamespace(page_number=number, content=content) for number, content in enumerate(pages, start=1)],
+        **kwargs,
+    )
+    return generator, generator.generate_pdf().getvalue()
+
+
+@pytest.fixture(autouse=True)
+def uncompressed_pages(monkeypatch):
+    # So that the drawing operators can be counted
+    monkeypatch.setattr("reportlab.rl_config.pageCompression", 0)
+
+
+def test_identical_backgrounds_are_drawn_once():
+    generator, pdf = generate([{"type": "dot"}] * 10 + [{"type": "dot", "dot_spacing": 0.5}] * 10)
+
+    assert len(generator._background_forms) == 2
+    assert pdf.count(b"/Subtype /Form") == 2
+    assert pdf.count(b"/Type /Page\n") == 20
+
+
+def test_backgrounds_are_drawn_on_every_page_without_reuse():
+    _, reused = generate([{"type": "lined"}] * 10)
+    _, redrawn = generate([{"type": "lined"}] * 10, reuse_backgrounds=False)
+
+    assert b"/Subtype /Form" not in redrawn
+    # Every line of every page is in the page streams, instead of once in the form
+    assert redrawn.count(b" l S") == 10 * reused.count(b" l S")
+
+
+def test_pages_without_background():
+    generator, pdf = generate([{"type": "blank"}] * 3)
+
+    assert generator._background_forms == {}
+    assert pdf.count(b"/Type /Page\n") == 3
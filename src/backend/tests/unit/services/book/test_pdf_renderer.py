@@ -0,0 +1,129 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from langflow.services.book.export_service import BookExport, BookExportService
+from langflow.services.book.pdf_renderer import PDFRenderPool, book_export_key, book_export_snapshot
+
+
+def make_book(page_types=("lined", "grid")):
+    book_id = uuid4()
+    book = SimpleNamespace(id=book_id, name="Planner", user_id=uuid4(), dimensions={"width": 6, "height": 9})
+    interior = SimpleNamespace(id=uuid4(), template_id=None, layout_settings={"margin_top": 0.5})
+    pages = [
+        SimpleNamespace(id=uuid4(), page_number=number, template_id=None, content={"type": page_type})
+        for number, page_type in enumerate(page_types, start=1)
+    ]
+    return book, interior, pages
+
+
+def snapshot_of(book, interior, pages):
+    return book_export_snapshot(book, None, interior, pages, {})
+
+
+def test_key_depends_on_content_and_options():
+    book, interior, pages = make_book()
+    snapshot = snapshot_of(book, interior, pages)
+    key = book_export_key(snapshot, include_bleed=False, quality=300)
+
+    # New ids and a different page order don't change what is rendered
+    for page in pages:
+        page.id = uuid4()
+    assert book_export_key(snapshot_of(book, interior, pages[::-1]), include_bleed=False, quality=300) == key
+
+    assert book_export_key(snapshot, include_bleed=True, quality=300) != key
+    assert book_export_key(snapshot, include_bleed=False, quality=150) != key
+    pages[0].content = {"type": "dot"}
+    assert book_export_key(snapshot_of(book, interior, pages), include_bleed=False, quality=300) != key
+
+
+async def test_render_pool_reports_progress():
+    book, interior, pages = make_book(page_types=["lined"] * 5)
+    pool = PDFRenderPool(max_workers=1)
+    progress = []
+    try:
+        pdf = await pool.render(
+            snapshot_of(book, interior, pages), on_progress=lambda rendered, total: progress.append((rendered, total))
+        )
+    finally:
+        pool.shutdown()
+
+    assert pdf.startswith(b"%PDF")
+    assert progress
+    assert progress[-1] == (5, 5)
+
+
+class InMemoryStorage:
+    def __init__(self):
+        self.files = {}
+
+    async def save_file(self, flow_id, file_name, data):
+        self.files[flow_id, file_name] = data
+
+    async def get_file(self, flow_id, file_name):
+        try:
+            return self.files[flow_id, file_name]
+        except KeyError:
+            msg = f"File {file_name} not found in flow {flow_id}"
+            raise FileNotFoundError(msg) from None
+
+    async def list_files(self, flow_id):
+        return [file_name for folder, file_name in self.files if folder == flow_id]
+
+    async def delete_file(self, flow_id, file_name):
+        del self.files[flow_id, file_name]
+
+
+@pytest.fixture
+def storage():
+    storage = InMemoryStorage()
+    with patch("langflow.services.book.export_service.get_storage_service", return_value=storage):
+        yield storage
+
+
+def export_of(book, interior, pages):
+    snapshot = snapshot_of(book, interior, pages)
+    return BookExport(
+        key=book_export_key(snapshot, include_bleed=False, quality=300),
+        book_id=book.id,
+        book_name=book.name,
+        snapshot=snapshot,
+        include_cover=False,
+        include_bleed=False,
+        quality=300,
+    )
+
+
+async def test_rendered_pdfs_are_cached(storage):
+    book, interior, pages = make_book()
+    export = export_of(book, interior, pages)
+    service = BookExportService(session=None)
+
+    with patch("langflow.services.book.export_service.render_pool.render", AsyncMock(return_value=b"%PDF-")) as render:
+        assert await service.get_or_render_pdf(export) == b"%PDF-"
+        assert await service.get_or_render_pdf(export) == b"%PDF-"
+
+    render.assert_awaited_once()
+    assert list(storage.files) == [(f"book_exports/{book.id}", "300dpi-trim-no-cover.pdf")]
+
+
+async def test_edited_books_replace_their_cached_pdf(storage):
+    book, interior, pages = make_book()
+    export = export_of(book, interior, pages)
+    service = BookExportService(session=None)
+    renders = [b"%PDF-first", b"%PDF-edited"]
+
+    with patch("langflow.services.book.export_service.render_pool.render", AsyncMock(side_effect=renders)):
+        await service.get_or_render_pdf(export)
+        pages[0].content = {"type": "dot"}
+        edited = export_of(book, interior, pages)
+
+        # The PDF of the earlier version isn't served for the edited book, and is overwritten
+        assert await service.get_cached_pdf(edited) is None
+        assert await service.get_or_render_pdf(edited) == b"%PDF-edited"
+        assert await service.get_cached_pdf(export) is None
+    assert len(storage.files) == 1
+
+    await BookExportService.delete_cached_pdfs(book.id)
+    assert storage.files == {}
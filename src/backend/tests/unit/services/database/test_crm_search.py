@@ -0,0 +1,79 @@
+from uuid import uuid4
+
+import pytest
+from langflow.services.database.models.crm.search import (
+    CRMSearchDocument,
+    LikeSearchBackend,
+    SQLiteSearchBackend,
+    search_tokens,
+)
+from sqlalchemy import create_engine, delete, insert, update
+
+WORKSPACE_ID, OTHER_WORKSPACE_ID = uuid4(), uuid4()
+documents = CRMSearchDocument.__table__
+
+
+@pytest.fixture
+def connection():
+    engine = create_engine("sqlite://")
+    # Creating the table also creates its FTS5 index and the triggers that maintain it
+    documents.create(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(documents),
+            [
+                {
+                    "workspace_id": WORKSPACE_ID,
+                    "entity_type": "client",
+                    "entity_id": uuid4(),
+                    "title": "Acme Widgets",
+                    "body": "acme.com",
+                },
+                {
+                    "workspace_id": WORKSPACE_ID,
+                    "entity_type": "product",
+                    "entity_id": uuid4(),
+                    "title": "Blue bolt",
+                    "body": "BB-1 Fits every acme widget",
+                },
+                {
+                    "workspace_id": OTHER_WORKSPACE_ID,
+                    "entity_type": "client",
+                    "entity_id": uuid4(),
+                    "title": "Widget World",
+                    "body": "",
+                },
+            ],
+        )
+        yield connection
+    engine.dispose()
+
+
+def titles(results):
+    return [result["title"] for result in results]
+
+
+@pytest.mark.parametrize("backend", [SQLiteSearchBackend(), LikeSearchBackend()])
+def test_search(connection, backend):
+    # The last word is a prefix, and matches in titles rank first
+    assert titles(backend.search(connection, "acme widg", [WORKSPACE_ID])) == ["Acme Widgets", "Blue bolt"]
+    assert titles(backend.search(connection, "widget", [WORKSPACE_ID], entity_types=["client"])) == ["Acme Widgets"]
+    assert titles(backend.search(connection, "world", [WORKSPACE_ID])) == []
+    assert len(backend.search(connection, "widget", [WORKSPACE_ID, OTHER_WORKSPACE_ID])) == 3
+    assert backend.search(connection, "widget", []) == []
+
+
+def test_index_follows_changes(connection):
+    backend = SQLiteSearchBackend()
+    connection.execute(update(documents).where(documents.c.title == "Blue bolt").values(title="Red bolt"))
+    assert titles(backend.search(connection, "red", [WORKSPACE_ID])) == ["Red bolt"]
+    assert backend.search(connection, "blue", [WORKSPACE_ID]) == []
+
+    connection.execute(delete(documents).where(documents.c.title == "Red bolt"))
+    assert backend.search(connection, "bolt", [WORKSPACE_ID]) == []
+
+
+def test_queries_are_not_parsed_as_operators(connection):
+    assert search_tokens('"Acme" OR NEAR(x*) -bb') == ["acme", "or", "near", "x", "bb"]
+    assert SQLiteSearchBackend().search(connection, 'acme" OR "', [WORKSPACE_ID]) == []
+    assert titles(SQLiteSearchBackend().search(connection, "bb-1", [WORKSPACE_ID])) == ["Blue bolt"]
@@ -0,0 +1,136 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from langflow.memory import aadd_messagetables
+from langflow.services.database.models.message.model import MessageTable
+from langflow.services.database.models.message.window import MessageWindows
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+FLOW_ID = uuid4()
+
+
+def message(session_id, minute, sender="User", *, error=False):
+    return MessageTable(
+        text=f"{session_id} {minute}",
+        sender=sender,
+        sender_name=sender,
+        session_id=session_id,
+        flow_id=FLOW_ID,
+        timestamp=START + timedelta(minutes=minute),
+        error=error,
+        files=[],
+    )
+
+
+def texts(rows):
+    return [row["text"] for row in rows]
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(MessageTable.__table__.create)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def windows():
+    windows = MessageWindows(size=3)
+    yield windows
+    windows.close()
+
+
+async def test_window_keeps_the_most_recent_messages(engine, windows):
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        await aadd_messagetables([message("a", minute) for minute in range(5)], session)
+        await windows.load(session, "a")
+
+        # A new message is written through to the window, dropping the oldest
+        await aadd_messagetables([message("a", 5, sender="Machine"), message("a", 6, error=True)], session)
+
+    assert texts(windows.find("a", limit=3)) == ["a 5", "a 4", "a 3"]
+    assert texts(windows.find("a", sender="Machine", limit=1)) == ["a 5"]
+    # Older messages might be missing from the window, so those are read from the database
+    assert windows.find("a") is None
+    assert windows.find("a", order="ASC", limit=3) is None
+    assert windows.find("b") is None
+
+
+async def test_complete_window_answers_every_query(engine, windows):
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        await aadd_messagetables([message("a", 1), message("a", 0, sender="Machine")], session)
+        await windows.load(session, "a")
+
+    assert texts(windows.find("a", order="ASC")) == ["a 0", "a 1"]
+    assert texts(windows.find("a", sender="User")) == ["a 1"]
+    assert windows.find("a", flow_id=str(uuid4())) == []
+
+
+async def test_changed_messages_drop_their_windows(engine, windows):
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        stored = [message("a", 0), message("b", 0)]
+        await aadd_messagetables(stored, session)
+        for session_id in ("a", "b"):
+            await windows.load(session, session_id)
+
+        first = await session.get(MessageTable, stored[0].id)
+        first.text = "edited"
+        await session.commit()
+        assert windows.find("a") is None
+        assert texts(windows.find("b")) == ["b 0"]
+
+        await session.exec(delete(MessageTable).where(MessageTable.session_id == "b"))
+        await session.commit()
+        assert windows.find("b") is None
+
+
+async def test_rolled_back_messages_are_not_added(engine, windows):
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        await windows.load(session, "a")
+        session.add(message("a", 0))
+        await session.flush()
+        await session.rollback()
+
+    assert windows.find("a") == []
+
+
+async def test_closed_windows_stop_following_changes(engine):
+    windows = MessageWindows(size=3)
+    windows.close()
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        await windows.load(session, "a")
+        await aadd_messagetables([message("a", 0)], session)
+
+    assert windows.find("a") == []
+
+
+async def test_expired_windows_are_read_again(engine, monkeypatch):
+    windows = MessageWindows(size=3, ttl=10)
+    now = 1000.0
+    monkeypatch.setattr("langflow.services.database.models.message.window.time.monotonic", lambda: now)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            await windows.load(session, "a")
+            assert windows.find("a") == []
+
+            # Written by another process, so the window doesn't see it
+            written = message("a", 0)
+            async with engine.begin() as conn:
+                await conn.execute(
+                    insert(MessageTable.__table__),
+                    {column.name: getattr(written, column.name) for column in MessageTable.__table__.columns},
+                )
+            assert windows.find("a") == []
+            now += 11
+            assert windows.find("a") is None
+
+            await windows.load(session, "a")
+            assert texts(windows.find("a")) == ["a 0"]
+    finally:
+        windows.close()
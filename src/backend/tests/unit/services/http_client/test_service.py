@@ -0,0 +1,103 @@
+import httpx
+import pytest
+import respx
+from httpx import Response
+from langflow.services.deps import get_settings_service
+from langflow.services.http_client.service import HttpClientService, ResponseTooLargeError
+
+URL = "https://example.com/api"
+
+
+@pytest.fixture
+async def service(monkeypatch):
+    monkeypatch.setattr("langflow.services.http_client.service.RETRY_BACKOFF_SECONDS", 0)
+    service = HttpClientService(get_settings_service())
+    yield service
+    await service.teardown()
+
+
+@respx.mock
+async def test_does_not_keep_cookies(service):
+    route = respx.get(URL).mock(return_value=Response(200, headers={"Set-Cookie": "session=abc"}))
+
+    await service.get(URL)
+    await service.get(URL)
+
+    assert "cookie" not in route.calls.last.request.headers
+
+
+@respx.mock
+async def test_clients_share_connections_but_not_state(service):
+    respx.get(URL).mock(return_value=Response(200))
+
+    async with service.get_client() as client:
+        client.cookies.set("session", "abc")
+        assert (await client.get(URL)).status_code == 200
+    other = service.get_client()
+
+    assert other is not client
+    assert not other.cookies
+    # Closing a client leaves the pooled connections open for the others
+    assert (await other.get(URL)).status_code == 200
+    assert service.get_metrics()["clients"] == 1
+
+
+@respx.mock
+async def test_retries_transient_failures(service):
+    route = respx.get(URL).mock(
+        side_effect=[httpx.ConnectError("refused"), Response(503), Response(200, json={"ok": True})]
+    )
+
+    response = await service.get(URL, max_retries=2)
+
+    assert response.json() == {"ok": True}
+    assert route.call_count == 3
+    metrics = service.get_metrics()
+    assert (metrics["requests"], metrics["retries"], metrics["errors"]) == (3, 2, 0)
+
+
+@respx.mock
+async def test_does_not_retry_non_idempotent_requests(service):
+    route = respx.post(URL).mock(side_effect=[Response(503), Response(200)])
+
+    response = await service.post(URL, json={}, max_retries=2)
+
+    assert response.status_code == 503
+    assert route.call_count == 1
+
+
+@respx.mock
+async def test_gives_up_after_max_retries(service):
+    respx.get(URL).mock(side_effect=httpx.ReadTimeout("timed out"))
+
+    with pytest.raises(httpx.ReadTimeout):
+        await service.get(URL, max_retries=1)
+
+    assert service.get_metrics()["errors"] == 1
+
+
+@respx.mock
+async def test_caps_response_size(service):
+    respx.get(URL).mock(return_value=Response(200, content=b"x" * 100))
+
+    assert (await service.get(URL, max_response_size=100)).content == b"x" * 100
+    with pytest.raises(ResponseTooLargeError):
+        await service.get(URL, max_response_size=99)
+
+    assert service.get_metrics()["responses_too_large"] == 1
+
+
+async def test_routes_requests_through_environment_proxies(service, monkeypatch):
+    for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.lower(), raising=False)
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example.com:3128")
+    monkeypatch.setenv("NO_PROXY", "internal.example.com")
+
+    async with service.get_client():
+        pass
+    pools = service._loop_client()
+
+    assert pools.transport_for(httpx.URL(URL)) is pools.proxy_transports["https"]
+    assert pools.transport_for(httpx.URL("https://internal.example.com")) is pools.transport
+    assert pools.transport_for(httpx.URL("http://example.com")) is pools.transport
@@ -0,0 +1,111 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langflow.services.storage import s3
+from langflow.services.storage.local import LocalStorageService
+from langflow.services.storage.s3 import S3StorageService
+
+CONTENT = bytes(range(256)) * 40
+
+
+async def chunks(data, size):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def read(stream):
+    return b"".join([chunk async for chunk in stream])
+
+
+@pytest.fixture
+def local_storage(tmp_path):
+    return LocalStorageService(MagicMock(), SimpleNamespace(settings=SimpleNamespace(config_dir=tmp_path)))
+
+
+async def test_local_storage_streams_files_and_ranges(local_storage):
+    assert await local_storage.save_file_stream("flow", "data.bin", chunks(CONTENT, 1000)) == len(CONTENT)
+
+    assert await local_storage.get_file("flow", "data.bin") == CONTENT
+    assert await read(local_storage.get_file_stream("flow", "data.bin", chunk_size=777)) == CONTENT
+    assert (
+        await read(local_storage.get_file_stream("flow", "data.bin", start=100, end=5000, chunk_size=777))
+        == (CONTENT[100:5001])
+    )
+    assert await read(local_storage.get_file_stream("flow", "data.bin", start=10_000)) == CONTENT[10_000:]
+    assert local_storage.get_local_path("flow", "data.bin").endswith("data.bin")
+    with pytest.raises(FileNotFoundError):
+        await read(local_storage.get_file_stream("flow", "missing.bin"))
+
+
+async def test_local_storage_leaves_no_partial_file_on_failure(local_storage):
+    async def failing_chunks():
+        yield b"partial"
+        msg = "connection lost"
+        raise ConnectionError(msg)
+
+    with pytest.raises(ConnectionError):
+        await local_storage.save_file_stream("flow", "data.bin", failing_chunks())
+
+    assert await local_storage.list_files("flow") == []
+
+
+@pytest.fixture
+def s3_storage(tmp_path):
+    with patch.object(s3.boto3, "client") as client:
+        storage = S3StorageService(MagicMock(), SimpleNamespace(settings=SimpleNamespace(config_dir=str(tmp_path))))
+    client = storage.s3_client
+    client.create_multipart_upload.return_value = {"UploadId": "upload"}
+    client.upload_part.side_effect = lambda **kwargs: {"ETag": f"etag{kwargs['PartNumber']}"}
+    return storage
+
+
+async def test_s3_uploads_large_files_in_parts(s3_storage, monkeypatch):
+    monkeypatch.setattr(s3, "MULTIPART_PART_SIZE", 4000)
+    client = s3_storage.s3_client
+
+    assert await s3_storage.save_file_stream("folder", "data.bin", chunks(CONTENT, 1500)) == len(CONTENT)
+
+    parts = [call.kwargs["Body"] for call in client.upload_part.call_args_list]
+    assert [len(part) for part in parts] == [4000, 4000, 2240]
+    assert b"".join(parts) == CONTENT
+    client.complete_multipart_upload.assert_called_once_with(
+        Bucket="langflow",
+        Key="folder/data.bin",
+        UploadId="upload",
+        MultipartUpload={"Parts": [{"ETag": f"etag{number}", "PartNumber": number} for number in (1, 2, 3)]},
+    )
+    client.put_object.assert_not_called()
+
+
+async def test_s3_saves_small_files_in_one_request(s3_storage):
+    client = s3_storage.s3_client
+
+    await s3_storage.save_file_stream("folder", "small.bin", chunks(b"small", 2))
+
+    client.put_object.assert_called_once_with(Bucket="langflow", Key="folder/small.bin", Body=b"small")
+    client.create_multipart_upload.assert_not_called()
+
+
+async def test_s3_aborts_failed_uploads(s3_storage, monkeypatch):
+    monkeypatch.setattr(s3, "MULTIPART_PART_SIZE", 4000)
+    client = s3_storage.s3_client
+    client.complete_multipart_upload.side_effect = RuntimeError("failed")
+
+    with pytest.raises(RuntimeError):
+        await s3_storage.save_file_stream("folder", "data.bin", chunks(CONTENT, 1500))
+
+    client.abort_multipart_upload.assert_called_once_with(Bucket="langflow", Key="folder/data.bin", UploadId="upload")
+
+
+async def test_s3_reads_only_the_requested_range(s3_storage):
+    body = MagicMock()
+    body.read.side_effect = [b"abc", b"de", b""]
+    s3_storage.s3_client.get_object.return_value = {"Body": body}
+
+    assert await read(s3_storage.get_file_stream("folder", "data.bin", start=10, end=14)) == b"abcde"
+
+    s3_storage.s3_client.get_object.assert_called_once_with(
+        Bucket="langflow", Key="folder/data.bin", Range="bytes=10-14"
+    )
+    body.close.assert_called_once()
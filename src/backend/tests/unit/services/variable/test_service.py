@@ -1,3 +1,4 @@
+import re
 from datetime import datetime
 from unittest.mock import patch
 from uuid import uuid4
@@ -240,3 +241,42 @@ async def test_create_variable(service, session: AsyncSession):
     assert result.type == CREDENTIAL_TYPE
     assert isinstance(result.created_at, datetime)
     assert isinstance(result.updated_at, datetime)
+
+
+async def test_get_variable__served_from_cache(service, session: AsyncSession):
+    user_id = uuid4()
+    await service.create_variable(user_id, "name", "value", session=session)
+
+    assert await service.get_variable(user_id, "name", "", session=session) == "value"
+    with patch.object(session, "exec", side_effect=AssertionError("unexpected query")):
+        assert await service.get_variable(user_id, "name", "", session=session) == "value"
+        with pytest.raises(TypeError, match="cannot be used in a Session ID field"):
+            await service.get_variable(user_id, "name", "session_id", session=session)
+
+
+async def test_update_variable__invalidates_cache(service, session: AsyncSession):
+    user_id = uuid4()
+    saved = await service.create_variable(user_id, "name", "value", session=session)
+    await service.get_variable(user_id, "name", "", session=session)
+
+    await service.update_variable(user_id, "name", "new_value", session=session)
+    assert await service.get_variable(user_id, "name", "", session=session) == "new_value"
+
+    await service.update_variable_fields(
+        user_id, saved.id, VariableUpdate(id=saved.id, name="renamed", value="renamed_value"), session=session
+    )
+    assert await service.get_variable(user_id, "renamed", "", session=session) == "renamed_value"
+    with pytest.raises(ValueError, match=re.escape("name variable not found.")):
+        await service.get_variable(user_id, "name", "", session=session)
+
+
+async def test_prefetch_variables(service, session: AsyncSession):
+    user_id = uuid4()
+    for i in range(3):
+        await service.create_variable(user_id, f"name{i}", f"value{i}", session=session)
+
+    await service.prefetch_variables(user_id, ["name0", "name1", "name2", "missing"], session=session)
+
+    with patch.object(session, "exec", side_effect=AssertionError("unexpected query")):
+        for i in range(3):
+            assert await service.get_variable(user_id, f"name{i}", "", session=session) == f"value{i}"
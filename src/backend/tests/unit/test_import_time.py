@@ -0,0 +1,58 @@
+import re
+import subprocess
+import sys
+
+# Only loaded once the features that need them are used, so a server that doesn't use them
+# starts without paying for them
+LAZY_MODULES = [
+    "elevenlabs",
+    "langchain.agents",
+    "litellm",
+    "networkx",
+    "openai",
+    "reportlab",
+    "scipy",
+    "supabase",
+    "webrtcvad",
+]
+
+IMPORT_TIME_LINE = re.compile(r"import time:\s+\d+ \|\s+(?P<cumulative>\d+) \| (?P<indent>\s*)(?P<module>\S+)")
+
+
+def import_times(module: str) -> list[tuple[str, int, int]]:
+    """The (module, cumulative microseconds, depth) of each module imported by importing `module`."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return [
+        (match["module"], int(match["cumulative"]), len(match["indent"]) // 2)
+        for match in map(IMPORT_TIME_LINE.match, result.stderr.splitlines())
+        if match
+    ]
+
+
+def importers(times: list[tuple[str, int, int]], index: int) -> list[str]:
+    """The chain of modules that led to importing the module at `index`, closest first."""
+    chain = []
+    depth = times[index][2]
+    # Modules are listed once their imports are done, so those importing it come after it
+    for module, _, module_depth in times[index + 1 :]:
+        if module_depth < depth:
+            chain.append(module)
+            depth = module_depth
+    return chain
+
+
+def test_server_import_stays_within_its_budget():
+    times = import_times("langflow.main")
+
+    loaded = {
+        module: f"{cumulative // 1000} ms, imported by {' <- '.join(importers(times, index)[:6])}"
+        for index, (module, cumulative, _) in enumerate(times)
+        if module in LAZY_MODULES
+    }
+
+    assert not loaded, loaded
@@ -219,7 +219,7 @@ async def test_detect_github_url(url, expected):
     mock_response.json = lambda: {"default_branch": "main"}  # Not async, just returns a dict
     mock_response.raise_for_status.return_value = None
 
-    with patch("httpx.AsyncClient.get", return_value=mock_response) as mock_get:
+    with patch("langflow.services.http_client.service.HttpClientService.get", return_value=mock_response) as mock_get:
         result = await detect_github_url(url)
         assert result == expected
 
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 from unittest.mock import patch
@@ -99,3 +100,79 @@ def test_max_size(sized_log_buffer):
     assert sized_log_buffer.max_size() == 0
     sized_log_buffer.max = 100
     assert sized_log_buffer.max_size() == 100
+
+
+def log_message(text, timestamp):
+    return json.dumps({"text": text, "record": {"time": {"timestamp": timestamp}}})
+
+
+def test_queries_wrap_around_the_ring(sized_log_buffer):
+    sized_log_buffer.max = 4
+    for i in range(10):
+        sized_log_buffer.write(log_message(f"Log {i}", 1625097600 + i))
+
+    assert sized_log_buffer.buffer == [(1625097600000 + i * 1000, f"Log {i}") for i in range(6, 10)]
+    assert sized_log_buffer.get_after_timestamp(1625097607500, lines=5) == {
+        1625097608000: "Log 8",
+        1625097609000: "Log 9",
+    }
+    assert sized_log_buffer.get_before_timestamp(1625097608000, lines=5) == {
+        1625097606000: "Log 6",
+        1625097607000: "Log 7",
+    }
+    # Past the newest message, the last lines are returned
+    assert list(sized_log_buffer.get_before_timestamp(1625097700000, lines=2)) == [1625097608000, 1625097609000]
+
+
+def test_out_of_order_timestamps_keep_their_place(sized_log_buffer):
+    sized_log_buffer.max = 5
+    for i, offset in enumerate([0, 2, 1, 3]):
+        sized_log_buffer.write(log_message(f"Log {i}", 1625097600 + offset))
+
+    assert sized_log_buffer.get_after_timestamp(1625097602000, lines=5) == {
+        1625097602000: "Log 1",
+        1625097601000: "Log 2",
+        1625097603000: "Log 3",
+    }
+
+
+def test_resizing_keeps_the_newest_messages(sized_log_buffer):
+    sized_log_buffer.max = 3
+    for i in range(3):
+        sized_log_buffer.write(log_message(f"Log {i}", 1625097600 + i))
+    sized_log_buffer.max = 2
+    sized_log_buffer.write(log_message("Log 3", 1625097603))
+
+    assert [msg for _, msg in sized_log_buffer.buffer] == ["Log 2", "Log 3"]
+    assert len(sized_log_buffer) == 2
+
+
+def test_reads_do_not_wait_for_writers(sized_log_buffer):
+    sized_log_buffer.max = 5
+    sized_log_buffer.write(log_message("Log 0", 1625097600))
+
+    with sized_log_buffer.get_write_lock():
+        assert sized_log_buffer.get_last_n(1) == {1625097600000: "Log 0"}
+        assert sized_log_buffer.get_after_timestamp(0, lines=1) == {1625097600000: "Log 0"}
+
+
+async def test_subscribers_receive_new_messages(sized_log_buffer):
+    sized_log_buffer = SizedLogBuffer(max_readers=1, max_pending=2)
+    sized_log_buffer.max = 5
+    sized_log_buffer.write(log_message("Before", 1625097600))
+
+    with sized_log_buffer.subscribe() as queue:
+        with pytest.raises(RuntimeError, match="Too many log subscribers"), sized_log_buffer.subscribe():
+            pass
+        for i in range(3):
+            sized_log_buffer.write(log_message(f"Log {i}", 1625097601 + i))
+        await asyncio.sleep(0)
+
+        # The oldest pending message is dropped for the newer ones
+        assert [queue.get_nowait(), queue.get_nowait()] == [(1625097602000, "Log 1"), (1625097603000, "Log 2")]
+
+    sized_log_buffer.write(log_message("After", 1625097604))
+    await asyncio.sleep(0)
+    assert queue.empty()
+    with sized_log_buffer.subscribe():
+        pass